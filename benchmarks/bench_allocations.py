@@ -0,0 +1,122 @@
+"""
+Per round memory and garbage collection benchmark.
+
+Runs kernel rounds of MOVE, SLEEP and OBSERVE commands for many agents, turns
+every result into the text sent over the socket and parses it back the way an
+agent does. For each round it reports the peak traced memory, the number of
+generation 0 collections (a proxy for how many container objects were
+allocated) and the time spent paused in the garbage collector.
+
+It also prints the memory one instance of each hot value type takes, including
+the objects it creates, and whether instances still carry a `__dict__`.
+
+Run from the repository root:
+    python benchmarks/bench_allocations.py [--agents N] [--rounds N]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from bench_command_batch import batched_round, make_kernel, queue_commands  # noqa: E402
+
+from a3.aegis_main import Aegis  # noqa: E402
+from a3.aegis_parser import AegisParser  # noqa: E402
+from aegis.common import AgentID, InternalLocation, LifeSignals  # noqa: E402
+from aegis.common.world.agent import Agent  # noqa: E402
+from aegis.common.world.info import CellInfo, SurroundInfo  # noqa: E402
+from aegis.common.world.objects import Rubble, Survivor, SurvivorGroup  # noqa: E402
+
+
+def instance_sizes(count: int = 10_000) -> list[tuple[str, float, bool]]:
+    factories: list[tuple[str, Callable[[int], object]]] = [
+        ("InternalLocation", lambda i: InternalLocation(i, i)),
+        ("AgentID", lambda i: AgentID(i, 1)),
+        ("LifeSignals", lambda i: LifeSignals([i, 0])),
+        ("CellInfo", lambda i: CellInfo()),
+        ("SurroundInfo", lambda i: SurroundInfo()),
+        ("Agent", lambda i: Agent(AgentID(i, 1), InternalLocation(0, 0))),
+        ("Survivor", lambda i: Survivor(i, 10, 1, 1, 1)),
+        ("SurvivorGroup", lambda i: SurvivorGroup(i, 10, 2)),
+        ("Rubble", lambda i: Rubble(i, 5, 2)),
+    ]
+    sizes: list[tuple[str, float, bool]] = []
+    for name, factory in factories:
+        tracemalloc.start()
+        instances = [factory(i) for i in range(count)]
+        size = tracemalloc.get_traced_memory()[0] / count
+        tracemalloc.stop()
+        sizes.append((name, size, hasattr(instances[0], "__dict__")))
+    return sizes
+
+
+def send_and_parse_results(aegis: Aegis) -> None:
+    handler = aegis._agent_handler  # pyright: ignore[reportPrivateUsage]
+    for agent_control in handler.agent_list:
+        if agent_control.result_of_command is not None:
+            _ = AegisParser.parse_aegis_command(str(agent_control.result_of_command))
+            agent_control.result_of_command = None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    _ = parser.add_argument("--world", default="worlds/ExampleWorld.world")
+    _ = parser.add_argument("--agents", type=int, default=400)
+    _ = parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'type':<16} {'bytes':>9} {'__dict__':>9}")
+    for name, size, has_dict in instance_sizes():
+        print(f"{name:<16} {size:>9.1f} {'yes' if has_dict else 'no':>9}")
+    print()
+
+    pauses: list[float] = []
+    started: list[float] = []
+
+    def on_gc(phase: str, info: dict[str, int]) -> None:
+        if phase == "start":
+            started.append(time.perf_counter())
+        elif started:
+            pauses.append(time.perf_counter() - started.pop())
+
+    world_filename = os.path.abspath(args.world)
+    with tempfile.TemporaryDirectory() as directory:
+        cwd = os.getcwd()
+        os.chdir(directory)
+        try:
+            aegis = make_kernel(world_filename, args.agents, seed=1)
+            gc.collect()
+            gc.callbacks.append(on_gc)
+            tracemalloc.start()
+            gen0_start = gc.get_stats()[0]["collections"]
+            peaks: list[int] = []
+            start = time.perf_counter()
+            for round_number in range(args.rounds):
+                tracemalloc.reset_peak()
+                queue_commands(aegis, seed=round_number)
+                batched_round(aegis)
+                send_and_parse_results(aegis)
+                peaks.append(tracemalloc.get_traced_memory()[1])
+            elapsed = time.perf_counter() - start
+            gen0 = gc.get_stats()[0]["collections"] - gen0_start
+            tracemalloc.stop()
+            gc.callbacks.remove(on_gc)
+        finally:
+            os.chdir(cwd)
+
+    print(f"{args.agents} agents, {args.rounds} rounds on {args.world}")
+    print(f"  time per round:          {elapsed / args.rounds * 1000:8.2f} ms (traced)")
+    print(f"  peak traced memory:      {max(peaks) / 1024:8.1f} KiB")
+    print(f"  gen 0 collections/round: {gen0 / args.rounds:8.2f}")
+    print(f"  gc pause per round:      {sum(pauses) / args.rounds * 1000:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""
+MOVE/SLEEP/OBSERVE round resolution benchmark.
+
+Times one round of MOVE, SLEEP and OBSERVE commands for many agents. The
+batched kernel path (`Aegis._process_MOVE` and friends, then `_create_results`)
+is compared against the old per-command loop, which looked every agent up with
+a linear scan of the world's and the agent handler's agent lists.
+
+Run from the repository root:
+    python benchmarks/bench_command_batch.py [--world worlds/<name>.world] [--agents N ...]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from a3.aegis_main import Aegis  # noqa: E402
+from aegis.agent_control.agent_control import AgentControl  # noqa: E402
+from aegis.common import AgentID, Constants, Direction, InternalLocation  # noqa: E402
+from aegis.common.commands.agent_commands import MOVE, OBSERVE, SLEEP  # noqa: E402
+from aegis.common.world.agent import Agent  # noqa: E402
+from aegis.parsers.world_file_parser import WorldFileParser  # noqa: E402
+
+
+def make_kernel(world_filename: str, agent_count: int, seed: int) -> Aegis:
+    loaded_world_file = WorldFileParser.load_world_file(world_filename)
+    if loaded_world_file is None:
+        raise SystemExit(f"Unable to load {world_filename}")
+
+    aegis = Aegis()
+    world = aegis.get_aegis_world()
+    rng = random.Random(seed)
+    with contextlib.redirect_stdout(io.StringIO()):
+        _ = world.build_world(loaded_world_file.world_file)
+        width = loaded_world_file.world_file.width
+        height = loaded_world_file.world_file.height
+        for index in range(agent_count):
+            agent_id = AgentID(index // 10 + 1, index % 10)
+            location = InternalLocation(rng.randrange(width), rng.randrange(height))
+            world.add_agent(Agent(agent_id, location, 10_000))
+
+            agent_control = AgentControl(agent_id)
+            aegis._agent_handler.agent_list.append(agent_control)  # pyright: ignore[reportPrivateUsage]
+            aegis._agent_handler._agent_index[agent_id] = agent_control  # pyright: ignore[reportPrivateUsage]
+    return aegis
+
+
+def queue_commands(aegis: Aegis, seed: int) -> None:
+    rng = random.Random(seed)
+    directions = list(Direction)
+    for agent in aegis.get_aegis_world().get_agents():
+        roll = rng.random()
+        if roll < 0.7:
+            command = MOVE(rng.choice(directions))
+        elif roll < 0.85:
+            command = SLEEP()
+        else:
+            command = OBSERVE(agent.location)
+        command.set_agent_id(agent.agent_id)
+        aegis._handle_agent_command(command)  # pyright: ignore[reportPrivateUsage]
+
+
+def batched_round(aegis: Aegis) -> None:
+    aegis._process_MOVE()  # pyright: ignore[reportPrivateUsage]
+    aegis._process_SLEEP()  # pyright: ignore[reportPrivateUsage]
+    aegis._process_OBSERVE()  # pyright: ignore[reportPrivateUsage]
+    aegis._create_results()  # pyright: ignore[reportPrivateUsage]
+
+
+def legacy_round(aegis: Aegis) -> None:
+    # the per-command loop the kernel used before commands were batched
+    world = aegis.get_aegis_world()
+    agents = world.get_agents()
+    handler = aegis._agent_handler  # pyright: ignore[reportPrivateUsage]
+
+    def find_agent(agent_id: AgentID) -> Agent | None:
+        for agent in agents:
+            if agent.agent_id == agent_id:
+                return agent
+        return None
+
+    def set_result(agent_id: AgentID, result: object) -> None:
+        for agent_control in handler.agent_list:
+            if agent_control.agent_id == agent_id:
+                agent_control.result_of_command = result  # pyright: ignore[reportAttributeAccessIssue]
+                return
+
+    move_results: list[AgentID] = []
+    for move in aegis._MOVE_list:  # pyright: ignore[reportPrivateUsage]
+        agent = find_agent(move.get_agent_id())
+        if agent is None:
+            continue
+        dest_location = agent.location.add(move.direction)
+        dest_cell = world.get_cell_at(dest_location)
+        if move.direction != Direction.CENTER and dest_cell:
+            agent.remove_energy(dest_cell.move_cost)
+            world.move_agent(agent.agent_id, dest_location)
+            agent.orientation = move.direction
+            agent.add_step_taken()
+        else:
+            agent.remove_energy(1)
+        if move.get_agent_id() not in move_results:
+            move_results.append(move.get_agent_id())
+    aegis._MOVE_list.clear()  # pyright: ignore[reportPrivateUsage]
+
+    sleep_results: list[AgentID] = []
+    for sleep in aegis._SLEEP_list:  # pyright: ignore[reportPrivateUsage]
+        agent = find_agent(sleep.get_agent_id())
+        if agent is None:
+            continue
+        agent_cell = world.get_cell_at(agent.location)
+        if agent_cell and agent_cell.is_charging_cell():
+            agent.set_energy_level(
+                min(
+                    agent.get_energy_level() + Constants.NORMAL_CHARGE,
+                    Constants.DEFAULT_MAX_ENERGY_LEVEL,
+                )
+            )
+        if sleep.get_agent_id() not in sleep_results:
+            sleep_results.append(sleep.get_agent_id())
+    aegis._SLEEP_list.clear()  # pyright: ignore[reportPrivateUsage]
+
+    observes = list(aegis._OBSERVE_list)  # pyright: ignore[reportPrivateUsage]
+    for observe in observes:
+        agent = find_agent(observe.get_agent_id())
+        if agent is not None:
+            agent.remove_energy(1)
+    aegis._OBSERVE_list.clear()  # pyright: ignore[reportPrivateUsage]
+
+    for agent_id in move_results + sleep_results:
+        agent = find_agent(agent_id)
+        if agent is not None:
+            set_result(agent_id, world.get_surround_info(agent.location))
+    for observe in observes:
+        cell = world.get_cell_at(observe.location)
+        if cell is not None:
+            set_result(observe.get_agent_id(), cell.get_cell_info())
+
+
+def time_rounds(world_filename: str, agent_count: int, rounds: int, legacy: bool) -> float:
+    aegis = make_kernel(world_filename, agent_count, seed=1)
+    total = 0.0
+    for round_number in range(rounds):
+        queue_commands(aegis, seed=round_number)
+        start = time.perf_counter()
+        if legacy:
+            legacy_round(aegis)
+        else:
+            batched_round(aegis)
+        total += time.perf_counter() - start
+    return total / rounds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    _ = parser.add_argument("--world", default="worlds/ExampleWorld.world")
+    _ = parser.add_argument("--agents", type=int, nargs="+", default=[50, 200, 800])
+    _ = parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    world_filename = os.path.abspath(args.world)
+    print(f"World: {args.world}, {args.rounds} rounds\n")
+    print(f"{'agents':>8} {'per-command':>14} {'batched':>14} {'speedup':>9}")
+
+    # building a world writes the agent world file to the working directory
+    with tempfile.TemporaryDirectory() as directory:
+        cwd = os.getcwd()
+        os.chdir(directory)
+        try:
+            for agent_count in args.agents:
+                legacy = time_rounds(world_filename, agent_count, args.rounds, True)
+                batched = time_rounds(world_filename, agent_count, args.rounds, False)
+                print(
+                    f"{agent_count:>8} {legacy * 1000:>11.2f} ms {batched * 1000:>11.2f} ms "
+                    f"{legacy / batched:>8.1f}x"
+                )
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Per-process dataset memory benchmark.
+
+Starts several worker processes that each open the same `.npy` dataset and
+read all of it, once with a plain `np.load` (a private copy per process)
+and once through `Datasets` (a shared, read-only memory map). Reports the
+private (RssAnon) and file backed (RssFile) resident memory each worker
+gained. Linux only, it reads /proc/self/status.
+
+Run from the repository root:
+    python benchmarks/bench_dataset_memory.py [--workers N] [--mb N] [--file path.npy]
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import numpy as np  # noqa: E402
+
+from aegis.agent_predictions.datasets import Datasets  # noqa: E402
+
+
+def resident_kb() -> tuple[int, int]:
+    anon = file = 0
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("RssAnon:"):
+                anon = int(line.split()[1])
+            elif line.startswith("RssFile:"):
+                file = int(line.split()[1])
+    return anon, file
+
+
+def worker(filename: str, mapped: bool) -> tuple[int, int]:
+    before_anon, before_file = resident_kb()
+    array = Datasets.load(filename) if mapped else np.load(filename)
+    _ = float(np.asarray(array).sum())  # touch every page
+    after_anon, after_file = resident_kb()
+    return after_anon - before_anon, after_file - before_file
+
+
+def run(filename: str, workers: int, mapped: bool) -> tuple[float, float]:
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(workers) as pool:
+        results = pool.starmap(worker, [(filename, mapped)] * workers)
+    anon = sum(result[0] for result in results) / workers / 1024
+    file = sum(result[1] for result in results) / workers / 1024
+    return anon, file
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark dataset memory per process")
+    _ = parser.add_argument("--workers", type=int, default=4)
+    _ = parser.add_argument("--mb", type=int, default=64)
+    _ = parser.add_argument("--file", type=str, default=None)
+    args = parser.parse_args()
+    workers: int = args.workers
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filename: str | None = args.file
+        if filename is None:
+            filename = os.path.join(tmp_dir, "dataset.npy")
+            count = args.mb * 1024 * 1024 // 4
+            np.save(filename, np.random.default_rng(0).random(count, dtype=np.float32))
+
+        size_mb = os.path.getsize(filename) / 1024 / 1024
+        copy_anon, copy_file = run(filename, workers, mapped=False)
+        map_anon, map_file = run(filename, workers, mapped=True)
+
+    print(f"Dataset     : {filename} ({size_mb:.1f} MB), {workers} workers")
+    print(f"np.load     : private {copy_anon:7.1f} MB, file backed {copy_file:7.1f} MB per worker")
+    print(f"Datasets    : private {map_anon:7.1f} MB, file backed {map_file:7.1f} MB per worker")
+
+
+if __name__ == "__main__":
+    main()
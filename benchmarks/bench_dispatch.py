@@ -0,0 +1,117 @@
+"""
+AEGIS command dispatch benchmark.
+
+Compares the `isinstance` chain `Brain.handle_aegis_command` used to pick a
+handler against the type-keyed `CommandDispatcher`, on the messages an agent
+receives in a typical round (most of which sit late in the old chain). The
+command classes derive from ABC, so every `isinstance` miss goes through
+`ABCMeta.__instancecheck__`.
+
+Run from the repository root:
+    python benchmarks/bench_dispatch.py [--repeat N]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from aegis.common.commands.aegis_command import AegisCommand  # noqa: E402
+from aegis.common.commands.aegis_commands import (  # noqa: E402
+    AEGIS_UNKNOWN,
+    CMD_RESULT_END,
+    CMD_RESULT_START,
+    CONNECT_OK,
+    DEATH_CARD,
+    DISCONNECT,
+    MESSAGES_END,
+    MESSAGES_START,
+    MOVE_RESULT,
+    OBSERVE_RESULT,
+    PREDICT_RESULT,
+    ROUND_END,
+    ROUND_START,
+    SAVE_SURV_RESULT,
+    SEND_MESSAGE_RESULT,
+    SLEEP_RESULT,
+    TEAM_DIG_RESULT,
+)
+from aegis.common.commands.command_dispatcher import CommandDispatcher  # noqa: E402
+from aegis.common.world.info import SurroundInfo  # noqa: E402
+
+# the order of the old Brain.handle_aegis_command chain
+CHAIN_ORDER: list[type[AegisCommand]] = [
+    CONNECT_OK,
+    DEATH_CARD,
+    DISCONNECT,
+    SEND_MESSAGE_RESULT,
+    MESSAGES_END,
+    MESSAGES_START,
+    MOVE_RESULT,
+    ROUND_END,
+    ROUND_START,
+    SAVE_SURV_RESULT,
+    PREDICT_RESULT,
+    SLEEP_RESULT,
+    OBSERVE_RESULT,
+    TEAM_DIG_RESULT,
+    AEGIS_UNKNOWN,
+    CMD_RESULT_START,
+    CMD_RESULT_END,
+]
+
+
+def round_messages() -> list[AegisCommand]:
+    return [
+        ROUND_START(),
+        CMD_RESULT_START(1),
+        MOVE_RESULT(100, SurroundInfo()),
+        CMD_RESULT_END(),
+        MESSAGES_START(0),
+        MESSAGES_END(),
+        ROUND_END(),
+    ]
+
+
+def chain_dispatch(command: AegisCommand, counts: list[int]) -> None:
+    for index, command_type in enumerate(CHAIN_ORDER):
+        if isinstance(command, command_type):
+            counts[index] += 1
+            return
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    _ = parser.add_argument("--repeat", type=int, default=200_000)
+    args = parser.parse_args()
+
+    messages = round_messages()
+    counts = [0] * len(CHAIN_ORDER)
+    dispatcher = CommandDispatcher()
+    for index, command_type in enumerate(CHAIN_ORDER):
+
+        def count(_: AegisCommand, index: int = index) -> None:
+            counts[index] += 1
+
+        dispatcher.register(command_type, count)
+
+    def run_chain() -> None:
+        for message in messages:
+            chain_dispatch(message, counts)
+
+    def run_dispatcher() -> None:
+        for message in messages:
+            _ = dispatcher.dispatch(message)
+
+    rounds = args.repeat // len(messages)
+    chain = timeit.timeit(run_chain, number=rounds) / (rounds * len(messages))
+    table = timeit.timeit(run_dispatcher, number=rounds) / (rounds * len(messages))
+    print(f"{len(CHAIN_ORDER)} command types, {rounds * len(messages)} messages\n")
+    print(f"  isinstance chain:   {chain * 1e9:8.1f} ns/message")
+    print(f"  CommandDispatcher:  {table * 1e9:8.1f} ns/message")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Package import time benchmark.
+
+Imports the packages agents and the kernel load, each in a fresh interpreter
+with `-X importtime`, and reports the median cumulative import time of each
+and of its slowest dependencies. Agents import `aegis` and `a3.agent`, which
+must not load numpy (see tests/test_import_time.py); the timings here depend
+on the machine, so they are reported, not asserted.
+
+Run from the repository root:
+    python benchmarks/bench_import_time.py [--repeat 5] [--top 5]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+MODULES = ["aegis", "a3.agent", "a3.aegis_main"]
+
+
+def import_times(module: str) -> dict[str, int]:
+    """Imports `module` in a fresh interpreter and returns {module: cumulative us}."""
+    env = dict(os.environ, PYTHONPATH=SRC_DIR)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    _ = parser.add_argument("--repeat", type=int, default=5)
+    _ = parser.add_argument("--top", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"median of {args.repeat} fresh interpreters\n")
+    for module in MODULES:
+        runs = [import_times(module) for _ in range(args.repeat)]
+        medians = {
+            name: statistics.median(run.get(name, 0) for run in runs)
+            for name in runs[0]
+        }
+        loads_numpy = "numpy" in medians
+        print(
+            f"{module:<16} {medians[module] / 1000:8.1f} ms"
+            + ("  (loads numpy)" if loads_numpy else "")
+        )
+        slowest = sorted(
+            (name for name in medians if name != module and "." not in name),
+            key=lambda name: medians[name],
+            reverse=True,
+        )
+        for name in slowest[: args.top]:
+            print(f"    {name:<24} {medians[name] / 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
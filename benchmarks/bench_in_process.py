@@ -0,0 +1,108 @@
+"""
+TCP versus in-process simulation benchmark.
+
+Runs the same simulation, with the example agent, in two ways and reports
+simulations per second for each:
+
+- tcp: the kernel (`src/aegis/main.py`) and every agent as separate
+  processes talking over `Constants.AGENT_PORT`, as `run.py` does
+- in-process: `a3.in_process.run_in_process`, with the agents as threads
+  talking to the kernel over a `LoopbackListener`
+
+Every run happens in a fresh working directory and a fresh interpreter, so
+start-up costs are included in both.
+
+Run from the repository root:
+    python benchmarks/bench_in_process.py [--agents 2] [--rounds 30] [--repeat 3]
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+SRC = os.path.join(REPO_ROOT, "src")
+AGENT = os.path.join(SRC, "agents", "example_agent_a3", "main.py")
+
+IN_PROCESS = """
+import sys
+from a3.in_process import run_in_process
+from agents.example_agent_a3.example_agent import ExampleAgent
+agents = int(sys.argv[1])
+sys.exit(0 if run_in_process(sys.argv[2:], [("test", ExampleAgent)] * agents) else 1)
+"""
+
+
+def run_tcp(directory: str, agents: int, kernel_args: list[str]) -> None:
+    env = dict(os.environ, PYTHONPATH=SRC)
+    kernel = subprocess.Popen(
+        [sys.executable, os.path.join(SRC, "aegis", "main.py"), "-NoKViewer"]
+        + [str(agents), *kernel_args],
+        cwd=directory,
+        env=env,
+        stdout=subprocess.DEVNULL,
+    )
+    # give the kernel time to open the agent port
+    time.sleep(1.0)
+    clients = [
+        subprocess.Popen(
+            [sys.executable, AGENT], cwd=directory, env=env, stdout=subprocess.DEVNULL
+        )
+        for _ in range(agents)
+    ]
+    for process in [kernel, *clients]:
+        if process.wait() != 0:
+            raise RuntimeError(f"{process.args[1]} exited with {process.returncode}")
+
+
+def run_in_process(directory: str, agents: int, kernel_args: list[str]) -> None:
+    _ = subprocess.run(
+        [sys.executable, "-c", IN_PROCESS, str(agents), *kernel_args],
+        cwd=directory,
+        env=dict(os.environ, PYTHONPATH=SRC),
+        stdout=subprocess.DEVNULL,
+        check=True,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    _ = parser.add_argument("--world", default="worlds/ExampleWorld.world")
+    _ = parser.add_argument("--agents", type=int, default=2)
+    _ = parser.add_argument("--rounds", type=int, default=30)
+    _ = parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    kernel_args = [
+        "-WorldFile",
+        os.path.abspath(args.world),
+        "-NumRound",
+        str(args.rounds),
+    ]
+    print(f"{args.world}, {args.agents} agents, {args.rounds} rounds\n")
+    rates: dict[str, float] = {}
+    for mode, run in (("tcp", run_tcp), ("in-process", run_in_process)):
+        elapsed = 0.0
+        for _ in range(args.repeat):
+            with tempfile.TemporaryDirectory() as directory:
+                _ = shutil.copytree(
+                    os.path.join(REPO_ROOT, "sys_files"),
+                    os.path.join(directory, "sys_files"),
+                )
+                start = time.perf_counter()
+                run(directory, args.agents, kernel_args)
+                elapsed += time.perf_counter() - start
+        rates[mode] = args.repeat / elapsed
+        print(
+            f"{mode:<12} {elapsed / args.repeat:8.2f} s/simulation  "
+            + f"{rates[mode]:8.2f} simulations/s"
+        )
+    print(f"\nin-process speedup: {rates['in-process'] / rates['tcp']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Kernel load benchmark over real connections.
+
+Starts the kernel in its own process, headless with `-Turbo true`, and drives
+it with `a3.load_generator`'s clients, all from this one process, over TCP or
+a Unix domain socket. Reports the clients' connect time, the rounds/sec and
+turns/sec, and the round and turn latencies as the number of agents grows,
+which shows how `AgentHandler` and the socket layer scale.
+
+The soft open file limit is raised to the hard limit for both processes, as
+every connection is a file descriptor on both ends.
+
+Run from the repository root:
+    python benchmarks/bench_load.py [--agents 10 100 1000] [--rounds 20]
+        [--policy walk] [--transport tcp]
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from a3.load_generator import LoadGenerator, idle_policy, walk_policy  # noqa: E402
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+CONFIG = os.path.join(REPO_ROOT, "sys_files", "aegis_config.json")
+
+
+def raise_open_file_limit() -> None:
+    try:
+        import resource
+    except ImportError:
+        return
+    _, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+
+def free_endpoint(transport: str, directory: str) -> str:
+    if transport == "unix":
+        return f"unix://{os.path.join(directory, 'aegis.sock')}"
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return f"tcp://127.0.0.1:{sock.getsockname()[1]}"
+
+
+def run_once(
+    agents: int, args: argparse.Namespace, directory: str
+) -> dict[str, float]:
+    """Runs one kernel against `agents` clients and returns the summary."""
+    endpoint = free_endpoint(args.transport, directory)
+    kernel_args = ["-NoKViewer", str(agents), "-WorldFile", args.world]
+    kernel_args += ["-NumRound", str(args.rounds), "-Turbo", "true"]
+    kernel_args += ["-Endpoint", endpoint, "-ConfigFile", CONFIG]
+    environment = dict(os.environ, PYTHONPATH=os.path.join(REPO_ROOT, "src"))
+    # the kernel writes its world info file to the working directory
+    kernel = subprocess.Popen(
+        [sys.executable, "-m", "aegis.main", *kernel_args],
+        cwd=directory,
+        env=environment,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        policy = idle_policy if args.policy == "idle" else walk_policy(args.seed)
+        report = asyncio.run(LoadGenerator(endpoint, policy).run(agents))
+        _ = kernel.wait(timeout=60)
+    finally:
+        if kernel.poll() is None:
+            kernel.kill()
+    return report.summary()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    _ = parser.add_argument("--agents", type=int, nargs="+", default=[10, 100, 1000])
+    _ = parser.add_argument("--rounds", type=int, default=20)
+    _ = parser.add_argument("--policy", choices=["walk", "idle"], default="walk")
+    _ = parser.add_argument("--transport", choices=["tcp", "unix"], default="tcp")
+    _ = parser.add_argument(
+        "--world", default=os.path.join(REPO_ROOT, "worlds", "ExampleWorld.world")
+    )
+    _ = parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    args.world = os.path.abspath(args.world)
+    raise_open_file_limit()
+
+    print(f"{args.policy} clients over {args.transport}, {args.rounds} rounds\n")
+    print(
+        f"{'agents':>7} {'connect s':>10} {'rounds/s':>9} {'turns/s':>9} "
+        + f"{'round p50':>10} {'round p99':>10} {'turn p50':>9} {'turn p99':>9}"
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        for agents in args.agents:
+            summary = run_once(agents, args, directory)
+            print(
+                f"{agents:>7} {summary['connect_s']:10.2f} "
+                + f"{summary['rounds_per_s']:9.1f} {summary['turns_per_s']:9.0f} "
+                + f"{summary['round_p50_s'] * 1000:8.1f}ms "
+                + f"{summary['round_p99_s'] * 1000:8.1f}ms "
+                + f"{summary['turn_p50_s'] * 1000:7.2f}ms "
+                + f"{summary['turn_p99_s'] * 1000:7.2f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
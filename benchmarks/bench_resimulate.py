@@ -0,0 +1,141 @@
+"""
+Command-log re-simulation benchmark.
+
+Records a simulation of the scripted agents in `scripted_agents.py` on a
+generated world, then re-simulates its replay with `a3.resimulator`, with
+and without checking every round against the replay, and reports rounds/sec
+for each. The re-simulation has no agents, no sockets and no replay file, so
+it times the kernel's own round on a fixed, recorded workload, and a change
+to the kernel that alters the simulation shows as a mismatch.
+
+Run from the repository root:
+    python benchmarks/bench_resimulate.py [--sizes 20 50 100] [--agents 10]
+        [--rounds 200] [--repeat 3]
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from a3.aegis_main import Aegis  # noqa: E402
+from a3.resimulator import CommandLog, resimulate  # noqa: E402
+from aegis.common.network.loopback_transport import LoopbackListener  # noqa: E402
+from aegis.tools.generate_world import generate_world, write_world  # noqa: E402
+from scripted_agents import ScriptedAgent, start_agents  # noqa: E402
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def record(
+    world: str, config: str, replay: str, agents: int, rounds: int, seed: int
+) -> float:
+    """Runs and records one simulation and returns its rounds/sec."""
+    aegis = Aegis()
+    args = ["-NoKViewer", str(agents), "-WorldFile", world, "-ConfigFile", config]
+    args += ["-NumRound", str(rounds), "-ProcFile", replay]
+    if not aegis.read_command_line(args):
+        raise RuntimeError("Bad kernel arguments")
+    listener = LoopbackListener()
+    aegis.set_agent_listener(listener)
+    if not aegis.start_up() or not aegis.build_world():
+        raise RuntimeError(f"Kernel couldn't start on {world}")
+
+    running: list[ScriptedAgent] = []
+
+    def connect() -> None:
+        running.extend(start_agents("mix", agents, seed, listener=listener))
+
+    # every agent waits for CONNECT_OK, which the kernel sends as it accepts
+    connector = threading.Thread(target=connect)
+    connector.start()
+    try:
+        aegis.connect_all_agents()
+        connector.join()
+        aegis.run_state()
+        results = aegis.get_results()
+    finally:
+        aegis.shutdown()
+        for agent in running:
+            agent.join(timeout=5)
+
+    completed = results["rounds"]
+    elapsed = results["simulation_s"]
+    assert isinstance(completed, int) and isinstance(elapsed, float)
+    if completed == 0:
+        raise RuntimeError(f"Kernel ran no rounds on {world}")
+    return completed / elapsed
+
+
+def measure(log: CommandLog, config: str, repeat: int, verify: bool) -> float:
+    """Returns the median rounds/sec of `repeat` re-simulations."""
+    samples: list[float] = []
+    for _ in range(repeat):
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            result = resimulate(log, config_filename=config, verify=verify)
+        if result.mismatch is not None:
+            raise RuntimeError(
+                f"Re-simulation differs from the replay in round {result.mismatch.round}"
+            )
+        samples.append(result.rounds / result.seconds)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    _ = parser.add_argument("--sizes", type=int, nargs="+", default=[20, 50, 100])
+    _ = parser.add_argument("--agents", type=int, default=10)
+    _ = parser.add_argument("--rounds", type=int, default=200)
+    _ = parser.add_argument("--repeat", type=int, default=3)
+    _ = parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{args.agents} scripted agents, {args.rounds} rounds, ", end="")
+    print(f"median of {args.repeat} re-simulations\n")
+    print(
+        f"{'world':<10} {'recorded r/s':>13} {'verified r/s':>13} "
+        + f"{'unverified r/s':>15}"
+    )
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        # the shipped config, with World_Max raised to the largest world
+        with open(os.path.join(REPO_ROOT, "sys_files", "aegis_config.json")) as file:
+            settings = json.load(file)
+        settings["World_Max"] = max(settings.get("World_Max", 0), *args.sizes)
+        config = os.path.join(directory, "aegis_config.json")
+        with open(config, "w") as file:
+            json.dump(settings, file)
+        # the kernel writes its world info file to the working directory
+        os.chdir(directory)
+        try:
+            for size in args.sizes:
+                world = os.path.join(directory, f"generated_{size}.world")
+                write_world(generate_world(size, size, args.seed), world)
+                replay = os.path.join(directory, f"replay_{size}.txt")
+                with (
+                    open(os.devnull, "w") as devnull,
+                    contextlib.redirect_stdout(devnull),
+                    contextlib.redirect_stderr(devnull),
+                ):
+                    recorded = record(
+                        world, config, replay, args.agents, args.rounds, args.seed
+                    )
+                log = CommandLog.read(replay)
+                verified = measure(log, config, args.repeat, verify=True)
+                unverified = measure(log, config, args.repeat, verify=False)
+                print(
+                    f"{size}x{size:<7} {recorded:13.1f} {verified:13.1f} "
+                    + f"{unverified:15.1f}"
+                )
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    main()
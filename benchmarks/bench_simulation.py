@@ -0,0 +1,251 @@
+"""
+End-to-end AEGIS simulation benchmark suite.
+
+Runs the real kernel (`src/aegis/main.py`) as a subprocess over the shipped
+worlds and over generated worlds, driven by the scripted agents in
+`scripted_agents.py` at 1, 10 and 100 agents. Each scenario reports:
+
+- rounds/sec and p50/p99 round latency, from the kernel's `-MetricsFile`
+- kernel CPU time and peak RSS, from the kernel process's resource usage
+
+Generated worlds come from `aegis.tools.generate_world`; sizes above the
+"World_Max" in `sys_files/aegis_config.json` need it raised first.
+
+Results are saved as JSON so two runs (e.g. before and after a kernel
+change) can be compared.
+
+Run from the repository root:
+    python benchmarks/bench_simulation.py run [-o results.json] [--agents 1 10 100]
+        [--worlds worlds/ExampleWorld.world ...] [--generated 30] [--rounds N]
+    python benchmarks/bench_simulation.py compare before.json after.json
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from aegis.tools.generate_world import (  # noqa: E402
+    generate_world,
+    write_world,
+)
+from scripted_agents import AGENT_TYPES, start_agents  # noqa: E402
+
+REPO_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+KERNEL = os.path.join(REPO_ROOT, "src", "aegis", "main.py")
+METRICS = ["rounds_per_sec", "p50_ms", "p99_ms", "cpu_s", "peak_rss_mb"]
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(q * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def wait_with_usage(process: subprocess.Popen[bytes]) -> tuple[float, float]:
+    """
+    Waits for a process and returns its CPU seconds and peak RSS in MiB.
+
+    Both are NaN where `os.wait4` is unavailable (Windows).
+    """
+    if not hasattr(os, "wait4"):
+        _ = process.wait()
+        return float("nan"), float("nan")
+    _, status, usage = os.wait4(process.pid, 0)
+    process.returncode = os.waitstatus_to_exitcode(status)
+    peak = usage.ru_maxrss / 1024  # KiB on Linux
+    if sys.platform == "darwin":
+        peak /= 1024  # bytes on macOS
+    return usage.ru_utime + usage.ru_stime, peak
+
+
+def run_scenario(
+    world: str, agents: int, agent_type: str, rounds: int, seed: int
+) -> dict[str, object]:
+    with tempfile.TemporaryDirectory() as directory:
+        metrics_filename = os.path.join(directory, "metrics.jsonl")
+        env = dict(os.environ, PYTHONPATH=os.path.join(REPO_ROOT, "src"))
+        kernel = subprocess.Popen(
+            [
+                sys.executable,
+                KERNEL,
+                "-NoKViewer",
+                str(agents),
+                "-WorldFile",
+                world,
+                "-NumRound",
+                str(rounds),
+                "-ProcFile",
+                os.path.join(directory, "replay.txt"),
+                "-MetricsFile",
+                metrics_filename,
+            ],
+            cwd=REPO_ROOT,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        start = time.perf_counter()
+        try:
+            running = start_agents(agent_type, agents, seed)
+        except Exception:
+            kernel.kill()
+            raise
+        cpu, peak = wait_with_usage(kernel)
+        wall = time.perf_counter() - start
+        for agent in running:
+            agent.join(timeout=5)
+
+        with open(metrics_filename) as file:
+            round_ms = [json.loads(line)["total_ms"] for line in file]
+
+    if not round_ms:
+        raise RuntimeError(f"Kernel ran no rounds on {world} with {agents} agents")
+    return {
+        "world": os.path.relpath(world, REPO_ROOT) if os.path.isabs(world) else world,
+        "agents": agents,
+        "agent_type": agent_type,
+        "rounds": len(round_ms),
+        "rounds_per_sec": len(round_ms) / (sum(round_ms) / 1000),
+        "p50_ms": statistics.median(round_ms),
+        "p99_ms": percentile(round_ms, 0.99),
+        "cpu_s": cpu,
+        "peak_rss_mb": peak,
+        "wall_s": wall,
+    }
+
+
+def run(args: argparse.Namespace) -> None:
+    worlds: list[str] = list(args.worlds)
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.generated:
+            filename = os.path.join(directory, f"generated-{size}.world")
+            write_world(generate_world(size, size, args.seed), filename)
+            worlds.append(filename)
+
+        results: list[dict[str, object]] = []
+        for world in worlds:
+            for agents in args.agents:
+                result = run_scenario(
+                    os.path.abspath(world),
+                    agents,
+                    args.agent_type,
+                    args.rounds,
+                    args.seed,
+                )
+                if world.startswith(directory):
+                    result["world"] = os.path.basename(world)
+                results.append(result)
+                print(
+                    f"{result['world']:<28} {agents:>4} agents  "
+                    + f"{result['rounds_per_sec']:8.1f} rounds/s  "
+                    + f"p50 {result['p50_ms']:7.2f} ms  "
+                    + f"p99 {result['p99_ms']:7.2f} ms  "
+                    + f"cpu {result['cpu_s']:6.2f} s  "
+                    + f"rss {result['peak_rss_mb']:6.1f} MiB"
+                )
+
+    report = {
+        "meta": {
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "rounds": args.rounds,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as file:
+        json.dump(report, file, indent=2)
+    print(f"\nResults written to {args.output}")
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(args: argparse.Namespace) -> None:
+    with open(args.before) as file:
+        before = json.load(file)
+    with open(args.after) as file:
+        after = json.load(file)
+
+    def key(result: dict[str, object]) -> tuple[object, ...]:
+        return result["world"], result["agents"], result["agent_type"]
+
+    baseline = {key(result): result for result in before["results"]}
+    print(f"before: {before['meta'].get('commit')}", end="  ")
+    print(f"after: {after['meta'].get('commit')}\n")
+    header = f"{'world':<28} {'agents':>6}"
+    for metric in METRICS:
+        header += f" {metric:>20}"
+    print(header)
+    for result in after["results"]:
+        old = baseline.get(key(result))
+        if old is None:
+            continue
+        line = f"{result['world']:<28} {result['agents']:>6}"
+        for metric in METRICS:
+            change = 0.0
+            if old[metric]:
+                change = (result[metric] - old[metric]) / old[metric] * 100
+            line += f" {result[metric]:>11.2f} ({change:+5.1f}%)"
+        print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmark scenarios")
+    _ = run_parser.add_argument(
+        "--worlds",
+        nargs="*",
+        default=sorted(
+            os.path.join("worlds", name)
+            for name in os.listdir(os.path.join(REPO_ROOT, "worlds"))
+            if name.endswith(".world")
+        ),
+    )
+    _ = run_parser.add_argument(
+        "--generated", type=int, nargs="*", default=[30], help="generated world sizes"
+    )
+    _ = run_parser.add_argument("--agents", type=int, nargs="+", default=[1, 10, 100])
+    _ = run_parser.add_argument(
+        "--agent-type", choices=["mix", *AGENT_TYPES], default="mix"
+    )
+    _ = run_parser.add_argument("--rounds", type=int, default=50)
+    _ = run_parser.add_argument("--seed", type=int, default=12345)
+    _ = run_parser.add_argument("-o", "--output", default="bench_simulation.json")
+
+    compare_parser = commands.add_parser("compare", help="compare two result files")
+    _ = compare_parser.add_argument("before")
+    _ = compare_parser.add_argument("after")
+
+    args = parser.parse_args()
+    if args.command == "run":
+        run(args)
+    else:
+        compare(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Agent transport latency benchmark.
+
+Times one agent turn as the kernel sees it: the kernel sends ROUND_START and
+waits for the agent's command and END_TURN, which the agent writes back to
+back. The turn is repeated over each transport:
+
+- tcp: `tcp://127.0.0.1:<port>`, with TCP_NODELAY as the kernel uses it
+- tcp-nagle: the same with Nagle's algorithm left on, as before endpoints
+- unix: a Unix domain socket, `unix:///tmp/...`
+- loopback: the in-process `LoopbackTransport`
+
+Run from the repository root:
+    python benchmarks/bench_transport.py [--turns 2000]
+"""
+
+import argparse
+import functools
+import os
+import socket
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from aegis.common.network.loopback_transport import LoopbackListener  # noqa: E402
+from aegis.common.network.socket_transport import (  # noqa: E402
+    SocketListener,
+    SocketTransport,
+)
+from aegis.common.network.transport import Transport, TransportListener  # noqa: E402
+
+COMMAND = "MOVE ( NORTH )"
+
+
+def agent(transport: Transport, turns: int) -> None:
+    for _ in range(turns):
+        _ = transport.read_message()
+        transport.send_message(COMMAND)
+        transport.send_message("END_TURN")
+
+
+def time_turns(
+    listener: TransportListener,
+    connect: Callable[[], Transport],
+    turns: int,
+    nagle: bool,
+) -> list[float]:
+    agent_end = connect()
+    kernel_end = listener.accept(5)
+    for transport in (agent_end, kernel_end):
+        sock = getattr(transport, "_socket", None)
+        if nagle and isinstance(sock, socket.socket):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 0)
+
+    thread = threading.Thread(target=agent, args=(agent_end, turns))
+    thread.start()
+    samples: list[float] = []
+    for _ in range(turns):
+        start = time.perf_counter()
+        kernel_end.send_message("ROUND_START")
+        _ = kernel_end.read_message()
+        _ = kernel_end.read_message()
+        samples.append(time.perf_counter() - start)
+    thread.join()
+    agent_end.close()
+    kernel_end.close()
+    listener.close()
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    _ = parser.add_argument("--turns", type=int, default=2000)
+    args = parser.parse_args()
+    turns: int = args.turns
+
+    print(f"{'transport':<12} {'p50':>10} {'p99':>10} {'turns/s':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        for name in ("tcp", "tcp-nagle", "unix", "loopback"):
+            connect: Callable[[], Transport]
+            if name == "loopback":
+                loopback = LoopbackListener()
+                listener: TransportListener = loopback
+                connect = loopback.connect
+            else:
+                if name == "unix":
+                    endpoint = f"unix://{os.path.join(directory, 'aegis.sock')}"
+                else:
+                    endpoint = "tcp://127.0.0.1:0"
+                listener = SocketListener(endpoint)
+                connect = functools.partial(
+                    SocketTransport.connect_endpoint, listener.endpoint
+                )
+
+            # fewer Nagle turns, each can take a delayed ACK (~40 ms)
+            count = min(turns, 50) if name == "tcp-nagle" else turns
+            samples = time_turns(listener, connect, count, name == "tcp-nagle")
+            samples.sort()
+            p50 = statistics.median(samples) * 1e6
+            p99 = samples[min(len(samples) - 1, int(0.99 * len(samples)))] * 1e6
+            print(
+                f"{name:<12} {p50:>8.1f}us {p99:>8.1f}us "
+                + f"{len(samples) / sum(samples):>10.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Vectorized environment benchmark.
+
+Steps `a3.vector_env.VectorEnv` with uniformly random actions at several
+numbers of environments and reports env-steps/sec (one env-step is one round
+of one simulation) and agent-steps/sec. Finished environments are reset with
+a new seed as they finish, as a training loop would, and resets count
+towards the time.
+
+Run from the repository root:
+    python benchmarks/bench_vector_env.py [--envs 1 8 32] [--agents 4]
+        [--steps 200] [--world worlds/ExampleWorld.world]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import numpy as np  # noqa: E402
+
+from a3.vector_env import NUM_ACTIONS, VectorEnv  # noqa: E402
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def run(world: str, num_envs: int, agents: int, steps: int, rounds: int) -> float:
+    """Returns env-steps/sec."""
+    env = VectorEnv(
+        world,
+        num_envs,
+        agents=agents,
+        rounds=rounds,
+        config_filename=os.path.join(REPO_ROOT, "sys_files", "aegis_config.json"),
+    )
+    rng = np.random.default_rng(0)
+    next_seed = num_envs
+    start = time.perf_counter()
+    _ = env.reset(seeds=range(num_envs))
+    for _ in range(steps):
+        actions = rng.integers(0, NUM_ACTIONS, (num_envs, agents))
+        _, _, terminated, truncated, _ = env.step(actions)
+        finished = np.flatnonzero(terminated | truncated)
+        if finished.size:
+            seeds = range(next_seed, next_seed + finished.size)
+            next_seed += finished.size
+            _ = env.reset(seeds=seeds, indices=finished.tolist())
+    elapsed = time.perf_counter() - start
+    env.close()
+    return num_envs * steps / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    _ = parser.add_argument("--envs", type=int, nargs="+", default=[1, 8, 32])
+    _ = parser.add_argument("--agents", type=int, default=4)
+    _ = parser.add_argument("--steps", type=int, default=200)
+    _ = parser.add_argument("--rounds", type=int, default=100)
+    _ = parser.add_argument("--world", default="worlds/ExampleWorld.world")
+    args = parser.parse_args()
+
+    world = os.path.abspath(args.world)
+    print(f"{args.world}, {args.agents} agents, {args.steps} steps, ", end="")
+    print(f"episodes of {args.rounds} rounds\n")
+    print(f"{'envs':>5} {'env-steps/s':>12} {'agent-steps/s':>14}")
+    for num_envs in args.envs:
+        rate = run(world, num_envs, args.agents, args.steps, args.rounds)
+        print(f"{num_envs:>5} {rate:12.0f} {rate * args.agents:14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+JSON vs compiled binary world loading benchmark.
+
+Generates a synthetic world, writes it both as a `.world` JSON file and as a
+compiled `.bworld` file, then times loading (read + parse) and building the
+world from each.
+
+Run from the repository root:
+    python benchmarks/bench_world_formats.py [--size N] [--repeat N]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from aegis.common import Constants  # noqa: E402
+from aegis.parsers.binary_world_file import BinaryWorldFile  # noqa: E402
+from aegis.parsers.helper.world_file_type import StackContent, WorldFileType  # noqa: E402
+from aegis.parsers.world_file_parser import WorldFileParser  # noqa: E402
+from aegis.world.aegis_world import AegisWorld  # noqa: E402
+
+
+def generate_world(size: int, seed: int = 12345) -> WorldFileType:
+    rng = random.Random(seed)
+    stacks = []
+    for x in range(size):
+        for y in range(size):
+            contents: list[StackContent] = []
+            roll = rng.random()
+            if roll < 0.1:
+                contents.append(
+                    {
+                        "type": "sv",
+                        "arguments": {
+                            "energy_level": rng.randint(1, 100),
+                            "body_mass": 0,
+                            "mental_state": 0,
+                            "damage_factor": 0,
+                        },
+                    }
+                )
+            if roll < 0.3:
+                contents.append(
+                    {
+                        "type": "rb",
+                        "arguments": {
+                            "remove_energy": rng.randint(1, 10),
+                            "remove_agents": rng.randint(1, 2),
+                        },
+                    }
+                )
+            stacks.append(
+                {
+                    "cell_loc": {"x": x, "y": y},
+                    "move_cost": rng.randint(1, 5),
+                    "contents": contents,
+                }
+            )
+    return {
+        "settings": {
+            "world_info": {
+                "size": {"width": size, "height": size},
+                "seed": seed,
+                "world_file_levels": {"high": 12, "mid": 7, "low": 1},
+                "agent_energy": 500,
+            }
+        },
+        "spawn_locs": [{"x": 0, "y": 0, "type": "any"}],  # pyright: ignore[reportAssignmentType]
+        "cell_types": {
+            "fire_cells": [{"x": 1, "y": 1}],
+            "killer_cells": [{"x": 2, "y": 2}],
+            "charging_cells": [{"x": 3, "y": 3}],
+        },
+        "stacks": stacks,  # pyright: ignore[reportAssignmentType]
+    }
+
+
+def time_load(filename: str, repeat: int) -> tuple[float, float]:
+    load_times: list[float] = []
+    build_times: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        loaded = WorldFileParser.load_world_file(filename)
+        middle = time.perf_counter()
+        assert loaded is not None
+        world = AegisWorld()
+        world.build_world(loaded.world_file)
+        end = time.perf_counter()
+        load_times.append(middle - start)
+        build_times.append(end - middle)
+    return min(load_times), min(build_times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark AEGIS world file formats")
+    _ = parser.add_argument("--size", type=int, default=512)
+    _ = parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    size: int = args.size
+    repeat: int = args.repeat
+
+    # the benchmark worlds are larger than the default world size cap
+    Constants.WORLD_MAX = max(Constants.WORLD_MAX, size)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        json_file = os.path.join(tmp_dir, "bench.world")
+        binary_file = os.path.join(tmp_dir, "bench.bworld")
+        with open(json_file, "w") as file:
+            json.dump(generate_world(size), file, indent=2)
+        _ = BinaryWorldFile.compile_world_file(json_file, binary_file)
+
+        # AegisWorld writes the agent world file to the working directory
+        cwd = os.getcwd()
+        os.chdir(tmp_dir)
+        try:
+            json_load, json_build = time_load(json_file, repeat)
+            binary_load, binary_build = time_load(binary_file, repeat)
+        finally:
+            os.chdir(cwd)
+
+        print(f"World size  : {size}x{size}")
+        print(
+            f"File size   : json {os.path.getsize(json_file)} bytes, binary {os.path.getsize(binary_file)} bytes"
+        )
+        print(
+            f"JSON        : load {json_load * 1000:9.2f} ms, build {json_build * 1000:9.2f} ms"
+        )
+        print(
+            f"Binary      : load {binary_load * 1000:9.2f} ms, build {binary_build * 1000:9.2f} ms"
+        )
+        print(f"Load speedup: {json_load / binary_load:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Agent world information loading benchmark.
+
+Compares an agent building its world grid from the old text
+WorldInfoFile.out (one regex split per cell) against the binary world
+information, read from a memory mapped file or decoded from the inline
+CONNECT_OK payload.
+
+Run from the repository root:
+    python benchmarks/bench_world_info.py [--size N] [--repeat N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from a3.aegis_parser import AegisParser  # noqa: E402
+from aegis.common.commands.aegis_commands import CONNECT_OK  # noqa: E402
+from aegis.common.world.cell import InternalCell  # noqa: E402
+from aegis.common.world.world_info_file import WorldInfoFile  # noqa: E402
+
+
+def generate_grid(size: int, seed: int = 12345) -> list[list[InternalCell]]:
+    rng = random.Random(seed)
+    grid = [[InternalCell(x, y) for y in range(size)] for x in range(size)]
+    for column in grid:
+        for cell in column:
+            cell.set_normal_cell()
+            if rng.random() < 0.05:
+                cell.set_fire_cell()
+            cell.move_cost = rng.randint(1, 5)
+    return grid
+
+
+def write_text_world_info(grid: list[list[InternalCell]], filename: str) -> None:
+    # the format AegisWorld wrote before the binary world information
+    with open(filename, "w") as writer:
+        _ = writer.write(f"Size: ( WIDTH {len(grid)} , HEIGHT {len(grid[0])} )\n")
+        for x, column in enumerate(grid):
+            for y, cell in enumerate(column):
+                fire = "+F" if cell.is_fire_cell() else "-F"
+                killer = "+K" if cell.is_killer_cell() else "-K"
+                charging = "+C" if cell.is_charging_cell() else "-C"
+                _ = writer.write(
+                    f"[({x},{y}),({fire},{killer},{charging}),False,{cell.move_cost}]\n"
+                )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark agent world information")
+    _ = parser.add_argument("--size", type=int, default=30)
+    _ = parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    size: int = args.size
+    repeat: int = args.repeat
+
+    grid = generate_grid(size)
+    data = WorldInfoFile.encode(grid, include_move_costs=True)
+    inline = CONNECT_OK.encode_world_data(data)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        text_file = os.path.join(tmp_dir, "WorldInfoFile.out")
+        binary_file = os.path.join(tmp_dir, "WorldInfoFile.bin")
+        write_text_world_info(grid, text_file)
+        WorldInfoFile.write(binary_file, data)
+
+        text = timeit.timeit(lambda: AegisParser.build_world(text_file), number=repeat)
+        binary = timeit.timeit(
+            lambda: AegisParser.build_world(binary_file), number=repeat
+        )
+        inline_time = timeit.timeit(
+            lambda: AegisParser.build_world_from_data(
+                CONNECT_OK.decode_world_data(inline)
+            ),
+            number=repeat,
+        )
+
+        print(f"World size   : {size}x{size}")
+        print(
+            f"Size         : text {os.path.getsize(text_file)} bytes, binary {len(data)} bytes, inline {len(inline)} chars"
+        )
+        print(f"Text         : {text / repeat * 1000:8.3f} ms")
+        print(f"Binary mmap  : {binary / repeat * 1000:8.3f} ms")
+        print(f"Binary inline: {inline_time / repeat * 1000:8.3f} ms")
+        print(f"Speedup      : {text / binary:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
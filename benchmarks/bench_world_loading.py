@@ -0,0 +1,76 @@
+"""
+Startup world loading benchmark.
+
+Compares the old startup path, where the world file was read and parsed four
+times and the config was loaded at import time by two modules, against the
+single-parse loading stage used by `Aegis.start_up`.
+
+Run from the repository root:
+    python benchmarks/bench_world_loading.py [--world worlds/<name>.world] [--repeat N]
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from aegis.parsers.config_parser import ConfigParser  # noqa: E402
+from aegis.parsers.world_file_parser import WorldFileParser  # noqa: E402
+
+CONFIG_FILE = "sys_files/aegis_config.json"
+
+
+def largest_world(directory: str = "worlds") -> str:
+    worlds = [
+        os.path.join(directory, name)
+        for name in os.listdir(directory)
+        if name.endswith(".world")
+    ]
+    return max(worlds, key=os.path.getsize)
+
+
+def legacy_startup(world_filename: str) -> None:
+    # the two import time config loads
+    for _ in range(2):
+        with open(CONFIG_FILE) as file:
+            _ = json.load(file)["Enable_Move_Cost"]
+    # ReplayFileWriter.open_replay_file
+    with open(world_filename) as file:
+        _ = file.read()
+    _ = ConfigParser.parse_config_file(CONFIG_FILE)
+    # Aegis.start_up (result thrown away) and build_world_from_file
+    _ = WorldFileParser.parse_world_file(world_filename)
+    _ = WorldFileParser.parse_world_file(world_filename)
+    # AegisWorld._get_json_world
+    with open(world_filename) as file:
+        _ = json.load(file)
+
+
+def single_parse_startup(world_filename: str) -> None:
+    _ = WorldFileParser.load_world_file(world_filename)
+    _ = ConfigParser.parse_config_file(CONFIG_FILE)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark AEGIS world loading")
+    _ = parser.add_argument("--world", type=str, default=None)
+    _ = parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    world_filename: str = args.world or largest_world()
+    repeat: int = args.repeat
+
+    legacy = timeit.timeit(lambda: legacy_startup(world_filename), number=repeat)
+    single = timeit.timeit(lambda: single_parse_startup(world_filename), number=repeat)
+
+    print(f"World file      : {world_filename} ({os.path.getsize(world_filename)} bytes)")
+    print(f"Legacy startup  : {legacy / repeat * 1000:.3f} ms")
+    print(f"Single parse    : {single / repeat * 1000:.3f} ms")
+    print(f"Speedup         : {legacy / single:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Large world build benchmark.
+
+Generates worlds with `aegis.tools.generate_world` and measures the time and
+traced memory of creating the bare `InternalWorld` grid and of building the
+full `AegisWorld` from the generated world, at sizes well beyond the default
+World_Max of 30 (256x256 and 1024x1024 by default).
+
+Run from the repository root:
+    python benchmarks/bench_world_size.py [--sizes 256 1024]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from aegis.common.world.world import InternalWorld  # noqa: E402
+from aegis.parsers.helper.world_file_type import WorldFileType  # noqa: E402
+from aegis.parsers.world_file_parser import WorldFileParser  # noqa: E402
+from aegis.tools.generate_world import generate_world  # noqa: E402
+from aegis.world.aegis_world import AegisWorld  # noqa: E402
+
+
+def measure(build: Callable[[], object]) -> tuple[float, float]:
+    """Returns the seconds and traced MiB kept by `build`, measured separately."""
+    gc.collect()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    del result
+    gc.collect()
+
+    tracemalloc.start()
+    result = build()
+    traced = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return elapsed, traced / 2**20
+
+
+def build_internal_world(size: int) -> InternalWorld:
+    return InternalWorld(width=size, height=size, max_size=size)
+
+
+def build_aegis_world(size: int, data: WorldFileType) -> AegisWorld:
+    world_file = WorldFileParser.parse_world_data(data)
+    assert world_file is not None
+    world = AegisWorld()
+    world.world_max = size
+    world.build_world(world_file)
+    return world
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    _ = parser.add_argument("--sizes", type=int, nargs="+", default=[256, 1024])
+    _ = parser.add_argument("--seed", type=int, default=12345)
+    args = parser.parse_args()
+
+    print(f"{'size':>10} {'phase':<14} {'time':>10} {'memory':>12} {'per cell':>10}")
+    for size in args.sizes:
+        cells = size * size
+        start = time.perf_counter()
+        data = generate_world(size, size, args.seed)
+        generate = time.perf_counter() - start
+        print(f"{size:>4}x{size:<5} {'generate':<14} {generate:>9.2f}s")
+
+        phases: list[tuple[str, Callable[[], object]]] = [
+            ("InternalWorld", lambda: build_internal_world(size)),
+            ("AegisWorld", lambda: build_aegis_world(size, data)),
+        ]
+        for phase, build in phases:
+            elapsed, memory = measure(build)
+            print(
+                f"{size:>4}x{size:<5} {phase:<14} {elapsed:>9.2f}s {memory:>8.1f} MiB "
+                + f"{memory * 2**20 / cells:>6.0f} B"
+            )
+
+
+if __name__ == "__main__":
+    main()
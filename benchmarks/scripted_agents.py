@@ -0,0 +1,198 @@
+"""
+Scripted agents for the AEGIS simulation benchmarks.
+
+Each agent is a thread speaking the agent protocol directly over an
+`AegisSocket`, so a single benchmark process can drive 100 agents without
+starting 100 interpreters (`BaseAgent` is a per-process singleton). The
+policies are deliberately simple and seeded so runs are repeatable:
+
+- `RandomWalker` moves in a random direction every round.
+- `Digger` digs rubble on its cell, otherwise walks.
+- `Saver` saves survivors and digs rubble on its cell, sleeps on charging
+  cells when low on energy, otherwise walks.
+"""
+
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from a3.aegis_parser import AegisParser  # noqa: E402
+from aegis.common import AgentID, CellType, Constants, Direction  # noqa: E402
+from aegis.common.commands.agent_command import AgentCommand  # noqa: E402
+from aegis.common.commands.agent_commands import (  # noqa: E402
+    CONNECT,
+    END_TURN,
+    MOVE,
+    SAVE_SURV,
+    SLEEP,
+    TEAM_DIG,
+)
+from aegis.common.commands.aegis_commands import (  # noqa: E402
+    CONNECT_OK,
+    DEATH_CARD,
+    DISCONNECT,
+    MOVE_RESULT,
+    ROUND_START,
+    SAVE_SURV_RESULT,
+    SLEEP_RESULT,
+    TEAM_DIG_RESULT,
+)
+from aegis.common.network.aegis_socket import AegisSocket  # noqa: E402
+from aegis.common.network.aegis_socket_exception import (  # noqa: E402
+    AegisSocketException,
+)
+from aegis.common.network.loopback_transport import LoopbackListener  # noqa: E402
+from aegis.common.world.info import CellInfo  # noqa: E402
+from aegis.common.world.objects import Rubble, Survivor, SurvivorGroup  # noqa: E402
+
+MOVE_DIRECTIONS = [
+    direction for direction in Direction if direction != Direction.CENTER
+]
+
+
+class ScriptedAgent(threading.Thread):
+    """An agent thread that picks one command each round from its policy."""
+
+    def __init__(
+        self,
+        group_name: str,
+        seed: int,
+        host: str = "localhost",
+        port: int = 0,
+        listener: LoopbackListener | None = None,
+    ) -> None:
+        super().__init__(daemon=True)
+        self.group_name = group_name
+        self.host = host
+        self.port = port or Constants.AGENT_PORT
+        self.listener = listener
+        self.rng = random.Random(seed)
+        self.agent_id = AgentID(-1, -1)
+        self.energy = 0
+        self.cell: CellInfo | None = None
+        self.rounds = 0
+        self.connected = threading.Event()
+        self._socket = AegisSocket()
+
+    def connect(self, timeout: float = 10.0) -> None:
+        """Connects to the kernel, retrying until it is listening."""
+        deadline = time.monotonic() + timeout
+        if self.listener is not None:
+            self._socket.connect_transport(self.listener.connect())
+        else:
+            while True:
+                try:
+                    self._socket.connect(self.host, self.port)
+                    break
+                except AegisSocketException:
+                    if time.monotonic() > deadline:
+                        raise
+                    time.sleep(0.05)
+        self._socket.send_message(str(CONNECT(self.group_name)))
+        message = self._socket.read_message()
+        command = AegisParser.parse_aegis_command(message) if message else None
+        if not isinstance(command, CONNECT_OK):
+            raise AegisSocketException(f"Expected CONNECT_OK, got {message!r}")
+        self.agent_id = command.new_agent_id
+        self.energy = command.energy_level
+        self.connected.set()
+
+    def run(self) -> None:
+        try:
+            while True:
+                message = self._socket.read_message()
+                if message is None:
+                    continue
+                command = AegisParser.parse_aegis_command(message)
+                if isinstance(command, ROUND_START):
+                    self.rounds += 1
+                    self._socket.send_message(str(self.choose()))
+                    self._socket.send_message(str(END_TURN()))
+                elif isinstance(
+                    command, (MOVE_RESULT, TEAM_DIG_RESULT, SAVE_SURV_RESULT)
+                ):
+                    self.energy = command.energy_level
+                    self.cell = command.surround_info.get_current_info()
+                elif isinstance(command, SLEEP_RESULT):
+                    if command.was_successful:
+                        self.energy = command.charge_energy
+                elif isinstance(command, (DEATH_CARD, DISCONNECT)):
+                    break
+        except AegisSocketException:
+            pass
+        finally:
+            self._socket.disconnect()
+
+    def choose(self) -> AgentCommand:
+        return MOVE(self.rng.choice(MOVE_DIRECTIONS))
+
+
+class RandomWalker(ScriptedAgent):
+    pass
+
+
+class Digger(ScriptedAgent):
+    def choose(self) -> AgentCommand:
+        if self.cell is not None and isinstance(self.cell.top_layer, Rubble):
+            return TEAM_DIG()
+        return super().choose()
+
+
+class Saver(ScriptedAgent):
+    def choose(self) -> AgentCommand:
+        if self.cell is not None:
+            top_layer = self.cell.top_layer
+            if isinstance(top_layer, (Survivor, SurvivorGroup)):
+                return SAVE_SURV()
+            if isinstance(top_layer, Rubble):
+                return TEAM_DIG()
+            if self.cell.cell_type == CellType.CHARGING_CELL and self.energy < 100:
+                return SLEEP()
+        return super().choose()
+
+
+AGENT_TYPES: dict[str, type[ScriptedAgent]] = {
+    "walker": RandomWalker,
+    "digger": Digger,
+    "saver": Saver,
+}
+
+
+def start_agents(
+    agent_type: str,
+    count: int,
+    seed: int,
+    port: int = 0,
+    listener: LoopbackListener | None = None,
+) -> list[ScriptedAgent]:
+    """
+    Connects and starts `count` agents, one at a time.
+
+    Args:
+        agent_type: A key of `AGENT_TYPES`, or "mix" to cycle through them.
+        count: How many agents to start.
+        seed: Seeds each agent's policy.
+        port: The kernel's agent port, defaults to `Constants.AGENT_PORT`.
+        listener: Connect to a kernel in this process instead of over TCP.
+
+    Returns:
+        The running agents.
+    """
+    if agent_type == "mix":
+        types = list(AGENT_TYPES.values())
+    else:
+        types = [AGENT_TYPES[agent_type]]
+    agents: list[ScriptedAgent] = []
+    for index in range(count):
+        agent = types[index % len(types)](
+            "bench", seed + index, port=port, listener=listener
+        )
+        # the kernel accepts agents one at a time, so connect them in order
+        agent.connect()
+        agent.start()
+        agents.append(agent)
+    return agents
@@ -15,6 +15,8 @@ class RunnerArgs:
     world_file: str
     verbose: bool
     agent_amount: int
+    in_process: bool
+    endpoint: str | None
 
 
 class AegisRunner:
@@ -25,6 +27,7 @@ class AegisRunner:
         world_file: str,
         agent_name: str,
         verbose: bool = False,
+        endpoint: str | None = None,
     ):
         """
         Initialize the AEGIS runner with configuration parameters.
@@ -35,6 +38,8 @@ class AegisRunner:
             world_file (str): Name of the world file to use
             agent_name (str): Name of the agent to run
             verbose (bool): Enable verbose logging
+            endpoint (str | None): Where agents connect to AEGIS, tcp://host:port
+                or unix:///path, defaults to TCP port 6001
         """
         self.curr_dir: str = os.path.dirname(os.path.realpath(__file__))
         self.agent_amount: int = max(1, agent_amount)
@@ -42,6 +47,7 @@ class AegisRunner:
         self.world_file: str = world_file
         self.agent_name: str = agent_name
         self.verbose: bool = verbose
+        self.endpoint: str | None = endpoint
 
         # Setup Python command based on platform
         self.python_command: str = (
@@ -88,6 +94,11 @@ class AegisRunner:
         if os.path.exists(site_packages):
             os.environ["PYTHONPATH"] += os.pathsep + site_packages
 
+        if self.endpoint:
+            # read by the agents' BaseAgent when connecting
+            os.environ["AEGIS_ENDPOINT"] = self.endpoint
+            self._log(f"AEGIS_ENDPOINT set to: {self.endpoint}")
+
         self._log(f"Using Python interpreter: {self.python_command}")
         self._log(f"PYTHONPATH set to: {os.environ['PYTHONPATH']}")
 
@@ -134,6 +145,8 @@ class AegisRunner:
             "-NumRound",
             str(self.rounds),
         ]
+        if self.endpoint:
+            command += ["-Endpoint", self.endpoint]
 
         self._log(f"Running AEGIS: {' '.join(command)}")
         result = subprocess.run(command)
@@ -141,6 +154,24 @@ class AegisRunner:
         if result.returncode != 0:
             print(f"AEGIS run failed with error:\n{result.stderr}")
 
+    def run_in_process(self) -> None:
+        """
+        Run AEGIS and the agents as threads of this interpreter, with no sockets.
+        """
+        sys.path.insert(0, os.path.join(self.curr_dir, "src"))
+        from a3.in_process import find_brain, run_in_process
+
+        brain = find_brain(self.agent_name)
+        self._log(f"Running AEGIS in process with {brain.__name__}")
+        kernel_args = [
+            "-WorldFile",
+            f"worlds/{self.world_file}.world",
+            "-NumRound",
+            str(self.rounds),
+        ]
+        if not run_in_process(kernel_args, [("test", brain)] * self.agent_amount):
+            raise RuntimeError("AEGIS failed to start")
+
     def run(self) -> None:
         """
         Run AEGIS simulation with agents using thread pool.
@@ -196,6 +227,18 @@ def main():
     _ = parser.add_argument(
         "--verbose", "-v", action="store_true", help="Enable verbose logging"
     )
+    _ = parser.add_argument(
+        "--endpoint",
+        type=str,
+        default=None,
+        help="Where agents connect, tcp://host:port or unix:///path "
+        + "(default: TCP port 6001)",
+    )
+    _ = parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Run AEGIS and the agents in this interpreter, with no sockets",
+    )
 
     args: RunnerArgs = parser.parse_args()  # pyright: ignore[reportAssignmentType]
 
@@ -205,10 +248,14 @@ def main():
         world_file=args.world_file,
         agent_name=args.agent_directory,
         verbose=args.verbose,
+        endpoint=args.endpoint,
     )
 
     try:
-        runner.run()
+        if args.in_process:
+            runner.run_in_process()
+        else:
+            runner.run()
     except Exception as e:
         print(f"An error occurred: {e}")
         sys.exit(1)
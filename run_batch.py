@@ -0,0 +1,466 @@
+import argparse
+import contextlib
+import csv
+import datetime
+import json
+import multiprocessing
+import os
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from itertools import product
+from typing import Any
+
+CURR_DIR = os.path.dirname(os.path.realpath(__file__))
+SRC_DIR = os.path.join(CURR_DIR, "src")
+WORLDS_DIR = os.path.join(CURR_DIR, "worlds")
+DEFAULT_CONFIG = os.path.join(CURR_DIR, "sys_files", "aegis_config.json")
+
+CSV_FIELDS = [
+    "world",
+    "seed",
+    "agents",
+    "config",
+    "status",
+    "rounds",
+    "wall_s",
+    "simulation_s",
+    "group",
+    "score",
+    "number_saved",
+    "number_saved_alive",
+    "number_saved_dead",
+    "number_predicted_right",
+    "number_predicted_wrong",
+]
+
+
+@dataclass
+class BatchArgs:
+    agent_directory: str
+    worlds: list[str]
+    seeds: list[int] | None
+    agent_amount: list[int]
+    configs: list[str]
+    rounds: int
+    workers: int
+    in_process: bool
+    turbo: bool
+    timeout: float
+    output: str
+    csv: str | None
+
+
+@dataclass
+class Simulation:
+    """One point of the batch grid.
+
+    Attributes:
+        world (str): Path of the world file.
+        seed (int | None): Random seed, or None for the world file's own seed.
+        agents (int): Number of agents to run.
+        config (str): Path of the config file.
+        agent_name (str): Directory of the agent in src/agents.
+        rounds (int): Number of simulation rounds.
+        in_process (bool): Run the agents as threads of the kernel's process.
+        turbo (bool): Run the kernel headless, with no replay or viewer output.
+        timeout (float): Seconds before the simulation is stopped.
+    """
+
+    world: str
+    seed: int | None
+    agents: int
+    config: str
+    agent_name: str
+    rounds: int
+    in_process: bool
+    turbo: bool
+    timeout: float
+
+
+def _python_command() -> str:
+    venv_python = os.path.join(
+        CURR_DIR,
+        ".venv",
+        "Scripts" if platform.system() == "Windows" else "bin",
+        "python.exe" if platform.system() == "Windows" else "python",
+    )
+    return venv_python if os.path.exists(venv_python) else sys.executable
+
+
+def _free_endpoint(directory: str) -> str:
+    """
+    Picks an endpoint no other simulation uses.
+
+    A Unix domain socket in the simulation's own directory where supported,
+    otherwise a TCP port the OS reports as free.
+    """
+    if hasattr(socket, "AF_UNIX"):
+        return f"unix://{os.path.join(directory, 'aegis.sock')}"
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+        probe.bind(("127.0.0.1", 0))
+        return f"tcp://127.0.0.1:{probe.getsockname()[1]}"
+
+
+def _wait_for_listener(endpoint: str, kernel: subprocess.Popen[bytes]) -> None:
+    if endpoint.startswith("unix://"):
+        path = endpoint[len("unix://") :]
+        deadline = time.monotonic() + 30
+        while not os.path.exists(path):
+            if kernel.poll() is not None or time.monotonic() > deadline:
+                return
+            time.sleep(0.01)
+    else:
+        # agents give up if the port isn't open yet, so give the kernel a moment
+        time.sleep(1)
+
+
+def _run_processes(sim: Simulation, directory: str, kernel_args: list[str]) -> None:
+    python = _python_command()
+    endpoint = _free_endpoint(directory)
+    env = dict(os.environ, PYTHONPATH=SRC_DIR, AEGIS_ENDPOINT=endpoint)
+    agent_main = os.path.join(SRC_DIR, "agents", sim.agent_name, "main.py")
+
+    with open(os.path.join(directory, "aegis.log"), "wb") as log:
+        kernel = subprocess.Popen(
+            [python, os.path.join(SRC_DIR, "aegis", "main.py")]
+            + ["-NoKViewer", str(sim.agents), "-Endpoint", endpoint, *kernel_args],
+            cwd=directory,
+            env=env,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+        )
+        _wait_for_listener(endpoint, kernel)
+        agents = [
+            subprocess.Popen(
+                [python, agent_main],
+                cwd=directory,
+                env=env,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            for _ in range(sim.agents)
+        ]
+        try:
+            _ = kernel.wait(timeout=sim.timeout)
+        finally:
+            for process in [kernel, *agents]:
+                if process.poll() is None:
+                    process.kill()
+                    _ = process.wait()
+
+
+def _run_in_process(sim: Simulation, directory: str, kernel_args: list[str]) -> None:
+    # the kernel and its agent threads run in a child process, as a process,
+    # unlike a thread, can be stopped when it runs past the timeout
+    worker = multiprocessing.Process(
+        target=_in_process_worker, args=(sim, directory, kernel_args)
+    )
+    worker.start()
+    worker.join(sim.timeout)
+    if worker.is_alive():
+        worker.kill()
+        worker.join()
+        raise TimeoutError(f"Simulation timed out after {sim.timeout} seconds")
+
+
+def _in_process_worker(
+    sim: Simulation, directory: str, kernel_args: list[str]
+) -> None:
+    if SRC_DIR not in sys.path:
+        sys.path.insert(0, SRC_DIR)
+    from a3.in_process import find_brain, run_in_process
+
+    brain = find_brain(sim.agent_name)
+    cwd = os.getcwd()
+    # the kernel and agents share WorldInfoFile.* through the working directory
+    os.chdir(directory)
+    try:
+        with (
+            open("aegis.log", "w") as log,
+            contextlib.redirect_stdout(log),
+            contextlib.redirect_stderr(log),
+        ):
+            _ = run_in_process(kernel_args, [("test", brain)] * sim.agents)
+    finally:
+        os.chdir(cwd)
+
+
+def run_simulation(sim: Simulation) -> dict[str, Any]:
+    """
+    Runs one simulation in a fresh working directory.
+
+    Args:
+        sim (Simulation): The simulation to run.
+
+    Returns:
+        dict[str, Any]: The simulation settings, its status ("ok",
+            "timeout" or the error), wall time and the kernel's results.
+    """
+    result: dict[str, Any] = asdict(sim)
+    result["config"] = os.path.splitext(os.path.basename(sim.config))[0]
+    result["world"] = os.path.relpath(sim.world, CURR_DIR)
+    with tempfile.TemporaryDirectory(prefix="aegis-batch-") as directory:
+        results_file = os.path.join(directory, "results.json")
+        kernel_args = [
+            "-WorldFile",
+            sim.world,
+            "-NumRound",
+            str(sim.rounds),
+            "-ConfigFile",
+            sim.config,
+            "-ResultsFile",
+            results_file,
+        ]
+        if sim.seed is not None:
+            kernel_args += ["-Seed", str(sim.seed)]
+        if sim.turbo:
+            kernel_args += ["-Turbo", "true"]
+
+        start = time.perf_counter()
+        try:
+            if sim.in_process:
+                _run_in_process(sim, directory, kernel_args)
+            else:
+                _run_processes(sim, directory, kernel_args)
+        except (TimeoutError, subprocess.TimeoutExpired):
+            result["status"] = "timeout"
+        except Exception as e:
+            result["status"] = f"error: {e}"
+        result["wall_s"] = time.perf_counter() - start
+
+        try:
+            with open(results_file) as file:
+                kernel_results: dict[str, Any] = json.load(file)
+        except (OSError, json.JSONDecodeError):
+            result.setdefault("status", "error: no results, " + _log_tail(directory))
+            return result
+
+    result.setdefault("status", "ok")
+    for key in ("seed", "agents_alive", "rounds", "simulation_s", "groups"):
+        result[key] = kernel_results[key]
+    return result
+
+
+def _log_tail(directory: str) -> str:
+    try:
+        with open(os.path.join(directory, "aegis.log"), errors="replace") as log:
+            return " | ".join(log.read().strip().splitlines()[-3:])
+    except OSError:
+        return "no log"
+
+
+def _find_worlds(names: list[str]) -> list[str]:
+    if names == ["all"]:
+        return sorted(
+            os.path.join(WORLDS_DIR, name)
+            for name in os.listdir(WORLDS_DIR)
+            if name.endswith((".world", ".bworld"))
+        )
+    worlds: list[str] = []
+    for name in names:
+        path = name if os.path.exists(name) else os.path.join(WORLDS_DIR, name)
+        if not os.path.exists(path):
+            path += ".world"
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"World file not found: {name}")
+        worlds.append(os.path.abspath(path))
+    return worlds
+
+
+def write_csv(results: list[dict[str, Any]], filename: str) -> None:
+    """
+    Writes one row per group of every simulation.
+
+    Args:
+        results (list[dict[str, Any]]): Results from `run_simulation`.
+        filename (str): The CSV file to write.
+    """
+    with open(filename, "w", newline="") as file:
+        writer = csv.DictWriter(file, CSV_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        for result in results:
+            for group in result.get("groups") or [{}]:
+                writer.writerow(result | group | {"group": group.get("name", "")})
+
+
+def print_summary(results: list[dict[str, Any]]) -> None:
+    """
+    Prints the mean score and saves of every config and agent count.
+
+    Args:
+        results (list[dict[str, Any]]): Results from `run_simulation`.
+    """
+    runs: dict[tuple[str, int], list[dict[str, Any]]] = {}
+    for result in results:
+        runs.setdefault((result["config"], result["agents"]), []).append(result)
+
+    print(f"\n{'config':<24} {'agents':>6} {'runs':>5} {'failed':>6} ", end="")
+    print(f"{'mean score':>10} {'mean saved':>10} {'mean rounds':>11}")
+    for (config, agents), group_runs in sorted(runs.items(), key=str):
+        ok = [run for run in group_runs if run["status"] == "ok"]
+        scores = [_total(run, "score") for run in ok] or [0]
+        saved = [_total(run, "number_saved") for run in ok] or [0]
+        rounds = [run["rounds"] for run in ok] or [0]
+        print(
+            f"{config:<24} {agents:>6} {len(group_runs):>5} "
+            + f"{len(group_runs) - len(ok):>6} "
+            + f"{statistics.fmean(scores):>10.1f} "
+            + f"{statistics.fmean(saved):>10.1f} "
+            + f"{statistics.fmean(rounds):>11.1f}"
+        )
+
+
+def _total(result: dict[str, Any], counter: str) -> int:
+    return sum(group[counter] for group in result.get("groups") or [])
+
+
+def main():
+    """
+    Main entry point with command-line argument parsing.
+    """
+    parser = argparse.ArgumentParser(
+        description="Run AEGIS over a grid of worlds, seeds, agent counts and configs",
+        epilog="Example: python run_batch.py --agent example_agent_a3 --worlds all "
+        + "--seeds 1 2 3 --rounds 100 -o results.json --csv results.csv",
+    )
+    _ = parser.add_argument(
+        "--agent",
+        dest="agent_directory",
+        type=str,
+        required=True,
+        help="Directory of the agent to run",
+    )
+    _ = parser.add_argument(
+        "--worlds",
+        nargs="+",
+        default=["all"],
+        help="World names in worlds/, paths, or 'all' (default: all)",
+    )
+    _ = parser.add_argument(
+        "--seeds",
+        type=int,
+        nargs="+",
+        default=None,
+        help="Random seeds (default: each world's own seed)",
+    )
+    _ = parser.add_argument(
+        "--agent-amount",
+        type=int,
+        nargs="+",
+        default=[1],
+        help="Agent counts to run (default: 1)",
+    )
+    _ = parser.add_argument(
+        "--configs",
+        nargs="+",
+        default=[DEFAULT_CONFIG],
+        help="Config file variants (default: sys_files/aegis_config.json)",
+    )
+    _ = parser.add_argument(
+        "--rounds", type=int, required=True, help="Number of simulation rounds"
+    )
+    _ = parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Simulations to run at once (default: number of CPUs)",
+    )
+    _ = parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Run each simulation's agents as threads of its kernel, with no sockets",
+    )
+    _ = parser.add_argument(
+        "--turbo",
+        action="store_true",
+        help="Run the kernel headless: no replay, viewer or per-round output",
+    )
+    _ = parser.add_argument(
+        "--timeout",
+        type=float,
+        default=600,
+        help="Seconds before a simulation is stopped and recorded as a timeout, "
+        + "in either mode (default: 600)",
+    )
+    _ = parser.add_argument(
+        "-o", "--output", default="batch_results.json", help="JSON summary file"
+    )
+    _ = parser.add_argument("--csv", default=None, help="Also write a CSV summary")
+    args: BatchArgs = parser.parse_args()  # pyright: ignore[reportAssignmentType]
+
+    try:
+        worlds = _find_worlds(args.worlds)
+    except FileNotFoundError as e:
+        print(e)
+        sys.exit(1)
+    seeds: list[int | None] = list(args.seeds) if args.seeds else [None]
+    simulations = [
+        Simulation(
+            world,
+            seed,
+            agents,
+            os.path.abspath(config),
+            args.agent_directory,
+            args.rounds,
+            args.in_process,
+            args.turbo,
+            args.timeout,
+        )
+        for world, seed, agents, config in product(
+            worlds, seeds, args.agent_amount, args.configs
+        )
+    ]
+
+    print(f"Running {len(simulations)} simulations on {args.workers} workers")
+    start = time.perf_counter()
+    results: list[dict[str, Any]] = [{} for _ in simulations]
+    done = 0
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures = {
+            executor.submit(run_simulation, sim): index
+            for index, sim in enumerate(simulations)
+        }
+        for future in as_completed(futures):
+            # keep the results in grid order, whatever order they finish in
+            result = results[futures[future]] = future.result()
+            done += 1
+            print(
+                f"[{done}/{len(simulations)}] {result['world']} "
+                + f"seed {result['seed']} agents {result['agents']} "
+                + f"config {result['config']}: {result['status']}, "
+                + f"score {_total(result, 'score')}, {result['wall_s']:.1f} s"
+            )
+    elapsed = time.perf_counter() - start
+
+    report = {
+        "meta": {
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "agent": args.agent_directory,
+            "rounds": args.rounds,
+            "in_process": args.in_process,
+            "turbo": args.turbo,
+            "workers": args.workers,
+            "elapsed_s": elapsed,
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as file:
+        json.dump(report, file, indent=2)
+    if args.csv:
+        write_csv(results, args.csv)
+
+    print_summary(results)
+    print(f"\n{len(results)} simulations in {elapsed:.1f} s, results in {args.output}")
+    if args.csv:
+        print(f"CSV summary in {args.csv}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,14 @@
-from typing import override
+from __future__ import annotations
 
-import numpy as np
-from numpy.typing import NDArray
+from typing import TYPE_CHECKING, override
 
 from aegis.common.commands.aegis_command import AegisCommand
 from aegis.common.world.info import SurroundInfo
 
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
 
 class SAVE_SURV_RESULT(AegisCommand):
     """
@@ -19,6 +22,15 @@ class SAVE_SURV_RESULT(AegisCommand):
         all_unique_labels (NDArray[np.int64] | None): An array of all unique labels for prediction.
     """
 
+    __slots__ = (
+        "energy_level",
+        "surround_info",
+        "_pred_info",
+        "surv_saved_id",
+        "image_to_predict",
+        "all_unique_labels",
+    )
+
     def __init__(
         self,
         energy_level: int,
@@ -1,15 +1,29 @@
 import base64
 import gzip
 import json
+import os
 import sys
 import time
+from collections.abc import Sequence
 from datetime import datetime
+from typing import cast
+
+import numpy as np
+from numpy.typing import NDArray
 
 from a3.agent_handler import AgentHandler
+from a3.checkpoint import Checkpoint, CheckpointFile, CheckpointWriter
 from aegis.agent_control.network.agent_crashed_exception import AgentCrashedException
 from aegis.assist.config_settings import ConfigSettings
+from aegis.assist.metrics_server import (
+    MetricsServer,
+    MetricsText,
+    resident_memory_bytes,
+)
+from aegis.assist.on_demand_profiler import OnDemandProfiler
 from aegis.assist.parameters import Parameters
 from aegis.assist.replay_file_writer import ReplayFileWriter
+from aegis.assist.round_profiler import RoundProfiler
 from aegis.assist.state import State
 from aegis.command_line_reader.command_line_reader import CommandLineReader
 from aegis.command_line_reader.option import Option
@@ -18,10 +32,11 @@ from aegis.common import (
     AgentIDList,
     Constants,
     Direction,
+    InternalLocation,
     LifeSignals,
-    Utility,
 )
 from aegis.common.commands.agent_command import AgentCommand
+from aegis.common.commands.command_dispatcher import CommandDispatcher
 from aegis.common.commands.agent_commands import (
     END_TURN,
     MOVE,
@@ -48,14 +63,19 @@ from aegis.common.commands.aegis_commands import (
     TEAM_DIG_RESULT,
 )
 from aegis.common.network.aegis_socket_exception import AegisSocketException
+from aegis.common.parsers.aegis_parser_exception import AegisParserException
+from aegis.common.network.transport import TransportListener
+from aegis.common.world.agent import Agent
 from aegis.common.world.cell import InternalCell
 from aegis.common.world.info.cell_info import CellInfo
 from aegis.common.world.objects import Rubble, Survivor, SurvivorGroup, WorldObject
 from aegis.parsers.config_parser import ConfigParser
+from aegis.parsers.loaded_world_file import LoadedWorldFile
 from aegis.parsers.world_file_parser import WorldFileParser
 from aegis.server_websocket import WebSocketServer
 from aegis.agent_predictions.prediction_handler import PredictionHandler
 from aegis.world.aegis_world import AegisWorld
+from aegis.world.agent_batch import AgentBatch
 
 
 class Aegis:
@@ -75,14 +95,33 @@ class Aegis:
         self._OBSERVE_list: list[OBSERVE] = []
         self._TEAM_DIG_RESULT_list: AgentIDList = AgentIDList()
         self._SAVE_SURV_RESULT_list: AgentIDList = AgentIDList()
-        self._MOVE_RESULT_list: AgentIDList = AgentIDList()
-        self._SLEEP_RESULT_list: AgentIDList = AgentIDList()
+        self._MOVE_RESULT_list: list[AgentID] = []
+        self._SLEEP_RESULT_list: list[AgentID] = []
         self._PREDICT_RESULT_list: AgentIDList = AgentIDList()
         self._OBSERVE_RESULT_list: list[OBSERVE] = []
         self._crashed_agents: AgentIDList = AgentIDList()
         self._aegis_world: AegisWorld = AegisWorld()
         self._ws_server: WebSocketServer = WebSocketServer()
         self._prediction_handler: PredictionHandler | None = None
+        self._loaded_world_file: LoadedWorldFile | None = None
+        self._agent_command_dispatcher: CommandDispatcher = CommandDispatcher()
+        self._register_agent_command_handlers()
+        self._profiler: RoundProfiler = RoundProfiler()
+        self._metrics_server: MetricsServer | None = None
+        self._on_demand_profiler: OnDemandProfiler | None = None
+        self._rounds_completed: int = 0
+        self._simulation_started: float | None = None
+        self._checkpoint_writer: CheckpointWriter | None = None
+
+    def _register_agent_command_handlers(self) -> None:
+        dispatcher = self._agent_command_dispatcher
+        dispatcher.register(TEAM_DIG, self._TEAM_DIG_list.append)
+        dispatcher.register(SAVE_SURV, self._SAVE_SURV_list.append)
+        dispatcher.register(PREDICT, self._PREDICT_list.append)
+        dispatcher.register(MOVE, self._MOVE_list.append)
+        dispatcher.register(SLEEP, self._SLEEP_list.append)
+        dispatcher.register(OBSERVE, self._OBSERVE_list.append)
+        dispatcher.register(SEND_MESSAGE, self._handle_SEND_MESSAGE)
 
     def read_command_line(self, args: list[str]) -> bool:
         try:
@@ -94,6 +133,18 @@ class Aegis:
                 ("WorldFile", CommandLineReader.STRING, True),
                 ("NumRound", CommandLineReader.INT, True),
                 ("WaitForClient", CommandLineReader.BOOL, False),
+                ("MetricsFile", CommandLineReader.STRING, False),
+                ("TraceFile", CommandLineReader.STRING, False),
+                ("MetricsPort", CommandLineReader.INT, False),
+                ("ProfileRounds", CommandLineReader.INT, False),
+                ("Endpoint", CommandLineReader.STRING, False),
+                ("Seed", CommandLineReader.INT, False),
+                ("ConfigFile", CommandLineReader.STRING, False),
+                ("ResultsFile", CommandLineReader.STRING, False),
+                ("Turbo", CommandLineReader.BOOL, False),
+                ("CheckpointEvery", CommandLineReader.INT, False),
+                ("CheckpointFile", CommandLineReader.STRING, False),
+                ("Resume", CommandLineReader.STRING, False),
             ]
 
             for name, value_type, is_required in options:
@@ -109,7 +160,8 @@ class Aegis:
 
             for name, value_type, _ in options:
                 option = command_line_reader.get_option(name)
-                if option and option.is_set and option.value:
+                # `is not None` so that 0, e.g. for -Seed, is still read
+                if option and option.is_set and option.value is not None:
                     if name == "NoKViewer":
                         self._parameters.number_of_agents = int(option.value)
                     elif name == "ProcFile":
@@ -120,6 +172,30 @@ class Aegis:
                         self._parameters.number_of_rounds = int(option.value)
                     elif name == "WaitForClient":
                         self._ws_server.set_wait_for_client(bool(option.value))
+                    elif name == "MetricsFile":
+                        self._parameters.metrics_filename = str(option.value)
+                    elif name == "TraceFile":
+                        self._parameters.trace_filename = str(option.value)
+                    elif name == "MetricsPort":
+                        self._parameters.metrics_port = int(option.value)
+                    elif name == "ProfileRounds":
+                        self._parameters.profile_rounds = int(option.value)
+                    elif name == "Endpoint":
+                        self._parameters.agent_endpoint = str(option.value)
+                    elif name == "Seed":
+                        self._parameters.random_seed = int(option.value)
+                    elif name == "ConfigFile":
+                        self._parameters.config_filename = str(option.value)
+                    elif name == "ResultsFile":
+                        self._parameters.results_filename = str(option.value)
+                    elif name == "Turbo":
+                        self._parameters.turbo = bool(option.value)
+                    elif name == "CheckpointEvery":
+                        self._parameters.checkpoint_every = int(option.value)
+                    elif name == "CheckpointFile":
+                        self._parameters.checkpoint_filename = str(option.value)
+                    elif name == "Resume":
+                        self._parameters.resume_filename = str(option.value)
 
             return True
         except Exception:
@@ -139,20 +215,83 @@ class Aegis:
         s += "\t                          build the world from upon startup.\n"
         s += "\t-NumRound <#>        = Set number of rounds in simulation."
         s += "\t-WaitForClient <bool> = Set to true to wait for client to connect."
+        s += "\t-MetricsFile <file>  = Write the time spent in each phase of every\n"
+        s += "\t                          round to this file, one JSON line per round.\n"
+        s += "\t-TraceFile <file>    = Write a Chrome trace of every round to this\n"
+        s += "\t                          file, viewable in Perfetto.\n"
+        s += "\t-MetricsPort <#>     = Serve live Prometheus metrics on\n"
+        s += "\t                          http://127.0.0.1:<#>/metrics.\n"
+        s += "\t-ProfileRounds <#>   = Number of rounds to profile after SIGUSR1\n"
+        s += "\t                          (cProfile) or SIGUSR2 (tracemalloc).\n"
+        s += "\t                          Not required, default 10.\n"
+        s += "\t-Endpoint <endpoint> = Where agents connect, tcp://host:port or\n"
+        s += "\t                          unix:///path/to/socket. Agents read it from\n"
+        s += "\t                          the AEGIS_ENDPOINT environment variable.\n"
+        s += "\t                          Not required, default tcp://:6001.\n"
+        s += "\t-Seed <#>            = Use this random seed instead of the world's.\n"
+        s += "\t-ConfigFile <file>   = The config file to use.\n"
+        s += "\t                          Not required, default\n"
+        s += "\t                          sys_files/aegis_config.json.\n"
+        s += "\t-ResultsFile <file>  = Write the final group results to this file\n"
+        s += "\t                          as JSON.\n"
+        s += "\t-Turbo <bool>        = Set to true to run headless for training and\n"
+        s += "\t                          batch runs: no replay file, no viewer and\n"
+        s += "\t                          no per-round output, only the results.\n"
+        s += "\t-CheckpointEvery <#> = Write a checkpoint every <#> rounds, from a\n"
+        s += "\t                          background thread.\n"
+        s += "\t-CheckpointFile <file> = The file to write checkpoints to, {round}\n"
+        s += "\t                          in the name keeps one file per checkpoint.\n"
+        s += "\t                          Not required, default checkpoint.ckpt.\n"
+        s += "\t-Resume <file>       = Resume the simulation from this checkpoint of\n"
+        s += "\t                          the same world. Agents connect again and\n"
+        s += "\t                          take the place of their group's agents.\n"
+        s += "\t                          With -Seed the simulation plays on with\n"
+        s += "\t                          that seed, to fork experiments.\n"
         return s
 
+    def set_agent_listener(self, listener: TransportListener) -> None:
+        """
+        Accepts agents on `listener` instead of `Constants.AGENT_PORT`.
+
+        Must be called before `start_up`. With a `LoopbackListener` the kernel
+        and its agents can run in one interpreter, see `a3.in_process`.
+        """
+        self._agent_handler.set_agent_listener(listener)
+
     def start_up(self) -> bool:
+        loaded_world_file = WorldFileParser.load_world_file(
+            self._parameters.world_filename
+        )
+        if loaded_world_file is None:
+            print(
+                f'Aegis  : Unable to parse world file from "{self._parameters.world_filename}"',
+                file=sys.stderr,
+            )
+            return False
+        self._loaded_world_file = loaded_world_file
+
         try:
-            self._agent_handler.set_agent_handler_port(Constants.AGENT_PORT)
-            if not ReplayFileWriter.open_replay_file(
-                self._parameters.replay_filename, self._parameters.world_filename
+            # a listener set before start up, e.g. for in-process agents, wins
+            if self._agent_handler.listener is None:
+                if self._parameters.agent_endpoint:
+                    self._agent_handler.set_agent_handler_endpoint(
+                        self._parameters.agent_endpoint
+                    )
+                else:
+                    self._agent_handler.set_agent_handler_port(Constants.AGENT_PORT)
+            if self._parameters.turbo:
+                # every replay write is a no-op without a replay file
+                ReplayFileWriter.close_replay_file()
+            elif ReplayFileWriter.open_replay_file(
+                self._parameters.replay_filename, loaded_world_file.content
             ):
+                print(f"Aegis  : Protocol file is: {self._parameters.replay_filename}")
+            else:
                 print(
                     f"Aegis  : Could not open protocol file: {self._parameters.replay_filename}",
                     file=sys.stderr,
                 )
                 return False
-            print(f"Aegis  : Protocol file is: {self._parameters.replay_filename}")
         except AegisSocketException:
             print("Aegis  : Could not open agent port.", file=sys.stderr)
             return False
@@ -165,11 +304,11 @@ class Aegis:
 
         try:
             config_settings = ConfigParser.parse_config_file(
-                "sys_files/aegis_config.json"
+                self._parameters.config_filename
             )
             if config_settings is None:
                 print(
-                    'aegis  : Unable to parse config file from "sys_files/aegis_config.json"',
+                    f'aegis  : Unable to parse config file from "{self._parameters.config_filename}"',
                     file=sys.stderr,
                 )
                 return False
@@ -178,52 +317,255 @@ class Aegis:
             self._agent_handler.send_messages_to_all_groups = (
                 self._parameters.config_settings.send_messages_to_all_groups
             )
+            self._aegis_world.move_cost_enabled = (
+                self._parameters.config_settings.move_cost_enabled
+            )
+            self._aegis_world.world_max = self._parameters.config_settings.world_max
+            self._aegis_world.verbose = not self._parameters.turbo
+            self._agent_handler.verbose = not self._parameters.turbo
             if self._parameters.config_settings.predictions_enabled:
                 self._prediction_handler = PredictionHandler()
         except Exception:
             print(
-                'Aegis  : Unable to parse config file from "sys_files/aegis_config.json"',
+                f'Aegis  : Unable to parse config file from "{self._parameters.config_filename}"',
                 file=sys.stderr,
             )
             return False
 
         try:
-            _aegis_world_file = WorldFileParser.parse_world_file(
-                self._parameters.world_filename
+            self._profiler = RoundProfiler(
+                self._parameters.metrics_filename, self._parameters.trace_filename
             )
-            if _aegis_world_file is None:
-                print(
-                    f'Aegis  : Unable to parse world file from "{self._parameters.world_filename}"',
-                    file=sys.stderr,
+        except OSError as e:
+            print(f"Aegis  : Unable to open profiling output: {e}", file=sys.stderr)
+            return False
+
+        if self._parameters.metrics_port > 0:
+            try:
+                self._metrics_server = MetricsServer(
+                    self._parameters.metrics_port, self._collect_metrics
                 )
+            except OSError as e:
+                print(f"Aegis  : Unable to start metrics server: {e}", file=sys.stderr)
                 return False
-        except Exception:
-            print(
-                f'Aegis  : Unable to parse world file from "{self._parameters.world_filename}"',
-                file=sys.stderr,
+            self._metrics_server.start()
+
+        if self._parameters.checkpoint_every > 0:
+            self._checkpoint_writer = CheckpointWriter(
+                self._parameters.checkpoint_filename
             )
-            return False
 
         self._state = State.IDLE
         self._started_idling = 0
         return True
 
+    def install_profiler_signal_handlers(self) -> bool:
+        """
+        Makes SIGUSR1 and SIGUSR2 start a cProfile or tracemalloc capture of
+        the next rounds of `run_state`, until `shutdown` restores the previous
+        handlers.
+
+        Only the standalone kernel does this, as signal handlers belong to
+        the whole process, which may run other kernels or its own handlers.
+        Other kernels have no on-demand profiler at all.
+
+        Returns:
+            True if the handlers were installed.
+        """
+        if self._on_demand_profiler is None:
+            self._on_demand_profiler = OnDemandProfiler(
+                os.path.splitext(self._parameters.replay_filename)[0],
+                self._parameters.profile_rounds,
+            )
+        return self._on_demand_profiler.install_signal_handlers()
+
     def build_world(self) -> bool:
-        return self._aegis_world.build_world_from_file(
-            self._parameters.world_filename, self._ws_server
+        if self._loaded_world_file is None:
+            return False
+        if self._parameters.random_seed is not None:
+            self._loaded_world_file.world_file.random_seed = (
+                self._parameters.random_seed
+            )
+        if not self._aegis_world.build_world_from_loaded_file(
+            self._loaded_world_file,
+            None if self._parameters.turbo else self._ws_server,
+        ):
+            return False
+        if self._prediction_handler is not None:
+            self._prediction_handler.rng = (
+                self._aegis_world.get_random_streams().predictions
+            )
+        if self._parameters.resume_filename:
+            return self._resume(self._parameters.resume_filename)
+        return True
+
+    def _resume(self, filename: str) -> bool:
+        try:
+            checkpoint = CheckpointFile.read(filename)
+            if checkpoint.world_filename != self._parameters.world_filename:
+                print(
+                    f"Aegis  : Warning, checkpoint was taken on world '{checkpoint.world_filename}'!"
+                )
+            if not self.restore(checkpoint, self._parameters.random_seed):
+                return False
+        except (OSError, ValueError, AegisParserException) as e:
+            print(f"Aegis  : Unable to resume from checkpoint: {e}", file=sys.stderr)
+            return False
+        print(
+            f"Aegis  : Resuming from round {checkpoint.rounds_completed} of {filename}"
+        )
+        ReplayFileWriter.write_string(
+            f"MSG;Resumed from round {checkpoint.rounds_completed};\n"
+        )
+        return True
+
+    def reset(self, seed: int | None = None) -> bool:
+        """
+        Starts a new simulation on the world, with no agents, without parsing
+        or building the world again, see `AegisWorld.reset`.
+
+        For a kernel driven by `add_agent` and `run_round`: connected agents
+        are disconnected, and the replay file isn't restarted.
+
+        Args:
+            seed: The random seed to play with, by default the one the world
+                was built with.
+
+        Returns:
+            True if the kernel was reset, False if the world hasn't been built.
+        """
+        if not self._aegis_world.reset(seed):
+            return False
+        self._agent_handler.remove_all_agents()
+        if self._prediction_handler is not None:
+            self._prediction_handler.reset()
+            self._prediction_handler.rng = (
+                self._aegis_world.get_random_streams().predictions
+            )
+        self._agent_commands.clear()
+        self._command_records.clear()
+        self._crashed_agents.clear()
+        self._rounds_completed = 0
+        self._simulation_started = None
+        self._end = False
+        return True
+
+    def checkpoint(self) -> Checkpoint:
+        """
+        Returns the state of the simulation between two rounds, to be put
+        back by `restore` or written by `CheckpointFile`.
+
+        Raises:
+            ValueError: If the world hasn't been built.
+        """
+        return Checkpoint(
+            self._parameters.world_filename,
+            self._rounds_completed,
+            self._aegis_world.checkpoint(),
+            self._agent_handler.checkpoint(),
+            (
+                self._prediction_handler.checkpoint()
+                if self._prediction_handler is not None
+                else None
+            ),
         )
 
+    def restore(self, checkpoint: Checkpoint, seed: int | None = None) -> bool:
+        """
+        Puts the simulation in the state of a checkpoint taken on the same
+        world, see `AegisWorld.restore`.
+
+        Connected agents are disconnected. The checkpoint's agents are back
+        in the world but not connected: agents that connect take their
+        places (see `AgentHandler.add_agent`), and those left when every agent
+        has connected are removed. A kernel driven by `run_round` can pass
+        their commands straight away.
+
+        Args:
+            checkpoint: The checkpoint, from `checkpoint`.
+            seed: A random seed to play on with instead of the checkpoint's
+                random state, to fork experiments that play out differently.
+
+        Returns:
+            True if the simulation was restored, False if the world hasn't
+            been built.
+
+        Raises:
+            ValueError: If the checkpoint wasn't taken on this world.
+            AegisParserException: If a command result or message in the
+                checkpoint can't be parsed.
+        """
+        if not self._aegis_world.restore(checkpoint.world, seed):
+            return False
+        self._agent_handler.restore(checkpoint.agent_handler)
+        if self._prediction_handler is not None:
+            self._prediction_handler.reset()
+            if checkpoint.predictions is not None:
+                self._prediction_handler.restore(checkpoint.predictions)
+            self._prediction_handler.rng = (
+                self._aegis_world.get_random_streams().predictions
+            )
+        self._agent_commands.clear()
+        self._command_records.clear()
+        self._crashed_agents.clear()
+        self._rounds_completed = checkpoint.rounds_completed
+        self._simulation_started = None
+        self._end = False
+        return True
+
+    def get_results(self) -> dict[str, object]:
+        """
+        Returns the outcome of the simulation so far.
+
+        Returns:
+            The world, seed, rounds completed, simulation time and the
+            counters of every group, as written by `-ResultsFile`.
+        """
+        elapsed = 0.0
+        if self._simulation_started is not None:
+            elapsed = time.perf_counter() - self._simulation_started
+        world_file = self._loaded_world_file
+        return {
+            "world": self._parameters.world_filename,
+            "seed": self._aegis_world.get_random_seed() if world_file else None,
+            "agents_alive": self._agent_handler.get_number_of_agents(),
+            "rounds": self._rounds_completed,
+            "number_of_rounds": self._parameters.number_of_rounds,
+            "survivors": self._aegis_world.get_num_survivors(),
+            "simulation_s": elapsed,
+            "groups": self._agent_handler.get_group_results(),
+        }
+
+    def _write_results(self) -> None:
+        try:
+            with open(self._parameters.results_filename, "w") as file:
+                json.dump(self.get_results(), file, indent=2)
+        except OSError as e:
+            print(f"Aegis  : Unable to write results: {e}", file=sys.stderr)
+
     def shutdown(self) -> None:
         try:
+            if self._parameters.results_filename:
+                self._write_results()
             self._agent_handler.print_group_survivor_saves()
             self._agent_handler.send_message_to_all(DISCONNECT())
             self._agent_handler.shutdown()
+            if self._checkpoint_writer is not None:
+                self._checkpoint_writer.close()
+                self._checkpoint_writer = None
+            if self._prediction_handler is not None:
+                self._prediction_handler.reset()
 
             ReplayFileWriter.write_string(
                 f"MSG;System Run ended on: {datetime.now()}\n"
             )
             ReplayFileWriter.write_string("MSG;Kernel Shutting Down;\n")
             ReplayFileWriter.close_replay_file()
+            self._profiler.close()
+            if self._on_demand_profiler is not None:
+                self._on_demand_profiler.stop()
+            if self._metrics_server is not None:
+                self._metrics_server.stop()
         except AgentCrashedException:
             pass
 
@@ -241,6 +583,10 @@ class Aegis:
         print(
             f"Aegis  : {count} out of {self._parameters.number_of_agents} agents connected to AEGIS."
         )
+        # agents of a resumed simulation that didn't connect again
+        for agent_id in self._agent_handler.remove_unconnected_agents():
+            print(f"Aegis  : Agent {agent_id} didn't connect and was removed.")
+            self._aegis_world.remove_agent(self._aegis_world.get_agent(agent_id))
         self._state = State.RUN_SIMULATION
 
     def _connect_agent(self, timeout: int) -> bool:
@@ -249,18 +595,28 @@ class Aegis:
             return False
 
         try:
-            self._aegis_world.add_agent_by_id(agent_id)
+            # an agent of a resumed simulation is already in the world
             agent = self._aegis_world.get_agent(agent_id)
+            if agent is None:
+                self._aegis_world.add_agent_by_id(agent_id)
+                agent = self._aegis_world.get_agent(agent_id)
             if agent is None:
                 return False
 
+            # agents on other hosts can't read the kernel's world info file
+            world_filename = self._aegis_world.get_agent_world_filename()
+            world_data = None
+            if not world_filename or not self._agent_handler.is_local_agent(agent_id):
+                world_data = self._aegis_world.get_agent_world_info()
+
             self._agent_handler.send_message_to(
                 agent_id,
                 CONNECT_OK(
                     agent_id,
                     agent.get_energy_level(),
                     agent.location,
-                    self._aegis_world.get_agent_world_filename(),
+                    world_filename,
+                    world_data,
                 ),
             )
             ReplayFileWriter.write_string(
@@ -273,12 +629,15 @@ class Aegis:
     def _end_simulation(self) -> None:
         print("Aegis  : Simulation Over.")
 
-        game_over_data = {"event_type": "SimulationComplete"}
-        event = json.dumps(game_over_data).encode()
-        self._compress_and_send(event)
+        if not self._parameters.turbo:
+            game_over_data = {"event_type": "SimulationComplete"}
+            event = json.dumps(game_over_data).encode()
+            self._compress_and_send(event)
 
         self._state = State.SHUT_DOWN
         self._end = True
+        if self._on_demand_profiler is not None:
+            self._on_demand_profiler.stop()
         self._ws_server.finish()
 
     def run_state(self) -> None:
@@ -317,6 +676,11 @@ class Aegis:
         ReplayFileWriter.write_string(
             f"#\nWorld File Used : {self._parameters.world_filename};\n"
         )
+        if self._parameters.random_seed is not None:
+            # the world in the replay holds the world file's seed, not this one
+            ReplayFileWriter.write_string(
+                f"Random Seed Used : {self._parameters.random_seed};\n"
+            )
         ReplayFileWriter.write_string(
             f"Simulation Start: Number of Rounds {self._parameters.number_of_rounds};\n"
         )
@@ -324,17 +688,20 @@ class Aegis:
         print("================================================")
         _ = sys.stdout.flush()
 
-        after_json_world = self.get_aegis_world().convert_to_json()
+        if not self._parameters.turbo:
+            after_json_world = self.get_aegis_world().convert_to_json()
 
-        round_data = {
-            "event_type": "Round",
-            "round": 0,
-            "after_world": after_json_world,
-        }
-        event = json.dumps(round_data).encode()
-        self._compress_and_send(event)
+            round_data = {
+                "event_type": "Round",
+                "round": 0,
+                "after_world": after_json_world,
+            }
+            event = json.dumps(round_data).encode()
+            self._compress_and_send(event)
+        self._simulation_started = time.perf_counter()
 
-        for round in range(1, self._parameters.number_of_rounds + 1):
+        first_round = self._rounds_completed + 1
+        for round in range(first_round, self._parameters.number_of_rounds + 1):
             if self._end:
                 break
 
@@ -360,43 +727,119 @@ class Aegis:
                 self._end_simulation()
                 return
 
+            profiler = self._profiler
+            profiler.begin_round(round)
+            if self._on_demand_profiler is not None:
+                self._on_demand_profiler.round_started(round)
             ReplayFileWriter.write_string(f"RS;{round};\n")
-            self._run_agent_round()
+            with profiler.phase("agent_round"):
+                self._run_agent_round()
+            self._resolve_round()
+            ReplayFileWriter.write_string("RE;\n")
+            if not self._parameters.turbo:
+                with profiler.phase("convert_to_json"):
+                    after_json_world = self.get_aegis_world().convert_to_json()
+
+                    round_data = {
+                        "event_type": "Round",
+                        "round": round,
+                        "after_world": after_json_world,
+                        "groups_data": self._agent_handler.get_groups_data(),
+                    }
+                    event = json.dumps(round_data).encode()
+                with profiler.phase("compress_and_send"):
+                    self._compress_and_send(event)
+            self._rounds_completed += 1
+            if (
+                self._checkpoint_writer is not None
+                and self._rounds_completed % self._parameters.checkpoint_every == 0
+            ):
+                with profiler.phase("checkpoint"):
+                    self._checkpoint_writer.submit(self.checkpoint())
+            profiler.end_round()
+
+        ReplayFileWriter.write_string("Simulation_Over;\n")
+        self._end_simulation()
 
+    def _resolve_round(self) -> None:
+        """Carries out the commands of the round and moves the world on."""
+        profiler = self._profiler
+        with profiler.phase("handle_commands"):
             for command in self._agent_commands:
                 self._handle_agent_command(command)
             self._agent_commands.clear()
 
-            agent_commands_message = "Agent_Cmds;{"
-            if len(self._command_records) == 0:
-                agent_commands_message += "None"
-            else:
-                agent_commands_message += "$".join(
-                    f"[{record}]" for record in self._command_records
-                )
-            self._command_records.clear()
-            agent_commands_message += "}\n"
-            ReplayFileWriter.write_string(agent_commands_message)
+            if not self._parameters.turbo:
+                agent_commands_message = "Agent_Cmds;{"
+                if len(self._command_records) == 0:
+                    agent_commands_message += "None"
+                else:
+                    agent_commands_message += "$".join(
+                        f"[{record}]" for record in self._command_records
+                    )
+                self._command_records.clear()
+                agent_commands_message += "}\n"
+                ReplayFileWriter.write_string(agent_commands_message)
 
+        with profiler.phase("process_commands"):
             self._process_commands()
+        with profiler.phase("create_results"):
             self._create_results()
+        with profiler.phase("run_simulators"):
             self._run_simulators()
+        with profiler.phase("grim_reaper"):
             self._grim_reaper()
-            self._agent_handler.empty_forward_messages()
-            ReplayFileWriter.write_string("RE;\n")
-            after_json_world = self.get_aegis_world().convert_to_json()
-
-            round_data = {
-                "event_type": "Round",
-                "round": round,
-                "after_world": after_json_world,
-                "groups_data": self._agent_handler.get_groups_data(),
-            }
-            event = json.dumps(round_data).encode()
-            self._compress_and_send(event)
-
-        ReplayFileWriter.write_string("Simulation_Over;\n")
-        self._end_simulation()
+        self._agent_handler.empty_forward_messages()
+
+    def add_agent(self, group_name: str) -> AgentID | None:
+        """
+        Adds an agent with no connection to the world.
+
+        Such an agent is told nothing; its commands are passed to `run_round`.
+        Must be called after `build_world`.
+
+        Args:
+            group_name: The name of the agent's group.
+
+        Returns:
+            The agent's id, or None if it couldn't be placed in the world.
+        """
+        agent_id = self._agent_handler.add_agent(group_name)
+        self._aegis_world.add_agent_by_id(agent_id)
+        if self._aegis_world.get_agent(agent_id) is None:
+            self._agent_handler.remove_agent(agent_id)
+            return None
+        return agent_id
+
+    def run_round(self, commands: Sequence[AgentCommand]) -> None:
+        """
+        Runs one round with `commands` in place of the connected agents'.
+
+        The commands go through the same handling as commands read from
+        agents, see `_resolve_round`.
+
+        Args:
+            commands: At most one command per agent, in agent order, each
+                with its agent's id set.
+        """
+        if self._simulation_started is None:
+            self._simulation_started = time.perf_counter()
+        self._aegis_world.round = self._rounds_completed + 1
+        self._agent_commands.extend(commands)
+        self._resolve_round()
+        self._rounds_completed += 1
+
+    def is_simulation_over(self) -> bool:
+        """
+        Returns True once every round has been run, every agent is dead or
+        every survivor is saved.
+        """
+        return (
+            self._rounds_completed >= self._parameters.number_of_rounds
+            or self._agent_handler.get_number_of_agents() <= 0
+            or self._aegis_world.get_total_saved_survivors()
+            == self._aegis_world.get_num_survivors()
+        )
 
     def _run_agent_round(self) -> None:
         self._agent_handler.reset_current_agent()
@@ -408,10 +851,13 @@ class Aegis:
                 self._agent_handler.send_result_of_command_to_current()
                 self._agent_handler.send_message_to_current(ROUND_START())
 
-                command = self._get_agent_command_of_current()
+                with self._profiler.agent_wait(
+                    self._agent_handler.get_current_agent().agent_id
+                ):
+                    command = self._get_agent_command_of_current()
                 if command is not None:
                     self._agent_commands.append(command)
-                else:
+                elif not self._parameters.turbo:
                     if self._parameters.config_settings is not None:
                         current_agent = self._agent_handler.get_current_agent()
                         if (
@@ -433,7 +879,8 @@ class Aegis:
             except AgentCrashedException:
                 crashed_agent_id = self._agent_handler.get_current_agent().agent_id
                 self._crashed_agents.add(crashed_agent_id)
-            _ = sys.stdout.flush()
+            if not self._parameters.turbo:
+                _ = sys.stdout.flush()
 
     def _get_agent_command_of_current(self) -> AgentCommand | None:
         timeout: int = self._parameters.milliseconds_to_wait_for_agent_command
@@ -482,41 +929,32 @@ class Aegis:
         return last_command
 
     def _handle_agent_command(self, command: AgentCommand) -> None:
-        self._command_records.append(command.proc_string())
-
-        agent = self._aegis_world.get_agent(command.get_agent_id())
-        if agent is not None:
-            agent.command_sent = str(command)
-
-        if isinstance(command, TEAM_DIG):
-            self._TEAM_DIG_list.append(command)
-        elif isinstance(command, SAVE_SURV):
-            self._SAVE_SURV_list.append(command)
-        elif isinstance(command, PREDICT):
-            self._PREDICT_list.append(command)
-        elif isinstance(command, MOVE):
-            self._MOVE_list.append(command)
-        elif isinstance(command, SLEEP):
-            self._SLEEP_list.append(command)
-        elif isinstance(command, OBSERVE):
-            self._OBSERVE_list.append(command)
-        elif isinstance(command, SEND_MESSAGE):
-            send_message: SEND_MESSAGE = command
-            send_message_result = SEND_MESSAGE_RESULT(
-                send_message.get_agent_id(),
-                send_message.agent_id_list,
-                send_message.message,
-            )
-            if send_message.agent_id_list.is_empty():
-                if self._parameters.config_settings is not None:
-                    if self._parameters.config_settings.send_messages_to_all_groups:
-                        self._agent_handler.forward_message_to_all(send_message_result)
-                    else:
-                        self._agent_handler.forward_message_to_group(
-                            send_message.get_agent_id().gid, send_message_result
-                        )
-            else:
-                self._agent_handler.forward_message(send_message_result)
+        # the command records go to the replay and `command_sent` to the viewer
+        if not self._parameters.turbo:
+            self._command_records.append(command.proc_string())
+
+            agent = self._aegis_world.get_agent(command.get_agent_id())
+            if agent is not None:
+                agent.command_sent = str(command)
+
+        _ = self._agent_command_dispatcher.dispatch(command)
+
+    def _handle_SEND_MESSAGE(self, send_message: SEND_MESSAGE) -> None:
+        send_message_result = SEND_MESSAGE_RESULT(
+            send_message.get_agent_id(),
+            send_message.agent_id_list,
+            send_message.message,
+        )
+        if send_message.agent_id_list.is_empty():
+            if self._parameters.config_settings is not None:
+                if self._parameters.config_settings.send_messages_to_all_groups:
+                    self._agent_handler.forward_message_to_all(send_message_result)
+                else:
+                    self._agent_handler.forward_message_to_group(
+                        send_message.get_agent_id().gid, send_message_result
+                    )
+        else:
+            self._agent_handler.forward_message(send_message_result)
 
     def _process_commands(self) -> None:
         self._process_TEAM_DIG()
@@ -531,32 +969,53 @@ class Aegis:
         self._process_SLEEP()
         self._process_OBSERVE()
 
-    def _process_TEAM_DIG(self) -> None:
-        temp_agent_list: AgentIDList = AgentIDList()
-        for team_dig in self._TEAM_DIG_list:
-            temp_agent_list.add(team_dig.get_agent_id())
-        self._TEAM_DIG_list.clear()
+    def _group_agents_by_cell(
+        self, agent_ids: list[AgentID]
+    ) -> list[tuple[InternalCell, list[AgentID]]]:
+        """
+        Groups the agents that sent a cooperative command by the cell they are on.
+
+        Cells are in the order their first agent's command was sent. Each cell's
+        agents start with that agent, followed by the cell's other commanding
+        agents in the cell's own agent order.
 
-        temp_cell_agent_list = AgentIDList()
-        while temp_agent_list.size() > 0:
-            temp_cell_agent_list.clear()
-            agent_id = temp_agent_list.remove_at(0)
-            temp_cell_agent_list.add(agent_id)
+        Args:
+            agent_ids: The agents that sent the command, in the order they sent it.
 
+        Returns:
+            Each cell with the agents on it that sent the command.
+        """
+        cell_agents: dict[InternalLocation, tuple[AgentID, set[AgentID]]] = {}
+        for agent_id in agent_ids:
             agent = self._aegis_world.get_agent(agent_id)
             if agent is None:
                 continue
 
-            cell = self._aegis_world.get_cell_at(agent.location)
+            entry = cell_agents.get(agent.location)
+            if entry is None:
+                cell_agents[agent.location] = (agent_id, {agent_id})
+            else:
+                entry[1].add(agent_id)
 
+        groups: list[tuple[InternalCell, list[AgentID]]] = []
+        for location, (first_agent_id, agents) in cell_agents.items():
+            cell = self._aegis_world.get_cell_at(location)
             if cell is None:
                 continue
 
-            for cell_agent in cell.agent_id_list:
-                if cell_agent in temp_agent_list:
-                    temp_cell_agent_list.add(cell_agent)
-                    temp_agent_list.remove(cell_agent)
+            group = [first_agent_id]
+            if len(agents) > 1:
+                for cell_agent in cell.agent_id_list:
+                    if cell_agent in agents and cell_agent != first_agent_id:
+                        group.append(cell_agent)
+            groups.append((cell, group))
+        return groups
+
+    def _process_TEAM_DIG(self) -> None:
+        agent_ids = [team_dig.get_agent_id() for team_dig in self._TEAM_DIG_list]
+        self._TEAM_DIG_list.clear()
 
+        for cell, temp_cell_agent_list in self._group_agents_by_cell(agent_ids):
             top_layer = cell.get_top_layer()
             if top_layer is None:
                 self._remove_energy_from_agents(
@@ -565,7 +1024,7 @@ class Aegis:
                 continue
 
             if isinstance(top_layer, Rubble):
-                if top_layer.remove_agents <= temp_cell_agent_list.size():
+                if top_layer.remove_agents <= len(temp_cell_agent_list):
                     self._aegis_world.remove_layer_from_cell(cell.location)
                     self._remove_energy_from_agents(
                         temp_cell_agent_list, top_layer.remove_energy
@@ -575,10 +1034,8 @@ class Aegis:
                         temp_cell_agent_list, self._parameters.TEAM_DIG_ENERGY_COST
                     )
 
-        temp_agent_list.clear()
-
     def _remove_energy_from_agents(
-        self, agent_list: AgentIDList, energy_cost: int
+        self, agent_list: list[AgentID], energy_cost: int
     ) -> None:
         for agent_id in agent_list:
             agent = self._aegis_world.get_agent(agent_id)
@@ -587,35 +1044,13 @@ class Aegis:
                 self._TEAM_DIG_RESULT_list.add(agent_id)
 
     def _process_SAVE_SURV(self) -> None:
-        temp_agent_list = AgentIDList()
-        for save_surv in self._SAVE_SURV_list:
-            temp_agent_list.add(save_surv.get_agent_id())
-
+        agent_ids = [save_surv.get_agent_id() for save_surv in self._SAVE_SURV_list]
         self._SAVE_SURV_list.clear()
-        temp_cell_agent_list: list[AgentID] = []
 
-        while temp_agent_list.size() > 0:
-            temp_cell_agent_list.clear()
+        for cell, temp_cell_agent_list in self._group_agents_by_cell(agent_ids):
             gid_counter: list[int] = [0] * 10
-
-            agent_id = temp_agent_list.remove_at(0)
-            temp_cell_agent_list.append(agent_id)
-            gid_counter[agent_id.gid] += 1
-
-            agent = self._aegis_world.get_agent(agent_id)
-            if agent is None:
-                continue
-
-            cell = self._aegis_world.get_cell_at(agent.location)
-
-            if cell is None:
-                continue
-
-            for cell_agent in cell.agent_id_list:
-                if cell_agent in temp_agent_list:
-                    temp_cell_agent_list.append(cell_agent)
-                    temp_agent_list.remove(cell_agent)
-                    gid_counter[cell_agent.gid] += 1
+            for agent_id in temp_cell_agent_list:
+                gid_counter[agent_id.gid] += 1
 
             top_layer = cell.get_top_layer()
             if top_layer is None:
@@ -629,8 +1064,6 @@ class Aegis:
                     top_layer, cell, temp_cell_agent_list, gid_counter
                 )
 
-        temp_agent_list.clear()
-
     def _process_PREDICT(self) -> None:
         for prediction in self._PREDICT_list:
             agent = self._aegis_world.get_agent(prediction.get_agent_id())
@@ -670,56 +1103,90 @@ class Aegis:
             self._PREDICT_RESULT_list.add(agent.agent_id)
         self._PREDICT_list.clear()
 
-    def _process_MOVE(self) -> None:
-        for move in self._MOVE_list:
-            agent = self._aegis_world.get_agent(move.get_agent_id())
+    def _batch_agents(
+        self, commands: Sequence[AgentCommand]
+    ) -> tuple[list[int], AgentBatch]:
+        """
+        Gathers the agents that sent commands of one type into a batch.
+
+        Args:
+            commands: The commands, in the order they were sent.
+
+        Returns:
+            The index of each command whose agent is still in the world, and a
+            batch of those agents in the same order.
+        """
+        indices: list[int] = []
+        agents: list[Agent] = []
+        for index, command in enumerate(commands):
+            agent = self._aegis_world.get_agent(command.get_agent_id())
             if agent is None:
                 continue
+            indices.append(index)
+            agents.append(agent)
+        return indices, AgentBatch(agents)
 
-            dest_location = agent.location.add(move.direction)
-            dest_cell = self._aegis_world.get_cell_at(dest_location)
-
-            if move.direction != Direction.CENTER and dest_cell:
-                agent.remove_energy(dest_cell.move_cost)
-                self._aegis_world.move_agent(agent.agent_id, dest_location)
-                agent.orientation = move.direction
-                agent.add_step_taken()
-            else:
-                agent.remove_energy(self._parameters.MOVE_ENERGY_COST)
-            self._MOVE_RESULT_list.add(move.get_agent_id())
+    def _process_MOVE(self) -> None:
+        indices, batch = self._batch_agents(self._MOVE_list)
+        moves = [self._MOVE_list[index] for index in indices]
         self._MOVE_list.clear()
+        if not moves:
+            return
 
-    def _process_SLEEP(self) -> None:
-        for sleep in self._SLEEP_list:
-            agent = self._aegis_world.get_agent(sleep.get_agent_id())
-            if agent is None:
-                continue
+        dx = np.fromiter((move.direction.dx for move in moves), np.int64, len(moves))
+        dy = np.fromiter((move.direction.dy for move in moves), np.int64, len(moves))
+        moved = batch.resolve_moves(
+            dx,
+            dy,
+            self._aegis_world.get_move_cost_grid(),
+            self._parameters.MOVE_ENERGY_COST,
+        )
+        batch.apply_energy()
 
-            agent_cell = self._aegis_world.get_cell_at(agent.location)
-            config_settings = self._parameters.config_settings
+        moved_indices = cast(list[int], np.flatnonzero(moved).tolist())
+        for index, location in zip(moved_indices, batch.locations(moved)):
+            agent = batch.agents[index]
+            self._aegis_world.move_agent(agent.agent_id, location)
+            agent.orientation = moves[index].direction
+            agent.add_step_taken()
+        self._MOVE_RESULT_list.extend(move.get_agent_id() for move in moves)
 
-            if (config_settings and config_settings.sleep_everywhere) or (
-                agent_cell and agent_cell.is_charging_cell()
-            ):
-                if (
-                    agent.get_energy_level() + Constants.NORMAL_CHARGE
-                    > Constants.DEFAULT_MAX_ENERGY_LEVEL
-                ):
-                    agent.set_energy_level(Constants.DEFAULT_MAX_ENERGY_LEVEL)
-                else:
-                    agent.add_energy(Constants.NORMAL_CHARGE)
-            self._SLEEP_RESULT_list.add(sleep.get_agent_id())
+    def _process_SLEEP(self) -> None:
+        indices, batch = self._batch_agents(self._SLEEP_list)
+        sleeps = [self._SLEEP_list[index] for index in indices]
         self._SLEEP_list.clear()
+        if not sleeps:
+            return
 
-    def _process_OBSERVE(self) -> None:
-        for observe in self._OBSERVE_list:
-            agent = self._aegis_world.get_agent(observe.get_agent_id())
-            if agent is None:
-                continue
+        batch.charge(
+            self._can_sleep(batch.agents),
+            Constants.NORMAL_CHARGE,
+            Constants.DEFAULT_MAX_ENERGY_LEVEL,
+        )
+        batch.apply_energy()
+        self._SLEEP_RESULT_list.extend(sleep.get_agent_id() for sleep in sleeps)
+
+    def _can_sleep(self, agents: list[Agent]) -> NDArray[np.bool_]:
+        config_settings = self._parameters.config_settings
+        if config_settings and config_settings.sleep_everywhere:
+            return np.ones(len(agents), np.bool_)
+
+        can_sleep = np.zeros(len(agents), np.bool_)
+        for index, agent in enumerate(agents):
+            agent_cell = self._aegis_world.get_cell_at(agent.location)
+            can_sleep[index] = agent_cell is not None and agent_cell.is_charging_cell()
+        return can_sleep
 
-            agent.remove_energy(self._parameters.OBSERVE_ENERGY_COST)
-            self._OBSERVE_RESULT_list.append(observe)
+    def _process_OBSERVE(self) -> None:
+        indices, batch = self._batch_agents(self._OBSERVE_list)
+        observes = [self._OBSERVE_list[index] for index in indices]
         self._OBSERVE_list.clear()
+        if not observes:
+            return
+
+        batch.remove_energy(self._parameters.OBSERVE_ENERGY_COST)
+        batch.apply_energy()
+        self._OBSERVE_RESULT_list.extend(observes)
 
     def _create_results(self) -> None:
         for agent_id in self._TEAM_DIG_RESULT_list:
@@ -838,7 +1305,9 @@ class Aegis:
 
             if cell is not None:
                 cell_info = cell.get_cell_info()
-                life_signals = cell.get_generated_life_signals()
+                life_signals = cell.get_generated_life_signals(
+                    self._aegis_world.get_random_streams().life_signals
+                )
             observe_result = OBSERVE_RESULT(
                 agent.get_energy_level(), cell_info, life_signals
             )
@@ -873,6 +1342,9 @@ class Aegis:
     def get_aegis_world(self) -> AegisWorld:
         return self._aegis_world
 
+    def get_agent_handler(self) -> AgentHandler:
+        return self._agent_handler
+
     def _handle_top_layer(
         self,
         top_layer: WorldObject,
@@ -950,8 +1422,9 @@ class Aegis:
                     self._agent_handler.increase_agent_group_saved(gid, amount, state)
 
         elif points_config == ConfigSettings.POINTS_FOR_RANDOM_SAVING_GROUPS:
+            rng = self._aegis_world.get_random_streams().ties
             random_id = temp_cell_agent_list[
-                Utility.next_int() % len(temp_cell_agent_list)
+                int(rng.integers(len(temp_cell_agent_list)))
             ]
             if alive_count > 0:
                 state = Constants.SAVE_STATE_ALIVE
@@ -1010,17 +1483,16 @@ class Aegis:
         gid_counter: list[int],
         max_group_size: int,
     ) -> None:
-        while True:
-            random_id = Utility.next_int() % len(gid_counter)
-            if gid_counter[random_id] == max_group_size:
-                if alive_count > 0:
-                    state = Constants.SAVE_STATE_ALIVE
-                    amount = alive_count
-                else:
-                    state = Constants.SAVE_STATE_DEAD
-                    amount = dead_count
-                self._agent_handler.increase_agent_group_saved(random_id, amount, state)
-                break
+        tied = [gid for gid, count in enumerate(gid_counter) if count == max_group_size]
+        rng = self._aegis_world.get_random_streams().ties
+        random_id = tied[int(rng.integers(len(tied)))]
+        if alive_count > 0:
+            state = Constants.SAVE_STATE_ALIVE
+            amount = alive_count
+        else:
+            state = Constants.SAVE_STATE_DEAD
+            amount = dead_count
+        self._agent_handler.increase_agent_group_saved(random_id, amount, state)
 
     def _handle_all_tie(
         self,
@@ -1040,6 +1512,123 @@ class Aegis:
 
                 self._agent_handler.increase_agent_group_saved(gid, amount, state)
 
+    def _collect_metrics(self) -> str:
+        """
+        Renders the kernel metrics in the Prometheus text format.
+
+        Runs on the metrics server thread. It only reads counters and takes
+        snapshots of lists and dicts, so the simulation never waits on it.
+        """
+        handler = self._agent_handler
+        agents = list(handler.agent_list)
+        metrics = MetricsText()
+
+        metrics.add_value(
+            "aegis_rounds_total", "counter", "Rounds completed.", self._rounds_completed
+        )
+        rounds_per_second = 0.0
+        if self._simulation_started is not None and self._rounds_completed > 0:
+            elapsed = time.perf_counter() - self._simulation_started
+            rounds_per_second = self._rounds_completed / elapsed
+        metrics.add_value(
+            "aegis_rounds_per_second",
+            "gauge",
+            "Average rounds completed per second since the simulation started.",
+            rounds_per_second,
+        )
+        metrics.add_value("aegis_agents", "gauge", "Connected agents.", len(agents))
+
+        latency = handler.command_latency.copy()
+        metrics.add_summary(
+            "aegis_agent_command_latency_seconds",
+            "Time the kernel waited for each agent's command, over recent rounds.",
+            [
+                ({"agent": f"{agent_id.id}:{agent_id.gid}"}, window)
+                for agent_id, window in latency.items()
+            ],
+        )
+
+        sockets = [
+            (f"{agent.agent_id.id}:{agent.agent_id.gid}", agent.agent_socket)
+            for agent in agents
+            if agent.agent_socket is not None
+        ]
+        for direction in ("sent", "received"):
+            metrics.add(
+                f"aegis_agent_bytes_{direction}_total",
+                "counter",
+                f"Bytes {direction} per agent, including framing.",
+                [
+                    ({"agent": name}, getattr(socket, f"bytes_{direction}"))
+                    for name, socket in sockets
+                ],
+            )
+            metrics.add(
+                f"aegis_agent_messages_{direction}_total",
+                "counter",
+                f"Messages {direction} per agent.",
+                [
+                    ({"agent": name}, getattr(socket, f"messages_{direction}"))
+                    for name, socket in sockets
+                ],
+            )
+        metrics.add(
+            "aegis_command_bytes_sent_total",
+            "counter",
+            "Bytes sent to agents per command type, including framing.",
+            [
+                ({"command": name}, count)
+                for name, count in handler.command_bytes_sent.copy().items()
+            ],
+        )
+        metrics.add(
+            "aegis_command_bytes_received_total",
+            "counter",
+            "Bytes received from agents per command type, including framing.",
+            [
+                ({"command": name}, count)
+                for name, count in handler.command_bytes_received.copy().items()
+            ],
+        )
+        metrics.add(
+            "aegis_agent_mailbox_depth",
+            "gauge",
+            "Messages waiting in each agent's mailboxes.",
+            [
+                (
+                    {"agent": f"{agent.agent_id.id}:{agent.agent_id.gid}"},
+                    len(agent.mailbox1) + len(agent.mailbox2),
+                )
+                for agent in agents
+            ],
+        )
+
+        metrics.add_value(
+            "aegis_websocket_queue_depth",
+            "gauge",
+            "Events waiting to be sent to viewer clients.",
+            self._ws_server.queue_depth(),
+        )
+        metrics.add_value(
+            "aegis_websocket_buffer_bytes",
+            "gauge",
+            "Size of the events kept to replay to newly connected viewers.",
+            self._ws_server.buffered_event_bytes(),
+        )
+        metrics.add_value(
+            "aegis_replay_file_bytes",
+            "gauge",
+            "Bytes written to the replay file.",
+            ReplayFileWriter.bytes_written,
+        )
+        metrics.add_value(
+            "aegis_resident_memory_bytes",
+            "gauge",
+            "Resident set size of the kernel process.",
+            resident_memory_bytes(),
+        )
+        return metrics.render()
+
     def _compress_and_send(self, event: bytes) -> None:
         compressed_event = gzip.compress(event)
         encoded_event = base64.b64encode(compressed_event).decode().encode()
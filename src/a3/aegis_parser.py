@@ -1,11 +1,10 @@
-import json
-import os
+from __future__ import annotations
+
 import re
 from collections.abc import Iterator
 import sys
-from typing import TextIO
+from typing import TYPE_CHECKING, TextIO
 
-import numpy as np
 from aegis.common import (
     AgentID,
     AgentIDList,
@@ -60,18 +59,25 @@ from aegis.common.world.objects import (
     SurvivorGroup,
     WorldObject,
 )
-from numpy.typing import NDArray
-
-MOVE_COST_TOGGLE: bool = json.load(open("sys_files/aegis_config.json"))[
-    "Enable_Move_Cost"
-]
+from aegis.common.world.world_info_file import WorldInfoFile
 
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
 
 class AegisParser:
     @staticmethod
     def build_world(file_location: str) -> list[list[InternalCell]] | None:
         world: list[list[InternalCell]] | None = None
         try:
+            with open(file_location, "rb") as file:
+                is_world_info = WorldInfoFile.is_world_info(
+                    file.read(len(WorldInfoFile.MAGIC))
+                )
+            if is_world_info:
+                return WorldInfoFile.read(file_location)
+
+            # text world information written by older kernels
             with open(file_location) as file:
                 world = AegisParser.read_world_size(file)
                 for line in file:
@@ -87,6 +93,15 @@ class AegisParser:
             )
         return world
 
+    @staticmethod
+    def build_world_from_data(world_data: bytes) -> list[list[InternalCell]]:
+        try:
+            return WorldInfoFile.decode(world_data)
+        except Exception:
+            raise AegisParserException(
+                "Unable to read in startup world information sent by AEGIS"
+            )
+
     @staticmethod
     def read_world_size(file: TextIO) -> list[list[InternalCell]]:
         tokens = file.readline().split()
@@ -119,7 +134,8 @@ class AegisParser:
 
         cell.has_survivors = has_survivors
 
-        if MOVE_COST_TOGGLE:
+        # move costs are only written when the kernel has them enabled
+        if len(tokens) > 6:
             cell.move_cost = int(tokens[6])
         return cell
 
@@ -149,7 +165,22 @@ class AegisParser:
                 y = AegisParser.integer(tokens)
                 AegisParser.close_round_bracket(tokens)
                 AegisParser.comma(tokens)
-                AegisParser.text(tokens, "FILE")
+                token = next(tokens)
+                if token == "DATA":
+                    world_data = CONNECT_OK.decode_world_data(next(tokens))
+                    AegisParser.close_round_bracket(tokens)
+                    AegisParser.done(tokens)
+                    return CONNECT_OK(
+                        AgentID(id, gid),
+                        energy_level,
+                        InternalLocation(x, y),
+                        "",
+                        world_data,
+                    )
+                if token != "FILE":
+                    raise AegisParserException(
+                        f"Expected: FILE or DATA, found: {token} "
+                    )
                 file_name = AegisParser.file(tokens)
                 AegisParser.done(tokens)
                 return CONNECT_OK(
@@ -206,7 +237,7 @@ class AegisParser:
                 tokens = iter(string[msg_end + 1 :].split())
                 AegisParser.close_round_bracket(tokens)
                 AegisParser.done(tokens)
-                return SEND_MESSAGE_RESULT(AgentID(id, gid), agent_id_list, message)
+                return SEND_MESSAGE_RESULT(AgentID.of(id, gid), agent_id_list, message)
             elif string.startswith(Command.STR_MESSAGES_END):
                 AegisParser.text(tokens, Command.STR_MESSAGES_END)
                 AegisParser.done(tokens)
@@ -347,7 +378,7 @@ class AegisParser:
                 y = AegisParser.integer(tokens)
                 AegisParser.close_round_bracket(tokens)
                 AegisParser.done(tokens)
-                return OBSERVE(InternalLocation(x, y))
+                return OBSERVE(InternalLocation.of(x, y))
             elif string.startswith(Command.STR_SAVE_SURV):
                 AegisParser.text(tokens, Command.STR_SAVE_SURV)
                 AegisParser.done(tokens)
@@ -362,7 +393,7 @@ class AegisParser:
                 label = AegisParser.integer(tokens)
                 AegisParser.close_round_bracket(tokens)
                 AegisParser.done(tokens)
-                return PREDICT(surv_id, np.int64(label))
+                return PREDICT(surv_id, AegisParser.label(label))
             elif string.startswith(Command.STR_SEND_MESSAGE):
                 AegisParser.text(tokens, Command.STR_SEND_MESSAGE)
                 AegisParser.open_round_bracket(tokens)
@@ -452,7 +483,7 @@ class AegisParser:
             AegisParser.text(tokens, "GID")
             gid = AegisParser.integer(tokens)
             AegisParser.close_square_bracket(tokens)
-            id_list.add(AgentID(id, gid))
+            id_list.add(AgentID.of(id, gid))
             if i < number_left_to_read - 1:
                 AegisParser.comma(tokens)
         return id_list
@@ -572,7 +603,7 @@ class AegisParser:
         AegisParser.close_round_bracket(tokens)
         AegisParser.close_round_bracket(tokens)
         return CellInfo(
-            cell_type, InternalLocation(x, y), move_cost, agent_id_list, top_layer
+            cell_type, InternalLocation.of(x, y), move_cost, agent_id_list, top_layer
         )
 
     @staticmethod
@@ -688,10 +719,19 @@ class AegisParser:
         if token != "|":
             raise AegisParserException(f"Expected: '|', found: {token}")
 
+    @staticmethod
+    def label(label: int) -> np.int64:
+        # numpy is only imported once a prediction is actually made
+        import numpy as np
+
+        return np.int64(label)
+
     @staticmethod
     def prediction_data(
         tokens: Iterator[str],
     ) -> tuple[int, NDArray[np.float32], NDArray[np.int64]]:
+        import numpy as np
+
         token = next(tokens)
         if token != "SURV_ID:":
             raise AegisParserException(f"Expected 'SURV_ID:', found {token}")
@@ -3,10 +3,12 @@
 # pyright: reportUnknownMemberType = false
 from __future__ import annotations
 
+import os
 import sys
+import threading
 from collections import deque
+from typing import TYPE_CHECKING
 
-import numpy as np
 from aegis import (
     END_TURN,
     AgentCommand,
@@ -15,24 +17,32 @@ from aegis import (
     SurroundInfo,
 )
 from aegis.api import Location
+from aegis.assist.on_demand_profiler import OnDemandProfiler
 from aegis.common.commands.agent_commands import CONNECT
 from aegis.common.location import InternalLocation
 from aegis.common.network.aegis_socket import AegisSocket
 from aegis.common.network.aegis_socket_exception import AegisSocketException
+from aegis.common.network.transport import Transport
 from a3.aegis_parser import AegisParser
 from aegis.common.parsers.aegis_parser_exception import AegisParserException
 from aegis.common.world.world import InternalWorld
-from numpy.typing import NDArray
 
 import a3.agent.brain
 from a3.agent.agent_states import AgentStates
 
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
 
 class BaseAgent:
     """Represents a base agent that connects to and interacts with AEGIS."""
 
+    # agents connect here unless the AEGIS_ENDPOINT environment variable
+    # names another endpoint, tcp://host:port or unix:///path/to/socket
     AGENT_PORT: int = 6001
     _agent: BaseAgent | None = None
+    _thread_agent: threading.local = threading.local()
 
     def __init__(self) -> None:
         """Initializes a BaseAgent instance."""
@@ -47,13 +57,30 @@ class BaseAgent:
             tuple[int, NDArray[np.float32] | None, NDArray[np.int64] | None]
         ] = deque()
         self._did_end_turn: bool = False
+        self._profiler: OnDemandProfiler | None = None
 
     @staticmethod
     def get_agent() -> BaseAgent:
+        agent: BaseAgent | None = getattr(BaseAgent._thread_agent, "agent", None)
+        if agent is not None:
+            return agent
         if BaseAgent._agent is None:
             BaseAgent._agent = BaseAgent()
         return BaseAgent._agent
 
+    @staticmethod
+    def create_for_thread() -> BaseAgent:
+        """
+        Creates an agent that `get_agent` returns on the calling thread only.
+
+        This lets several agents run as threads of one interpreter, e.g. with
+        the kernel in `a3.in_process`. The brain must be created on the same
+        thread, after this call, since brains look up their agent when built.
+        """
+        agent = BaseAgent()
+        BaseAgent._thread_agent.agent = agent
+        return agent
+
     def update_surround(
         self, surround_info: SurroundInfo, world: InternalWorld | None
     ) -> None:
@@ -79,6 +106,8 @@ class BaseAgent:
 
         if agent_state == AgentStates.READ_MAIL:
             self._round += 1
+            if self._profiler is not None:
+                self._profiler.round_started(self._round)
 
         self.log(f"New State: {self._agent_state}")
 
@@ -154,23 +183,70 @@ class BaseAgent:
     ) -> None:
         self.start("localhost", group_name, brain)
 
-    def start(self, host: str, group_name: str, brain: a3.agent.brain.Brain) -> None:
+    def start_with_transport(
+        self, transport: Transport, group_name: str, brain: a3.agent.brain.Brain
+    ) -> None:
+        """
+        Runs the agent over an already connected transport.
+
+        Args:
+            transport: The connection to AEGIS, e.g. from `LoopbackListener.connect`.
+            group_name: The name of the agent's group.
+            brain: The agent's brain.
+        """
+        self.start("localhost", group_name, brain, transport)
+
+    def start(
+        self,
+        host: str,
+        group_name: str,
+        brain: a3.agent.brain.Brain,
+        transport: Transport | None = None,
+    ) -> None:
         if self._agent_state == AgentStates.CONNECTING:
             self._brain = brain
-            if self._connect_to_aegis(host, group_name):
+            if self._connect_to_aegis(host, group_name, transport):
+                self._install_profiler()
                 self._run_base_agent_states()
             else:
                 self.log("Failed to connect to AEGIS.")
         else:
             self.log("Multiple calls made to start method, ( call ignored )")
 
-    def _connect_to_aegis(self, host: str, group_name: str) -> bool:
+    def _install_profiler(self) -> None:
+        """
+        Lets SIGUSR1 and SIGUSR2 profile the agent for the next rounds.
+
+        The number of rounds comes from the AEGIS_PROFILE_ROUNDS environment
+        variable (default 10), and the results are written to the working
+        directory as `agent_<id>_<gid>.cprofile.r<first>-<last>.pstats` and
+        `agent_<id>_<gid>.tracemalloc.r<first>-<last>.txt`.
+        """
+        try:
+            rounds = int(os.environ.get("AEGIS_PROFILE_ROUNDS", "10"))
+        except ValueError:
+            rounds = 10
+        self._profiler = OnDemandProfiler(
+            f"agent_{self._id.id}_{self._id.gid}", rounds, self.log
+        )
+        if not self._profiler.install_signal_handlers():
+            self._profiler = None
+
+    def _connect_to_aegis(
+        self, host: str, group_name: str, transport: Transport | None = None
+    ) -> bool:
         result: bool = False
         for _ in range(5):
             self.log("Trying to connect to AEGIS...")
             try:
                 self._aegis_socket = AegisSocket()
-                self._aegis_socket.connect(host, self.AGENT_PORT)
+                endpoint = os.environ.get("AEGIS_ENDPOINT")
+                if transport is not None:
+                    self._aegis_socket.connect_transport(transport)
+                elif endpoint:
+                    self._aegis_socket.connect_endpoint(endpoint)
+                else:
+                    self._aegis_socket.connect(host, self.AGENT_PORT)
                 self._aegis_socket.send_message(str(CONNECT(group_name)))
                 message = self._aegis_socket.read_message()
                 if message is not None and self._brain is not None:
@@ -180,7 +256,7 @@ class BaseAgent:
                 if self.get_agent_state() == AgentStates.CONNECTED:
                     result = True
             except AegisParserException as e:
-                print(f"Can't parse/find WorldInfoFile.out -> {e}")
+                print(f"Can't parse/find the world information from AEGIS -> {e}")
                 sys.exit(1)
             except AegisSocketException as e:
                 print(f"Can't connect to AEGIS -> {e}")
@@ -221,6 +297,8 @@ class BaseAgent:
                 end = True
             _ = sys.stdout.flush()
 
+        if self._profiler is not None:
+            self._profiler.stop()
         if self._aegis_socket is not None:
             self._aegis_socket.disconnect()
 
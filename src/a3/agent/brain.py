@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 
 from aegis.common.commands.aegis_command import AegisCommand
+from aegis.common.commands.command_dispatcher import CommandDispatcher
 from aegis.common.commands.aegis_commands import (
     AEGIS_UNKNOWN,
     CMD_RESULT_END,
@@ -35,6 +36,8 @@ class Brain(ABC):
     def __init__(self) -> None:
         """Initializes the Brain instance with no world information."""
         self._world: World | None = None
+        self._aegis_command_dispatcher: CommandDispatcher = CommandDispatcher()
+        self._register_aegis_command_handlers()
 
     def get_world(self) -> World | None:
         """Returns the current world information associated with the brain."""
@@ -89,97 +92,112 @@ class Brain(ABC):
         Args:
             aegis_command: The command received from AEGIS.
         """
-        base_agent = a3.agent.base_agent.BaseAgent.get_agent()
-        if isinstance(aegis_command, CONNECT_OK):
-            connect_ok: CONNECT_OK = aegis_command
-            base_agent.set_agent_id(connect_ok.new_agent_id)
-            base_agent.set_energy_level(connect_ok.energy_level)
-            base_agent.set_location(connect_ok.location)
-            self._world = InternalWorld(
-                AegisParser.build_world(connect_ok.world_filename)
-            )  # pyright: ignore[reportAttributeAccessIssue]
-            base_agent.set_agent_state(AgentStates.CONNECTED)
-            base_agent.log("Connected Successfully")
-
-        elif isinstance(aegis_command, DEATH_CARD):
-            base_agent.set_agent_state(AgentStates.SHUTTING_DOWN)
-
-        elif isinstance(aegis_command, DISCONNECT):
-            base_agent.set_agent_state(AgentStates.SHUTTING_DOWN)
-
-        elif isinstance(aegis_command, SEND_MESSAGE_RESULT):
-            self.handle_send_message_result(aegis_command)
-
-        elif isinstance(aegis_command, MESSAGES_END):
-            base_agent.set_agent_state(AgentStates.IDLE)
-
-        elif isinstance(aegis_command, MESSAGES_START):
-            base_agent.set_agent_state(AgentStates.READ_MAIL)
-
-        elif isinstance(aegis_command, MOVE_RESULT):
-            move_result: MOVE_RESULT = aegis_command
-            move_result_current_info: CellInfo = (
-                move_result.surround_info.get_current_info()
+        if not self._aegis_command_dispatcher.dispatch(aegis_command):
+            a3.agent.base_agent.BaseAgent.get_agent().log(
+                f"Brain: Got unrecognized reply from AEGIS: {aegis_command.__class__.__name__}.",
             )
-            base_agent.set_energy_level(move_result.energy_level)
-            base_agent.set_location(move_result_current_info.location)
-            base_agent.update_surround(move_result.surround_info, self.get_world())  # pyright: ignore[reportArgumentType]
-
-        elif isinstance(aegis_command, ROUND_END):
-            base_agent.set_agent_state(AgentStates.IDLE)
-
-        elif isinstance(aegis_command, ROUND_START):
-            base_agent.set_agent_state(AgentStates.THINK)
 
-        elif isinstance(aegis_command, SAVE_SURV_RESULT):
-            save_surv_result: SAVE_SURV_RESULT = aegis_command
-            save_surv_result_current_info = (
-                save_surv_result.surround_info.get_current_info()
-            )
-            base_agent.set_energy_level(save_surv_result.energy_level)
-            base_agent.set_location(save_surv_result_current_info.location)
-            if save_surv_result.has_pred_info():
-                surv_id, image, labels = (
-                    save_surv_result.surv_saved_id,
-                    save_surv_result.image_to_predict,
-                    save_surv_result.all_unique_labels,
-                )
-                base_agent.add_prediction_info((surv_id, image, labels))
-
-            self.handle_save_surv_result(save_surv_result)
-            base_agent.update_surround(save_surv_result.surround_info, self.get_world())  # pyright: ignore[reportArgumentType]
-
-        elif isinstance(aegis_command, PREDICT_RESULT):
-            pred_req: PREDICT_RESULT = aegis_command
-            self.handle_predict_result(pred_req)
-
-        elif isinstance(aegis_command, SLEEP_RESULT):
-            sleep_result: SLEEP_RESULT = aegis_command
-            if sleep_result.was_successful:
-                base_agent.set_energy_level(sleep_result.charge_energy)
-        elif isinstance(aegis_command, OBSERVE_RESULT):
-            ovr: OBSERVE_RESULT = aegis_command
-            self.handle_observe_result(ovr)
-
-        elif isinstance(aegis_command, TEAM_DIG_RESULT):
-            team_dig_result: TEAM_DIG_RESULT = aegis_command
-            team_dig_result_current_info: CellInfo = (
-                team_dig_result.surround_info.get_current_info()
+    def _register_aegis_command_handlers(self) -> None:
+        dispatcher = self._aegis_command_dispatcher
+        dispatcher.register(CONNECT_OK, self._handle_CONNECT_OK)
+        dispatcher.register(DEATH_CARD, self._handle_shutdown)
+        dispatcher.register(DISCONNECT, self._handle_shutdown)
+        dispatcher.register(SEND_MESSAGE_RESULT, self.handle_send_message_result)
+        dispatcher.register(MESSAGES_END, self._handle_idle)
+        dispatcher.register(MESSAGES_START, self._handle_MESSAGES_START)
+        dispatcher.register(MOVE_RESULT, self._handle_MOVE_RESULT)
+        dispatcher.register(ROUND_END, self._handle_idle)
+        dispatcher.register(ROUND_START, self._handle_ROUND_START)
+        dispatcher.register(SAVE_SURV_RESULT, self._handle_SAVE_SURV_RESULT)
+        dispatcher.register(PREDICT_RESULT, self.handle_predict_result)
+        dispatcher.register(SLEEP_RESULT, self._handle_SLEEP_RESULT)
+        dispatcher.register(OBSERVE_RESULT, self.handle_observe_result)
+        dispatcher.register(TEAM_DIG_RESULT, self._handle_TEAM_DIG_RESULT)
+        dispatcher.register(AEGIS_UNKNOWN, self._handle_AEGIS_UNKNOWN)
+        dispatcher.register(CMD_RESULT_START, self._handle_CMD_RESULT_START)
+        dispatcher.register(CMD_RESULT_END, self._handle_idle)
+
+    def _handle_CONNECT_OK(self, connect_ok: CONNECT_OK) -> None:
+        base_agent = a3.agent.base_agent.BaseAgent.get_agent()
+        base_agent.set_agent_id(connect_ok.new_agent_id)
+        base_agent.set_energy_level(connect_ok.energy_level)
+        base_agent.set_location(connect_ok.location)
+        if connect_ok.world_data is not None:
+            world = AegisParser.build_world_from_data(connect_ok.world_data)
+        else:
+            world = AegisParser.build_world(connect_ok.world_filename)
+        # the kernel has already checked the size against its own World_Max
+        self._world = InternalWorld(
+            world,  # pyright: ignore[reportArgumentType]
+            max_size=max(len(world), len(world[0])) if world else None,
+        )
+        base_agent.set_agent_state(AgentStates.CONNECTED)
+        base_agent.log("Connected Successfully")
+
+    def _handle_shutdown(self, _: DEATH_CARD | DISCONNECT) -> None:
+        a3.agent.base_agent.BaseAgent.get_agent().set_agent_state(
+            AgentStates.SHUTTING_DOWN
+        )
+
+    def _handle_idle(self, _: MESSAGES_END | ROUND_END | CMD_RESULT_END) -> None:
+        a3.agent.base_agent.BaseAgent.get_agent().set_agent_state(AgentStates.IDLE)
+
+    def _handle_MESSAGES_START(self, _: MESSAGES_START) -> None:
+        a3.agent.base_agent.BaseAgent.get_agent().set_agent_state(
+            AgentStates.READ_MAIL
+        )
+
+    def _handle_ROUND_START(self, _: ROUND_START) -> None:
+        a3.agent.base_agent.BaseAgent.get_agent().set_agent_state(AgentStates.THINK)
+
+    def _handle_CMD_RESULT_START(self, _: CMD_RESULT_START) -> None:
+        a3.agent.base_agent.BaseAgent.get_agent().set_agent_state(
+            AgentStates.GET_CMD_RESULT
+        )
+
+    def _handle_MOVE_RESULT(self, move_result: MOVE_RESULT) -> None:
+        base_agent = a3.agent.base_agent.BaseAgent.get_agent()
+        move_result_current_info: CellInfo = (
+            move_result.surround_info.get_current_info()
+        )
+        base_agent.set_energy_level(move_result.energy_level)
+        base_agent.set_location(move_result_current_info.location)
+        base_agent.update_surround(move_result.surround_info, self.get_world())  # pyright: ignore[reportArgumentType]
+
+    def _handle_SAVE_SURV_RESULT(self, save_surv_result: SAVE_SURV_RESULT) -> None:
+        base_agent = a3.agent.base_agent.BaseAgent.get_agent()
+        save_surv_result_current_info = (
+            save_surv_result.surround_info.get_current_info()
+        )
+        base_agent.set_energy_level(save_surv_result.energy_level)
+        base_agent.set_location(save_surv_result_current_info.location)
+        if save_surv_result.has_pred_info():
+            surv_id, image, labels = (
+                save_surv_result.surv_saved_id,
+                save_surv_result.image_to_predict,
+                save_surv_result.all_unique_labels,
             )
-            base_agent.set_energy_level(team_dig_result.energy_level)
-            base_agent.set_location(team_dig_result_current_info.location)
-            base_agent.update_surround(team_dig_result.surround_info, self.get_world())  # pyright: ignore[reportArgumentType]
-
-        elif isinstance(aegis_command, AEGIS_UNKNOWN):
-            base_agent.log("Brain: Got Unknown command reply from AEGIS.")
+            base_agent.add_prediction_info((surv_id, image, labels))
 
-        elif isinstance(aegis_command, CMD_RESULT_START):
-            base_agent.set_agent_state(AgentStates.GET_CMD_RESULT)
+        self.handle_save_surv_result(save_surv_result)
+        base_agent.update_surround(save_surv_result.surround_info, self.get_world())  # pyright: ignore[reportArgumentType]
 
-        elif isinstance(aegis_command, CMD_RESULT_END):
-            base_agent.set_agent_state(AgentStates.IDLE)
-
-        else:
-            base_agent.log(
-                f"Brain: Got unrecognized reply from AEGIS: {aegis_command.__class__.__name__}.",
+    def _handle_SLEEP_RESULT(self, sleep_result: SLEEP_RESULT) -> None:
+        if sleep_result.was_successful:
+            a3.agent.base_agent.BaseAgent.get_agent().set_energy_level(
+                sleep_result.charge_energy
             )
+
+    def _handle_TEAM_DIG_RESULT(self, team_dig_result: TEAM_DIG_RESULT) -> None:
+        base_agent = a3.agent.base_agent.BaseAgent.get_agent()
+        team_dig_result_current_info: CellInfo = (
+            team_dig_result.surround_info.get_current_info()
+        )
+        base_agent.set_energy_level(team_dig_result.energy_level)
+        base_agent.set_location(team_dig_result_current_info.location)
+        base_agent.update_surround(team_dig_result.surround_info, self.get_world())  # pyright: ignore[reportArgumentType]
+
+    def _handle_AEGIS_UNKNOWN(self, _: AEGIS_UNKNOWN) -> None:
+        a3.agent.base_agent.BaseAgent.get_agent().log(
+            "Brain: Got Unknown command reply from AEGIS."
+        )
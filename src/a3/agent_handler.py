@@ -1,11 +1,13 @@
-import socket
 import sys
+import time
+from typing import TypedDict
 
 from aegis.agent_control.agent_control import AgentControl
 from aegis.agent_control.agent_group import AgentGroup
 from aegis.agent_control.network.agent_crashed_exception import AgentCrashedException
 from aegis.agent_control.network.agent_socket import AgentSocket
 from aegis.agent_control.network.agent_socket_exception import AgentSocketException
+from aegis.assist.metrics_server import LatencyWindow
 from aegis.common.agent_id import AgentID
 from aegis.common.commands.agent_command import AgentCommand
 from aegis.common.commands.agent_commands import AGENT_UNKNOWN, CONNECT
@@ -20,58 +22,243 @@ from aegis.common.commands.aegis_commands import (
 )
 from aegis.common.constants import Constants
 from aegis.common.network.aegis_socket_exception import AegisSocketException
+from aegis.common.network.socket_transport import SocketListener
+from aegis.common.network.transport import TransportListener
 from a3.aegis_parser import AegisParser
 from aegis.common.parsers.aegis_parser_exception import AegisParserException
 
 import numpy as np
 
 
+class GroupCheckpoint(TypedDict):
+    gid: int
+    name: str
+    id_counter: int
+    score: int
+    number_saved: int
+    number_saved_alive: int
+    number_saved_dead: int
+    number_predicted: int
+    number_predicted_right: int
+    number_predicted_wrong: int
+
+
+class AgentControlCheckpoint(TypedDict):
+    id: int
+    gid: int
+    # the command result the agent is sent next round
+    result_of_command: str | None
+    # indexes into the checkpoint's messages
+    mailbox1: list[int]
+    mailbox2: list[int]
+
+
+class MessageCheckpoint(TypedDict):
+    message: str
+    number_left_to_read: int
+
+
+class AgentHandlerCheckpoint(TypedDict):
+    gid_counter: int
+    current_mailbox: int
+    groups: list[GroupCheckpoint]
+    agents: list[AgentControlCheckpoint]
+    messages: list[MessageCheckpoint]
+
+
 class AgentHandler:
     def __init__(self) -> None:
         self.GID_counter: int = 1
         self.agent_list: list[AgentControl] = []
+        self._agent_index: dict[AgentID, AgentControl] = {}
         self.current_agent: int = 0
         self.agent_group_list: list[AgentGroup] = []
         self.current_mailbox: int = 1
         self.forward_message_list: list[SEND_MESSAGE_RESULT] = []
         self.send_messages_to_all_groups: bool = False
-        self.server_socket: socket.socket | None = None
+        self.verbose: bool = True
+        self.listener: TransportListener | None = None
+        # restored agents that have yet to connect again, see `restore`
+        self._unconnected_agents: list[AgentControl] = []
+        # read by the metrics server thread, so only ever added to or replaced
+        self.command_bytes_sent: dict[str, int] = {}
+        self.command_bytes_received: dict[str, int] = {}
+        self.command_latency: dict[AgentID, LatencyWindow] = {}
 
     def set_agent_handler_port(self, port: int) -> None:
         try:
-            self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            self.server_socket.bind(("", port))
-            self.server_socket.listen(5)
+            self.listener = SocketListener(f"tcp://:{port}")
         except Exception:
             print(f"Aegis  : Can't create server socket at port: {port}")
             raise AegisSocketException()
 
+    def set_agent_handler_endpoint(self, endpoint: str) -> None:
+        """Accepts agents on `endpoint`, `tcp://host:port` or `unix:///path`."""
+        try:
+            self.listener = SocketListener(endpoint)
+        except Exception as e:
+            print(f"Aegis  : Can't create server socket at {endpoint}: {e}")
+            raise AegisSocketException()
+
+    def set_agent_listener(self, listener: TransportListener) -> None:
+        """Accepts agents on `listener`, e.g. a `LoopbackListener`, not a port."""
+        self.listener = listener
+
     def shutdown(self) -> None:
+        self.remove_all_agents()
+        self._reset_all()
+
+    def remove_all_agents(self) -> None:
+        """Disconnects and forgets every agent and group, keeping the listener."""
         for agent in self.agent_list:
             if agent.agent_socket:
                 agent.agent_socket.disconnect()
-        self._reset_all()
-
-    def _reset_all(self):
         self.GID_counter = 1
         self.agent_list.clear()
+        self._agent_index.clear()
+        self.current_agent = 0
+        self.command_latency = {}
         self.current_mailbox = 1
         self.agent_group_list.clear()
         self.forward_message_list.clear()
+        self._unconnected_agents.clear()
+
+    def checkpoint(self) -> AgentHandlerCheckpoint:
+        """
+        Returns the groups and agents, with the command results and messages
+        they are sent next round, to be put back by `restore`.
+        """
+        messages: list[MessageCheckpoint] = []
+        message_index: dict[int, int] = {}
+
+        def index_of(smr: SEND_MESSAGE_RESULT) -> int:
+            # a message sent to many agents is one object in many mailboxes
+            index = message_index.get(id(smr))
+            if index is None:
+                index = message_index[id(smr)] = len(messages)
+                messages.append(
+                    {
+                        "message": str(smr),
+                        "number_left_to_read": smr.get_number_left_to_read(),
+                    }
+                )
+            return index
+
+        agents: list[AgentControlCheckpoint] = []
+        for agent in self.agent_list:
+            result = agent.result_of_command
+            agents.append(
+                {
+                    "id": agent.agent_id.id,
+                    "gid": agent.agent_id.gid,
+                    "result_of_command": (
+                        None if result is None else self._encode_command(result)
+                    ),
+                    "mailbox1": [index_of(smr) for smr in agent.mailbox1],
+                    "mailbox2": [index_of(smr) for smr in agent.mailbox2],
+                }
+            )
+        return {
+            "gid_counter": self.GID_counter,
+            "current_mailbox": self.current_mailbox,
+            "groups": [
+                {
+                    "gid": group.GID,
+                    "name": group.name,
+                    "id_counter": group.id_counter,
+                    "score": group.score,
+                    "number_saved": group.number_saved,
+                    "number_saved_alive": group.number_saved_alive,
+                    "number_saved_dead": group.number_saved_dead,
+                    "number_predicted": group.number_predicted,
+                    "number_predicted_right": group.number_predicted_right,
+                    "number_predicted_wrong": group.number_predicted_wrong,
+                }
+                for group in self.agent_group_list
+            ],
+            "agents": agents,
+            "messages": messages,
+        }
+
+    def restore(self, checkpoint: AgentHandlerCheckpoint) -> None:
+        """
+        Replaces every group and agent with those of a checkpoint.
+
+        Connected agents are disconnected. The restored agents have no
+        connection; an agent that connects takes the place of one of its
+        group's, see `add_agent`.
+
+        Args:
+            checkpoint: The checkpoint, from `checkpoint`.
+
+        Raises:
+            AegisParserException: If a command result or message can't be
+                parsed.
+        """
+        self.remove_all_agents()
+        messages: list[SEND_MESSAGE_RESULT] = []
+        for message in checkpoint["messages"]:
+            smr = AegisParser.parse_aegis_command(message["message"])
+            if not isinstance(smr, SEND_MESSAGE_RESULT):
+                raise AegisParserException(f"Not a message: {message['message']}")
+            smr.set_number_left_to_read(message["number_left_to_read"])
+            messages.append(smr)
+
+        for data in checkpoint["groups"]:
+            group = AgentGroup(data["gid"], data["name"])
+            group.id_counter = data["id_counter"]
+            group.score = data["score"]
+            group.number_saved = data["number_saved"]
+            group.number_saved_alive = data["number_saved_alive"]
+            group.number_saved_dead = data["number_saved_dead"]
+            group.number_predicted = data["number_predicted"]
+            group.number_predicted_right = data["number_predicted_right"]
+            group.number_predicted_wrong = data["number_predicted_wrong"]
+            self.agent_group_list.append(group)
+        self.GID_counter = checkpoint["gid_counter"]
+        self.current_mailbox = checkpoint["current_mailbox"]
+
+        for data in checkpoint["agents"]:
+            agent = AgentControl(AgentID(data["id"], data["gid"]))
+            result = data["result_of_command"]
+            if result is not None:
+                agent.result_of_command = AegisParser.parse_aegis_command(result)
+            agent.mailbox1 = [messages[index] for index in data["mailbox1"]]
+            agent.mailbox2 = [messages[index] for index in data["mailbox2"]]
+            group = self.get_agent_group(data["gid"])
+            if group is not None:
+                group.agent_list.append(agent)
+            self.agent_list.append(agent)
+            self._agent_index[agent.agent_id] = agent
+            self.command_latency[agent.agent_id] = LatencyWindow()
+            self._unconnected_agents.append(agent)
+        self.forward_message_list = messages
+
+    def remove_unconnected_agents(self) -> list[AgentID]:
+        """
+        Forgets the restored agents that haven't connected again.
+
+        Returns:
+            The ids of the agents removed.
+        """
+        removed = [agent.agent_id for agent in self._unconnected_agents]
+        for agent_id in removed:
+            self.remove_agent(agent_id)
+        self._unconnected_agents.clear()
+        return removed
+
+    def _reset_all(self):
         self.send_messages_to_all_groups = False
-        if self.server_socket:
-            self.server_socket.close()
-            self.server_socket = None
+        if self.listener:
+            self.listener.close()
+            self.listener = None
 
     def connect_to_agent(self, timeout: int) -> AgentID | None:
-        if self.server_socket is None:
+        if self.listener is None:
             return None
-        server_socket = self.server_socket
         try:
-            server_socket.settimeout(timeout)
             agent_socket = AgentSocket()
-            agent_socket.connect(server_socket)
+            agent_socket.connect(self.listener, timeout)
             message = agent_socket.read_message(timeout=timeout)
 
             if message is None:
@@ -83,28 +270,49 @@ class AgentHandler:
                 agent_socket.disconnect()
                 return None
 
-            agent_connect = command
-            group = self.get_group(agent_connect.group_name)
-            if group is None:
-                gid = self.add_group(agent_connect.group_name).GID
-            else:
-                gid = group.GID
-
-            group = self.get_group(agent_connect.group_name)
-            if group is None:
-                return None
-
-            id = group.id_counter
-            agent_control = AgentControl(AgentID(id, group.GID))
-            group.id_counter += 1
-
-            agent_control.agent_socket = agent_socket
-            group.agent_list.append(agent_control)
-            self.agent_list.append(agent_control)
-            return AgentID(id, gid)
+            return self.add_agent(command.group_name, agent_socket)
         except AgentSocketException | AegisParserException | AgentCrashedException:
             return None
 
+    def add_agent(
+        self, group_name: str, agent_socket: AgentSocket | None = None
+    ) -> AgentID:
+        """
+        Adds an agent to a group, creating the group if it is new.
+
+        Args:
+            group_name: The name of the agent's group.
+            agent_socket: The agent's connection, or None for an agent whose
+                commands are handed to the kernel directly, e.g. by
+                `a3.vector_env`. Nothing is sent to such an agent. A connected
+                agent takes the place of the first restored agent of its group
+                that hasn't connected yet, if any.
+
+        Returns:
+            The agent's id.
+        """
+        group = self.get_group(group_name)
+        if group is None:
+            group = self.add_group(group_name)
+
+        if agent_socket is not None:
+            for agent_control in self._unconnected_agents:
+                if agent_control.agent_id.gid == group.GID:
+                    self._unconnected_agents.remove(agent_control)
+                    agent_control.agent_socket = agent_socket
+                    return agent_control.agent_id
+
+        id = group.id_counter
+        agent_control = AgentControl(AgentID(id, group.GID))
+        group.id_counter += 1
+
+        agent_control.agent_socket = agent_socket
+        group.agent_list.append(agent_control)
+        self.agent_list.append(agent_control)
+        self._agent_index[agent_control.agent_id] = agent_control
+        self.command_latency[agent_control.agent_id] = LatencyWindow()
+        return AgentID(id, group.GID)
+
     def add_group(self, group_name: str) -> AgentGroup:
         group = AgentGroup(self.GID_counter, group_name)
         self.GID_counter += 1
@@ -138,11 +346,26 @@ class AgentHandler:
 
         return groups_data
 
+    def get_group_results(self) -> list[dict[str, str | int]]:
+        """Returns every counter of every group, for the results file."""
+        return [
+            {
+                "gid": group.GID,
+                "name": group.name,
+                "agents_alive": len(group.agent_list),
+                "score": group.score,
+                "number_saved": group.number_saved,
+                "number_saved_alive": group.number_saved_alive,
+                "number_saved_dead": group.number_saved_dead,
+                "number_predicted": group.number_predicted,
+                "number_predicted_right": group.number_predicted_right,
+                "number_predicted_wrong": group.number_predicted_wrong,
+            }
+            for group in self.agent_group_list
+        ]
+
     def get_agent(self, agent_id: AgentID) -> AgentControl | None:
-        for agent in self.agent_list:
-            if agent.agent_id == agent_id:
-                return agent
-        return None
+        return self._agent_index.get(agent_id)
 
     def get_current_agent(self) -> AgentControl:
         return self.agent_list[self.current_agent]
@@ -159,6 +382,7 @@ class AgentHandler:
             return
 
         self.agent_list.remove(agent)
+        del self._agent_index[agent_id]
         group: AgentGroup | None = self.get_agent_group(agent_id.gid)
         if group is None:
             return
@@ -168,6 +392,12 @@ class AgentHandler:
     def get_number_of_agents(self) -> int:
         return len(self.agent_list)
 
+    def is_local_agent(self, agent_id: AgentID) -> bool:
+        agent = self.get_agent(agent_id)
+        if agent is None or agent.agent_socket is None:
+            return False
+        return agent.agent_socket.is_local()
+
     def send_message_to_current(self, command: AegisCommand) -> None:
         agent = self.get_current_agent()
         self.send_message_to(agent.agent_id, command)
@@ -181,24 +411,17 @@ class AgentHandler:
                 if (
                     isinstance(command, SAVE_SURV_RESULT)
                     and command.image_to_predict is not None
+                    and command.all_unique_labels is None
                 ):
-                    image = command.image_to_predict
-                    unique_labels = command.all_unique_labels
-                    if unique_labels is None:
-                        return
-
-                    if image.size == 0 or unique_labels.size == 0:
-                        raise ValueError("Image or unique_labels is empty.")
-
-                    message: str = str(command)
-                    surv_id_str = str(command.surv_saved_id)
-                    image_str = " ".join(map(str, image.flatten()))
-                    labels_str = " ".join(map(str, unique_labels))
-
-                    message += f" PredInfo: SURV_ID: {surv_id_str} IMAGE: {image_str} LABELS: {labels_str}"
-                    agent.agent_socket.send_message(message)
-                else:
-                    agent.agent_socket.send_message(str(command))
+                    return
+                message = self._encode_command(command)
+                agent.agent_socket.send_message(message)
+                self._count_bytes(
+                    self.command_bytes_sent,
+                    command,
+                    message,
+                    agent.agent_socket.framing_bytes,
+                )
         except AgentCrashedException as e:
             print(
                 f'Aegis  : Exception "{e}" sending message " {command} " to agent {agent_id} !',
@@ -211,6 +434,27 @@ class AgentHandler:
                 file=sys.stderr,
             )
 
+    @staticmethod
+    def _encode_command(command: AegisCommand) -> str:
+        if (
+            isinstance(command, SAVE_SURV_RESULT)
+            and command.image_to_predict is not None
+            and command.all_unique_labels is not None
+        ):
+            image = command.image_to_predict
+            unique_labels = command.all_unique_labels
+            if image.size == 0 or unique_labels.size == 0:
+                raise ValueError("Image or unique_labels is empty.")
+
+            message: str = str(command)
+            surv_id_str = str(command.surv_saved_id)
+            image_str = " ".join(map(str, image.flatten()))
+            labels_str = " ".join(map(str, unique_labels))
+
+            message += f" PredInfo: SURV_ID: {surv_id_str} IMAGE: {image_str} LABELS: {labels_str}"
+            return message
+        return str(command)
+
     def send_message_to_all(self, command: AegisCommand) -> None:
         for agent in self.agent_list:
             self.send_message_to(agent.agent_id, command)
@@ -221,10 +465,17 @@ class AgentHandler:
             if agent.agent_socket is None:
                 return None
 
+            start = time.perf_counter()
             s = agent.agent_socket.read_message(timeout=timeout)
             if not s:
                 return None
+            latency = self.command_latency.get(agent.agent_id)
+            if latency is not None:
+                latency.add(time.perf_counter() - start)
             command = AegisParser.parse_agent_command(s)
+            self._count_bytes(
+                self.command_bytes_received, command, s, agent.agent_socket.framing_bytes
+            )
         except AgentSocketException:
             print(
                 f"Aegis  : Exception reading message from agent {self.get_current_agent().agent_id} !",
@@ -246,12 +497,34 @@ class AgentHandler:
         command.set_agent_id(self.get_current_agent().agent_id)
         return command
 
+    def _count_bytes(
+        self,
+        counts: dict[str, int],
+        command: AgentCommand | AegisCommand,
+        message: str,
+        framing_bytes: int,
+    ) -> None:
+        name = type(command).__name__
+        counts[name] = counts.get(name, 0) + len(message) + framing_bytes
+
     def set_result_of_command(self, agent_id: AgentID, command: AegisCommand) -> None:
         agent = self.get_agent(agent_id)
         if agent is None:
             return
         agent.result_of_command = command
 
+    def pop_result_of_command(self, agent_id: AgentID) -> AegisCommand | None:
+        """
+        Returns and clears the result the agent is sent next round, for an
+        agent with no connection.
+        """
+        agent = self.get_agent(agent_id)
+        if agent is None:
+            return None
+        result = agent.result_of_command
+        agent.result_of_command = None
+        return result
+
     def send_result_of_command_to_current(self) -> None:
         agent = self.get_current_agent()
         if agent.result_of_command is not None:
@@ -339,8 +612,9 @@ class AgentHandler:
     def increase_agent_group_saved(
         self, gid: int, number_saved: int, save_state: int
     ) -> None:
-        state_message = "alive" if save_state == Constants.SAVE_STATE_ALIVE else "dead"
-        print(f"Aegis  : Group {gid} saved {number_saved} survivors {state_message}.")
+        if self.verbose:
+            state = "alive" if save_state == Constants.SAVE_STATE_ALIVE else "dead"
+            print(f"Aegis  : Group {gid} saved {number_saved} survivors {state}.")
         agent_group: AgentGroup | None = self.get_agent_group(gid)
         if agent_group is None:
             return
@@ -379,9 +653,10 @@ class AgentHandler:
             agent_group.number_predicted_wrong += 1
         agent_group.number_predicted += 1
 
-        print(
-            f"Aegis  : Group {gid} predicted symbol {label} from survivor {surv_id} {correct_string}"
-        )
+        if self.verbose:
+            print(
+                f"Aegis  : Group {gid} predicted symbol {label} from survivor {surv_id} {correct_string}"
+            )
 
     def print_group_survivor_saves(self) -> None:
         print("=================================================")
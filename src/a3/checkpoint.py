@@ -0,0 +1,191 @@
+"""
+Checkpoints of a running simulation, for resuming it after a crash or for
+forking experiments from a mid-game state.
+
+A checkpoint is taken between rounds, see `Aegis.checkpoint`, and put back on
+a kernel that has built the same world with `Aegis.restore`, or from the
+command line with `-Resume`.
+"""
+
+import json
+import os
+import struct
+import threading
+import zlib
+from dataclasses import asdict, dataclass
+from typing import cast
+
+from a3.agent_handler import AgentHandlerCheckpoint
+from aegis.agent_predictions.prediction_handler import PredictionCheckpoint
+from aegis.world.aegis_world import WorldCheckpoint
+
+
+@dataclass
+class Checkpoint:
+    """
+    The state of a simulation between two rounds.
+
+    Attributes:
+        world_filename (str): The world file the simulation was started on.
+        rounds_completed (int): The rounds run before the checkpoint.
+        world (WorldCheckpoint): The world, see `AegisWorld.checkpoint`.
+        agent_handler (AgentHandlerCheckpoint): The groups, agents and their
+            mailboxes, see `AgentHandler.checkpoint`.
+        predictions (PredictionCheckpoint | None): The pending predictions,
+            or None if predictions are disabled.
+    """
+
+    world_filename: str
+    rounds_completed: int
+    world: WorldCheckpoint
+    agent_handler: AgentHandlerCheckpoint
+    predictions: PredictionCheckpoint | None
+
+
+class CheckpointFile:
+    """
+    Reads and writes checkpoint files.
+
+    The file is a fixed little-endian header followed by the checkpoint as
+    zlib compressed JSON, so loading a checkpoint never runs code from it.
+    A checkpoint of a large world is mostly the cells changed since it was
+    built, so it stays small however large the world is.
+    """
+
+    MAGIC = b"AEGC"
+    VERSION = 1
+    # magic, version, flags, rounds completed, payload size, payload crc32
+    _HEADER = struct.Struct("<4sHHIII")
+
+    @staticmethod
+    def encode(checkpoint: Checkpoint) -> bytes:
+        payload = zlib.compress(
+            json.dumps(asdict(checkpoint), separators=(",", ":")).encode()
+        )
+        header = CheckpointFile._HEADER.pack(
+            CheckpointFile.MAGIC,
+            CheckpointFile.VERSION,
+            0,
+            checkpoint.rounds_completed,
+            len(payload),
+            zlib.crc32(payload),
+        )
+        return header + payload
+
+    @staticmethod
+    def decode(data: bytes) -> Checkpoint:
+        """
+        Decodes a checkpoint encoded by `encode`.
+
+        Raises:
+            ValueError: If the data is not a checkpoint or is damaged.
+        """
+        header_size = CheckpointFile._HEADER.size
+        if len(data) < header_size:
+            raise ValueError("Too small to be a checkpoint")
+        magic, version, _flags, _rounds, size, crc = cast(
+            tuple[bytes, int, int, int, int, int],
+            CheckpointFile._HEADER.unpack_from(data),
+        )
+        if magic != CheckpointFile.MAGIC:
+            raise ValueError("Not a checkpoint")
+        if version != CheckpointFile.VERSION:
+            raise ValueError(
+                f"Checkpoint version {version}, expected {CheckpointFile.VERSION}"
+            )
+        payload = data[header_size : header_size + size]
+        if len(payload) != size or zlib.crc32(payload) != crc:
+            raise ValueError("Checkpoint is truncated or damaged")
+        return Checkpoint(**json.loads(zlib.decompress(payload)))
+
+    @staticmethod
+    def write(checkpoint: Checkpoint, filename: str) -> None:
+        """
+        Writes a checkpoint, replacing the file only once it is complete, so
+        a crash while writing leaves the previous checkpoint in place.
+        """
+        data = CheckpointFile.encode(checkpoint)
+        temporary = f"{filename}.tmp"
+        with open(temporary, "wb") as file:
+            _ = file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, filename)
+
+    @staticmethod
+    def read(filename: str) -> Checkpoint:
+        """
+        Reads a checkpoint file.
+
+        Args:
+            filename: The path of the checkpoint file.
+
+        Returns:
+            The checkpoint.
+
+        Raises:
+            ValueError: If the file is not a checkpoint file or is damaged.
+        """
+        with open(filename, "rb") as file:
+            data = file.read()
+        try:
+            return CheckpointFile.decode(data)
+        except ValueError as e:
+            raise ValueError(f"'{filename}': {e}") from e
+
+
+class CheckpointWriter:
+    """
+    Writes checkpoints from a background thread.
+
+    The kernel only takes the checkpoint, which is cheap; encoding,
+    compressing and writing it happen on the writer's thread. A checkpoint
+    submitted while the previous one is still being written replaces any
+    other waiting one, so the writer never falls behind the simulation.
+
+    `filename` may contain `{round}`, replaced by the rounds completed, to
+    keep every checkpoint instead of only the latest.
+
+    Examples:
+        >>> writer = CheckpointWriter("checkpoint_{round}.ckpt")
+        >>> writer.submit(aegis.checkpoint())
+        >>> writer.close()
+    """
+
+    def __init__(self, filename: str) -> None:
+        self.filename: str = filename
+        self._pending: Checkpoint | None = None
+        self._closed: bool = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(
+            target=self._run, name="aegis-checkpoint", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, checkpoint: Checkpoint) -> None:
+        with self._condition:
+            self._pending = checkpoint
+            self._condition.notify()
+
+    def close(self) -> None:
+        """Writes the checkpoint still waiting, if any, and stops the thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self._pending is None and not self._closed:
+                    _ = self._condition.wait()
+                checkpoint, self._pending = self._pending, None
+                if checkpoint is None:
+                    return
+            filename = self.filename.replace(
+                "{round}", str(checkpoint.rounds_completed)
+            )
+            try:
+                CheckpointFile.write(checkpoint, filename)
+            except OSError as e:
+                print(f"Aegis  : Unable to write checkpoint '{filename}': {e}")
@@ -0,0 +1,122 @@
+"""
+Runs the AEGIS kernel and its agents in one interpreter.
+
+The kernel accepts agents on a `LoopbackListener` instead of a TCP port, and
+every agent runs on its own thread with its own `BaseAgent`, so there are no
+sockets, no message framing and no agent processes to start. This is meant
+for offline evaluation, where the simulation, not the network, should set
+the pace. Brains must not share mutable module-level state, since they now
+share an interpreter.
+"""
+
+import importlib
+import inspect
+import sys
+import threading
+from collections.abc import Callable, Sequence
+
+from a3.aegis_main import Aegis
+from a3.agent.base_agent import BaseAgent
+from a3.agent.brain import Brain
+from aegis.common.network.loopback_transport import LoopbackListener
+from aegis.common.network.transport import Transport
+
+BrainFactory = Callable[[], Brain]
+
+
+def run_in_process(
+    kernel_args: list[str], agents: Sequence[tuple[str, BrainFactory]]
+) -> bool:
+    """
+    Runs a whole simulation on this interpreter.
+
+    Args:
+        kernel_args: The kernel's command line (as for `aegis/main.py`),
+            without `-NoKViewer`, which is set to the number of agents.
+        agents: The group name and brain factory (usually the `Brain`
+            subclass itself) of every agent. Each brain is created on its
+            agent's thread.
+
+    Returns:
+        True if the simulation ran, False if the kernel couldn't start.
+    """
+    aegis = Aegis()
+    if not aegis.read_command_line(["-NoKViewer", str(len(agents)), *kernel_args]):
+        print("Aegis  : Unable to initialize.", file=sys.stderr)
+        return False
+
+    listener = LoopbackListener()
+    aegis.set_agent_listener(listener)
+    if not aegis.start_up():
+        print("Aegis  : Unable to start up.", file=sys.stderr)
+        return False
+
+    threads: list[threading.Thread] = []
+    try:
+        if not aegis.build_world():
+            print("Aegis  : Error building world.", file=sys.stderr)
+            return False
+
+        for index, (group_name, brain_factory) in enumerate(agents):
+            # agents are accepted in the order they connect, so connect them
+            # here rather than on their threads for the same ids every run
+            thread = threading.Thread(
+                target=_run_agent,
+                args=(listener.connect(), group_name, brain_factory),
+                name=f"aegis-agent-{index + 1}",
+                daemon=True,
+            )
+            thread.start()
+            threads.append(thread)
+
+        aegis.connect_all_agents()
+        aegis.run_state()
+    finally:
+        aegis.shutdown()
+        for thread in threads:
+            thread.join(timeout=5)
+    return True
+
+
+def find_brain(agent_name: str) -> type[Brain]:
+    """
+    Finds the brain of an agent in `src/agents`.
+
+    Agents are started by their `main.py`, which imports the brain it runs,
+    so the brain is the one concrete `Brain` subclass in that module.
+
+    Args:
+        agent_name: The agent's directory, e.g. "example_agent_a3".
+
+    Returns:
+        The brain class, which is also a brain factory.
+
+    Raises:
+        ImportError: If the agent's main module can't be imported.
+        LookupError: If the module has no brain, or more than one.
+    """
+    module = importlib.import_module(f"agents.{agent_name}.main")
+    brains = {
+        value
+        for value in vars(module).values()
+        if inspect.isclass(value)
+        and issubclass(value, Brain)
+        and not inspect.isabstract(value)
+    }
+    if len(brains) != 1:
+        raise LookupError(
+            f"Expected one Brain in agents/{agent_name}/main.py, found {len(brains)}"
+        )
+    return brains.pop()
+
+
+def _run_agent(
+    transport: Transport, group_name: str, brain_factory: BrainFactory
+) -> None:
+    try:
+        agent = BaseAgent.create_for_thread()
+        agent.start_with_transport(transport, group_name, brain_factory())
+    finally:
+        # if the brain raises, the kernel sees the agent disconnect, as it
+        # would if an agent process died, instead of waiting for it forever
+        transport.close()
@@ -0,0 +1,371 @@
+"""
+Drives a kernel with many lightweight clients, to load test the agent
+connections.
+
+A single asyncio process opens one connection per client and speaks the
+agent protocol directly, so thousands of clients cost a few kilobytes each
+instead of an interpreter each. Every round a client sends the commands of
+its policy and END_TURN as soon as ROUND_START arrives:
+
+- `walk`: a random move, seeded per client.
+- `idle`: only END_TURN, which leaves the connection and protocol cost.
+- a replay or command log (see `a3.resimulator`): client `i` plays the
+  recorded commands of the replay's `i`th agent, wrapping around to the
+  first agent when there are more clients than recorded agents, and to the
+  first round when the simulation runs longer than the recording.
+
+The kernel hands the round to its agents one at a time, so a round takes
+the sum of every agent's turn. The generator reports the rounds' times, as
+the clients see them, and each turn from ROUND_START to ROUND_END, which is
+the kernel's own handling of the turn plus both ends of the connection.
+
+Start the kernel first, waiting for as many agents as there are clients.
+Each connection is a file descriptor on both ends, so raise `ulimit -n` for
+more than about a thousand clients.
+
+Usage (with `src` on the PYTHONPATH):
+    python -m aegis.main -NoKViewer 1000 -WorldFile worlds/ExampleWorld.world \\
+        -NumRound 100 -Turbo true
+    python -m a3.load_generator --agents 1000 [--policy walk | --replay replay.txt]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import struct
+import sys
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+
+from a3.aegis_parser import AegisParser
+from a3.resimulator import CommandLog, parse_command_record
+from aegis.common import AgentID, Constants, Direction
+from aegis.common.commands.agent_commands import CONNECT, END_TURN, MOVE
+from aegis.common.commands.aegis_commands import CONNECT_OK
+from aegis.common.commands.command import Command
+from aegis.common.network.socket_transport import parse_endpoint
+
+# the framing of `SocketTransport`: a 4 byte little-endian length, which
+# counts the null terminator, the ASCII message and a null byte
+_LENGTH = struct.Struct("<I")
+_END_TURN = str(END_TURN())
+_MOVES = [
+    str(MOVE(direction)) for direction in Direction if direction != Direction.CENTER
+]
+
+# the commands a client sends in a round, given its index and the round
+Policy = Callable[[int, int], Sequence[str]]
+
+
+def walk_policy(seed: int) -> Policy:
+    """Moves every client in a random direction every round."""
+    rngs: dict[int, random.Random] = {}
+
+    def policy(client: int, round: int) -> Sequence[str]:
+        rng = rngs.setdefault(client, random.Random(seed + client))
+        return [rng.choice(_MOVES)]
+
+    return policy
+
+
+def idle_policy(client: int, round: int) -> Sequence[str]:
+    """Only ends the turn."""
+    return []
+
+
+def recorded_policy(log: CommandLog) -> Policy:
+    """
+    Plays back the commands of a recorded simulation.
+
+    Raises:
+        ValueError: If the recording has no agents or a command can't be
+            parsed.
+    """
+    if not log.agents:
+        raise ValueError("The recording has no agents")
+    rounds = max(len(log.rounds), 1)
+    streams: dict[AgentID, list[list[str]]] = {
+        AgentID(id, gid): [[] for _ in range(rounds)] for id, gid, *_ in log.agents
+    }
+    for index, recorded in enumerate(log.rounds):
+        for record in recorded.commands:
+            command = parse_command_record(record)
+            stream = streams.get(command.get_agent_id())
+            if stream is not None:
+                stream[index].append(str(command))
+    ordered = list(streams.values())
+
+    def policy(client: int, round: int) -> Sequence[str]:
+        return ordered[client % len(ordered)][(round - 1) % rounds]
+
+    return policy
+
+
+@dataclass
+class LoadReport:
+    """
+    What the clients saw of a run.
+
+    Attributes:
+        agents (int): The clients that connected.
+        connect_seconds (float): The time to connect them all.
+        round_starts (list[float]): When each round's first ROUND_START
+            arrived, from `time.perf_counter`.
+        round_ends (list[float]): When each round's last ROUND_END arrived.
+        turn_seconds (list[float]): Every turn, from ROUND_START to ROUND_END.
+        messages_sent (int): The messages the clients sent after connecting.
+        messages_received (int): The messages the clients received.
+    """
+
+    agents: int = 0
+    connect_seconds: float = 0.0
+    round_starts: list[float] = field(default_factory=list)
+    round_ends: list[float] = field(default_factory=list)
+    turn_seconds: list[float] = field(default_factory=list)
+    messages_sent: int = 0
+    messages_received: int = 0
+
+    @property
+    def rounds(self) -> int:
+        return len(self.round_starts)
+
+    @property
+    def elapsed_seconds(self) -> float:
+        """From the first round's start to the last round's end."""
+        if not self.round_starts:
+            return 0.0
+        return self.round_ends[-1] - self.round_starts[0]
+
+    def round_seconds(self) -> list[float]:
+        """Each round, from its first ROUND_START to the next round's."""
+        starts = self.round_starts
+        periods = [later - earlier for earlier, later in zip(starts, starts[1:])]
+        if starts:
+            periods.append(self.round_ends[-1] - starts[-1])
+        return periods
+
+    def summary(self) -> dict[str, float]:
+        """The run's throughput and latency percentiles, in seconds."""
+        elapsed = self.elapsed_seconds
+        summary = {
+            "agents": float(self.agents),
+            "connect_s": self.connect_seconds,
+            "rounds": float(self.rounds),
+            "rounds_per_s": self.rounds / elapsed if elapsed > 0 else 0.0,
+            "turns_per_s": len(self.turn_seconds) / elapsed if elapsed > 0 else 0.0,
+        }
+        for name, samples in (
+            ("round", self.round_seconds()),
+            ("turn", self.turn_seconds),
+        ):
+            if len(samples) < 2:
+                continue
+            percentiles = statistics.quantiles(samples, n=100, method="inclusive")
+            summary[f"{name}_p50_s"] = statistics.median(samples)
+            summary[f"{name}_p99_s"] = percentiles[98]
+            summary[f"{name}_max_s"] = max(samples)
+        return summary
+
+
+class LoadGenerator:
+    """
+    Connects clients to a kernel and plays its rounds with them.
+
+    Examples:
+        >>> generator = LoadGenerator("tcp://localhost:6001", walk_policy(1))
+        >>> report = asyncio.run(generator.run(1000))
+        >>> report.summary()["rounds_per_s"]
+    """
+
+    def __init__(
+        self, endpoint: str, policy: Policy, group_name: str = "load"
+    ) -> None:
+        """
+        Args:
+            endpoint: Where the kernel listens for agents, see
+                `parse_endpoint`.
+            policy: The commands each client sends every round.
+            group_name: The group the clients join.
+
+        Raises:
+            ValueError: If the endpoint is invalid.
+        """
+        self.endpoint: str = endpoint
+        self.policy: Policy = policy
+        self.group_name: str = group_name
+        self.report: LoadReport = LoadReport()
+        _ = parse_endpoint(endpoint)
+
+    async def run(self, agents: int, connect_timeout: float = 30.0) -> LoadReport:
+        """
+        Connects `agents` clients and plays until the kernel disconnects them.
+
+        Args:
+            agents: How many clients to connect.
+            connect_timeout: How long to wait for the kernel to listen.
+
+        Returns:
+            What the clients saw.
+
+        Raises:
+            ConnectionError: If a client isn't accepted.
+            OSError: If the kernel isn't listening within `connect_timeout`.
+        """
+        self.report = LoadReport()
+        clients: list[asyncio.Task[None]] = []
+        start = time.perf_counter()
+        try:
+            # the kernel accepts agents one at a time, so connect them in order
+            for client in range(agents):
+                reader, writer = await self._connect(connect_timeout)
+                clients.append(asyncio.create_task(self._play(client, reader, writer)))
+            self.report.agents = agents
+            self.report.connect_seconds = time.perf_counter() - start
+            _ = await asyncio.gather(*clients)
+        finally:
+            for task in clients:
+                _ = task.cancel()
+        return self.report
+
+    async def _connect(
+        self, timeout: float
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                reader, writer = await self._open_connection()
+                break
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise
+                await asyncio.sleep(0.05)
+
+        _send(writer, str(CONNECT(self.group_name)))
+        await writer.drain()
+        message = await _read(reader)
+        command = AegisParser.parse_aegis_command(message) if message else None
+        if not isinstance(command, CONNECT_OK):
+            writer.close()
+            raise ConnectionError(f"Expected CONNECT_OK, got {message!r}")
+        return reader, writer
+
+    async def _open_connection(
+        self,
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        _, address = parse_endpoint(self.endpoint)
+        if isinstance(address, tuple):
+            host, port = address
+            return await asyncio.open_connection(host or "localhost", port)
+        return await asyncio.open_unix_connection(address)
+
+    async def _play(
+        self, client: int, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        report = self.report
+        round = 0
+        turn_start = 0.0
+        try:
+            while (message := await _read(reader)) is not None:
+                report.messages_received += 1
+                if message == Command.STR_ROUND_START:
+                    turn_start = time.perf_counter()
+                    round += 1
+                    # the first client to start a round starts it for all
+                    if round > len(report.round_starts):
+                        report.round_starts.append(turn_start)
+                        report.round_ends.append(turn_start)
+                    commands = self.policy(client, round)
+                    for command in commands:
+                        _send(writer, command)
+                    _send(writer, _END_TURN)
+                    report.messages_sent += len(commands) + 1
+                    await writer.drain()
+                elif message == Command.STR_ROUND_END:
+                    now = time.perf_counter()
+                    report.turn_seconds.append(now - turn_start)
+                    report.round_ends[round - 1] = now
+                elif message.startswith(
+                    (Command.STR_DEATH_CARD, Command.STR_DISCONNECT)
+                ):
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+def _send(writer: asyncio.StreamWriter, message: str) -> None:
+    encoded = message.encode("ascii")
+    writer.write(_LENGTH.pack(len(encoded) + 1) + encoded + b"\x00")
+
+
+async def _read(reader: asyncio.StreamReader) -> str | None:
+    """Reads a message, or returns None once the kernel closes the connection."""
+    try:
+        size: int = _LENGTH.unpack(await reader.readexactly(_LENGTH.size))[0]
+    except asyncio.IncompleteReadError:
+        return None
+    # the message and its null byte
+    return (await reader.readexactly(size))[:-1].decode("ascii").strip()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Load test an AEGIS kernel with many lightweight agents",
+        epilog="Example: python -m a3.load_generator --agents 1000",
+    )
+    _ = parser.add_argument(
+        "--agents", type=int, default=100, help="How many clients to connect"
+    )
+    _ = parser.add_argument(
+        "--endpoint",
+        default=os.environ.get(
+            "AEGIS_ENDPOINT", f"tcp://localhost:{Constants.AGENT_PORT}"
+        ),
+        help="Where the kernel listens, by default $AEGIS_ENDPOINT or port 6001",
+    )
+    _ = parser.add_argument(
+        "--policy", choices=["walk", "idle"], default="walk", help="What clients do"
+    )
+    _ = parser.add_argument(
+        "--replay",
+        default=None,
+        help="Play the commands of this replay or command log instead",
+    )
+    _ = parser.add_argument("--seed", type=int, default=1, help="Seeds `walk`")
+    _ = parser.add_argument("--group", default="load", help="The clients' group")
+    args = parser.parse_args()
+    agents: int = args.agents  # pyright: ignore[reportAny]
+    replay: str | None = args.replay  # pyright: ignore[reportAny]
+    policy_name: str = args.policy  # pyright: ignore[reportAny]
+
+    try:
+        if replay is not None:
+            policy = recorded_policy(CommandLog.read(replay))
+        elif policy_name == "idle":
+            policy = idle_policy
+        else:
+            policy = walk_policy(args.seed)  # pyright: ignore[reportAny]
+        generator = LoadGenerator(
+            args.endpoint,  # pyright: ignore[reportAny]
+            policy,
+            args.group,  # pyright: ignore[reportAny]
+        )
+        report = asyncio.run(generator.run(agents))
+    except (OSError, ValueError) as e:
+        print(f"Load generator: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    for name, value in report.summary().items():
+        # latencies in milliseconds
+        if name.startswith(("round_", "turn_")):
+            print(f"{name[:-2] + '_ms':<16} {value * 1000:12.3f}")
+        else:
+            print(f"{name:<16} {value:12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,420 @@
+"""
+Re-simulates a recorded simulation from its replay, with no agents.
+
+Every round of a replay records the commands the kernel handled, in order,
+followed by what the simulation did with them. The re-simulator hands those
+commands straight to a turbo kernel (see `Aegis.run_round`), so there are no
+sockets, no agent processes and no waiting on agents, and by default checks
+that every round's `Sim_Events` through `Dead_Agents` come out exactly as
+recorded. That makes a recorded simulation both a deterministic workload for
+benchmarking the kernel and a regression check for changes to it.
+
+A replay can be cut down to a command log, which refers to the world file
+instead of holding the whole world.
+
+Usage (with `src` on the PYTHONPATH):
+    python -m a3.resimulator replay.txt [--world worlds/ExampleWorld.world]
+    python -m a3.resimulator replay.txt --write-log replay.cmdlog
+"""
+
+import argparse
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+
+from a3.aegis_main import Aegis
+from aegis.assist.parameters import Parameters
+from aegis.assist.replay_file_writer import ReplayFileWriter
+from aegis.common import AgentID, AgentIDList, Direction, InternalLocation
+from aegis.common.commands.agent_command import AgentCommand
+from aegis.common.commands.agent_commands import (
+    AGENT_UNKNOWN,
+    END_TURN,
+    MOVE,
+    OBSERVE,
+    PREDICT,
+    SAVE_SURV,
+    SEND_MESSAGE,
+    SLEEP,
+    TEAM_DIG,
+)
+from aegis.common.network.loopback_transport import LoopbackListener
+from aegis.parsers.world_file_parser import WorldFileParser
+
+COMMAND_LOG_HEADER = "AEGIS command log 1"
+
+_ADD_AGENT = re.compile(
+    r"ADD_AGT; Info\(ID (\d+), GID (\d+), Eng (-?\d+)\):Loc\(X (-?\d+), Y (-?\d+)\);"
+)
+_WORLD_FILE = re.compile(r"World File Used : (.*);")
+_SEED = re.compile(r"Random Seed Used : (-?\d+);")
+_NUMBER_OF_ROUNDS = re.compile(r"Simulation Start: Number of Rounds (\d+);")
+_ROUND_START = re.compile(r"RS;(\d+);")
+# records are joined with `$`, which a message may also contain
+_RECORD_SEPARATOR = re.compile(r"\]\$\[(?=\(\d+, \d+\)#)")
+_RECORD = re.compile(r"\((\d+), (\d+)\)#(.*)", re.DOTALL)
+_OBSERVE = re.compile(r"Observe \( (-?\d+), (-?\d+) \)")
+_PREDICT = re.compile(r"Prediction (-?\d+) for survivor (-?\d+)")
+_SEND = re.compile(r"Send (.*) to (all|\(.*\))", re.DOTALL)
+_AGENT_ID = re.compile(r"\((\d+), (\d+)\)")
+_SIMPLE_COMMANDS = {
+    "Save SV": SAVE_SURV,
+    "Team Dig": TEAM_DIG,
+    "Sleep": SLEEP,
+    "End Turn": END_TURN,
+    "??": AGENT_UNKNOWN,
+}
+
+
+@dataclass
+class RecordedRound:
+    """
+    One round of a recorded simulation.
+
+    Attributes:
+        round (int): The round number.
+        commands (list[str]): The command records of the round, in the order
+            the kernel handled them, see `AgentCommand.proc_string`.
+        events (str | None): What the kernel wrote after the commands, from
+            `Sim_Events;` to the `Dead_Agents` line, or None if not recorded.
+    """
+
+    round: int
+    commands: list[str] = field(default_factory=list)
+    events: str | None = None
+
+
+@dataclass
+class CommandLog:
+    """
+    The agents and commands of a recorded simulation.
+
+    Attributes:
+        world_filename (str): The world file the simulation ran on.
+        world_content (str | None): The world as the replay holds it, or None
+            if read from a command log.
+        number_of_rounds (int): The rounds the simulation was started for.
+        random_seed (int | None): The seed given with `-Seed`, if any.
+        agents (list[list[int]]): `[id, gid, energy level, x, y]` of every
+            agent, in the order they connected.
+        rounds (list[RecordedRound]): The rounds, in order.
+    """
+
+    world_filename: str = ""
+    world_content: str | None = None
+    number_of_rounds: int = 0
+    random_seed: int | None = None
+    agents: list[list[int]] = field(default_factory=list)
+    rounds: list[RecordedRound] = field(default_factory=list)
+
+    @staticmethod
+    def read(filename: str) -> "CommandLog":
+        """
+        Reads a replay or a command log.
+
+        Args:
+            filename: The path of the replay or command log.
+
+        Returns:
+            The recorded simulation.
+
+        Raises:
+            ValueError: If the file is neither, or is of a resumed simulation,
+                which doesn't start from the beginning.
+        """
+        log = CommandLog()
+        with open(filename) as file:
+            first_line = file.readline().rstrip("\n")
+            if first_line.isdigit():
+                # a replay starts with the world, after its length
+                log.world_content = file.read(int(first_line))
+            elif first_line != COMMAND_LOG_HEADER:
+                raise ValueError(f"'{filename}' is not a replay or command log")
+
+            current: RecordedRound | None = None
+            for line in file:
+                line = line.rstrip("\n")
+                if current is not None:
+                    if line == "RE;":
+                        log.rounds.append(current)
+                        current = None
+                    elif line.startswith("Agent_Cmds;{") and line.endswith("}"):
+                        records = line[len("Agent_Cmds;{") : -1]
+                        if records != "None":
+                            current.commands = _RECORD_SEPARATOR.split(records[1:-1])
+                    else:
+                        current.events = (current.events or "") + line + "\n"
+                elif match := _ROUND_START.fullmatch(line):
+                    current = RecordedRound(int(match.group(1)))
+                elif match := _ADD_AGENT.fullmatch(line):
+                    log.agents.append([int(value) for value in match.groups()])
+                elif match := _WORLD_FILE.fullmatch(line):
+                    log.world_filename = match.group(1)
+                elif match := _SEED.fullmatch(line):
+                    log.random_seed = int(match.group(1))
+                elif match := _NUMBER_OF_ROUNDS.fullmatch(line):
+                    log.number_of_rounds = int(match.group(1))
+                elif line.startswith("MSG;Resumed from round"):
+                    raise ValueError(
+                        f"'{filename}' is of a resumed simulation, which can't be re-simulated"
+                    )
+        if not log.world_filename:
+            raise ValueError(f"'{filename}' doesn't say which world it ran on")
+        return log
+
+    def write(self, filename: str) -> None:
+        """
+        Writes the recorded simulation as a command log, which refers to the
+        world file instead of holding the world.
+
+        Args:
+            filename: The path of the command log.
+        """
+        with open(filename, "w") as file:
+            _ = file.write(f"{COMMAND_LOG_HEADER}\n")
+            for id, gid, energy_level, x, y in self.agents:
+                _ = file.write(
+                    f"ADD_AGT; Info(ID {id}, GID {gid}, Eng {energy_level}):Loc(X {x}, Y {y});\n"
+                )
+            _ = file.write(f"World File Used : {self.world_filename};\n")
+            if self.random_seed is not None:
+                _ = file.write(f"Random Seed Used : {self.random_seed};\n")
+            _ = file.write(
+                f"Simulation Start: Number of Rounds {self.number_of_rounds};\n"
+            )
+            for recorded in self.rounds:
+                _ = file.write(f"RS;{recorded.round};\n")
+                records = "$".join(f"[{record}]" for record in recorded.commands)
+                _ = file.write(f"Agent_Cmds;{{{records or 'None'}}}\n")
+                _ = file.write(recorded.events or "")
+                _ = file.write("RE;\n")
+
+
+@dataclass
+class Mismatch:
+    """
+    Where a re-simulation first differed from the recorded simulation.
+
+    Attributes:
+        round (int): The round, 0 for where the agents were placed.
+        expected (str): What was recorded.
+        actual (str): What the re-simulation did.
+    """
+
+    round: int
+    expected: str
+    actual: str
+
+
+@dataclass
+class ResimulationResult:
+    """
+    Attributes:
+        rounds (int): The rounds re-simulated.
+        seconds (float): The time the rounds took, without start up.
+        mismatch (Mismatch | None): The first difference from the recorded
+            simulation, after which the re-simulation stopped, or None.
+    """
+
+    rounds: int
+    seconds: float
+    mismatch: Mismatch | None
+
+
+def parse_command_record(record: str) -> AgentCommand:
+    """
+    Parses a command as the replay records it, see `AgentCommand.proc_string`.
+
+    Args:
+        record: The command record, e.g. `(1, 1)#Move NORTH`.
+
+    Returns:
+        The command, with its agent's id set.
+
+    Raises:
+        ValueError: If the record isn't a command.
+    """
+    match = _RECORD.fullmatch(record)
+    if match is None:
+        raise ValueError(f"Not a command record: {record}")
+    id, gid, text = match.groups()
+
+    command: AgentCommand
+    if text in _SIMPLE_COMMANDS:
+        command = _SIMPLE_COMMANDS[text]()
+    elif text.startswith("Move ") and text[5:] in Direction.__members__:
+        command = MOVE(Direction[text[5:]])
+    elif observe := _OBSERVE.fullmatch(text):
+        command = OBSERVE(InternalLocation(*map(int, observe.groups())))
+    elif predict := _PREDICT.fullmatch(text):
+        # numpy is only imported once a prediction is actually made
+        import numpy as np
+
+        label, survivor_id = predict.groups()
+        command = PREDICT(int(survivor_id), np.int64(label))
+    elif send := _SEND.fullmatch(text):
+        message, agent_ids = send.groups()
+        command = SEND_MESSAGE(
+            AgentIDList(
+                [
+                    AgentID(int(agent_id), int(agent_gid))
+                    for agent_id, agent_gid in _AGENT_ID.findall(agent_ids)
+                ]
+            ),
+            message,
+        )
+    else:
+        raise ValueError(f"Unknown command record: {record}")
+    command.set_agent_id(AgentID(int(id), int(gid)))
+    return command
+
+
+def resimulate(
+    log: CommandLog,
+    world_filename: str | None = None,
+    config_filename: str = Parameters.config_filename,
+    verify: bool = True,
+) -> ResimulationResult:
+    """
+    Runs the recorded commands through a new kernel.
+
+    The config must be the one the simulation ran with. Agents that crashed
+    can't be re-simulated, as the replay doesn't say they crashed, and show
+    as a mismatch.
+
+    Args:
+        log: The recorded simulation.
+        world_filename: The world file, by default the one recorded.
+        config_filename: The config file to run with.
+        verify: Whether to check every round against the recorded one. Off,
+            nothing is checked and the kernel writes nothing.
+
+    Returns:
+        The rounds re-simulated, their time and the first mismatch, if any.
+
+    Raises:
+        ValueError: If the world file isn't the one in the replay or a
+            command record can't be parsed.
+        RuntimeError: If the kernel can't start.
+    """
+    world_filename = world_filename or log.world_filename
+    if log.world_content is not None:
+        loaded_world_file = WorldFileParser.load_world_file(world_filename)
+        if loaded_world_file is None:
+            raise RuntimeError(f"Unable to load world file '{world_filename}'")
+        if loaded_world_file.content != log.world_content:
+            raise ValueError(f"'{world_filename}' isn't the world of the replay")
+    # parsed up front, so only the kernel is timed
+    rounds = [
+        [parse_command_record(record) for record in recorded.commands]
+        for recorded in log.rounds
+    ]
+
+    aegis = Aegis()
+    args = ["-WorldFile", world_filename, "-ConfigFile", config_filename]
+    args += ["-NumRound", str(max(log.number_of_rounds, len(log.rounds)))]
+    args += ["-Turbo", "true"]
+    if log.random_seed is not None:
+        args += ["-Seed", str(log.random_seed)]
+    if not aegis.read_command_line(args):
+        raise RuntimeError(f"Bad kernel arguments: {args}")
+    aegis.set_agent_listener(LoopbackListener())
+    aegis.get_aegis_world().agent_world_file_enabled = False
+    if not aegis.start_up() or not aegis.build_world():
+        raise RuntimeError(f"Unable to start a kernel on {world_filename}")
+
+    world = aegis.get_aegis_world()
+    for id, gid, energy_level, x, y in log.agents:
+        # groups get their ids in the order they first connect
+        agent_id = aegis.add_agent(f"Group {gid}")
+        agent = world.get_agent(agent_id) if agent_id is not None else None
+        actual = (
+            [agent.agent_id.id, agent.agent_id.gid]
+            + [agent.get_energy_level(), agent.location.x, agent.location.y]
+            if agent is not None
+            else []
+        )
+        if actual != [id, gid, energy_level, x, y]:
+            return ResimulationResult(
+                0, 0.0, Mismatch(0, str([id, gid, energy_level, x, y]), str(actual))
+            )
+
+    buffer = ReplayFileWriter.open_replay_buffer() if verify else None
+    completed = 0
+    start = time.perf_counter()
+    try:
+        for recorded, commands in zip(log.rounds, rounds):
+            aegis.run_round(commands)
+            completed += 1
+            if buffer is None or recorded.events is None:
+                continue
+            actual = buffer.getvalue()
+            _ = buffer.seek(0)
+            _ = buffer.truncate()
+            if actual != recorded.events:
+                return ResimulationResult(
+                    completed,
+                    time.perf_counter() - start,
+                    Mismatch(recorded.round, recorded.events, actual),
+                )
+        return ResimulationResult(completed, time.perf_counter() - start, None)
+    finally:
+        if buffer is not None:
+            ReplayFileWriter.close_replay_file()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Re-simulate an AEGIS replay without agents",
+        epilog="Example: python -m a3.resimulator replay.txt",
+    )
+    _ = parser.add_argument("replay", help="A replay or command log")
+    _ = parser.add_argument(
+        "--world", default=None, help="The world file, by default the recorded one"
+    )
+    _ = parser.add_argument(
+        "--config", default=Parameters.config_filename, help="The config file"
+    )
+    _ = parser.add_argument(
+        "--no-verify",
+        action="store_true",
+        help="Don't check the rounds against the recorded ones",
+    )
+    _ = parser.add_argument(
+        "--write-log",
+        default=None,
+        help="Write the replay as a command log to this file instead",
+    )
+    args = parser.parse_args()
+    replay: str = args.replay  # pyright: ignore[reportAny]
+    write_log: str | None = args.write_log  # pyright: ignore[reportAny]
+
+    try:
+        log = CommandLog.read(replay)
+        if write_log is not None:
+            log.write(write_log)
+            print(f"{replay} -> {write_log} ({len(log.rounds)} rounds)")
+            return
+        result = resimulate(
+            log,
+            args.world,  # pyright: ignore[reportAny]
+            args.config,  # pyright: ignore[reportAny]
+            not args.no_verify,  # pyright: ignore[reportAny]
+        )
+    except (OSError, ValueError, RuntimeError) as e:
+        print(f"Error re-simulating '{replay}': {e}", file=sys.stderr)
+        sys.exit(1)
+
+    rate = result.rounds / result.seconds if result.seconds > 0 else 0.0
+    print(f"{result.rounds} rounds in {result.seconds:.3f} s ({rate:.0f} rounds/s)")
+    if result.mismatch is not None:
+        mismatch = result.mismatch
+        print(f"Mismatch in round {mismatch.round}", file=sys.stderr)
+        print(f"Expected:\n{mismatch.expected}", file=sys.stderr)
+        print(f"Actual:\n{mismatch.actual}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
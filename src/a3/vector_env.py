@@ -0,0 +1,393 @@
+"""
+A vectorized, Gym-style environment over the AEGIS kernel.
+
+`VectorEnv` steps K simulations in lockstep in this interpreter, with no
+sockets. Each one is a full `Aegis` kernel in turbo mode whose agents have no
+connection: their commands come from `VectorEnv.step` and go through the
+kernel's own command handling (`Aegis.run_round`), and their observations
+are encoded from the results the kernel would have sent them. A policy
+trained here can drive a real agent by sending `action_to_command(action)`
+and encoding the results it receives with `encode_surround_info`.
+
+Every kernel draws from its own random streams, spawned from its seed when
+it is reset, so each environment plays out the same for the same seed and
+actions whatever the others do.
+
+Examples:
+    >>> env = VectorEnv("worlds/ExampleWorld.world", num_envs=8, agents=2)
+    >>> observation, info = env.reset(seeds=range(8))
+    >>> actions = np.full((8, 2), SLEEP_ACTION)
+    >>> observation, rewards, terminated, truncated, info = env.step(actions)
+"""
+
+from collections.abc import Iterable, Sequence
+from typing import Any, cast
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from a3.aegis_main import Aegis
+from aegis.assist.parameters import Parameters
+from aegis.common import AgentID, Direction
+from aegis.common.commands.aegis_commands import (
+    MOVE_RESULT,
+    SAVE_SURV_RESULT,
+    TEAM_DIG_RESULT,
+)
+from aegis.common.commands.agent_command import AgentCommand
+from aegis.common.commands.agent_commands import MOVE, SAVE_SURV, SLEEP, TEAM_DIG
+from aegis.common.network.loopback_transport import LoopbackListener
+from aegis.common.world.info.surround_info import SurroundInfo
+from aegis.common.world.objects import Rubble, Survivor, SurvivorGroup
+
+Observation = dict[str, NDArray[Any]]
+
+# actions 0 to 8 move in `Direction` order, the last (CENTER) staying put
+_DIRECTIONS = list(Direction)
+SLEEP_ACTION = len(_DIRECTIONS)
+TEAM_DIG_ACTION = SLEEP_ACTION + 1
+SAVE_SURV_ACTION = SLEEP_ACTION + 2
+NUM_ACTIONS = SLEEP_ACTION + 3
+
+# top layer kinds, 0 is no top layer
+TOP_LAYER_KINDS: dict[type, int] = {Rubble: 1, Survivor: 2, SurvivorGroup: 3}
+
+GROUP_NAME = "vector_env"
+
+# the command results that report the agent's surroundings
+_SURROUND_RESULTS = (MOVE_RESULT, TEAM_DIG_RESULT, SAVE_SURV_RESULT)
+
+
+def action_to_command(action: int) -> AgentCommand:
+    """
+    Returns the command for an action.
+
+    Args:
+        action: 0 to 8 for MOVE in `Direction` order, `SLEEP_ACTION`,
+            `TEAM_DIG_ACTION` or `SAVE_SURV_ACTION`.
+
+    Raises:
+        ValueError: If the action is unknown.
+    """
+    if 0 <= action < SLEEP_ACTION:
+        return MOVE(_DIRECTIONS[action])
+    if action == SLEEP_ACTION:
+        return SLEEP()
+    if action == TEAM_DIG_ACTION:
+        return TEAM_DIG()
+    if action == SAVE_SURV_ACTION:
+        return SAVE_SURV()
+    raise ValueError(f"Unknown action {action}, expected 0 to {NUM_ACTIONS - 1}")
+
+
+def encode_surround_info(
+    surround_info: SurroundInfo, life_signals_size: int = 8
+) -> Observation:
+    """
+    Encodes an agent's surroundings, as sent in a MOVE_RESULT, TEAM_DIG_RESULT
+    or SAVE_SURV_RESULT, the way `VectorEnv` observes them.
+
+    Args:
+        surround_info: The agent's surroundings.
+        life_signals_size: How many life signals to keep.
+
+    Returns:
+        "cell_type", "move_cost" and "top_layer" of the 9 cells in `Direction`
+        order, and "life_signals" of the current cell, top layer first,
+        padded with -1.
+    """
+    observation: Observation = {
+        "cell_type": np.zeros(len(_DIRECTIONS), np.int8),
+        "move_cost": np.zeros(len(_DIRECTIONS), np.int32),
+        "top_layer": np.zeros(len(_DIRECTIONS), np.int8),
+        "life_signals": np.full(life_signals_size, -1, np.int32),
+    }
+    _encode_surround_info(
+        surround_info,
+        observation["cell_type"],
+        observation["move_cost"],
+        observation["top_layer"],
+        observation["life_signals"],
+    )
+    return observation
+
+
+def _encode_surround_info(
+    surround_info: SurroundInfo,
+    cell_type: NDArray[np.int8],
+    move_cost: NDArray[np.int32],
+    top_layer: NDArray[np.int8],
+    life_signals: NDArray[np.int32],
+) -> None:
+    for index, direction in enumerate(_DIRECTIONS):
+        cell_info = surround_info.get_surround_info(direction)
+        if cell_info is None:
+            continue
+        cell_type[index] = cell_info.cell_type.value
+        move_cost[index] = cell_info.move_cost
+        top_layer[index] = TOP_LAYER_KINDS.get(type(cell_info.top_layer), 0)
+    signals = surround_info.life_signals.life_signals[: len(life_signals)]
+    life_signals[: len(signals)] = signals
+    life_signals[len(signals) :] = -1
+
+
+class VectorEnv:
+    """
+    K AEGIS simulations stepped in lockstep, each with one group of agents.
+
+    Observations are dicts of arrays with leading dimensions (K, agents):
+
+    - "cell_type" (K, agents, 9): `CellType` values of the surrounding cells
+    - "move_cost" (K, agents, 9): their move costs
+    - "top_layer" (K, agents, 9): their top layer kinds, see `TOP_LAYER_KINDS`
+    - "life_signals" (K, agents, life_signals_size): of the current cell, -1
+      where unknown
+    - "energy" (K, agents): energy levels
+    - "location" (K, agents, 2): x and y
+    - "alive" (K, agents): False once an agent has died
+
+    Surroundings are only updated by the commands whose results report them
+    (MOVE, TEAM_DIG and SAVE_SURV), as for a connected agent. The reward of
+    a step is the increase in the group's score.
+
+    A finished simulation ignores its actions and stays finished until it is
+    reset, e.g. `env.reset(indices=np.flatnonzero(terminated | truncated))`.
+    """
+
+    def __init__(
+        self,
+        worlds: str | Sequence[str],
+        num_envs: int | None = None,
+        agents: int = 1,
+        rounds: int = Parameters.number_of_rounds,
+        config_filename: str = Parameters.config_filename,
+        life_signals_size: int = 8,
+    ) -> None:
+        """
+        Creates the environments, which must be reset before stepping.
+
+        Args:
+            worlds: A world file for every environment, or one world file for
+                all of them.
+            num_envs: The number of environments, by default one per world.
+            agents: The number of agents in every environment.
+            rounds: The number of rounds before an environment is truncated.
+            config_filename: The kernel config file.
+            life_signals_size: How many life signals to observe.
+        """
+        if isinstance(worlds, str):
+            worlds = [worlds] * (num_envs or 1)
+        elif num_envs is not None and num_envs != len(worlds):
+            raise ValueError(f"Got {len(worlds)} worlds for {num_envs} environments")
+        self.worlds: list[str] = list(worlds)
+        self.num_envs: int = len(self.worlds)
+        self.agents: int = agents
+        self.rounds: int = rounds
+        self.config_filename: str = config_filename
+        self.life_signals_size: int = life_signals_size
+
+        self._kernels: list[Aegis | None] = [None] * self.num_envs
+        self._agent_ids: list[list[AgentID]] = [[] for _ in range(self.num_envs)]
+        self._scores: NDArray[np.int64] = np.zeros(self.num_envs, np.int64)
+        self._rounds: NDArray[np.int64] = np.zeros(self.num_envs, np.int64)
+        self._done: NDArray[np.bool_] = np.zeros(self.num_envs, np.bool_)
+
+        shape = (self.num_envs, agents)
+        self._observation: Observation = {
+            "cell_type": np.zeros((*shape, len(_DIRECTIONS)), np.int8),
+            "move_cost": np.zeros((*shape, len(_DIRECTIONS)), np.int32),
+            "top_layer": np.zeros((*shape, len(_DIRECTIONS)), np.int8),
+            "life_signals": np.full((*shape, life_signals_size), -1, np.int32),
+            "energy": np.zeros(shape, np.int32),
+            "location": np.zeros((*shape, 2), np.int32),
+            "alive": np.zeros(shape, np.bool_),
+        }
+
+    def reset(
+        self,
+        seeds: Iterable[int | None] | None = None,
+        indices: Iterable[int] | None = None,
+    ) -> tuple[Observation, dict[str, NDArray[Any]]]:
+        """
+        Starts new simulations.
+
+        Args:
+            seeds: A random seed for each reset environment, None to use the
+                world file's own seed.
+            indices: The environments to reset, by default all of them.
+
+        Returns:
+            The observation of every environment and the info, see `step`.
+
+        Raises:
+            RuntimeError: If a kernel can't start.
+        """
+        indices = list(range(self.num_envs) if indices is None else indices)
+        seed_list = [None] * len(indices) if seeds is None else list(seeds)
+        if len(seed_list) != len(indices):
+            raise ValueError(f"Got {len(seed_list)} seeds for {len(indices)} resets")
+
+        for index, seed in zip(indices, seed_list):
+            # a kernel is started once per environment, and then reset to its
+            # world as it was built
+            aegis = self._kernels[index]
+            if aegis is None:
+                aegis = self._start_kernel(self.worlds[index])
+                self._kernels[index] = aegis
+            if not aegis.reset(seed):
+                raise RuntimeError(f"Unable to reset {self.worlds[index]}")
+            self._scores[index] = 0
+            self._rounds[index] = 0
+            self._done[index] = False
+
+            world = aegis.get_aegis_world()
+            self._agent_ids[index] = []
+            for agent in range(self.agents):
+                agent_id = aegis.add_agent(GROUP_NAME)
+                if agent_id is None:
+                    raise RuntimeError(
+                        f"Unable to place agents in {self.worlds[index]}"
+                    )
+                self._agent_ids[index].append(agent_id)
+
+                # a connected agent is sent the whole world when it connects,
+                # but no life signals until it acts
+                agent_object = world.get_agent(agent_id)
+                surround_info = (
+                    world.get_surround_info(
+                        agent_object.location, with_life_signals=False
+                    )
+                    if agent_object is not None
+                    else None
+                )
+                self._observe_agent(index, agent, surround_info)
+        return self._copy_observation(), self._info()
+
+    def step(
+        self, actions: ArrayLike
+    ) -> tuple[
+        Observation,
+        NDArray[np.float32],
+        NDArray[np.bool_],
+        NDArray[np.bool_],
+        dict[str, NDArray[Any]],
+    ]:
+        """
+        Runs one round of every unfinished environment.
+
+        Args:
+            actions: (K, agents) actions, see `action_to_command`. The actions
+                of dead agents are ignored.
+
+        Returns:
+            The observation, the reward of every environment, whether each
+            has terminated (every agent dead or every survivor saved) or been
+            truncated (out of rounds), and the info: every group's "score"
+            and the "round" each environment is at.
+
+        Raises:
+            ValueError: If the actions have the wrong shape or are unknown.
+            RuntimeError: If an environment hasn't been reset.
+        """
+        actions = np.asarray(actions)
+        if actions.shape != (self.num_envs, self.agents):
+            raise ValueError(
+                f"Expected actions of shape {(self.num_envs, self.agents)}, "
+                + f"got {actions.shape}"
+            )
+        if actions.size and (actions.min() < 0 or actions.max() >= NUM_ACTIONS):
+            raise ValueError(f"Actions must be 0 to {NUM_ACTIONS - 1}")
+
+        rewards = np.zeros(self.num_envs, np.float32)
+        for index, aegis in enumerate(self._kernels):
+            if aegis is None:
+                raise RuntimeError(f"Environment {index} hasn't been reset")
+            if self._done[index]:
+                continue
+
+            world = aegis.get_aegis_world()
+            commands: list[AgentCommand] = []
+            agent_actions = cast(list[int], actions[index].tolist())
+            for agent_id, action in zip(self._agent_ids[index], agent_actions):
+                if world.get_agent(agent_id) is None:
+                    continue
+                command = action_to_command(action)
+                command.set_agent_id(agent_id)
+                commands.append(command)
+            aegis.run_round(commands)
+            self._rounds[index] += 1
+
+            handler = aegis.get_agent_handler()
+            for agent, agent_id in enumerate(self._agent_ids[index]):
+                result = handler.pop_result_of_command(agent_id)
+                if isinstance(result, _SURROUND_RESULTS):
+                    self._observe_agent(index, agent, result.surround_info)
+                else:
+                    self._observe_agent(index, agent, None)
+
+            group = handler.get_group(GROUP_NAME)
+            score = group.score if group is not None else 0
+            rewards[index] = score - self._scores[index]
+            self._scores[index] = score
+            self._done[index] = aegis.is_simulation_over()
+
+        truncated = self._done & (self._rounds >= self.rounds)
+        terminated = self._done & ~truncated
+        return self._copy_observation(), rewards, terminated, truncated, self._info()
+
+    def close(self) -> None:
+        """Drops every simulation."""
+        for aegis in self._kernels:
+            if aegis is not None:
+                aegis.get_agent_handler().shutdown()
+        self._kernels = [None] * self.num_envs
+
+    def _start_kernel(self, world_filename: str) -> Aegis:
+        aegis = Aegis()
+        args = ["-WorldFile", world_filename, "-NumRound", str(self.rounds)]
+        args += ["-ConfigFile", self.config_filename, "-Turbo", "true"]
+        if not aegis.read_command_line(args):
+            raise RuntimeError(f"Bad kernel arguments: {args}")
+
+        # nothing connects, but it keeps the kernel off the agent port
+        aegis.set_agent_listener(LoopbackListener())
+        aegis.get_aegis_world().agent_world_file_enabled = False
+        if not aegis.start_up() or not aegis.build_world():
+            raise RuntimeError(f"Unable to start a kernel on {world_filename}")
+        return aegis
+
+    def _observe_agent(
+        self, index: int, agent: int, surround_info: SurroundInfo | None
+    ) -> None:
+        aegis = self._kernels[index]
+        agent_object = (
+            aegis.get_aegis_world().get_agent(self._agent_ids[index][agent])
+            if aegis is not None
+            else None
+        )
+        observation = self._observation
+        if agent_object is None:
+            observation["alive"][index, agent] = False
+            observation["energy"][index, agent] = 0
+            return
+
+        observation["alive"][index, agent] = True
+        observation["energy"][index, agent] = agent_object.get_energy_level()
+        observation["location"][index, agent] = (
+            agent_object.location.x,
+            agent_object.location.y,
+        )
+        if surround_info is not None:
+            _encode_surround_info(
+                surround_info,
+                observation["cell_type"][index, agent],
+                observation["move_cost"][index, agent],
+                observation["top_layer"][index, agent],
+                observation["life_signals"][index, agent],
+            )
+
+    def _copy_observation(self) -> Observation:
+        return {name: array.copy() for name, array in self._observation.items()}
+
+    def _info(self) -> dict[str, NDArray[Any]]:
+        return {"score": self._scores.copy(), "round": self._rounds.copy()}
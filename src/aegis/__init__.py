@@ -1,41 +1,109 @@
-from aegis.api import Cell, Location, World
-from aegis.api.location import create_location
-from aegis.common import AgentID, AgentIDList, Direction, LifeSignals
-from aegis.common.commands.aegis_command import AegisCommand
-from aegis.common.commands.aegis_commands import (
-    AEGIS_UNKNOWN,
-    CONNECT_OK,
-    DEATH_CARD,
-    DISCONNECT,
-    MOVE_RESULT,
-    OBSERVE_RESULT,
-    PREDICT_RESULT,
-    SAVE_SURV_RESULT,
-    SEND_MESSAGE_RESULT,
-    SLEEP_RESULT,
-    TEAM_DIG_RESULT,
-)
-from aegis.common.commands.agent_command import AgentCommand
-from aegis.common.commands.agent_commands import (
-    AGENT_UNKNOWN,
-    END_TURN,
-    MOVE,
-    OBSERVE,
-    PREDICT,
-    SAVE_SURV,
-    SEND_MESSAGE,
-    SLEEP,
-    TEAM_DIG,
-)
-from aegis.common.world.info import (
-    CellInfo,
-    SurroundInfo,
-)
-from aegis.common.world.objects import (
-    Rubble,
-    Survivor,
-    WorldObject,
-)
+"""
+The public AEGIS API.
+
+Names are imported the first time they are used (PEP 562), so importing
+`aegis`, or any module inside it, doesn't load the whole command and world
+object tree.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from aegis.agent_predictions.datasets import Datasets
+    from aegis.api import Cell, Location, World
+    from aegis.api.location import create_location
+    from aegis.common import AgentID, AgentIDList, Direction, LifeSignals
+    from aegis.common.commands.aegis_command import AegisCommand
+    from aegis.common.commands.aegis_commands import (
+        AEGIS_UNKNOWN,
+        CONNECT_OK,
+        DEATH_CARD,
+        DISCONNECT,
+        MOVE_RESULT,
+        OBSERVE_RESULT,
+        PREDICT_RESULT,
+        SAVE_SURV_RESULT,
+        SEND_MESSAGE_RESULT,
+        SLEEP_RESULT,
+        TEAM_DIG_RESULT,
+    )
+    from aegis.common.commands.agent_command import AgentCommand
+    from aegis.common.commands.agent_commands import (
+        AGENT_UNKNOWN,
+        END_TURN,
+        MOVE,
+        OBSERVE,
+        PREDICT,
+        SAVE_SURV,
+        SEND_MESSAGE,
+        SLEEP,
+        TEAM_DIG,
+    )
+    from aegis.common.world.info import (
+        CellInfo,
+        SurroundInfo,
+    )
+    from aegis.common.world.objects import (
+        Rubble,
+        Survivor,
+        WorldObject,
+    )
+
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "Cell": "aegis.api",
+    "Location": "aegis.api",
+    "World": "aegis.api",
+    "create_location": "aegis.api.location",
+    "Datasets": "aegis.agent_predictions.datasets",
+    "AgentID": "aegis.common",
+    "AgentIDList": "aegis.common",
+    "Direction": "aegis.common",
+    "LifeSignals": "aegis.common",
+    "AegisCommand": "aegis.common.commands.aegis_command",
+    "AEGIS_UNKNOWN": "aegis.common.commands.aegis_commands",
+    "CONNECT_OK": "aegis.common.commands.aegis_commands",
+    "DEATH_CARD": "aegis.common.commands.aegis_commands",
+    "DISCONNECT": "aegis.common.commands.aegis_commands",
+    "MOVE_RESULT": "aegis.common.commands.aegis_commands",
+    "OBSERVE_RESULT": "aegis.common.commands.aegis_commands",
+    "PREDICT_RESULT": "aegis.common.commands.aegis_commands",
+    "SAVE_SURV_RESULT": "aegis.common.commands.aegis_commands",
+    "SEND_MESSAGE_RESULT": "aegis.common.commands.aegis_commands",
+    "SLEEP_RESULT": "aegis.common.commands.aegis_commands",
+    "TEAM_DIG_RESULT": "aegis.common.commands.aegis_commands",
+    "AgentCommand": "aegis.common.commands.agent_command",
+    "AGENT_UNKNOWN": "aegis.common.commands.agent_commands",
+    "END_TURN": "aegis.common.commands.agent_commands",
+    "MOVE": "aegis.common.commands.agent_commands",
+    "OBSERVE": "aegis.common.commands.agent_commands",
+    "PREDICT": "aegis.common.commands.agent_commands",
+    "SAVE_SURV": "aegis.common.commands.agent_commands",
+    "SEND_MESSAGE": "aegis.common.commands.agent_commands",
+    "SLEEP": "aegis.common.commands.agent_commands",
+    "TEAM_DIG": "aegis.common.commands.agent_commands",
+    "CellInfo": "aegis.common.world.info",
+    "SurroundInfo": "aegis.common.world.info",
+    "Rubble": "aegis.common.world.objects",
+    "Survivor": "aegis.common.world.objects",
+    "WorldObject": "aegis.common.world.objects",
+}
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value: object = getattr(importlib.import_module(module_name), name)
+    # cache it so __getattr__ is only hit once per name
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "AGENT_UNKNOWN",
@@ -47,6 +115,7 @@ __all__ = [
     "CONNECT_OK",
     "DEATH_CARD",
     "DISCONNECT",
+    "Datasets",
     "Direction",
     "END_TURN",
     "SEND_MESSAGE_RESULT",
@@ -1,59 +1,71 @@
 from __future__ import annotations
 
-import io
-import socket
-import struct
 import threading
 from typing import override
 
 from aegis.agent_control.network.agent_socket_exception import AgentSocketException
+from aegis.common.network.transport import Transport, TransportListener
 
 
 class AgentSocket:
-    """A class to represent the TCP socket connection between the AEGIS server and an Agent client.
+    """A class to represent the connection between the AEGIS server and an Agent client.
 
     Attributes:
-        socket (socket.socket | None): The TCP socket on the AEGIS server connected to an Agent client.
-        in_stream (io.BufferedReader | None): The input stream for reading messages from the Agent client.
-        out_stream (io.BufferedWriter | None): The output stream for sending messages to the Agent client.
+        transport (Transport | None): The connection to the Agent client, a TCP socket or an in-process loopback.
         send_cool_message (str | None): The message to send to the Agent client.
         send_success (bool): Whether the message was successfully sent to the Agent client.
         send_exception (bool): Whether an exception occurred while sending the message to the Agent client.
+        bytes_sent (int): The number of bytes sent to the Agent client, including the transport's framing.
+        bytes_received (int): The number of bytes received from the Agent client, including the transport's framing.
+        messages_sent (int): The number of messages sent to the Agent client.
+        messages_received (int): The number of messages received from the Agent client.
     """
 
     def __init__(self) -> None:
-        self.socket: socket.socket | None = None
-        self.in_stream: io.BufferedReader | None = None
-        self.out_stream: io.BufferedWriter | None = None
+        self.transport: Transport | None = None
         self.send_cool_message: str | None = None
         self.send_success: bool = False
         self.send_exception: bool = False
+        self.bytes_sent: int = 0
+        self.bytes_received: int = 0
+        self.messages_sent: int = 0
+        self.messages_received: int = 0
 
-    def connect(self, server_socket: socket.socket) -> None:
-        """Connect an agent by accepting connection on the passed server socket
+    def connect(self, listener: TransportListener, timeout: float | None) -> None:
+        """Connect an agent by accepting the next connection on the passed listener
 
         Args:
-            server_socket (socket.socket): The server socket to connect to the Agent client.
+            listener (TransportListener): The listener to accept the Agent client on.
+            timeout (float | None): How long to wait for the Agent client to connect.
         """
         try:
-            self.socket = server_socket.accept()[0]
-            self.in_stream = self.socket.makefile("rb")
-            self.out_stream = self.socket.makefile("wb")
+            self.transport = listener.accept(timeout)
         except Exception as e:
             raise AgentSocketException(f"Unable to connect AEGIS to agent: {str(e)}")
 
+    @property
+    def framing_bytes(self) -> int:
+        """The bytes the transport adds to every message, 0 when not connected."""
+        if self.transport is None:
+            return 0
+        return self.transport.framing_bytes
+
+    def is_local(self) -> bool:
+        """Whether the Agent client is connected from the same host as AEGIS
+
+        Returns:
+            bool: True if the Agent client connected over a loopback address or in-process.
+        """
+        if self.transport is None:
+            return False
+        return self.transport.is_local()
+
     def disconnect(self):
         """Disconnect from the Agent client"""
         try:
-            if (
-                self.socket is not None
-                and self.in_stream is not None
-                and self.out_stream is not None
-            ):
-                self.in_stream.close()
-                self.out_stream.close()
-                self.socket.close()
-                self.socket = None
+            if self.transport is not None:
+                self.transport.close()
+                self.transport = None
         except Exception:
             pass
 
@@ -70,39 +82,27 @@ class AgentSocket:
         Returns:
             str | None: The message read from the Agent client.
         """
-        if self.socket is not None:  # only read if connected
-            self.socket.settimeout(timeout)
-            try:
-                return self._read_message()
-            finally:
-                self.reset_timeout()
+        if self.transport is not None:  # only read if connected
+            return self._read_message(timeout)
         return ""
 
-    def _read_message(self) -> str | None:
+    def _read_message(self, timeout: int) -> str | None:
         """Read a message from the Agent client
 
+        Args:
+            timeout (int): The timeout for reading the message from the Agent client.
+
         Returns:
             str | None: The message read from the Agent client.
         """
         try:
-            if self.in_stream is None:
-                raise AgentSocketException("Input stream is not initialized")
-            size_buffer = self.in_stream.read(4)
-            if len(size_buffer) != 4:
-                raise AgentSocketException("Couldn't read message length.")
-
-            # -1 is for the null byte
-            size: int = struct.unpack("I", size_buffer)[0] - 1
-
-            message_buffer = self.in_stream.read(size)
-            if len(message_buffer) < size:
-                raise AgentSocketException("Message is shorter than expected.")
-
-            _ = self.in_stream.read(1)  # read the null byte
-
-            return message_buffer.decode("ascii").strip()
-        except socket.timeout:
-            return None
+            if self.transport is None:
+                raise AgentSocketException("Transport is not initialized")
+            message = self.transport.read_message(timeout)
+            if message is not None:
+                self.bytes_received += len(message) + self.transport.framing_bytes
+                self.messages_received += 1
+            return message
         except Exception as e:
             raise AgentSocketException(str(e))
 
@@ -112,18 +112,22 @@ class AgentSocket:
         Args:
             message (str): The message to send to the Agent client.
         """
-        if self.socket is not None:
+        if self.transport is not None:
             self.send_cool_message = message
             self.send_success = False
             self.send_exception = False
 
-            sender = self._Sender(self)
-            sender.start()
+            if self.transport.blocking_send:
+                sender = self._Sender(self)
+                sender.start()
 
-            sender.join(0.1)
+                sender.join(0.1)
 
-            if sender.is_alive():
-                sender.interrupt()
+                if sender.is_alive():
+                    sender.interrupt()
+            else:
+                # nothing to wait on, so send without the watchdog thread
+                self._send()
 
             if self.send_exception:
                 self.disconnect()
@@ -136,6 +140,19 @@ class AgentSocket:
                     "Unable to send message to agent due to terminal TCP buffer output stream write block, disconnecting from agent."
                 )
 
+    def _send(self) -> None:
+        try:
+            if self.transport is not None and self.send_cool_message is not None:
+                self.transport.send_message(self.send_cool_message)
+                self.bytes_sent += (
+                    len(self.send_cool_message) + self.transport.framing_bytes
+                )
+                self.messages_sent += 1
+                self.send_success = True
+        except Exception as e:
+            print(f"error in sender thread: {e}")
+            self.send_exception = True
+
     class _Sender(threading.Thread):
         """
         Send a message to the Agent client
@@ -150,31 +167,10 @@ class AgentSocket:
 
         @override
         def run(self) -> None:
-            try:
-                if (
-                    self.agent_socket.out_stream is not None
-                    and self.agent_socket.send_cool_message is not None
-                ):
-                    size_buffer = struct.pack(
-                        "I", len(self.agent_socket.send_cool_message) + 1
-                    )
-                    _ = self.agent_socket.out_stream.write(size_buffer)
-                    _ = self.agent_socket.out_stream.write(
-                        self.agent_socket.send_cool_message.encode("ascii")
-                    )
-                    _ = self.agent_socket.out_stream.write(b"\x00")
-                    self.agent_socket.out_stream.flush()
-                    self.agent_socket.send_success = True
-            except Exception as e:
-                print(f"error in sender thread: {e}")
-                self.agent_socket.send_exception = True
+            self.agent_socket._send()  # pyright: ignore[reportPrivateUsage]
 
         def interrupt(self) -> None:
             self._stop_event.set()
 
         def is_interrupted(self) -> bool:
             return self._stop_event.is_set()
-
-    def reset_timeout(self):
-        if self.socket is not None:
-            self.socket.settimeout(None)
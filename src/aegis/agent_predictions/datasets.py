@@ -0,0 +1,83 @@
+import os
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+class Datasets:
+    """
+    Read-only access to the prediction datasets.
+
+    Arrays are memory mapped (`np.load(mmap_mode="r")`) instead of read into
+    each process, so every kernel and agent process on a host shares the same
+    page cache copy. Each file is only opened once per process.
+
+    Examples:
+        >>> images = Datasets.testing_images()
+        >>> labels = Datasets.testing_labels()
+        >>> images.shape[0] == labels.shape[0]
+        True
+    """
+
+    DATA_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+    TESTING_DIRECTORY = os.path.join(DATA_DIRECTORY, "model_testing_data")
+    # the training set ships with the agent package, for agents to train on
+    TRAINING_DIRECTORY = os.path.normpath(
+        os.path.join(DATA_DIRECTORY, "..", "..", "a3", "agent", "model_training_data")
+    )
+
+    _cache: dict[str, NDArray[np.generic]] = {}
+
+    @staticmethod
+    def load(filename: str) -> NDArray[np.generic]:
+        """
+        Memory maps a `.npy` file, reusing the map if it is already open.
+
+        Args:
+            filename: The path of the `.npy` file.
+
+        Returns:
+            A read-only array backed by the file.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        path = os.path.realpath(filename)
+        array = Datasets._cache.get(path)
+        if array is None:
+            array = np.load(path, mmap_mode="r")
+            Datasets._cache[path] = array
+        return array
+
+    @staticmethod
+    def testing_images() -> NDArray[np.float32]:
+        return Datasets.load(  # pyright: ignore[reportReturnType]
+            os.path.join(Datasets.TESTING_DIRECTORY, "x_test_a3.npy")
+        )
+
+    @staticmethod
+    def testing_labels() -> NDArray[np.int64]:
+        return Datasets.load(  # pyright: ignore[reportReturnType]
+            os.path.join(Datasets.TESTING_DIRECTORY, "y_test_a3.npy")
+        )
+
+    @staticmethod
+    def training_images() -> NDArray[np.float32]:
+        return Datasets.load(  # pyright: ignore[reportReturnType]
+            os.path.join(Datasets.TRAINING_DIRECTORY, "x_train_a3.npy")
+        )
+
+    @staticmethod
+    def training_labels() -> NDArray[np.int64]:
+        return Datasets.load(  # pyright: ignore[reportReturnType]
+            os.path.join(Datasets.TRAINING_DIRECTORY, "y_train_a3.npy")
+        )
+
+    @staticmethod
+    def is_loaded(filename: str) -> bool:
+        return os.path.realpath(filename) in Datasets._cache
+
+    @staticmethod
+    def clear() -> None:
+        """Drops this process' references to every mapped dataset."""
+        Datasets._cache.clear()
@@ -1,131 +1,262 @@
-import os
-import random
+from typing import TypedDict, cast
 
 import numpy as np
 from numpy.typing import NDArray
 
+from aegis.agent_predictions.datasets import Datasets
 from aegis.common import AgentID
 from aegis.common.constants import Constants
 
 
+class PendingPredictionCheckpoint(TypedDict):
+    gid: int
+    survivor_id: int
+    image_index: int
+    order: int
+    # [id, gid] of every agent that helped save the survivor
+    agents: list[list[int]]
+
+
+class PredictionResultCheckpoint(TypedDict):
+    gid: int
+    survivor_id: int
+    agent_id: int
+    correct: bool
+    order: int
+
+
+class PredictionCheckpoint(TypedDict):
+    order: int
+    no_pred_yet: list[PendingPredictionCheckpoint]
+    pred_results: list[PredictionResultCheckpoint]
+
+
 class PredictionHandler:
-    # (gid, survivor_id), ([agent(s) helped save], idx for img/label)
-    _no_pred_yet: dict[tuple[int, int], tuple[list[AgentID], int]] = {}
-
-    # gid, {survivor_id: (agent_id, prediction_correct)}
-    _pred_results: dict[int, dict[int, tuple[int, bool]]] = {}
-
-    aegis_testing_output_dir = os.path.join(
-        "src", "aegis", "agent_predictions", "model_testing_data"
-    )
-    _x_test: NDArray[np.float32] = np.load(
-        os.path.join(aegis_testing_output_dir, "x_test_a3.npy")
-    )
-    _y_test: NDArray[np.int64] = np.load(
-        os.path.join(aegis_testing_output_dir, "y_test_a3.npy")
-    )
-    _unique_labels: NDArray[np.int64] = np.unique(_y_test)
+    """
+    Tracks the survivors waiting on a prediction and the prediction results
+    of one simulation.
+
+    Every lookup the kernel makes per command is a dict lookup through the
+    per agent indexes. The testing data is shared by every handler in the
+    process and is only mapped on first use.
+    """
+
+    # mapped on first use, see initialize_testing_data
+    _x_test: NDArray[np.float32] | None = None
+    _y_test: NDArray[np.int64] | None = None
+    _unique_labels: NDArray[np.int64] | None = None
+
+    def __init__(self, rng: np.random.Generator | None = None) -> None:
+        """
+        Args:
+            rng: The generator that picks the image of each saved survivor,
+                the kernel's `RandomStreams.predictions`.
+        """
+        self.rng: np.random.Generator = (
+            rng if rng is not None else np.random.default_rng()
+        )
+        # (gid, survivor_id), ([agent(s) helped save], idx for img/label)
+        self._no_pred_yet: dict[tuple[int, int], tuple[list[AgentID], int]] = {}
+        self._no_pred_yet_order: dict[tuple[int, int], int] = {}
+        # agent_id, {(gid, survivor_id): order the entry was added to _no_pred_yet}
+        self._no_pred_yet_by_agent: dict[AgentID, dict[tuple[int, int], int]] = {}
+
+        # gid, {survivor_id: (agent_id, prediction_correct)}
+        self._pred_results: dict[int, dict[int, tuple[int, bool]]] = {}
+        # (gid, agent id), {survivor_id: order the survivor was added to _pred_results}
+        self._pred_results_by_agent: dict[tuple[int, int], dict[int, int]] = {}
+        self._pred_results_order: dict[tuple[int, int], int] = {}
+
+        self._order: int = 0
+
+    def reset(self) -> None:
+        """Forgets every pending prediction and prediction result."""
+        self._no_pred_yet.clear()
+        self._no_pred_yet_order.clear()
+        self._no_pred_yet_by_agent.clear()
+        self._pred_results.clear()
+        self._pred_results_by_agent.clear()
+        self._pred_results_order.clear()
+        self._order = 0
+
+    def checkpoint(self) -> PredictionCheckpoint:
+        """
+        Returns the pending predictions and prediction results, to be put
+        back by `restore`. The generator's state is saved by the kernel.
+        """
+        return {
+            "order": self._order,
+            "no_pred_yet": [
+                {
+                    "gid": key[0],
+                    "survivor_id": key[1],
+                    "image_index": image_index,
+                    "order": self._no_pred_yet_order[key],
+                    "agents": [[agent_id.id, agent_id.gid] for agent_id in agents],
+                }
+                for key, (agents, image_index) in self._no_pred_yet.items()
+            ],
+            "pred_results": [
+                {
+                    "gid": gid,
+                    "survivor_id": survivor_id,
+                    "agent_id": agent_id,
+                    # numpy's bool, from comparing labels
+                    "correct": bool(correct),
+                    "order": self._pred_results_order[(gid, survivor_id)],
+                }
+                for gid, results in self._pred_results.items()
+                for survivor_id, (agent_id, correct) in results.items()
+            ],
+        }
+
+    def restore(self, checkpoint: PredictionCheckpoint) -> None:
+        """
+        Replaces every pending prediction and prediction result with those of
+        a checkpoint.
+
+        Args:
+            checkpoint: The checkpoint, from `checkpoint`.
+        """
+        self.reset()
+        for pending in checkpoint["no_pred_yet"]:
+            key = (pending["gid"], pending["survivor_id"])
+            agents = [AgentID(id, gid) for id, gid in pending["agents"]]
+            self._no_pred_yet[key] = (agents, pending["image_index"])
+            self._no_pred_yet_order[key] = pending["order"]
+            for agent_id in agents:
+                agent_entries = self._no_pred_yet_by_agent.setdefault(agent_id, {})
+                agent_entries[key] = pending["order"]
+        for result in checkpoint["pred_results"]:
+            gid, survivor_id = result["gid"], result["survivor_id"]
+            group_results = self._pred_results.setdefault(gid, {})
+            group_results[survivor_id] = (result["agent_id"], result["correct"])
+            self._pred_results_order[(gid, survivor_id)] = result["order"]
+            agent_entries = self._pred_results_by_agent.setdefault(
+                (gid, result["agent_id"]), {}
+            )
+            agent_entries[survivor_id] = result["order"]
+        self._order = checkpoint["order"]
 
     @staticmethod
     def initialize_testing_data() -> None:
-        pass
-        # if PredictionHandler._x_test is None or PredictionHandler._y_test is None:
-        #     PredictionHandler._x_test = np.load(os.path.join(aegis_testing_output_dir, "x_test.npy"))
-        #     PredictionHandler._y_test = np.load(os.path.join(aegis_testing_output_dir, "y_test.npy"))
+        if PredictionHandler._x_test is None or PredictionHandler._y_test is None:
+            PredictionHandler._x_test = Datasets.testing_images()
+            PredictionHandler._y_test = Datasets.testing_labels()
+            PredictionHandler._unique_labels = np.unique(PredictionHandler._y_test)
 
     @staticmethod
-    def get_image_from_index(index: int) -> NDArray[np.float32]:
-        # print(f"\n\nx_test shape: {PredictionHandler._x_test.shape}\n\n\n")
-        return PredictionHandler._x_test[index]
+    def _x_test_data() -> NDArray[np.float32]:
+        PredictionHandler.initialize_testing_data()
+        return cast(NDArray[np.float32], PredictionHandler._x_test)
 
     @staticmethod
-    def get_label_from_index(index: int) -> int:
-        # print(f"\n\ny_test shape: {PredictionHandler._y_test.shape}\n\n\n")
-        return PredictionHandler._y_test[index]
+    def _y_test_data() -> NDArray[np.int64]:
+        PredictionHandler.initialize_testing_data()
+        return cast(NDArray[np.int64], PredictionHandler._y_test)
 
     @staticmethod
-    def is_group_in_no_pred_yet(gid: int, survivor_id: int) -> bool:
-        return (gid, survivor_id) in PredictionHandler._no_pred_yet
+    def _unique_labels_data() -> NDArray[np.int64]:
+        PredictionHandler.initialize_testing_data()
+        return cast(NDArray[np.int64], PredictionHandler._unique_labels)
 
     @staticmethod
-    def is_agent_in_saving_group(agent_id: AgentID, survivor_id: int) -> bool:
-        gid = agent_id.gid
-        key = (gid, survivor_id)
-        if key in PredictionHandler._no_pred_yet:
-            agents_helped_save, _ = PredictionHandler._no_pred_yet[key]
-            return agent_id in agents_helped_save
-        return False
+    def get_image_from_index(index: int) -> NDArray[np.float32]:
+        return PredictionHandler._x_test_data()[index]
 
     @staticmethod
-    def add_agent_to_no_pred_yet(agent_id: AgentID, survivor_id: int) -> None:
+    def get_label_from_index(index: int) -> int:
+        return PredictionHandler._y_test_data()[index]
+
+    def _next_order(self) -> int:
+        self._order += 1
+        return self._order
+
+    def is_group_in_no_pred_yet(self, gid: int, survivor_id: int) -> bool:
+        return (gid, survivor_id) in self._no_pred_yet
+
+    def is_agent_in_saving_group(self, agent_id: AgentID, survivor_id: int) -> bool:
+        key = (agent_id.gid, survivor_id)
+        return key in self._no_pred_yet_by_agent.get(agent_id, {})
+
+    def add_agent_to_no_pred_yet(self, agent_id: AgentID, survivor_id: int) -> None:
         gid = agent_id.gid
         key = (gid, survivor_id)
-        if key in PredictionHandler._no_pred_yet:
-            agents_helped_save, _ = PredictionHandler._no_pred_yet[key]
+        if key in self._no_pred_yet:
+            agents_helped_save, _ = self._no_pred_yet[key]
             agents_helped_save.append(agent_id)
         else:
             agents_helped_save = [agent_id]
-            random_index = random.randint(0, Constants.NUM_OF_TESTING_IMAGES - 1)
-            PredictionHandler._no_pred_yet[key] = (agents_helped_save, random_index)
+            random_index = int(self.rng.integers(Constants.NUM_OF_TESTING_IMAGES))
+            self._no_pred_yet[key] = (agents_helped_save, random_index)
+            self._no_pred_yet_order[key] = self._next_order()
+        agent_entries = self._no_pred_yet_by_agent.setdefault(agent_id, {})
+        agent_entries[key] = self._no_pred_yet_order[key]
 
-    @staticmethod
-    def _remove_group_surv_from_no_pred_yet(gid: int, survivor_id: int) -> None:
+    def _remove_group_surv_from_no_pred_yet(self, gid: int, survivor_id: int) -> None:
         key = (gid, survivor_id)
-        if key in PredictionHandler._no_pred_yet:
-            del PredictionHandler._no_pred_yet[key]
+        if key not in self._no_pred_yet:
+            return
+        agents_helped_save, _ = self._no_pred_yet.pop(key)
+        del self._no_pred_yet_order[key]
+        for agent_id in agents_helped_save:
+            agent_entries = self._no_pred_yet_by_agent.get(agent_id)
+            if agent_entries is None:
+                continue
+            _ = agent_entries.pop(key, None)
+            if not agent_entries:
+                del self._no_pred_yet_by_agent[agent_id]
 
-    @staticmethod
     def get_pred_info_for_agent(
+        self,
         agent_id: AgentID,
     ) -> tuple[int, NDArray[np.float32], NDArray[np.int64]] | None:
-        # find agent in a list of agent(s) helped saved and return pred_info for it, otherwise return None
-        for (gid, surv_id), (
-            agents_helped_save,
-            idx,
-        ) in PredictionHandler._no_pred_yet.items():
-            # filter to check only entries with agents group
-            if agent_id.gid == gid:
-                if agent_id in agents_helped_save:
-                    return (
-                        surv_id,
-                        PredictionHandler._x_test[idx],
-                        PredictionHandler._unique_labels,
-                    )
-        return None
+        # the oldest survivor this agent helped save that its group hasn't predicted yet
+        agent_entries = self._no_pred_yet_by_agent.get(agent_id)
+        if not agent_entries:
+            return None
+        key = min(agent_entries, key=agent_entries.__getitem__)
+        _, idx = self._no_pred_yet[key]
+        return (
+            key[1],
+            PredictionHandler._x_test_data()[idx],
+            PredictionHandler._unique_labels_data(),
+        )
 
-    @staticmethod
     def check_agent_prediction(
-        agent_id: AgentID, survivor_id: int, label: np.int64
+        self, agent_id: AgentID, survivor_id: int, label: np.int64
     ) -> bool:
-        gid = agent_id.gid
-        key = (gid, survivor_id)
-        if key in PredictionHandler._no_pred_yet:
-            _, idx = PredictionHandler._no_pred_yet[key]
-            return PredictionHandler._y_test[idx] == label
+        key = (agent_id.gid, survivor_id)
+        if key in self._no_pred_yet:
+            _, idx = self._no_pred_yet[key]
+            return PredictionHandler._y_test_data()[idx] == label
         return False
 
-    @staticmethod
     def set_prediction_result(
-        agent_id: AgentID, survivor_id: int, prediction_correct: bool
+        self, agent_id: AgentID, survivor_id: int, prediction_correct: bool
     ) -> None:
         gid = agent_id.gid
-        if gid not in PredictionHandler._pred_results:
-            PredictionHandler._pred_results[gid] = {}
-        PredictionHandler._pred_results[gid][survivor_id] = (
-            agent_id.id,
-            prediction_correct,
-        )
+        group_results = self._pred_results.setdefault(gid, {})
+        previous = group_results.get(survivor_id)
+        if previous is None:
+            self._pred_results_order[(gid, survivor_id)] = self._next_order()
+        elif previous[0] != agent_id.id:
+            previous_entries = self._pred_results_by_agent[(gid, previous[0])]
+            del previous_entries[survivor_id]
+            if not previous_entries:
+                del self._pred_results_by_agent[(gid, previous[0])]
+        group_results[survivor_id] = (agent_id.id, prediction_correct)
+
+        agent_entries = self._pred_results_by_agent.setdefault((gid, agent_id.id), {})
+        agent_entries[survivor_id] = self._pred_results_order[(gid, survivor_id)]
 
         # remove this group and the surv from no_pred_yet, since this agent made the prediction for the group, and only one person from a group needs to make a prediction
-        PredictionHandler._remove_group_surv_from_no_pred_yet(agent_id.gid, survivor_id)
+        self._remove_group_surv_from_no_pred_yet(agent_id.gid, survivor_id)
 
-    @staticmethod
-    def get_prediction_result(agent_id: AgentID) -> tuple[int, bool] | None:
-        if agent_id.gid in PredictionHandler._pred_results:
-            for surv_id, (
-                agent_id_responsible,
-                prediction_correct,
-            ) in PredictionHandler._pred_results[agent_id.gid].items():
-                if agent_id_responsible == agent_id.id:
-                    return surv_id, prediction_correct
-        return None
+    def get_prediction_result(self, agent_id: AgentID) -> tuple[int, bool] | None:
+        # the first survivor this agent is recorded as predicting for its group
+        agent_entries = self._pred_results_by_agent.get((agent_id.gid, agent_id.id))
+        if not agent_entries:
+            return None
+        surv_id = min(agent_entries, key=agent_entries.__getitem__)
+        return surv_id, self._pred_results[agent_id.gid][surv_id][1]
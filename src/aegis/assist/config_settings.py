@@ -1,3 +1,6 @@
+from aegis.common import Constants
+
+
 class ConfigSettings:
     POINTS_FOR_ALL_SAVING_GROUPS = 0
     POINTS_FOR_RANDOM_SAVING_GROUPS = 1
@@ -11,9 +14,13 @@ class ConfigSettings:
     SEND_MESSAGE_OR_PERFORM_ACTION = False
     SLEEP_ON_ALL_CELLS = True
     SLEEP_ONLY_ON_CHARGING_CELLS = False
+    MOVE_COST_ENABLED = True
+    WORLD_MAX = Constants.WORLD_MAX
     points_for_saving_survivors = POINTS_FOR_ALL_SAVING_GROUPS
     points_for_saving_survivors_tie = POINTS_TIE_ALL_SAVING_GROUPS
     predictions_enabled = PREDICTIONS_ENABLED
     handling_messages = SEND_MESSAGES_AND_PERFORM_ACTION
     send_messages_to_all_groups = SEND_MESSAGES_TO_ALL_GROUPS
     sleep_everywhere = SLEEP_ON_ALL_CELLS
+    move_cost_enabled = MOVE_COST_ENABLED
+    world_max = WORLD_MAX
@@ -0,0 +1,221 @@
+import math
+import os
+import sys
+import threading
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import override
+
+
+class LatencyWindow:
+    """
+    Keeps the most recent latency samples of one agent.
+
+    Samples are written into a fixed-size ring, so another thread can take a
+    snapshot with `samples` while the simulation keeps adding to it, without
+    either side taking a lock.
+    """
+
+    __slots__ = ("_samples", "_next", "count", "total")
+
+    def __init__(self, size: int = 256) -> None:
+        self._samples: list[float] = [math.nan] * size
+        self._next = 0
+        self.count = 0
+        self.total = 0.0
+
+    def add(self, seconds: float) -> None:
+        self._samples[self._next] = seconds
+        self._next = (self._next + 1) % len(self._samples)
+        self.count += 1
+        self.total += seconds
+
+    def samples(self) -> list[float]:
+        """Returns the samples currently in the window, in no particular order."""
+        return [sample for sample in self._samples[:] if not math.isnan(sample)]
+
+    def quantile(self, q: float) -> float:
+        """
+        Returns a quantile of the samples in the window.
+
+        Args:
+            q: The quantile, between 0 and 1.
+
+        Returns:
+            The nearest-rank quantile, or NaN if the window is empty.
+        """
+        samples = sorted(self.samples())
+        if not samples:
+            return math.nan
+        index = max(0, math.ceil(q * len(samples)) - 1)
+        return samples[index]
+
+
+class MetricsText:
+    """Builds a page in the Prometheus text exposition format."""
+
+    def __init__(self) -> None:
+        self._lines: list[str] = []
+
+    def add(
+        self,
+        name: str,
+        kind: str,
+        help: str,
+        samples: list[tuple[dict[str, str], float]],
+    ) -> None:
+        """
+        Adds a metric family.
+
+        Args:
+            name: The metric name.
+            kind: The Prometheus type, e.g. "counter", "gauge" or "summary".
+            help: A description of the metric.
+            samples: The labels and value of every sample in the family.
+        """
+        self._lines.append(f"# HELP {name} {help}")
+        self._lines.append(f"# TYPE {name} {kind}")
+        for labels, value in samples:
+            self._lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+    def add_value(self, name: str, kind: str, help: str, value: float) -> None:
+        self.add(name, kind, help, [({}, value)])
+
+    def add_summary(
+        self,
+        name: str,
+        help: str,
+        windows: list[tuple[dict[str, str], LatencyWindow]],
+        quantiles: tuple[float, ...] = (0.5, 0.9, 0.99),
+    ) -> None:
+        """
+        Adds a summary family with one set of quantiles per latency window.
+
+        Args:
+            name: The metric name.
+            help: A description of the metric.
+            windows: The labels and latency window of every sample.
+            quantiles: The quantiles to report for each window.
+        """
+        self._lines.append(f"# HELP {name} {help}")
+        self._lines.append(f"# TYPE {name} summary")
+        for labels, window in windows:
+            for q in quantiles:
+                quantile_labels = labels | {"quantile": str(q)}
+                value = window.quantile(q)
+                self._lines.append(
+                    f"{name}{_format_labels(quantile_labels)} {_format_value(value)}"
+                )
+            self._lines.append(
+                f"{name}_sum{_format_labels(labels)} {_format_value(window.total)}"
+            )
+            self._lines.append(f"{name}_count{_format_labels(labels)} {window.count}")
+
+    def render(self) -> str:
+        return "\n".join(self._lines) + "\n"
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+    return "{" + pairs + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+    if isinstance(value, int):
+        return str(value)
+    return repr(value)
+
+
+class MetricsServer:
+    """
+    Serves metrics over HTTP from a background thread.
+
+    Every GET of `/metrics` calls `collect` on the server thread and returns
+    what it renders, so `collect` must only read state the simulation updates
+    without locking (plain counters, list and dict snapshots).
+
+    Examples:
+        >>> server = MetricsServer(9464, lambda: "aegis_up 1\\n")
+        >>> server.start()
+        >>> server.stop()
+    """
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(
+        self, port: int, collect: Callable[[], str], host: str = "127.0.0.1"
+    ) -> None:
+        self._collect = collect
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="aegis-metrics", daemon=True
+        )
+
+    @property
+    def port(self) -> int:
+        """The port the server is bound to, useful when created with port 0."""
+        return self._server.server_address[1]
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread.is_alive():
+            self._server.shutdown()
+            self._thread.join()
+        self._server.server_close()
+
+    def _make_handler(self) -> type[BaseHTTPRequestHandler]:
+        collect = self._collect
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                try:
+                    body = collect().encode()
+                except Exception as e:
+                    self.send_error(500, str(e))
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", MetricsServer.CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                _ = self.wfile.write(body)
+
+            @override
+            def log_message(self, format: str, *args: object) -> None:
+                return
+
+        return _Handler
+
+
+def resident_memory_bytes() -> int:
+    """
+    Returns the resident set size of this process, or 0 if it can't be read.
+
+    Uses /proc on Linux and falls back to the peak RSS from `resource`.
+    """
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+        return peak if sys.platform == "darwin" else peak * 1024
+    except (ImportError, OSError):
+        return 0
@@ -0,0 +1,216 @@
+import cProfile
+import os
+import signal
+import sys
+import tracemalloc
+from collections.abc import Callable
+from types import FrameType
+
+_SignalHandler = Callable[[int, FrameType | None], object] | int | None
+
+
+class OnDemandProfiler:
+    """
+    Profiles a running simulation for a few rounds when asked to.
+
+    A capture is requested with `request_cprofile` or `request_tracemalloc`,
+    or by sending the process SIGUSR1 (cProfile) or SIGUSR2 (tracemalloc)
+    once `install_signal_handlers` has been called. The capture starts at the
+    next call to `round_started` and stops after `rounds` rounds. `stop`
+    puts back the handlers that were there before.
+
+    Results are written to files named after `output_prefix` and tagged with
+    the rounds they cover, e.g. `replay.cprofile.r12-21.pstats` and
+    `replay.tracemalloc.r12-21.txt`. The pstats file can be opened with
+    `python -m pstats` or snakeviz.
+
+    Examples:
+        >>> profiler = OnDemandProfiler("replay", rounds=10)
+        >>> profiler.install_signal_handlers()
+        >>> for round in range(1, 101):
+        ...     profiler.round_started(round)
+        ...     run_round()
+        >>> profiler.stop()
+    """
+
+    TOP_ALLOCATIONS = 25
+
+    def __init__(
+        self,
+        output_prefix: str,
+        rounds: int = 10,
+        log: Callable[[str], None] | None = None,
+    ) -> None:
+        self._output_prefix = output_prefix
+        self._log = log if log is not None else OnDemandProfiler._log_to_stderr
+        self._rounds = max(1, rounds)
+        self._round = 0
+
+        self._cprofile_requested = False
+        self._cprofile: cProfile.Profile | None = None
+        self._cprofile_start = 0
+
+        self._tracemalloc_requested = False
+        self._tracemalloc_snapshot: tracemalloc.Snapshot | None = None
+        self._tracemalloc_start = 0
+        self._started_tracemalloc = False
+
+        self._previous_handlers: dict[int, _SignalHandler] = {}
+
+    def install_signal_handlers(self) -> bool:
+        """
+        Makes SIGUSR1 request a cProfile capture and SIGUSR2 a tracemalloc one,
+        until `stop` restores the previous handlers.
+
+        Returns:
+            True if the handlers were installed, False if the platform has no
+            SIGUSR1/SIGUSR2 or this is not the main thread.
+        """
+        if not hasattr(signal, "SIGUSR1") or not hasattr(signal, "SIGUSR2"):
+            return False
+        if self._previous_handlers:
+            return True
+        handlers = {
+            signal.SIGUSR1: self._on_cprofile_signal,
+            signal.SIGUSR2: self._on_tracemalloc_signal,
+        }
+        try:
+            for signum, handler in handlers.items():
+                self._previous_handlers[signum] = signal.getsignal(signum)
+                _ = signal.signal(signum, handler)
+        except ValueError:
+            self._restore_signal_handlers()
+            return False
+        return True
+
+    def request_cprofile(self) -> None:
+        self._cprofile_requested = True
+
+    def request_tracemalloc(self) -> None:
+        self._tracemalloc_requested = True
+
+    def round_started(self, round: int) -> None:
+        """
+        Stops captures that have run for enough rounds and starts requested ones.
+
+        Args:
+            round: The round that is starting.
+        """
+        self._round = round
+        if self._cprofile is not None and round - self._cprofile_start >= self._rounds:
+            self._stop_cprofile(round - 1)
+        if (
+            self._tracemalloc_snapshot is not None
+            and round - self._tracemalloc_start >= self._rounds
+        ):
+            self._stop_tracemalloc(round - 1)
+
+        if self._cprofile_requested and self._cprofile is None:
+            self._cprofile_requested = False
+            self._start_cprofile(round)
+        if self._tracemalloc_requested and self._tracemalloc_snapshot is None:
+            self._tracemalloc_requested = False
+            self._start_tracemalloc(round)
+
+    def stop(self) -> None:
+        """
+        Stops any running capture, writes what it collected so far and
+        restores the signal handlers replaced by `install_signal_handlers`.
+        """
+        if self._cprofile is not None:
+            self._stop_cprofile(self._round)
+        if self._tracemalloc_snapshot is not None:
+            self._stop_tracemalloc(self._round)
+        self._restore_signal_handlers()
+
+    def _restore_signal_handlers(self) -> None:
+        for signum, handler in self._previous_handlers.items():
+            try:
+                # None is a handler that wasn't installed from Python
+                _ = signal.signal(
+                    signum, signal.SIG_DFL if handler is None else handler
+                )
+            except ValueError:
+                pass
+        self._previous_handlers.clear()
+
+    @staticmethod
+    def _log_to_stderr(message: str) -> None:
+        print(f"Aegis  : {message}", file=sys.stderr)
+
+    def _on_cprofile_signal(self, signum: int, frame: FrameType | None) -> None:
+        self.request_cprofile()
+
+    def _on_tracemalloc_signal(self, signum: int, frame: FrameType | None) -> None:
+        self.request_tracemalloc()
+
+    def _filename(self, kind: str, first: int, last: int, extension: str) -> str:
+        return f"{self._output_prefix}.{kind}.r{first}-{last}.{extension}"
+
+    def _start_cprofile(self, round: int) -> None:
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError as e:
+            # another profiler (or debugger) is already attached
+            self._log(f"Unable to start cProfile: {e}")
+            return
+        self._cprofile = profile
+        self._cprofile_start = round
+        self._log(f"cProfile started at round {round} for {self._rounds} rounds.")
+
+    def _stop_cprofile(self, last_round: int) -> None:
+        if self._cprofile is None:
+            return
+        self._cprofile.disable()
+        filename = self._filename(
+            "cprofile", self._cprofile_start, last_round, "pstats"
+        )
+        try:
+            self._cprofile.dump_stats(filename)
+            self._log(f"cProfile stats written to {filename}")
+        except OSError as e:
+            self._log(f"Unable to write {filename}: {e}")
+        self._cprofile = None
+
+    def _start_tracemalloc(self, round: int) -> None:
+        self._started_tracemalloc = not tracemalloc.is_tracing()
+        if self._started_tracemalloc:
+            tracemalloc.start()
+        self._tracemalloc_snapshot = tracemalloc.take_snapshot()
+        self._tracemalloc_start = round
+        self._log(f"tracemalloc started at round {round} for {self._rounds} rounds.")
+
+    def _stop_tracemalloc(self, last_round: int) -> None:
+        if self._tracemalloc_snapshot is None:
+            return
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+
+        top = OnDemandProfiler.TOP_ALLOCATIONS
+        by_size = snapshot.statistics("lineno")[:top]
+        by_growth = snapshot.compare_to(self._tracemalloc_snapshot, "lineno")[:top]
+        lines = [
+            f"tracemalloc, rounds {self._tracemalloc_start}-{last_round}",
+            f"pid {os.getpid()}, traced {current / 1024:.1f} KiB, "
+            + f"peak {peak / 1024:.1f} KiB",
+            "",
+            f"Top {top} allocations by size:",
+            *(str(stat) for stat in by_size),
+            "",
+            f"Top {top} allocations by growth since round {self._tracemalloc_start}:",
+            *(str(stat) for stat in by_growth),
+        ]
+
+        filename = self._filename(
+            "tracemalloc", self._tracemalloc_start, last_round, "txt"
+        )
+        try:
+            with open(filename, "w") as file:
+                _ = file.write("\n".join(lines) + "\n")
+            self._log(f"tracemalloc snapshot written to {filename}")
+        except OSError as e:
+            self._log(f"Unable to write {filename}: {e}")
+        self._tracemalloc_snapshot = None
@@ -13,6 +13,18 @@ class Parameters:
     number_of_agents = 0
     replay_filename = "replay.txt"
     world_filename = "ExampleWorld.world"
+    metrics_filename = ""
+    trace_filename = ""
+    metrics_port = 0
+    profile_rounds = 10
+    agent_endpoint = ""
+    random_seed: int | None = None
+    config_filename = "sys_files/aegis_config.json"
+    results_filename = ""
+    turbo = False
+    checkpoint_every = 0
+    checkpoint_filename = "checkpoint.ckpt"
+    resume_filename = ""
     OBSERVE_ENERGY_COST = DEFAULT_OBSERVE_ENERGY_COST
     SAVE_SURV_ENERGY_COST = DEFAULT_SAVE_SURV_ENERGY_COST
     PREDICTION_ENERGY_COST = DEFAULT_PREDICTION_ENERGY_COST
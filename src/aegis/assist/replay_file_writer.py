@@ -1,29 +1,25 @@
-import os
+import io
 from datetime import datetime
+from typing import TextIO
 
 
 class ReplayFileWriter:
-    replay_file = None
+    replay_file: TextIO | None = None
+    bytes_written = 0
 
     @staticmethod
-    def open_replay_file(filename: str, world_filename: str) -> bool:
+    def open_replay_file(filename: str, world_file_content: str) -> bool:
         try:
             if ReplayFileWriter.replay_file is not None:
                 ReplayFileWriter.close_replay_file()
             ReplayFileWriter.replay_file = open(filename, "w")
 
-            if not os.path.exists(world_filename):
-                print(f"Cannot find world file {world_filename}")
-                return False
-
-            with open(world_filename, "r") as world_file:
-                world_file_content = world_file.read()
-                _ = ReplayFileWriter.replay_file.write(f"{len(world_file_content)}\n")
-                _ = ReplayFileWriter.replay_file.write(world_file_content + "\n")
-                _ = ReplayFileWriter.replay_file.write(
-                    f"System Run date: {datetime.now()}\n"
-                )
-                ReplayFileWriter.replay_file.flush()
+            _ = ReplayFileWriter.replay_file.write(f"{len(world_file_content)}\n")
+            _ = ReplayFileWriter.replay_file.write(world_file_content + "\n")
+            _ = ReplayFileWriter.replay_file.write(
+                f"System Run date: {datetime.now()}\n"
+            )
+            ReplayFileWriter.replay_file.flush()
 
         except FileNotFoundError:
             print(f"Cannot find/open replay file {filename}")
@@ -33,15 +29,31 @@ class ReplayFileWriter:
             return False
         return True
 
+    @staticmethod
+    def open_replay_buffer() -> io.StringIO:
+        """
+        Writes the replay to a new in-memory buffer, with no world or date
+        header, e.g. to compare a round with a recorded replay.
+
+        Returns:
+            The buffer, which is closed with `close_replay_file`.
+        """
+        ReplayFileWriter.close_replay_file()
+        buffer = io.StringIO()
+        ReplayFileWriter.replay_file = buffer
+        return buffer
+
     @staticmethod
     def close_replay_file() -> None:
         if ReplayFileWriter.replay_file is not None:
             ReplayFileWriter.replay_file.close()
+            ReplayFileWriter.replay_file = None
 
     @staticmethod
     def write_string(string: str) -> None:
         if ReplayFileWriter.replay_file is not None:
             _ = ReplayFileWriter.replay_file.write(string)
+            ReplayFileWriter.bytes_written += len(string)
             ReplayFileWriter.replay_file.flush()
 
     @classmethod
@@ -0,0 +1,228 @@
+import json
+import os
+import time
+from types import TracebackType
+from typing import TextIO
+
+from aegis.common import AgentID
+
+
+class _NoTimer:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        return None
+
+
+class _Timer:
+    __slots__ = ("_profiler", "_name", "_agent_id", "_start")
+
+    def __init__(
+        self, profiler: "RoundProfiler", name: str, agent_id: AgentID | None
+    ) -> None:
+        self._profiler = profiler
+        self._name = name
+        self._agent_id = agent_id
+        self._start = 0
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter_ns()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._profiler.record(
+            self._name, self._start, time.perf_counter_ns(), self._agent_id
+        )
+
+
+class RoundProfiler:
+    """
+    Times the phases of each simulation round.
+
+    Each round is written as one JSON line to the metrics file, with the time
+    spent in every phase and the time every agent took to send its command.
+    Optionally every phase and agent wait is also written as a Chrome trace
+    event, so a run can be opened in Perfetto (ui.perfetto.dev) or
+    chrome://tracing.
+
+    When neither file is given the profiler is disabled and `phase` and
+    `agent_wait` return a shared no-op context manager.
+
+    Examples:
+        >>> profiler = RoundProfiler("metrics.jsonl", "trace.json")
+        >>> profiler.begin_round(1)
+        >>> with profiler.phase("process_commands"):
+        ...     process_commands()
+        >>> profiler.end_round()
+        >>> profiler.close()
+    """
+
+    _NO_TIMER = _NoTimer()
+    _KERNEL_THREAD = 0
+
+    def __init__(
+        self, metrics_filename: str | None = None, trace_filename: str | None = None
+    ) -> None:
+        self._metrics_file: TextIO | None = None
+        self._trace_file: TextIO | None = None
+        self._origin = time.perf_counter_ns()
+        self._round = 0
+        self._round_start = 0
+        self._phases: dict[str, int] = {}
+        self._agent_waits: dict[str, int] = {}
+        self._agent_threads: dict[AgentID, int] = {}
+        self._trace_events = 0
+
+        if metrics_filename:
+            self._metrics_file = open(metrics_filename, "w")
+        if trace_filename:
+            self._trace_file = open(trace_filename, "w")
+            _ = self._trace_file.write("[")
+            self._write_trace_event(
+                {
+                    "name": "process_name",
+                    "ph": "M",
+                    "pid": os.getpid(),
+                    "args": {"name": "AEGIS"},
+                }
+            )
+            self._name_thread(RoundProfiler._KERNEL_THREAD, "kernel")
+
+    @property
+    def enabled(self) -> bool:
+        return self._metrics_file is not None or self._trace_file is not None
+
+    def begin_round(self, round: int) -> None:
+        if not self.enabled:
+            return
+        self._round = round
+        self._round_start = time.perf_counter_ns()
+        self._phases.clear()
+        self._agent_waits.clear()
+
+    def end_round(self) -> None:
+        """Writes the metrics of the round started by `begin_round`."""
+        if not self.enabled:
+            return
+        end = time.perf_counter_ns()
+        self.record("round", self._round_start, end, None)
+
+        if self._metrics_file is not None:
+            metrics = {
+                "round": self._round,
+                "total_ms": (end - self._round_start) / 1e6,
+                "phases_ms": {
+                    name: elapsed / 1e6
+                    for name, elapsed in self._phases.items()
+                    if name != "round"
+                },
+                "agent_wait_ms": {
+                    agent: elapsed / 1e6 for agent, elapsed in self._agent_waits.items()
+                },
+            }
+            _ = self._metrics_file.write(json.dumps(metrics) + "\n")
+            self._metrics_file.flush()
+
+    def phase(self, name: str) -> _Timer | _NoTimer:
+        """
+        Times a phase of the current round.
+
+        Args:
+            name: The name of the phase. Phases with the same name in a round add up.
+        """
+        if not self.enabled:
+            return RoundProfiler._NO_TIMER
+        return _Timer(self, name, None)
+
+    def agent_wait(self, agent_id: AgentID) -> _Timer | _NoTimer:
+        """
+        Times how long the kernel waits for an agent's command.
+
+        Args:
+            agent_id: The agent being waited on.
+        """
+        if not self.enabled:
+            return RoundProfiler._NO_TIMER
+        return _Timer(self, "agent_wait", agent_id)
+
+    def record(
+        self, name: str, start: int, end: int, agent_id: AgentID | None
+    ) -> None:
+        """
+        Records a timed span.
+
+        Args:
+            name: The name of the phase.
+            start: When the span started, from `time.perf_counter_ns`.
+            end: When the span ended, from `time.perf_counter_ns`.
+            agent_id: The agent the span belongs to, if any.
+        """
+        elapsed = end - start
+        self._phases[name] = self._phases.get(name, 0) + elapsed
+        thread = RoundProfiler._KERNEL_THREAD
+        if agent_id is not None:
+            key = f"{agent_id.id}:{agent_id.gid}"
+            self._agent_waits[key] = self._agent_waits.get(key, 0) + elapsed
+            thread = self._agent_thread(agent_id)
+
+        if self._trace_file is not None:
+            self._write_trace_event(
+                {
+                    "name": name,
+                    "cat": "agent" if agent_id is not None else "kernel",
+                    "ph": "X",
+                    "ts": (start - self._origin) / 1e3,
+                    "dur": elapsed / 1e3,
+                    "pid": os.getpid(),
+                    "tid": thread,
+                    "args": {"round": self._round},
+                }
+            )
+
+    def close(self) -> None:
+        if self._metrics_file is not None:
+            self._metrics_file.close()
+            self._metrics_file = None
+        if self._trace_file is not None:
+            _ = self._trace_file.write("\n]\n")
+            self._trace_file.close()
+            self._trace_file = None
+
+    def _agent_thread(self, agent_id: AgentID) -> int:
+        thread = self._agent_threads.get(agent_id)
+        if thread is None:
+            thread = len(self._agent_threads) + 1
+            self._agent_threads[agent_id] = thread
+            self._name_thread(thread, f"agent {agent_id.id}:{agent_id.gid}")
+        return thread
+
+    def _name_thread(self, thread: int, name: str) -> None:
+        if self._trace_file is None:
+            return
+        self._write_trace_event(
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": os.getpid(),
+                "tid": thread,
+                "args": {"name": name},
+            }
+        )
+
+    def _write_trace_event(self, event: dict[str, object]) -> None:
+        if self._trace_file is not None:
+            separator = "\n" if self._trace_events == 0 else ",\n"
+            _ = self._trace_file.write(separator + json.dumps(event))
+            self._trace_events += 1
@@ -7,11 +7,18 @@ class AgentID:
     """
     Represents an agent with a unique ID and group ID.
 
+    Agent IDs are immutable values, so `clone` returns the same instance and
+    `AgentID.of` hands out one shared instance per agent.
+
     Attributes:
         id (int): An integer that uniquely identifies the agent within a group.
         gid (int): An integer that represents the group identifier for the agent.
     """
 
+    __slots__ = ("id", "gid")
+
+    _interned: dict[tuple[int, int], AgentID] = {}
+
     def __init__(self, id: int, gid: int) -> None:
         """
         Initializes an AgentID with the given ID and GID.
@@ -34,14 +41,29 @@ class AgentID:
     def proc_string(self) -> str:
         return f"({self.id}, {self.gid})"
 
+    @staticmethod
+    def of(id: int, gid: int) -> AgentID:
+        """
+        Returns the shared AgentID for the given ID and GID.
+
+        Args:
+            id: The unique identifier of the agent.
+            gid: The group identifier of the agent.
+        """
+        agent_id = AgentID._interned.get((id, gid))
+        if agent_id is None:
+            agent_id = AgentID(id, gid)
+            AgentID._interned[(id, gid)] = agent_id
+        return agent_id
+
     def clone(self) -> AgentID:
         """
-        Creates and returns a new AgentID with the same ID and GID.
+        Returns this AgentID, which is immutable.
 
         Returns:
-            A new AgentID object with same ID and GID as the current instance.
+            The current instance.
         """
-        return AgentID(self.id, self.gid)
+        return self
 
     @override
     def __hash__(self) -> int:
@@ -9,6 +9,8 @@ from aegis.common.agent_id import AgentID
 class AgentIDList:
     """Represents a list of AgentID instances."""
 
+    __slots__ = ("_agent_id_list",)
+
     def __init__(self, agent_id_list: list[AgentID] | None = None) -> None:
         """
         Initializes an AgentIDList with the provided list of AgentID instances.
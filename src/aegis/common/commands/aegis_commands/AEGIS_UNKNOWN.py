@@ -6,6 +6,8 @@ from aegis.common.commands.aegis_command import AegisCommand
 class AEGIS_UNKNOWN(AegisCommand):
     """Represents an unknown command in AEGIS."""
 
+    __slots__ = ()
+
     @override
     def __str__(self) -> str:
         return self.STR_UNKNOWN
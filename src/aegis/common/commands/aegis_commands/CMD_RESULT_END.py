@@ -9,6 +9,8 @@ class CMD_RESULT_END(AegisCommand):
     the agent's last command are returned.
     """
 
+    __slots__ = ()
+
     @override
     def __str__(self) -> str:
         return self.STR_CMD_RESULT_END
@@ -12,6 +12,8 @@ class CMD_RESULT_START(AegisCommand):
         results (int): The number of results from the agents last command.
     """
 
+    __slots__ = ("results",)
+
     def __init__(self, results: int) -> None:
         """
         Initializes a CMD_RESULT_START instance.
@@ -1,3 +1,5 @@
+import base64
+import zlib
 from typing import override
 
 from aegis.common import AgentID, InternalLocation
@@ -12,15 +14,26 @@ class CONNECT_OK(AegisCommand):
         new_agent_id (AgentID): The unique AgentID of the new agent.
         energy_level (int): The start energy level of the new agent.
         location (Location): The start location of the new agent.
-        world_filename (str): The world file being used.
+        world_filename (str): The world information file being used.
+        world_data (bytes | None): The world information itself, sent instead
+            of the file name to agents that can't read the kernel's filesystem.
     """
 
+    __slots__ = (
+        "new_agent_id",
+        "energy_level",
+        "location",
+        "world_filename",
+        "world_data",
+    )
+
     def __init__(
         self,
         new_agent_id: AgentID,
         energy_level: int,
         location: InternalLocation,
         world_filename: str,
+        world_data: bytes | None = None,
     ) -> None:
         """
         Initializes a CONNECT_OK instance.
@@ -29,13 +42,27 @@ class CONNECT_OK(AegisCommand):
             new_agent_id: The unique AgentID of the new agent.
             energy_level: The start energy level of the new agent.
             location: The start location of the new agent.
-            world_filename: The world file being used.
+            world_filename: The world information file being used.
+            world_data: The world information, if it is sent inline.
         """
         self.new_agent_id: AgentID = new_agent_id
         self.energy_level: int = energy_level
         self.location: InternalLocation = location
         self.world_filename: str = world_filename
+        self.world_data: bytes | None = world_data
+
+    @staticmethod
+    def encode_world_data(world_data: bytes) -> str:
+        return base64.b64encode(zlib.compress(world_data)).decode("ascii")
+
+    @staticmethod
+    def decode_world_data(encoded: str) -> bytes:
+        return zlib.decompress(base64.b64decode(encoded))
 
     @override
     def __str__(self) -> str:
-        return f"{self.STR_CONNECT_OK} ( ID {self.new_agent_id.id} , GID {self.new_agent_id.gid} , ENG_LEV {self.energy_level} , LOC {self.location} , FILE {self.world_filename} )"
+        if self.world_data is not None:
+            world = f"DATA {self.encode_world_data(self.world_data)}"
+        else:
+            world = f"FILE {self.world_filename}"
+        return f"{self.STR_CONNECT_OK} ( ID {self.new_agent_id.id} , GID {self.new_agent_id.gid} , ENG_LEV {self.energy_level} , LOC {self.location} , {world} )"
@@ -6,6 +6,8 @@ from aegis.common.commands.aegis_command import AegisCommand
 class DEATH_CARD(AegisCommand):
     """Represents if the agent has died."""
 
+    __slots__ = ()
+
     @override
     def __str__(self) -> str:
         return self.STR_DEATH_CARD
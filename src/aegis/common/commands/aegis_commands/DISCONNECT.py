@@ -6,6 +6,8 @@ from aegis.common.commands.aegis_command import AegisCommand
 class DISCONNECT(AegisCommand):
     """Represents if the agent has disconnected and the system has shutdown."""
 
+    __slots__ = ()
+
     @override
     def __str__(self) -> str:
         return self.STR_DISCONNECT
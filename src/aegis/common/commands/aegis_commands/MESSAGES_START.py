@@ -11,6 +11,8 @@ class MESSAGES_START(AegisCommand):
         messages (int): The number of messages to forward.
     """
 
+    __slots__ = ("messages",)
+
     def __init__(self, messages: int) -> None:
         """
         Initializes a MESSAGES_START instance.
@@ -15,6 +15,8 @@ class OBSERVE_RESULT(AegisCommand):
         life_signals (LifeSignals): The life signals of the cell.
     """
 
+    __slots__ = ("energy_level", "cell_info", "life_signals")
+
     def __init__(
         self, energy_level: int, cell_info: CellInfo, life_signals: LifeSignals
     ) -> None:
@@ -12,6 +12,8 @@ class PREDICT_RESULT(AegisCommand):
         prediction_correct (bool): If the agent's prediction was correct or not.
     """
 
+    __slots__ = ("surv_id", "prediction_correct")
+
     def __init__(self, surv_id: int, prediction_correct: bool) -> None:
         """
         Initializes a PREDICT_RESULT instance.
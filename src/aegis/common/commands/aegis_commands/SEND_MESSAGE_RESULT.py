@@ -14,6 +14,8 @@ class SEND_MESSAGE_RESULT(AegisCommand):
         msg (str): The content of the message.
     """
 
+    __slots__ = ("from_agent_id", "agent_id_list", "msg", "_number_left_to_read")
+
     def __init__(
         self, from_agent_id: AgentID, agent_id_list: AgentIDList, msg: str
     ) -> None:
@@ -12,6 +12,8 @@ class SLEEP_RESULT(AegisCommand):
         charge_energy (int): The agents current energy level.
     """
 
+    __slots__ = ("was_successful", "charge_energy")
+
     def __init__(self, was_successful: bool, charge_energy: int) -> None:
         """
         Initializes a SLEEP_RESULT instance.
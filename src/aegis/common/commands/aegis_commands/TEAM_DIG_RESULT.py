@@ -13,6 +13,8 @@ class TEAM_DIG_RESULT(AegisCommand):
         surround_info (SurroundInfo): The surrounding info of the agent.
     """
 
+    __slots__ = ("energy_level", "surround_info")
+
     def __init__(self, energy_level: int, surround_info: SurroundInfo) -> None:
         """
         Initializes a TEAM_DIG_RESULT instance.
@@ -7,7 +7,10 @@ from aegis.common.commands.command import Command
 class AgentCommand(Command, ABC):
     """The base class that represents all commands coming from agents."""
 
-    _agent_id = AgentID(-1, -1)
+    __slots__ = ("_agent_id",)
+
+    def __init__(self) -> None:
+        self._agent_id: AgentID = AgentID(-1, -1)
 
     def get_agent_id(self) -> AgentID:
         """Returns the unique AgentID of the agent."""
@@ -6,6 +6,8 @@ from aegis.common.commands.agent_command import AgentCommand
 class AGENT_UNKNOWN(AgentCommand):
     """Represents an unknown agent command."""
 
+    __slots__ = ()
+
     @override
     def __str__(self) -> str:
         return self.STR_UNKNOWN
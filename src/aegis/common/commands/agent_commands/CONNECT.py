@@ -11,6 +11,8 @@ class CONNECT(AgentCommand):
         group_name (str): The group name for the agent.
     """
 
+    __slots__ = ("group_name",)
+
     def __init__(self, group_name: str) -> None:
         """
         Initializes a CONNECT instance.
@@ -18,6 +20,7 @@ class CONNECT(AgentCommand):
         Args:
             group_name: The group name for the agent.
         """
+        super().__init__()
         self.group_name = group_name
 
     @override
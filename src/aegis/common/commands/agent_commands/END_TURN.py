@@ -13,6 +13,8 @@ class END_TURN(AgentCommand):
         END_TURN
     """
 
+    __slots__ = ()
+
     @override
     def __str__(self) -> str:
         return self.STR_END_TURN
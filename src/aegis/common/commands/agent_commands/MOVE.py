@@ -18,6 +18,8 @@ class MOVE(AgentCommand):
         direction (Direction): The direction to move.
     """
 
+    __slots__ = ("direction",)
+
     def __init__(self, direction: Direction) -> None:
         """
         Initializes a MOVE instance.
@@ -25,6 +27,7 @@ class MOVE(AgentCommand):
         Args:
             direction: The direction to move.
         """
+        super().__init__()
         self.direction = direction
 
     @override
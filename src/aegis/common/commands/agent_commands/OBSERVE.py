@@ -12,6 +12,8 @@ class OBSERVE(AgentCommand):
         location (Location): The location to observe.
     """
 
+    __slots__ = ("location",)
+
     def __init__(self, location: InternalLocation) -> None:
         """
         Initializes a OBSERVE instance.
@@ -19,6 +21,7 @@ class OBSERVE(AgentCommand):
         Args:
             location: The location to observe.
         """
+        super().__init__()
         self.location: InternalLocation = location
 
     @override
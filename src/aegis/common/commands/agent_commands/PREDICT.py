@@ -1,9 +1,12 @@
-from typing import override
+from __future__ import annotations
 
-import numpy as np
+from typing import TYPE_CHECKING, override
 
 from aegis.common.commands.agent_command import AgentCommand
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 class PREDICT(AgentCommand):
     """
@@ -14,6 +17,8 @@ class PREDICT(AgentCommand):
         label (np.int64): The label of the prediction.
     """
 
+    __slots__ = ("surv_id", "label")
+
     def __init__(self, surv_id: int, label: np.int64):
         """
         Initializes a PREDICT instance.
@@ -12,6 +12,8 @@ class SAVE_SURV(AgentCommand):
         SAVE_SURV
     """
 
+    __slots__ = ()
+
     @override
     def __str__(self) -> str:
         return self.STR_SAVE_SURV
@@ -15,6 +15,8 @@ class SEND_MESSAGE(AgentCommand):
         message (str): The content of the message.
     """
 
+    __slots__ = ("agent_id_list", "message")
+
     def __init__(self, agent_id_list: AgentIDList, message: str) -> None:
         """
         Initializes a SEND_MESSAGE instance.
@@ -23,6 +25,7 @@ class SEND_MESSAGE(AgentCommand):
             agent_id_list: The list of agents to send a message to.
             message: The content of the message.
         """
+        super().__init__()
         self.agent_id_list = agent_id_list
         self.message = message
 
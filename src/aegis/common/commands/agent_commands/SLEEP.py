@@ -10,6 +10,8 @@ class SLEEP(AgentCommand):
     This command must be called on a charging grid when the `Sleep_On_Every` setting is set to false.
     """
 
+    __slots__ = ()
+
     @override
     def __str__(self) -> str:
         return self.STR_SLEEP
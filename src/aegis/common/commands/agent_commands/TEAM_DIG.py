@@ -12,6 +12,8 @@ class TEAM_DIG(AgentCommand):
     TEAM_DIG command during the same round.
     """
 
+    __slots__ = ()
+
     @override
     def __str__(self) -> str:
         return self.STR_TEAM_DIG
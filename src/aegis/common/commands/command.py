@@ -5,6 +5,8 @@ from typing import override
 class Command(ABC):
     """Represents a command in AEGIS."""
 
+    __slots__ = ()
+
     STR_CONNECT = "CONNECT"
     STR_END_TURN = "END_TURN"
     STR_MOVE = "MOVE"
@@ -0,0 +1,74 @@
+from collections.abc import Callable
+from typing import Any
+
+from aegis.common.commands.command import Command
+
+
+class CommandDispatcher:
+    """
+    Calls the handler registered for a command's type.
+
+    Handlers are looked up by the exact type of the command, so dispatching
+    takes the same time however many command types are registered. A command
+    whose type has no handler of its own uses the handler of its closest
+    registered base class.
+
+    Examples:
+        >>> dispatcher = CommandDispatcher()
+        >>> dispatcher.register(ROUND_START, lambda command: print("start"))
+        >>> dispatcher.dispatch(ROUND_START())
+        start
+        True
+    """
+
+    __slots__ = ("_handlers", "_inherited")
+
+    def __init__(self) -> None:
+        self._handlers: dict[type[Command], Callable[[Any], None]] = {}
+        self._inherited: set[type[Command]] = set()
+
+    def register(
+        self, command_type: type[Command], handler: Callable[[Any], None]
+    ) -> None:
+        """
+        Registers the handler for a command type, replacing any existing one.
+
+        Args:
+            command_type: The type of command to handle.
+            handler: Called with each command of that type.
+        """
+        # handlers cached for subclasses may now come from a closer base class
+        for inherited_type in self._inherited:
+            del self._handlers[inherited_type]
+        self._inherited.clear()
+        self._handlers[command_type] = handler
+
+    def dispatch(self, command: Command) -> bool:
+        """
+        Calls the handler for a command.
+
+        Args:
+            command: The command to handle.
+
+        Returns:
+            True if the command was handled, False if no handler was registered
+            for its type.
+        """
+        handler = self._handlers.get(type(command))
+        if handler is None:
+            handler = self._inherited_handler(type(command))
+            if handler is None:
+                return False
+        handler(command)
+        return True
+
+    def _inherited_handler(
+        self, command_type: type[Command]
+    ) -> Callable[[Any], None] | None:
+        for base in command_type.__mro__[1:]:
+            handler = self._handlers.get(base)
+            if handler is not None:
+                self._handlers[command_type] = handler
+                self._inherited.add(command_type)
+                return handler
+        return None
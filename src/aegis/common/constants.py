@@ -16,7 +16,8 @@ class Constants:
         SAVE_STATE_DEAD (int): The state value indicating that the survivor is dead.
         FIRE_SPREAD (bool): Flag indicating if fire spread is enabled or not.
         WORLD_MIN (int): The minimum size of a world.
-        WORLD_MAX (int): The maximum size of a world.
+        WORLD_MAX (int): The default maximum size of a world, used when the
+            config file doesn't set "World_Max".
         NUM_OF_TESTING_IMAGES (int): The number of testing images.
     """
 
@@ -11,6 +11,8 @@ class LifeSignals:
         life_signals (list[int]): A list of life signals.
     """
 
+    __slots__ = ("life_signals",)
+
     def __init__(self, life_signals: list[int] | None = None) -> None:
         """
         Initializes a LifeSignals instance.
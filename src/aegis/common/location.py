@@ -8,11 +8,18 @@ class InternalLocation:
     """
     Represents a location in the world.
 
+    Locations are immutable values, so `clone` returns the same instance and
+    `InternalLocation.of` hands out one shared instance per coordinate.
+
     Attributes:
         x (int): The x-coordinate of the location.
         y (int): The y-coordinate of the location.
     """
 
+    __slots__ = ("x", "y")
+
+    _interned: dict[tuple[int, int], InternalLocation] = {}
+
     def __init__(self, x: int, y: int) -> None:
         """
         Initializes a new Location instance.
@@ -35,8 +42,23 @@ class InternalLocation:
     def proc_string(self) -> str:
         return f"( {self.x}, {self.y} )"
 
+    @staticmethod
+    def of(x: int, y: int) -> InternalLocation:
+        """
+        Returns the shared location for the given coordinates.
+
+        Args:
+            x: The x-coordinate of the location.
+            y: The y-coordinate of the location.
+        """
+        location = InternalLocation._interned.get((x, y))
+        if location is None:
+            location = InternalLocation(x, y)
+            InternalLocation._interned[(x, y)] = location
+        return location
+
     def clone(self) -> InternalLocation:
-        return InternalLocation(self.x, self.y)
+        return self
 
     @override
     def __hash__(self) -> int:
@@ -55,7 +77,7 @@ class InternalLocation:
         Returns:
             A new Location object one unit away in the given direction.
         """
-        return InternalLocation(self.x + direction.dx, self.y + direction.dy)
+        return InternalLocation.of(self.x + direction.dx, self.y + direction.dy)
 
     def direction_to(self, location: InternalLocation) -> Direction:
         """
@@ -1,17 +1,14 @@
-import io
-import socket
-
 from aegis.common.network.aegis_socket_exception import AegisSocketException
+from aegis.common.network.socket_transport import SocketTransport
+from aegis.common.network.transport import Transport
 
 
 class AegisSocket:
-    """Represents a socket connection to AEGIS."""
+    """Represents a connection to AEGIS."""
 
     def __init__(self) -> None:
         """Initializes a AegisSocket instance."""
-        self._socket: socket.socket | None = None
-        self._in_stream: io.BufferedReader | None = None
-        self._out_stream: io.BufferedWriter | None = None
+        self._transport: Transport | None = None
 
     def connect(self, host: str, port: int) -> None:
         """
@@ -25,25 +22,48 @@ class AegisSocket:
             AegisSocketException: If the connection to AEGIS fails.
         """
         try:
-            self._socket = socket.create_connection((host, port))
-            self._in_stream = self._socket.makefile("rb")
-            self._out_stream = self._socket.makefile("wb")
+            self._transport = SocketTransport.connect(host, port)
         except Exception:
             raise AegisSocketException("Unable to connect to AEGIS.")
 
+    def connect_endpoint(self, endpoint: str) -> None:
+        """
+        Connects to AEGIS at an endpoint, `tcp://host:port` or `unix:///path`.
+
+        Args:
+            endpoint: Where AEGIS is listening for agents.
+
+        Raises:
+            AegisSocketException: If the endpoint is invalid or the connection fails.
+        """
+        try:
+            self._transport = SocketTransport.connect_endpoint(endpoint)
+        except ValueError as e:
+            raise AegisSocketException(str(e))
+        except Exception:
+            raise AegisSocketException(f"Unable to connect to AEGIS at {endpoint}.")
+
+    def connect_transport(self, transport: Transport) -> None:
+        """
+        Uses an already connected transport, such as one end of an in-process
+        `LoopbackTransport`.
+
+        Args:
+            transport: The connection to AEGIS.
+        """
+        self._transport = transport
+
     def disconnect(self) -> None:
         """
-        Disconnects from the AEGIS server and closes the socket and streams.
+        Disconnects from the AEGIS server and closes the connection.
 
         The `disconnect` method ensures that the connection is properly closed, and all
         resources are released. It does nothing if the socket is already closed or not connected.
         """
         try:
-            if self._socket and self._in_stream and self._out_stream:
-                self._in_stream.close()
-                self._out_stream.close()
-                self._socket.close()
-                self._socket = None
+            if self._transport is not None:
+                self._transport.close()
+                self._transport = None
         except Exception:
             pass
 
@@ -66,32 +86,11 @@ class AegisSocket:
             AegisSocketException: If an error occurs while reading the message, such as an incomplete
                                  message or missing null byte.
         """
-        if self._socket and self._in_stream and self._out_stream:
-            self._socket.settimeout(timeout)
+        if self._transport is not None:
             try:
-                size_data = self._in_stream.read(4)
-                if len(size_data) < 4:
-                    raise AegisSocketException("Couldn't read message length.")
-
-                size = int.from_bytes(size_data, "little")
-                size -= 1
-
-                message_data = self._in_stream.read(size)
-                if len(message_data) < size:
-                    raise AegisSocketException("Message is shorter than expected.")
-
-                null_byte = self._in_stream.read(1)
-                if len(null_byte) < 1:
-                    raise AegisSocketException("Null byte is missing.")
-
-                return message_data.decode("ascii").strip()
-
-            except socket.timeout:
-                return None
+                return self._transport.read_message(timeout)
             except Exception as e:
                 raise AegisSocketException(str(e))
-            finally:
-                self._socket.settimeout(None)
 
     def send_message(self, message: str) -> None:
         """
@@ -104,14 +103,7 @@ class AegisSocket:
             AegisSocketException: If an error occurs while sending the message.
         """
         try:
-            if self._socket and self._out_stream:
-                message_encoded = message.encode("ascii")
-                size = len(message_encoded) + 1
-                size_bytes = size.to_bytes(4, "little")
-
-                _ = self._out_stream.write(size_bytes)
-                _ = self._out_stream.write(message_encoded)
-                _ = self._out_stream.write(b"\x00")
-                _ = self._out_stream.flush()
+            if self._transport is not None:
+                self._transport.send_message(message)
         except Exception:
             raise AegisSocketException("Unable to send message to AEGIS.")
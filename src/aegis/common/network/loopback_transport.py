@@ -0,0 +1,114 @@
+import queue
+from typing import override
+
+from aegis.common.network.transport import Transport, TransportListener
+
+
+class LoopbackTransport(Transport):
+    """
+    One end of an in-process connection.
+
+    Messages are handed to the other end through a queue as they are, with
+    no framing or encoding, so the kernel and its agents can run as threads
+    of one interpreter. Closing an end makes every later read or send on the
+    other end raise `ConnectionError`.
+
+    Examples:
+        >>> agent_end, kernel_end = LoopbackTransport.pair()
+        >>> agent_end.send_message("CONNECT ( group )")
+        >>> kernel_end.read_message()
+        'CONNECT ( group )'
+    """
+
+    blocking_send: bool = False
+
+    def __init__(self) -> None:
+        self._inbox: queue.SimpleQueue[str | None] = queue.SimpleQueue()
+        self._peer: LoopbackTransport = self
+        self._closed: bool = False
+        self._peer_closed: bool = False
+
+    @staticmethod
+    def pair() -> tuple["LoopbackTransport", "LoopbackTransport"]:
+        """Returns two connected ends."""
+        first = LoopbackTransport()
+        second = LoopbackTransport()
+        first._peer = second
+        second._peer = first
+        return first, second
+
+    @override
+    def send_message(self, message: str) -> None:
+        if self._closed or self._peer._closed:
+            raise ConnectionError("Loopback connection is closed.")
+        self._peer._inbox.put(message)
+
+    @override
+    def read_message(self, timeout: float | None = None) -> str | None:
+        if self._closed or self._peer_closed:
+            raise ConnectionError("Loopback connection is closed.")
+        try:
+            message = self._inbox.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        if message is None:
+            # the other end closed, and everything it sent has been read
+            self._peer_closed = True
+            raise ConnectionError("Loopback connection is closed.")
+        return message
+
+    @override
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        # wakes up the other end if it is waiting for a message
+        self._peer._inbox.put(None)
+
+    @override
+    def is_local(self) -> bool:
+        return True
+
+
+class LoopbackListener(TransportListener):
+    """
+    Accepts agents connecting from the same interpreter.
+
+    Agents call `connect` (from any thread, before or after the kernel starts
+    accepting) and the kernel accepts them in the order they connected.
+    """
+
+    def __init__(self) -> None:
+        self._pending: queue.SimpleQueue[LoopbackTransport] = queue.SimpleQueue()
+        self._closed: bool = False
+
+    def connect(self) -> LoopbackTransport:
+        """
+        Connects a new agent.
+
+        Returns:
+            The agent's end of the connection.
+
+        Raises:
+            ConnectionRefusedError: If the listener is closed.
+        """
+        if self._closed:
+            raise ConnectionRefusedError("Loopback listener is closed.")
+        agent_end, kernel_end = LoopbackTransport.pair()
+        self._pending.put(kernel_end)
+        return agent_end
+
+    @override
+    def accept(self, timeout: float | None = None) -> Transport:
+        if self._closed:
+            raise OSError("Loopback listener is closed.")
+        try:
+            return self._pending.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError("No agent connected.")
+
+    @override
+    def close(self) -> None:
+        self._closed = True
+        while not self._pending.empty():
+            self._pending.get_nowait().close()
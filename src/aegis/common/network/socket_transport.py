@@ -0,0 +1,208 @@
+import io
+import ipaddress
+import os
+import socket
+import stat
+import struct
+from typing import cast, override
+
+from aegis.common.network.transport import Transport, TransportListener
+
+# every message is a 4 byte little-endian length (which counts the null
+# terminator), the ASCII message and a null byte
+_LENGTH = struct.Struct("<I")
+
+SocketAddress = tuple[str, int] | str
+
+
+def parse_endpoint(endpoint: str) -> tuple[socket.AddressFamily, SocketAddress]:
+    """
+    Parses an agent endpoint.
+
+    Args:
+        endpoint: `tcp://host:port`, where an empty host means every interface
+            when listening and localhost when connecting, or
+            `unix:///path/to/socket` for a Unix domain socket.
+
+    Returns:
+        The socket family and address.
+
+    Raises:
+        ValueError: If the endpoint is malformed or its kind isn't supported
+            on this platform.
+    """
+    scheme, separator, rest = endpoint.partition("://")
+    if not separator:
+        raise ValueError(f"Endpoint '{endpoint}' has no scheme, e.g. tcp:// or unix://")
+    if scheme == "tcp":
+        host, colon, port = rest.rpartition(":")
+        if not colon or not port.isdigit():
+            raise ValueError(f"Endpoint '{endpoint}' has no port")
+        return socket.AF_INET, (host, int(port))
+    if scheme == "unix":
+        if not hasattr(socket, "AF_UNIX"):
+            raise ValueError("Unix domain sockets are not supported on this platform")
+        if not rest:
+            raise ValueError(f"Endpoint '{endpoint}' has no path")
+        return socket.AF_UNIX, rest
+    raise ValueError(f"Endpoint '{endpoint}' has unknown scheme '{scheme}'")
+
+
+class SocketTransport(Transport):
+    """A transport over a connected TCP or Unix domain socket."""
+
+    # the length prefix and the null terminator
+    framing_bytes: int = _LENGTH.size + 1
+
+    def __init__(self, sock: socket.socket) -> None:
+        if sock.family == socket.AF_INET:
+            # a turn is a few small messages written back to back, which
+            # Nagle's algorithm would hold back waiting for delayed ACKs
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._socket: socket.socket | None = sock
+        self._in_stream: io.BufferedReader = sock.makefile("rb")
+        self._out_stream: io.BufferedWriter = sock.makefile("wb")
+
+    @staticmethod
+    def connect(host: str, port: int) -> "SocketTransport":
+        """
+        Connects to AEGIS at the specified host and port.
+
+        Raises:
+            OSError: If the connection fails.
+        """
+        return SocketTransport(socket.create_connection((host, port)))
+
+    @staticmethod
+    def connect_endpoint(endpoint: str) -> "SocketTransport":
+        """
+        Connects to AEGIS at an endpoint, see `parse_endpoint`.
+
+        Raises:
+            ValueError: If the endpoint is invalid.
+            OSError: If the connection fails.
+        """
+        family, address = parse_endpoint(endpoint)
+        if isinstance(address, tuple):
+            host, port = address
+            return SocketTransport.connect(host or "localhost", port)
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        try:
+            sock.connect(address)
+        except OSError:
+            sock.close()
+            raise
+        return SocketTransport(sock)
+
+    @override
+    def send_message(self, message: str) -> None:
+        if self._socket is None:
+            raise ConnectionError("Socket is closed.")
+        message_encoded = message.encode("ascii")
+        _ = self._out_stream.write(_LENGTH.pack(len(message_encoded) + 1))
+        _ = self._out_stream.write(message_encoded)
+        _ = self._out_stream.write(b"\x00")
+        self._out_stream.flush()
+
+    @override
+    def read_message(self, timeout: float | None = None) -> str | None:
+        if self._socket is None:
+            raise ConnectionError("Socket is closed.")
+        self._socket.settimeout(timeout)
+        try:
+            size_data = self._in_stream.read(4)
+            if len(size_data) < 4:
+                raise ConnectionError("Couldn't read message length.")
+
+            # -1 is for the null byte
+            size: int = _LENGTH.unpack(size_data)[0] - 1
+            message_data = self._in_stream.read(size)
+            if len(message_data) < size:
+                raise ConnectionError("Message is shorter than expected.")
+
+            if len(self._in_stream.read(1)) < 1:
+                raise ConnectionError("Null byte is missing.")
+            return message_data.decode("ascii").strip()
+        except socket.timeout:
+            return None
+        finally:
+            if self._socket is not None:
+                self._socket.settimeout(None)
+
+    @override
+    def close(self) -> None:
+        if self._socket is None:
+            return
+        try:
+            self._in_stream.close()
+            self._out_stream.close()
+            self._socket.close()
+        except OSError:
+            pass
+        self._socket = None
+
+    @override
+    def is_local(self) -> bool:
+        if self._socket is None:
+            return False
+        if self._socket.family != socket.AF_INET:
+            return True
+        try:
+            host = cast(tuple[str, int], self._socket.getpeername())[0]
+            return ipaddress.ip_address(host).is_loopback
+        except (OSError, ValueError):
+            return False
+
+
+class SocketListener(TransportListener):
+    """Accepts agents on a TCP port or a Unix domain socket."""
+
+    def __init__(self, endpoint: str) -> None:
+        """
+        Binds and listens on `endpoint`, see `parse_endpoint`.
+
+        A stale Unix domain socket left at the path by an earlier run is
+        replaced, and the socket file is removed again by `close`.
+
+        Raises:
+            ValueError: If the endpoint is invalid.
+            OSError: If the endpoint can't be bound.
+        """
+        family, address = parse_endpoint(endpoint)
+        self._path: str | None = address if isinstance(address, str) else None
+        self._socket = socket.socket(family, socket.SOCK_STREAM)
+        try:
+            if self._path is None:
+                self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            elif os.path.exists(self._path) and stat.S_ISSOCK(
+                os.stat(self._path).st_mode
+            ):
+                os.unlink(self._path)
+            self._socket.bind(address)
+            self._socket.listen(5)
+        except OSError:
+            self._socket.close()
+            raise
+
+    @property
+    def endpoint(self) -> str:
+        """The endpoint agents connect to, with the real port if bound to port 0."""
+        if self._path is not None:
+            return f"unix://{self._path}"
+        host, port = cast(tuple[str, int], self._socket.getsockname())
+        return f"tcp://{'' if host == '0.0.0.0' else host}:{port}"
+
+    @override
+    def accept(self, timeout: float | None = None) -> Transport:
+        self._socket.settimeout(timeout)
+        return SocketTransport(self._socket.accept()[0])
+
+    @override
+    def close(self) -> None:
+        self._socket.close()
+        if self._path is not None:
+            try:
+                os.unlink(self._path)
+            except OSError:
+                pass
+            self._path = None
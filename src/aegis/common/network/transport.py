@@ -0,0 +1,81 @@
+from abc import ABC, abstractmethod
+
+
+class Transport(ABC):
+    """
+    A connection that carries whole protocol messages between AEGIS and an agent.
+
+    `AgentSocket` (kernel side) and `AegisSocket` (agent side) read and write
+    through a transport, so the same protocol can run over a TCP socket or
+    over in-process queues.
+
+    Attributes:
+        blocking_send: Whether `send_message` can block on a full buffer, in
+            which case the kernel sends from a watchdog thread.
+        framing_bytes: The bytes the transport adds to every message on the
+            wire, counted by the kernel's byte metrics.
+    """
+
+    blocking_send: bool = True
+    framing_bytes: int = 0
+
+    @abstractmethod
+    def send_message(self, message: str) -> None:
+        """
+        Sends one message to the other end.
+
+        Args:
+            message: The message to send.
+
+        Raises:
+            ConnectionError: If the connection is closed.
+            OSError: If the message can't be written.
+        """
+
+    @abstractmethod
+    def read_message(self, timeout: float | None = None) -> str | None:
+        """
+        Reads one message from the other end.
+
+        Args:
+            timeout: How long to wait for a message, or None to wait forever.
+
+        Returns:
+            The message, or None if none arrived before the timeout.
+
+        Raises:
+            ConnectionError: If the connection is closed.
+            OSError: If the message can't be read.
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """Closes the connection, it is safe to call more than once."""
+
+    def is_local(self) -> bool:
+        """Whether the other end runs on the same host."""
+        return False
+
+
+class TransportListener(ABC):
+    """Accepts agent connections on the kernel side."""
+
+    @abstractmethod
+    def accept(self, timeout: float | None = None) -> Transport:
+        """
+        Waits for the next agent to connect.
+
+        Args:
+            timeout: How long to wait, or None to wait forever.
+
+        Returns:
+            The connection to the agent.
+
+        Raises:
+            TimeoutError: If no agent connected before the timeout.
+            OSError: If the listener is closed or the connection failed.
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """Stops accepting connections."""
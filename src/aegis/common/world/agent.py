@@ -16,6 +16,15 @@ class Agent:
         command_sent (str): The last command sent by the agent.
     """
 
+    __slots__ = (
+        "agent_id",
+        "location",
+        "_energy_level",
+        "orientation",
+        "command_sent",
+        "steps_taken",
+    )
+
     def __init__(
         self,
         agent_id: AgentID,
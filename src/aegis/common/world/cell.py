@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import override
+from typing import TYPE_CHECKING, cast, override
 
 from aegis.common import (
     AgentIDList,
@@ -8,11 +8,14 @@ from aegis.common import (
     CellType,
     LifeSignals,
     InternalLocation,
-    Utility,
 )
 from aegis.common.world.info import CellInfo
 from aegis.common.world.objects import Survivor, SurvivorGroup, WorldObject
 
+# agents use cells too, and don't load numpy
+if TYPE_CHECKING:
+    import numpy as np
+
 
 class InternalCell:
     """
@@ -38,6 +41,15 @@ class InternalCell:
         location (InternalLocation): The location of the cell on the map.
     """
 
+    __slots__ = (
+        "_type",
+        "move_cost",
+        "agent_id_list",
+        "_cell_layer_list",
+        "has_survivors",
+        "location",
+    )
+
     def __init__(
         self,
         x: int | None = None,
@@ -57,9 +69,9 @@ class InternalCell:
         self.has_survivors: bool = False
 
         if x is not None and y is not None:
-            self.location: InternalLocation = InternalLocation(x, y)
+            self.location: InternalLocation = InternalLocation.of(x, y)
         else:
-            self.location = InternalLocation(-1, -1)
+            self.location = InternalLocation.of(-1, -1)
 
     def setup_cell(self, cell_state_type: str) -> None:
         cell_state_type = cell_state_type.upper().strip()
@@ -185,31 +197,28 @@ class InternalCell:
                 count += layer.number_of_survivors
         return count
 
-    def get_generated_life_signals(self) -> LifeSignals:
-        layer = self.number_of_layers() - 1
-        i = 0
+    def get_generated_life_signals(self, rng: np.random.Generator) -> LifeSignals:
+        """
+        Returns the life signals of the layers, top first, every layer under
+        the top one distorted by a random amount that grows with its depth.
+
+        Args:
+            rng: The generator the distortion is drawn from.
+        """
         if not self._cell_layer_list:
             return LifeSignals()
-        life_signals: list[int] = [0] * self.number_of_layers()
-        life_signals[i] = self._cell_layer_list[layer].get_life_signal()
-        i += 1
-        layer -= 1
-
-        low_range = Constants.DEPTH_LOW_START
-        high_range = Constants.DEPTH_HIGH_START
-        while layer >= 0:
-            lss = self._cell_layer_list[layer].get_life_signal()
-            distortion = Utility.random_in_range(low_range, high_range)
-            if distortion > lss:
-                lss = 0
-            else:
-                lss -= distortion
-            life_signals[i] = lss
-            i += 1
-            layer -= 1
-            low_range += Constants.DEPTH_LOW_INC
-            high_range += Constants.DEPTH_HIGH_INC
-
+        life_signals = [
+            layer.get_life_signal() for layer in reversed(self._cell_layer_list)
+        ]
+        if len(life_signals) > 1:
+            # one call for every layer under the top one, as numpy is slow to
+            # draw integers in per-element ranges
+            uniforms = cast(list[float], rng.random(len(life_signals) - 1).tolist())
+            for depth, uniform in enumerate(uniforms):
+                low = Constants.DEPTH_LOW_START + Constants.DEPTH_LOW_INC * depth
+                high = Constants.DEPTH_HIGH_START + Constants.DEPTH_HIGH_INC * depth
+                distortion = low + int(uniform * (high - low + 1))
+                life_signals[depth + 1] = max(life_signals[depth + 1] - distortion, 0)
         return LifeSignals(life_signals)
 
     @override
@@ -233,3 +242,19 @@ class InternalCell:
         cell.move_cost = self.move_cost
         cell.has_survivors = self.has_survivors
         return cell
+
+    def copy(self) -> InternalCell:
+        """
+        Returns a copy of the cell that, unlike `clone`, shares its layers.
+
+        Layers can be added to or removed from either cell without changing
+        the other, but a change to a layer itself shows in both.
+        """
+        cell = InternalCell()
+        cell._type = self._type
+        cell.location = self.location
+        cell.agent_id_list = self.agent_id_list.clone()
+        cell._cell_layer_list = self._cell_layer_list.copy()
+        cell.move_cost = self.move_cost
+        cell.has_survivors = self.has_survivors
+        return cell
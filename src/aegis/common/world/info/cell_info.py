@@ -16,6 +16,8 @@ class CellInfo:
         top_layer (WorldObject | None): Information about the top layer object.
     """
 
+    __slots__ = ("cell_type", "location", "move_cost", "agent_id_list", "top_layer")
+
     def __init__(
         self,
         cell_type: CellType = CellType.NO_CELL,
@@ -36,7 +38,7 @@ class CellInfo:
         """
         self.cell_type: CellType = cell_type
         self.location: InternalLocation = (
-            location if location is not None else InternalLocation(-1, -1)
+            location if location is not None else InternalLocation.of(-1, -1)
         )
         self.move_cost: int = move_cost
         self.agent_id_list: AgentIDList = (
@@ -12,6 +12,8 @@ class SurroundInfo:
         life_signals (LifeSignals): The life signals in each surrounding cell.
     """
 
+    __slots__ = ("life_signals", "_surround_info")
+
     def __init__(self) -> None:
         """Initializes a new instance of SurroundInfo."""
         self.life_signals = LifeSignals()
@@ -16,6 +16,8 @@ class Rubble(WorldObject):
         remove_agents (int): The amount of agents to remove the rubble.
     """
 
+    __slots__ = ("remove_energy", "remove_agents")
+
     def __init__(
         self, id: int = -1, remove_energy: int = 1, remove_agents: int = 1
     ) -> None:
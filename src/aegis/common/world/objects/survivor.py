@@ -17,6 +17,8 @@ class Survivor(WorldObject):
         mental_state (int): The mental state of the survivor.
     """
 
+    __slots__ = ("damage_factor", "body_mass", "mental_state", "_energy_level")
+
     def __init__(
         self,
         id: int = -1,
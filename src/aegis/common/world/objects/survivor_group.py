@@ -13,6 +13,8 @@ class SurvivorGroup(WorldObject):
         number_of_survivors (int): The number of survivors in the group.
     """
 
+    __slots__ = ("number_of_survivors", "_energy_level")
+
     def __init__(
         self, id: int = -1, energy_level: int = 1, number_of_survivors: int = 1
     ) -> None:
@@ -19,6 +19,8 @@ class WorldObject(ABC):
         RuntimeError: If there is an issue while cloning the world object.
     """
 
+    __slots__ = ("_state", "id")
+
     class State(Enum):
         """Enum for the state of a world object."""
 
@@ -1,3 +1,5 @@
+import gc
+
 from aegis.common import Constants, InternalLocation
 from aegis.common.world.cell import InternalCell
 
@@ -19,6 +21,7 @@ class InternalWorld:
         world: list[list[InternalCell]] | None = None,
         width: int = 0,
         height: int = 0,
+        max_size: int | None = None,
     ) -> None:
         """
         Initializes a World instance.
@@ -30,6 +33,8 @@ class InternalWorld:
             world: An optional 2D grid to initialize the world.
             width: The width of the world if initializing with dimensions.
             height: The height of the world if initializing with dimensions.
+            max_size: The largest allowed width and height, defaults to
+                `Constants.WORLD_MAX`.
 
         Raises:
             ValueError: If both initializing methods are None or both were passed.
@@ -41,14 +46,23 @@ class InternalWorld:
         elif width > 0 and height > 0 and world is None:
             self.height = height
             self.width = width
-            self._world = [
-                [InternalCell(x, y) for y in range(height)] for x in range(width)
-            ]
+            # the cells hold no reference cycles, so don't let the collector
+            # repeatedly scan the grid while a large world is being built
+            gc_was_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                self._world = [
+                    [InternalCell(x, y) for y in range(height)] for x in range(width)
+                ]
+            finally:
+                if gc_was_enabled:
+                    gc.enable()
         else:
             raise ValueError(
                 "Either 'world' OR 'width and height' must be passed into the class"
             )
 
+        self._max_size: int = max_size if max_size is not None else Constants.WORLD_MAX
         self._isValidMap()
 
     def _isValidMap(self) -> None:
@@ -61,14 +75,14 @@ class InternalWorld:
         if self.width < Constants.WORLD_MIN:
             raise ValueError(f"World width must be larger than {Constants.WORLD_MIN}")
 
-        if self.width > Constants.WORLD_MAX:
-            raise ValueError(f"World width must be beneath {Constants.WORLD_MAX}")
+        if self.width > self._max_size:
+            raise ValueError(f"World width must be beneath {self._max_size}")
 
         if self.height < Constants.WORLD_MIN:
             raise ValueError(f"World height must be larger than {Constants.WORLD_MIN}")
 
-        if self.height > Constants.WORLD_MAX:
-            raise ValueError(f"World height must be beneath {Constants.WORLD_MAX}")
+        if self.height > self._max_size:
+            raise ValueError(f"World height must be beneath {self._max_size}")
 
     def get_world_grid(self) -> list[list[InternalCell]]:
         """Returns the 2D grid representing the world."""
@@ -0,0 +1,174 @@
+import mmap
+import struct
+import sys
+from array import array
+from typing import cast
+
+from aegis.common.world.cell import InternalCell
+
+
+class WorldInfoFile:
+    """
+    The binary world information AEGIS gives to agents when they connect.
+
+    The kernel encodes it once per world. Agents on the same host memory map
+    the file it was written to, remote agents get the same bytes inline in
+    `CONNECT_OK`.
+
+    Layout (little-endian):
+        header: magic, version, flags, width, height
+        cell flags: one byte per cell (fire, killer, charging, has survivors)
+        move costs: one int32 per cell, only present when move costs are enabled
+
+    Cells are stored column by column, so the cell at `(x, y)` is at index
+    `x * height + y`.
+    """
+
+    MAGIC = b"AEWI"
+    VERSION = 1
+    HAS_MOVE_COSTS = 0x1
+
+    FIRE = 0x1
+    KILLER = 0x2
+    CHARGING = 0x4
+    HAS_SURVIVORS = 0x8
+
+    _HEADER = struct.Struct("<4sHHII")
+
+    @staticmethod
+    def is_world_info(data: bytes | mmap.mmap) -> bool:
+        return data[: len(WorldInfoFile.MAGIC)] == WorldInfoFile.MAGIC
+
+    @staticmethod
+    def encode(world: list[list[InternalCell]], include_move_costs: bool) -> bytes:
+        """
+        Encodes the agent's view of the world.
+
+        Args:
+            world: The world grid, indexed `[x][y]`.
+            include_move_costs: If the move cost of each cell is sent to agents.
+
+        Returns:
+            The encoded world information.
+        """
+        width = len(world)
+        height = len(world[0]) if width else 0
+        cell_flags = bytearray(width * height)
+        move_costs = array("i", bytes(4 * width * height))
+
+        index = 0
+        for column in world:
+            for cell in column:
+                value = 0
+                if cell.is_fire_cell():
+                    value |= WorldInfoFile.FIRE
+                if cell.is_killer_cell():
+                    value |= WorldInfoFile.KILLER
+                if cell.is_charging_cell():
+                    value |= WorldInfoFile.CHARGING
+                if cell.number_of_survivors() > 0:
+                    value |= WorldInfoFile.HAS_SURVIVORS
+                cell_flags[index] = value
+                move_costs[index] = cell.move_cost
+                index += 1
+
+        header = WorldInfoFile._HEADER.pack(
+            WorldInfoFile.MAGIC,
+            WorldInfoFile.VERSION,
+            WorldInfoFile.HAS_MOVE_COSTS if include_move_costs else 0,
+            width,
+            height,
+        )
+        if not include_move_costs:
+            return header + cell_flags
+
+        if sys.byteorder == "big":
+            move_costs.byteswap()
+        # keep the int32 array 4 byte aligned within the buffer
+        padding = -(len(header) + len(cell_flags)) % 4
+        return header + cell_flags + bytes(padding) + move_costs.tobytes()
+
+    @staticmethod
+    def decode(data: bytes | mmap.mmap) -> list[list[InternalCell]]:
+        """
+        Builds the agent's world grid from encoded world information.
+
+        Args:
+            data: The encoded world information.
+
+        Returns:
+            The world grid, indexed `[x][y]`.
+
+        Raises:
+            ValueError: If the data is not valid world information.
+        """
+        if len(data) < WorldInfoFile._HEADER.size:
+            raise ValueError("World information is too short")
+        magic, version, flags, width, height = cast(
+            tuple[bytes, int, int, int, int], WorldInfoFile._HEADER.unpack_from(data)
+        )
+        if magic != WorldInfoFile.MAGIC:
+            raise ValueError("Not world information")
+        if version != WorldInfoFile.VERSION:
+            raise ValueError(
+                f"World information version {version}, expected {WorldInfoFile.VERSION}"
+            )
+
+        cell_count = width * height
+        offset = WorldInfoFile._HEADER.size
+        cell_flags = bytes(data[offset : offset + cell_count])
+        if len(cell_flags) < cell_count:
+            raise ValueError("World information is truncated")
+        offset += cell_count
+
+        move_costs: array[int] | None = None
+        if flags & WorldInfoFile.HAS_MOVE_COSTS:
+            offset += -offset % 4
+            move_costs = array("i")
+            move_costs.frombytes(data[offset : offset + 4 * cell_count])
+            if len(move_costs) < cell_count:
+                raise ValueError("World information is truncated")
+            if sys.byteorder == "big":
+                move_costs.byteswap()
+
+        world: list[list[InternalCell]] = []
+        index = 0
+        for x in range(width):
+            column: list[InternalCell] = []
+            for y in range(height):
+                value = cell_flags[index]
+                cell = InternalCell(x, y)
+                cell.set_normal_cell()
+                if value & WorldInfoFile.FIRE:
+                    cell.set_fire_cell()
+                if value & WorldInfoFile.KILLER:
+                    cell.set_killer_cell()
+                if value & WorldInfoFile.CHARGING:
+                    cell.set_charging_cell()
+                cell.has_survivors = bool(value & WorldInfoFile.HAS_SURVIVORS)
+                if move_costs is not None:
+                    cell.move_cost = move_costs[index]
+                column.append(cell)
+                index += 1
+            world.append(column)
+        return world
+
+    @staticmethod
+    def write(filename: str, data: bytes) -> None:
+        with open(filename, "wb") as file:
+            _ = file.write(data)
+
+    @staticmethod
+    def read(filename: str) -> list[list[InternalCell]]:
+        """
+        Memory maps a world information file and builds the world grid from it.
+
+        Args:
+            filename: The path of the world information file.
+
+        Returns:
+            The world grid, indexed `[x][y]`.
+        """
+        with open(filename, "rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return WorldInfoFile.decode(data)
@@ -22,6 +22,7 @@ def main() -> None:
                 file=sys.stderr,
             )
             sys.exit(1)
+        _ = aegis.install_profiler_signal_handlers()
 
         if not aegis.build_world():
             print(
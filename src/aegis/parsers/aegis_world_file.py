@@ -1,9 +1,13 @@
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from aegis.parsers.helper.cell_info_settings import CellInfoSettings
 from aegis.parsers.helper.cell_type_info import CellTypeInfo
 from aegis.world.spawn_manager import SpawnZone
 
+if TYPE_CHECKING:
+    from aegis.parsers.binary_world_file import CompiledWorld
+
 
 @dataclass
 class AegisWorldFile:
@@ -17,3 +21,6 @@ class AegisWorldFile:
     cell_stack_info: list[CellInfoSettings]
     cell_settings: list[CellTypeInfo]
     agent_spawn_locations: list[SpawnZone]
+    # set when the world was loaded from a compiled world file, the cells
+    # are then built from its arrays instead of cell_stack_info / cell_settings
+    compiled: "CompiledWorld | None" = None
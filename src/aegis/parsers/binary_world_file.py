@@ -0,0 +1,426 @@
+import json
+import mmap
+import struct
+from dataclasses import dataclass
+from typing import cast
+
+import numpy as np
+from numpy.typing import NDArray
+
+from aegis.common import InternalLocation
+from aegis.parsers.aegis_world_file import AegisWorldFile
+from aegis.parsers.helper.world_file_type import (
+    Arguments,
+    CellLoc,
+    CellTypes,
+    SpawnInfo,
+    StackContent,
+    StackInfo,
+    WorldFileType,
+)
+from aegis.world.spawn_manager import SpawnZone, SpawnZoneType
+
+
+@dataclass
+class CompiledWorld:
+    """
+    The typed arrays of a compiled world.
+
+    Cells are stored in the same order as `InternalWorld`'s grid, so the
+    cell at `(x, y)` is at index `x * height + y`.
+
+    Attributes:
+        width (int): The width of the world.
+        height (int): The height of the world.
+        agent_energy (int): The starting energy of the agents.
+        seed (int): The random seed of the world.
+        high_survivor_level (int): The high survivor level.
+        mid_survivor_level (int): The mid survivor level.
+        low_survivor_level (int): The low survivor level.
+        cell_types (NDArray[np.uint8]): One `BinaryWorldFile.CELL_TYPES` code per cell.
+        move_costs (NDArray[np.int32]): The move cost of every cell.
+        layer_offsets (NDArray[np.uint32]): Cell `i` owns the layers
+            `layers[layer_offsets[i]:layer_offsets[i + 1]]`, top layer first.
+        layers (NDArray[np.int32]): One `(kind, arg0, arg1, arg2, arg3)` row per layer.
+        spawns (NDArray[np.int32]): One `(x, y, zone_type, gid)` row per spawn zone,
+            with a gid of -1 meaning no group.
+    """
+
+    width: int
+    height: int
+    agent_energy: int
+    seed: int
+    high_survivor_level: int
+    mid_survivor_level: int
+    low_survivor_level: int
+    cell_types: NDArray[np.uint8]
+    move_costs: NDArray[np.int32]
+    layer_offsets: NDArray[np.uint32]
+    layers: NDArray[np.int32]
+    spawns: NDArray[np.int32]
+
+    def to_aegis_world_file(self) -> AegisWorldFile:
+        spawns = [
+            SpawnZone(
+                InternalLocation(x, y),
+                BinaryWorldFile.SPAWN_TYPES[zone_type],
+                None if gid < 0 else gid,
+            )
+            for x, y, zone_type, gid in cast(list[list[int]], self.spawns.tolist())
+        ]
+        return AegisWorldFile(
+            self.width,
+            self.height,
+            self.agent_energy,
+            self.seed,
+            self.high_survivor_level,
+            self.mid_survivor_level,
+            self.low_survivor_level,
+            [],
+            [],
+            spawns,
+            self,
+        )
+
+    def to_json_world(self) -> WorldFileType:
+        """
+        Rebuilds the JSON form of the world, for the viewer and the replay file.
+
+        Returns:
+            The world in the same structure as a `.world` file.
+        """
+        spawn_locs: list[SpawnInfo] = []
+        for x, y, zone_type, gid in cast(list[list[int]], self.spawns.tolist()):
+            spawn = cast(SpawnInfo, {"x": x, "y": y})
+            if gid >= 0:
+                spawn["gid"] = gid
+            spawn["type"] = cast(
+                SpawnZoneType, BinaryWorldFile.SPAWN_TYPES[zone_type].value
+            )
+            spawn_locs.append(spawn)
+
+        cell_types: dict[str, list[CellLoc]] = {
+            "fire_cells": [],
+            "killer_cells": [],
+            "charging_cells": [],
+        }
+        for index in cast(list[int], np.flatnonzero(self.cell_types).tolist()):
+            name = BinaryWorldFile.CELL_TYPES[int(self.cell_types[index])].lower()
+            x, y = divmod(index, self.height)
+            cell_types.setdefault(name, []).append({"x": x, "y": y})
+
+        move_costs = cast(list[int], self.move_costs.tolist())
+        offsets = cast(list[int], self.layer_offsets.tolist())
+        layers = cast(list[list[int]], self.layers.tolist())
+        stacks: list[StackInfo] = []
+        for index in range(self.width * self.height):
+            x, y = divmod(index, self.height)
+            stacks.append(
+                {
+                    "cell_loc": {"x": x, "y": y},
+                    "move_cost": move_costs[index],
+                    "contents": [
+                        BinaryWorldFile.layer_to_content(layer)
+                        for layer in layers[offsets[index] : offsets[index + 1]]
+                    ],
+                }
+            )
+
+        return {
+            "settings": {
+                "world_info": {
+                    "size": {"width": self.width, "height": self.height},
+                    "seed": self.seed,
+                    "world_file_levels": {
+                        "high": self.high_survivor_level,
+                        "mid": self.mid_survivor_level,
+                        "low": self.low_survivor_level,
+                    },
+                    "agent_energy": self.agent_energy,
+                }
+            },
+            "spawn_locs": spawn_locs,
+            "cell_types": cast(CellTypes, cell_types),
+            "stacks": stacks,
+        }
+
+
+class BinaryWorldFile:
+    """
+    Reads and writes the compiled binary world format.
+
+    The file is a fixed little-endian header followed by the arrays of a
+    `CompiledWorld`, each starting on an 8 byte boundary so they can be
+    used straight out of a memory map.
+    """
+
+    MAGIC = b"AEGW"
+    VERSION = 1
+    # magic, version, flags, width, height, agent_energy, seed,
+    # high, mid, low, layer count, spawn count
+    _HEADER = struct.Struct("<4sHHiiiiiiiII")
+    _ALIGNMENT = 8
+
+    # index 0 means the world file never set the cell's type
+    CELL_TYPES = ["", "NORMAL_CELLS", "FIRE_CELLS", "KILLER_CELLS", "CHARGING_CELLS"]
+    SPAWN_TYPES = [SpawnZoneType.ANY, SpawnZoneType.GROUP]
+    # layer kind -> (object handler key, arguments in column order), kind 0 is unused
+    LAYER_KINDS: list[tuple[str, list[Arguments]]] = [
+        ("", []),
+        ("RB", ["remove_energy", "remove_agents"]),
+        ("SVG", ["energy_level", "number_of_survivors"]),
+        ("SV", ["energy_level", "body_mass", "mental_state", "damage_factor"]),
+    ]
+    _LAYER_KIND_BY_TYPE = {
+        "RB": 1,
+        "RUBBLE": 1,
+        "SVG": 2,
+        "SURVIVORGROUP": 2,
+        "SV": 3,
+        "SURVIVOR": 3,
+    }
+
+    @staticmethod
+    def is_binary_world_file(filename: str) -> bool:
+        try:
+            with open(filename, "rb") as file:
+                return file.read(len(BinaryWorldFile.MAGIC)) == BinaryWorldFile.MAGIC
+        except OSError:
+            return False
+
+    @staticmethod
+    def layer_to_content(layer: list[int]) -> StackContent:
+        key, arguments = BinaryWorldFile.LAYER_KINDS[layer[0]]
+        return {
+            "type": key.lower(),
+            "arguments": {
+                name: value for name, value in zip(arguments, layer[1:])
+            },
+        }
+
+    @staticmethod
+    def compile_world_data(data: WorldFileType) -> CompiledWorld:
+        """
+        Compiles the JSON structure of a `.world` file into typed arrays.
+
+        Cells follow the same rules as `AegisWorld.build_world`: later
+        entries overwrite the type and move cost of earlier ones, off map
+        entries are dropped and layers of unknown types are skipped.
+
+        Args:
+            data: The decoded JSON of a `.world` file.
+
+        Returns:
+            The compiled world.
+
+        Raises:
+            KeyError: If a required setting is missing from the world file.
+        """
+        world_info = data["settings"]["world_info"]
+        width = world_info["size"]["width"]
+        height = world_info["size"]["height"]
+        cell_count = width * height
+
+        cell_types = np.zeros(cell_count, dtype=np.uint8)
+        for name, cell_locs in data["cell_types"].items():
+            name = name.upper().strip()
+            if name not in BinaryWorldFile.CELL_TYPES:
+                continue
+            code = BinaryWorldFile.CELL_TYPES.index(name)
+            for loc in cast(list[CellLoc], cell_locs):
+                if 0 <= loc["x"] < width and 0 <= loc["y"] < height:
+                    cell_types[loc["x"] * height + loc["y"]] = code
+
+        move_costs = np.ones(cell_count, dtype=np.int32)
+        cell_layers: list[list[list[int]]] = [[] for _ in range(cell_count)]
+        for stack in data["stacks"]:
+            x = stack["cell_loc"]["x"]
+            y = stack["cell_loc"]["y"]
+            if not (0 <= x < width and 0 <= y < height):
+                continue
+            index = x * height + y
+            move_costs[index] = stack["move_cost"]
+            for content in stack["contents"]:
+                kind = BinaryWorldFile._LAYER_KIND_BY_TYPE.get(content["type"].upper())
+                if kind is None:
+                    continue
+                arguments = content["arguments"]
+                names = BinaryWorldFile.LAYER_KINDS[kind][1]
+                if any(name not in arguments for name in names):
+                    print(
+                        f"WARNING: BinaryWorldFile: skipping {content['type']} at ({x},{y}), missing arguments"
+                    )
+                    continue
+                layer = [kind] + [arguments[name] for name in names]
+                cell_layers[index].append(layer + [0] * (5 - len(layer)))
+
+        layer_offsets = np.zeros(cell_count + 1, dtype=np.uint32)
+        layer_offsets[1:] = np.cumsum([len(layers) for layers in cell_layers])
+        layers = np.array(
+            [layer for layers in cell_layers for layer in layers], dtype=np.int32
+        ).reshape(-1, 5)
+
+        spawns = np.array(
+            [
+                [
+                    spawn["x"],
+                    spawn["y"],
+                    BinaryWorldFile.SPAWN_TYPES.index(SpawnZoneType(spawn["type"])),
+                    -1 if spawn.get("gid") is None else cast(int, spawn.get("gid")),
+                ]
+                for spawn in data["spawn_locs"]
+            ],
+            dtype=np.int32,
+        ).reshape(-1, 4)
+
+        return CompiledWorld(
+            width,
+            height,
+            world_info["agent_energy"],
+            world_info["seed"],
+            world_info["world_file_levels"]["high"],
+            world_info["world_file_levels"]["mid"],
+            world_info["world_file_levels"]["low"],
+            cell_types,
+            move_costs,
+            layer_offsets,
+            layers,
+            spawns,
+        )
+
+    @staticmethod
+    def write(compiled: CompiledWorld, filename: str) -> None:
+        header = BinaryWorldFile._HEADER.pack(
+            BinaryWorldFile.MAGIC,
+            BinaryWorldFile.VERSION,
+            0,
+            compiled.width,
+            compiled.height,
+            compiled.agent_energy,
+            compiled.seed,
+            compiled.high_survivor_level,
+            compiled.mid_survivor_level,
+            compiled.low_survivor_level,
+            len(compiled.layers),
+            len(compiled.spawns),
+        )
+        with open(filename, "wb") as file:
+            _ = file.write(header)
+            offset = len(header)
+            for array, dtype in BinaryWorldFile._sections(compiled):
+                padding = -offset % BinaryWorldFile._ALIGNMENT
+                _ = file.write(b"\0" * padding)
+                data = np.ascontiguousarray(array, dtype=dtype).tobytes()
+                _ = file.write(data)
+                offset += padding + len(data)
+
+    @staticmethod
+    def read(filename: str) -> CompiledWorld:
+        """
+        Memory maps a compiled world file.
+
+        The arrays of the returned world are read-only views into the map,
+        so nothing beyond the header is copied until it is used.
+
+        Args:
+            filename: The path of the compiled world file.
+
+        Returns:
+            The compiled world.
+
+        Raises:
+            ValueError: If the file is not a compiled world file or is truncated.
+        """
+        with open(filename, "rb") as file:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        header_size = BinaryWorldFile._HEADER.size
+        if len(buffer) < header_size:
+            raise ValueError(f"'{filename}' is too small to be a compiled world")
+        (
+            magic,
+            version,
+            _flags,
+            width,
+            height,
+            agent_energy,
+            seed,
+            high,
+            mid,
+            low,
+            layer_count,
+            spawn_count,
+        ) = cast(
+            tuple[bytes, int, int, int, int, int, int, int, int, int, int, int],
+            BinaryWorldFile._HEADER.unpack_from(buffer),
+        )
+        if magic != BinaryWorldFile.MAGIC:
+            raise ValueError(f"'{filename}' is not a compiled world")
+        if version != BinaryWorldFile.VERSION:
+            raise ValueError(
+                f"'{filename}' is compiled world version {version}, expected {BinaryWorldFile.VERSION}"
+            )
+
+        cell_count = width * height
+        shapes = [
+            (cell_count,),
+            (cell_count,),
+            (cell_count + 1,),
+            (layer_count, 5),
+            (spawn_count, 4),
+        ]
+        arrays: list[NDArray[np.generic]] = []
+        offset = header_size
+        for shape, dtype in zip(shapes, BinaryWorldFile._section_dtypes()):
+            offset += -offset % BinaryWorldFile._ALIGNMENT
+            count = int(np.prod(shape))
+            size = count * np.dtype(dtype).itemsize
+            if offset + size > len(buffer):
+                raise ValueError(f"'{filename}' is truncated")
+            arrays.append(
+                np.frombuffer(buffer, dtype=dtype, count=count, offset=offset).reshape(
+                    shape
+                )
+            )
+            offset += size
+
+        return CompiledWorld(
+            width,
+            height,
+            agent_energy,
+            seed,
+            high,
+            mid,
+            low,
+            cast(NDArray[np.uint8], arrays[0]),
+            cast(NDArray[np.int32], arrays[1]),
+            cast(NDArray[np.uint32], arrays[2]),
+            cast(NDArray[np.int32], arrays[3]),
+            cast(NDArray[np.int32], arrays[4]),
+        )
+
+    @staticmethod
+    def compile_world_file(filename: str, output_filename: str) -> CompiledWorld:
+        with open(filename, "r") as file:
+            data: WorldFileType = json.load(file)
+        compiled = BinaryWorldFile.compile_world_data(data)
+        BinaryWorldFile.write(compiled, output_filename)
+        return compiled
+
+    @staticmethod
+    def _section_dtypes() -> list[str]:
+        # explicit little-endian so the files are portable between machines
+        return ["<u1", "<i4", "<u4", "<i4", "<i4"]
+
+    @staticmethod
+    def _sections(
+        compiled: CompiledWorld,
+    ) -> list[tuple[NDArray[np.generic], str]]:
+        arrays: list[NDArray[np.generic]] = [
+            compiled.cell_types,
+            compiled.move_costs,
+            compiled.layer_offsets,
+            compiled.layers,
+            compiled.spawns,
+        ]
+        return list(zip(arrays, BinaryWorldFile._section_dtypes()))
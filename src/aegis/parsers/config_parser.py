@@ -3,6 +3,7 @@ import sys
 from typing import Any
 
 from aegis.assist.config_settings import ConfigSettings
+from aegis.common import Constants
 from a3.aegis_parser import AegisParser
 
 
@@ -58,10 +59,24 @@ class ConfigParser(AegisParser):
                         "C_ALL": ConfigSettings.POINTS_TIE_ALL_SAVING_GROUPS,
                     }.get(tie_strategy, ConfigSettings.POINTS_TIE_ALL_SAVING_GROUPS)
 
+            if "Enable_Move_Cost" in data:
+                move_cost_enabled: bool = data["Enable_Move_Cost"]
+                config_settings.move_cost_enabled = move_cost_enabled
+
             if "Predictions" in data:
                 predictions_on: bool = data["Predictions"]
                 config_settings.predictions_enabled = predictions_on
 
+            if "World_Max" in data:
+                world_max: int = data["World_Max"]
+                if world_max < Constants.WORLD_MIN:
+                    print(
+                        f"Aegis  : World_Max must be at least {Constants.WORLD_MIN}",
+                        file=sys.stderr,
+                    )
+                    return None
+                config_settings.world_max = world_max
+
         except (FileNotFoundError, IOError, json.JSONDecodeError) as e:
             print(f"Aegis  : Unable to parse config file: {e}", file=sys.stderr)
             return None
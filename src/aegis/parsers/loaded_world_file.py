@@ -0,0 +1,41 @@
+import json
+from dataclasses import dataclass, field
+
+from aegis.parsers.aegis_world_file import AegisWorldFile
+from aegis.parsers.helper.world_file_type import WorldFileType
+
+
+@dataclass
+class LoadedWorldFile:
+    """
+    A world file that has been read from disk and parsed exactly once.
+
+    Every startup consumer (world builder, viewer, replay writer) takes
+    what it needs from here instead of going back to the file. For a
+    compiled world the JSON form is only rebuilt when something asks for it.
+
+    Attributes:
+        filename (str): The path the world was loaded from.
+        world_file (AegisWorldFile): The parsed world settings used to build the world.
+    """
+
+    filename: str
+    world_file: AegisWorldFile
+    _content: str | None = field(default=None, repr=False)
+    _json_world: WorldFileType | None = field(default=None, repr=False)
+
+    @property
+    def json_world(self) -> WorldFileType:
+        """The decoded JSON structure of the world file."""
+        if self._json_world is None:
+            if self.world_file.compiled is None:
+                raise ValueError("World file was loaded without its JSON form")
+            self._json_world = self.world_file.compiled.to_json_world()
+        return self._json_world
+
+    @property
+    def content(self) -> str:
+        """The JSON text of the world file."""
+        if self._content is None:
+            self._content = json.dumps(self.json_world, indent=2)
+        return self._content
@@ -3,6 +3,7 @@ from typing import cast
 
 from aegis.common import AgentID, InternalLocation
 from aegis.parsers.aegis_world_file import AegisWorldFile
+from aegis.parsers.binary_world_file import BinaryWorldFile
 from aegis.parsers.helper.cell_info_settings import CellInfoSettings
 from aegis.parsers.helper.cell_type_info import CellTypeInfo
 from aegis.parsers.helper.world_file_type import (
@@ -13,47 +14,80 @@ from aegis.parsers.helper.world_file_type import (
     StackInfo,
     WorldFileType,
 )
+from aegis.parsers.loaded_world_file import LoadedWorldFile
 from aegis.world.spawn_manager import SpawnZone, SpawnZoneType
 
 
 class WorldFileParser:
     @staticmethod
     def parse_world_file(filename: str) -> AegisWorldFile | None:
+        loaded_world_file = WorldFileParser.load_world_file(filename)
+        if loaded_world_file is None:
+            return None
+        return loaded_world_file.world_file
+
+    @staticmethod
+    def load_world_file(filename: str) -> LoadedWorldFile | None:
+        if BinaryWorldFile.is_binary_world_file(filename):
+            return WorldFileParser._load_binary_world_file(filename)
+
         try:
             with open(filename, "r") as file:
-                data: WorldFileType = json.load(file)
-                width = data["settings"]["world_info"]["size"]["width"]
-                height = data["settings"]["world_info"]["size"]["height"]
-                agent_energy = data["settings"]["world_info"]["agent_energy"]
-                seed = data["settings"]["world_info"]["seed"]
-                high_survivor_level = data["settings"]["world_info"][
-                    "world_file_levels"
-                ]["high"]
-
-                mid_survivor_level = data["settings"]["world_info"][
-                    "world_file_levels"
-                ]["mid"]
-                low_survivor_level = data["settings"]["world_info"][
-                    "world_file_levels"
-                ]["low"]
-
-                cell_settings = WorldFileParser._parse_cell_settings(data["cell_types"])
-                cell_stack_info = WorldFileParser._parse_cell_stack_info(data["stacks"])
-                agent_spawn_locations = WorldFileParser._parse_spawn_locations(
-                    data["spawn_locs"]
-                )
-                return AegisWorldFile(
-                    width,
-                    height,
-                    agent_energy,
-                    seed,
-                    high_survivor_level,
-                    mid_survivor_level,
-                    low_survivor_level,
-                    cell_stack_info,
-                    cell_settings,
-                    agent_spawn_locations,
-                )
+                content = file.read()
+            data: WorldFileType = json.loads(content)
+        except Exception as e:
+            print(f"Error: {e}")
+            return None
+
+        world_file = WorldFileParser.parse_world_data(data)
+        if world_file is None:
+            return None
+        return LoadedWorldFile(filename, world_file, content, data)
+
+    @staticmethod
+    def _load_binary_world_file(filename: str) -> LoadedWorldFile | None:
+        try:
+            compiled = BinaryWorldFile.read(filename)
+            return LoadedWorldFile(filename, compiled.to_aegis_world_file())
+        except Exception as e:
+            print(f"Error: {e}")
+            return None
+
+    @staticmethod
+    def parse_world_data(data: WorldFileType) -> AegisWorldFile | None:
+        try:
+            width = data["settings"]["world_info"]["size"]["width"]
+            height = data["settings"]["world_info"]["size"]["height"]
+            agent_energy = data["settings"]["world_info"]["agent_energy"]
+            seed = data["settings"]["world_info"]["seed"]
+            high_survivor_level = data["settings"]["world_info"]["world_file_levels"][
+                "high"
+            ]
+
+            mid_survivor_level = data["settings"]["world_info"]["world_file_levels"][
+                "mid"
+            ]
+            low_survivor_level = data["settings"]["world_info"]["world_file_levels"][
+                "low"
+            ]
+
+            cell_settings = WorldFileParser._parse_cell_settings(data["cell_types"])
+            cell_stack_info = WorldFileParser._parse_cell_stack_info(data["stacks"])
+            agent_spawn_locations = WorldFileParser._parse_spawn_locations(
+                data["spawn_locs"]
+            )
+            return AegisWorldFile(
+                width,
+                height,
+                agent_energy,
+                seed,
+                high_survivor_level,
+                mid_survivor_level,
+                low_survivor_level,
+                cell_stack_info,
+                cell_settings,
+                agent_spawn_locations,
+            )
         except Exception as e:
             print(f"Error: {e}")
             return None
@@ -27,6 +27,7 @@ class WebSocketServer:
         self._done = False
         self._server = None
         self._previous_events: list[bytes] = []
+        self._previous_events_bytes = 0
         self._incoming_events: queue.Queue[bytes] = queue.Queue()
         self._queue_thread = threading.Thread(target=self._process_queue)
         self._lock = threading.Lock()
@@ -60,6 +61,7 @@ class WebSocketServer:
                 for client in self._server.clients:  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
                     self._server.send_message(client, event)  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
                 self._previous_events.append(event)
+                self._previous_events_bytes += len(event)
 
     def add_event(self, event: bytes) -> None:
         """
@@ -72,6 +74,14 @@ class WebSocketServer:
             raise RuntimeError("Can't add event, server already finished!")
         self._incoming_events.put(event)
 
+    def queue_depth(self) -> int:
+        """Returns the number of events waiting to be sent to clients."""
+        return self._incoming_events.qsize()
+
+    def buffered_event_bytes(self) -> int:
+        """Returns the size of the events kept to replay to new clients."""
+        return self._previous_events_bytes
+
     def _on_open(self, client: Client, server: WebsocketServer) -> None:
         """
         Handle actions upon client connection.
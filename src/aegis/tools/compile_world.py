@@ -0,0 +1,78 @@
+"""
+Compiles `.world` files into the binary world format.
+
+Usage (with `src` on the PYTHONPATH):
+    python -m aegis.tools.compile_world worlds/ExampleWorld.world [-o ExampleWorld.bworld]
+
+The kernel accepts the compiled file anywhere a `.world` file is accepted,
+e.g. `-WorldFile worlds/ExampleWorld.bworld`.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from aegis.parsers.binary_world_file import BinaryWorldFile
+
+COMPILED_WORLD_EXTENSION = ".bworld"
+
+
+def compile_world(filename: str, output_filename: str | None = None) -> str:
+    """
+    Compiles one world file.
+
+    Args:
+        filename: The `.world` file to compile.
+        output_filename: Where to write the compiled world, defaults to the
+            input path with a `.bworld` extension.
+
+    Returns:
+        The path of the compiled world.
+    """
+    if output_filename is None:
+        output_filename = os.path.splitext(filename)[0] + COMPILED_WORLD_EXTENSION
+    _ = BinaryWorldFile.compile_world_file(filename, output_filename)
+    return output_filename
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compile AEGIS .world files into the binary world format",
+        epilog="Example: python -m aegis.tools.compile_world worlds/ExampleWorld.world",
+    )
+    _ = parser.add_argument("worlds", nargs="+", help="World files to compile")
+    _ = parser.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        default=None,
+        help="Output file (only valid with a single input world)",
+    )
+    args = parser.parse_args()
+    worlds: list[str] = args.worlds  # pyright: ignore[reportAny]
+    output: str | None = args.output  # pyright: ignore[reportAny]
+
+    if output is not None and len(worlds) > 1:
+        parser.error("--output can only be used with a single world file")
+
+    failed = False
+    for world in worlds:
+        start = time.perf_counter()
+        try:
+            compiled = compile_world(world, output)
+        except Exception as e:
+            print(f"Error compiling '{world}': {e}", file=sys.stderr)
+            failed = True
+            continue
+        elapsed = (time.perf_counter() - start) * 1000
+        print(
+            f"{world} -> {compiled} ({os.path.getsize(world)} -> {os.path.getsize(compiled)} bytes, {elapsed:.1f} ms)"
+        )
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
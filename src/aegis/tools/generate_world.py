@@ -0,0 +1,245 @@
+"""
+Generates seeded random worlds of any size.
+
+Usage (with `src` on the PYTHONPATH):
+    python -m aegis.tools.generate_world --size 256 --seed 7 -o generated-256.world
+
+Writing to a `.bworld` file writes the compiled binary world format instead
+of JSON. The same seed and options always produce the same world. Worlds
+larger than the "World_Max" in `sys_files/aegis_config.json` are rejected by
+the kernel, so raise it to run them.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from typing import cast
+
+from aegis.parsers.binary_world_file import BinaryWorldFile
+from aegis.parsers.helper.world_file_type import (
+    CellLoc,
+    SpawnInfo,
+    StackContent,
+    StackInfo,
+    WorldFileType,
+)
+from aegis.tools.compile_world import COMPILED_WORLD_EXTENSION
+
+
+def generate_world(
+    width: int,
+    height: int,
+    seed: int = 0,
+    survivors: float = 0.05,
+    survivor_groups: float = 0.01,
+    rubble: float = 0.15,
+    charging: float = 0.01,
+    fire: float = 0.01,
+    killer: float = 0.005,
+    max_move_cost: int = 5,
+    spawns: int = 1,
+    group_spawns: int = 0,
+    agent_energy: int = 500,
+) -> WorldFileType:
+    """
+    Generates a world.
+
+    Densities are the chance of each cell getting that feature. Fire and
+    killer cells are never placed on spawn cells, and spawn cells start
+    without rubble so agents can always move off them.
+
+    Args:
+        width: The width of the world.
+        height: The height of the world.
+        seed: Seeds both the generator and the world's own random seed.
+        survivors: Density of single survivors.
+        survivor_groups: Density of survivor groups.
+        rubble: Density of rubble, which may cover survivors.
+        charging: Density of charging cells.
+        fire: Density of fire cells.
+        killer: Density of killer cells.
+        max_move_cost: Move costs are drawn uniformly from 1 to this.
+        spawns: Number of spawn zones any group can use.
+        group_spawns: Number of groups to give a spawn zone of their own,
+            with group ids from 1.
+        agent_energy: The starting energy of every agent.
+
+    Returns:
+        The world, in the structure of a `.world` file.
+    """
+    if width <= 0 or height <= 0:
+        raise ValueError("World width and height must be positive")
+    if spawns + group_spawns > width * height:
+        raise ValueError("More spawn zones than cells in the world")
+
+    rng = random.Random(seed)
+    spawn_cells = rng.sample(range(width * height), spawns + group_spawns)
+    spawn_locs: list[SpawnInfo] = []
+    for number, index in enumerate(spawn_cells):
+        x, y = divmod(index, height)
+        if number < spawns:
+            spawn = {"x": x, "y": y, "type": "any"}
+        else:
+            spawn = {"x": x, "y": y, "gid": number - spawns + 1, "type": "group"}
+        spawn_locs.append(cast(SpawnInfo, spawn))
+    safe = set(spawn_cells)
+
+    fire_cells: list[CellLoc] = []
+    killer_cells: list[CellLoc] = []
+    charging_cells: list[CellLoc] = []
+    stacks: list[StackInfo] = []
+    for x in range(width):
+        for y in range(height):
+            index = x * height + y
+            roll = rng.random()
+            if index not in safe:
+                if roll < killer:
+                    killer_cells.append({"x": x, "y": y})
+                elif roll < killer + fire:
+                    fire_cells.append({"x": x, "y": y})
+                elif roll < killer + fire + charging:
+                    charging_cells.append({"x": x, "y": y})
+            elif roll < charging:
+                charging_cells.append({"x": x, "y": y})
+
+            contents: list[StackContent] = []
+            roll = rng.random()
+            if roll < survivors:
+                contents.append(
+                    {
+                        "type": "sv",
+                        "arguments": {
+                            "energy_level": rng.randint(1, 100),
+                            "body_mass": rng.randint(0, 100),
+                            "mental_state": rng.randint(0, 100),
+                            "damage_factor": rng.randint(0, 10),
+                        },
+                    }
+                )
+            elif roll < survivors + survivor_groups:
+                contents.append(
+                    {
+                        "type": "svg",
+                        "arguments": {
+                            "energy_level": rng.randint(1, 100),
+                            "number_of_survivors": rng.randint(2, 5),
+                        },
+                    }
+                )
+            if index not in safe and rng.random() < rubble:
+                contents.append(
+                    {
+                        "type": "rb",
+                        "arguments": {
+                            "remove_energy": rng.randint(1, 10),
+                            "remove_agents": rng.randint(1, 2),
+                        },
+                    }
+                )
+
+            stacks.append(
+                {
+                    "cell_loc": {"x": x, "y": y},
+                    "move_cost": rng.randint(1, max(1, max_move_cost)),
+                    "contents": contents,
+                }
+            )
+
+    return {
+        "settings": {
+            "world_info": {
+                "size": {"width": width, "height": height},
+                "seed": seed,
+                "world_file_levels": {"high": 12, "mid": 7, "low": 1},
+                "agent_energy": agent_energy,
+            }
+        },
+        "spawn_locs": spawn_locs,
+        "cell_types": {
+            "fire_cells": fire_cells,
+            "killer_cells": killer_cells,
+            "charging_cells": charging_cells,
+        },
+        "stacks": stacks,
+    }  # pyright: ignore[reportReturnType]
+
+
+def write_world(world: WorldFileType, filename: str) -> None:
+    """
+    Writes a generated world, compiled if `filename` ends in `.bworld`.
+
+    Args:
+        world: The world to write.
+        filename: Where to write it.
+    """
+    if filename.endswith(COMPILED_WORLD_EXTENSION):
+        BinaryWorldFile.write(BinaryWorldFile.compile_world_data(world), filename)
+    else:
+        with open(filename, "w") as file:
+            json.dump(world, file)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Generate a seeded random AEGIS world",
+        epilog="Example: python -m aegis.tools.generate_world --size 256 -o big.world",
+    )
+    _ = parser.add_argument("--size", type=int, default=30, help="Width and height")
+    _ = parser.add_argument("--width", type=int, default=None)
+    _ = parser.add_argument("--height", type=int, default=None)
+    _ = parser.add_argument("--seed", type=int, default=0)
+    _ = parser.add_argument("--survivors", type=float, default=0.05)
+    _ = parser.add_argument("--survivor-groups", type=float, default=0.01)
+    _ = parser.add_argument("--rubble", type=float, default=0.15)
+    _ = parser.add_argument("--charging", type=float, default=0.01)
+    _ = parser.add_argument("--fire", type=float, default=0.01)
+    _ = parser.add_argument("--killer", type=float, default=0.005)
+    _ = parser.add_argument("--max-move-cost", type=int, default=5)
+    _ = parser.add_argument(
+        "--spawns", type=int, default=1, help="Spawn zones open to any group"
+    )
+    _ = parser.add_argument(
+        "--group-spawns", type=int, default=0, help="Groups with their own spawn zone"
+    )
+    _ = parser.add_argument("--agent-energy", type=int, default=500)
+    _ = parser.add_argument(
+        "-o", "--output", type=str, required=True, help="A .world or .bworld file"
+    )
+    args = parser.parse_args()
+
+    width: int = args.width or args.size  # pyright: ignore[reportAny]
+    height: int = args.height or args.size  # pyright: ignore[reportAny]
+    output: str = args.output  # pyright: ignore[reportAny]
+
+    start = time.perf_counter()
+    try:
+        world = generate_world(
+            width,
+            height,
+            args.seed,  # pyright: ignore[reportAny]
+            args.survivors,  # pyright: ignore[reportAny]
+            args.survivor_groups,  # pyright: ignore[reportAny]
+            args.rubble,  # pyright: ignore[reportAny]
+            args.charging,  # pyright: ignore[reportAny]
+            args.fire,  # pyright: ignore[reportAny]
+            args.killer,  # pyright: ignore[reportAny]
+            args.max_move_cost,  # pyright: ignore[reportAny]
+            args.spawns,  # pyright: ignore[reportAny]
+            args.group_spawns,  # pyright: ignore[reportAny]
+            args.agent_energy,  # pyright: ignore[reportAny]
+        )
+        write_world(world, output)
+    except (ValueError, OSError) as e:
+        print(f"Error generating '{output}': {e}", file=sys.stderr)
+        sys.exit(1)
+
+    elapsed = (time.perf_counter() - start) * 1000
+    size = os.path.getsize(output)
+    print(f"{output} ({width}x{height}, {size} bytes, {elapsed:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,8 +3,10 @@ import gzip
 import json
 import os
 import queue
-import random
-from typing import TypedDict, cast
+from typing import Any, TypedDict, cast
+
+import numpy as np
+from numpy.typing import NDArray
 
 from aegis.assist.state import State
 from aegis.common import (
@@ -20,8 +22,11 @@ from aegis.common.world.cell import InternalCell
 from aegis.common.world.info import CellInfo, SurroundInfo
 from aegis.common.world.objects import Survivor, SurvivorGroup
 from aegis.common.world.world import InternalWorld
+from aegis.common.world.world_info_file import WorldInfoFile
 from aegis.parsers.aegis_world_file import AegisWorldFile
-from aegis.parsers.helper.world_file_type import StackContent, WorldFileType
+from aegis.parsers.binary_world_file import BinaryWorldFile, CompiledWorld
+from aegis.parsers.helper.world_file_type import StackContent
+from aegis.parsers.loaded_world_file import LoadedWorldFile
 from aegis.parsers.world_file_parser import WorldFileParser
 from aegis.server_websocket import WebSocketServer
 from aegis.world.object_handlers import (
@@ -30,9 +35,11 @@ from aegis.world.object_handlers import (
     SurvivorGroupHandler,
     SurvivorHandler,
 )
+from aegis.world.random_streams import RandomStreams
 from aegis.world.simulators.fire_simulator import FireSimulator
 from aegis.world.simulators.survivor_simulator import SurvivorSimulator
 from aegis.world.spawn_manager import SpawnManger
+from aegis.world.world_template import WorldTemplate
 
 
 class LocationDict(TypedDict):
@@ -74,9 +81,24 @@ class WorldDict(TypedDict):
     number_of_survivors_saved_dead: int
 
 
-MOVE_COST_TOGGLE: bool = json.load(open("sys_files/aegis_config.json"))[
-    "Enable_Move_Cost"
-]
+class WorldCheckpoint(TypedDict):
+    round: int
+    random_seed: int
+    random_state: dict[str, dict[str, Any]]
+    # [x, y, number of layers] of every cell changed since the world was built
+    cells: list[list[int]]
+    # [id, energy level] of every survivor and survivor group
+    survivors: list[list[int]]
+    survivor_groups: list[list[int]]
+    # [id, gid, x, y, energy level, steps taken] of every agent, in order
+    agents: list[list[int]]
+    spawned: list[bool]
+    number_of_alive_agents: int
+    number_of_dead_agents: int
+    number_of_survivors_alive: int
+    number_of_survivors_dead: int
+    number_of_survivors_saved_alive: int
+    number_of_survivors_saved_dead: int
 
 
 class AegisWorld:
@@ -91,9 +113,11 @@ class AegisWorld:
         self._mid_survivor_level: int = 0
         self._high_survivor_level: int = 0
         self._random_seed: int = 0
+        self._random: RandomStreams = RandomStreams(self._random_seed)
         self.round: int = 0
         self._world: InternalWorld | None = None
         self._agents: list[Agent] = []
+        self._agent_index: dict[AgentID, Agent] = {}
         self._normal_cell_list: list[InternalCell] = []
         self._fire_cells_list: list[InternalCell] = []
         self._non_fire_cells_list: list[InternalCell] = []
@@ -108,6 +132,7 @@ class AegisWorld:
         )
         self._initial_agent_energy: int = Constants.DEFAULT_MAX_ENERGY_LEVEL
         self._agent_world_filename: str = ""
+        self._agent_world_info: bytes = b""
         self._number_of_survivors: int = 0
         self._number_of_alive_agents: int = 0
         self._number_of_dead_agents: int = 0
@@ -116,15 +141,34 @@ class AegisWorld:
         self._number_of_survivors_saved_alive: int = 0
         self._number_of_survivors_saved_dead: int = 0
         self._max_move_cost: int = 0
+        self._move_cost_grid: NDArray[np.int32] = np.zeros((0, 0), np.int32)
+        self.move_cost_enabled: bool = True
+        self.world_max: int = Constants.WORLD_MAX
+        self.verbose: bool = True
+        # off when no agent will read the world, e.g. in `a3.vector_env`
+        self.agent_world_file_enabled: bool = True
         self._states: queue.Queue[State] = queue.Queue()
+        self._template: WorldTemplate | None = None
+        # the cells copied from the template since it was last reset to
+        self._copied_cells: list[InternalLocation] = []
+
+    def build_world_from_file(
+        self, filename: str, ws_server: WebSocketServer | None
+    ) -> bool:
+        loaded_world_file = WorldFileParser.load_world_file(filename)
+        if loaded_world_file is None:
+            return False
+        return self.build_world_from_loaded_file(loaded_world_file, ws_server)
 
-    def build_world_from_file(self, filename: str, ws_server: WebSocketServer) -> bool:
+    def build_world_from_loaded_file(
+        self, loaded_world_file: LoadedWorldFile, ws_server: WebSocketServer | None
+    ) -> bool:
         try:
-            aegis_world_file_info = WorldFileParser().parse_world_file(filename)
-            success = self.build_world(aegis_world_file_info)
+            success = self.build_world(loaded_world_file.world_file)
+            if ws_server is None:
+                return success
 
-            world = self._get_json_world(filename)
-            data = {"event_type": "World", "data": world}
+            data = {"event_type": "World", "data": loaded_world_file.json_world}
             compressed_data = gzip.compress(json.dumps(data).encode())
             encoded_data = base64.b64encode(compressed_data).decode().encode()
 
@@ -145,14 +189,19 @@ class AegisWorld:
             self._high_survivor_level = aegis_world_file.high_survivor_level
             self._random_seed = aegis_world_file.random_seed
             self._initial_agent_energy = aegis_world_file.initial_agent_energy
-            Utility.set_random_seed(aegis_world_file.random_seed)
+            self._seed_random(aegis_world_file.random_seed)
             self.round = 1
 
             # Create a world of known size
             self._world = InternalWorld(
-                width=aegis_world_file.width, height=aegis_world_file.height
+                width=aegis_world_file.width,
+                height=aegis_world_file.height,
+                max_size=self.world_max,
             )
 
+            if aegis_world_file.compiled is not None:
+                self._build_cells_from_compiled(aegis_world_file.compiled)
+
             # Special type cells
             for cell_setting in aegis_world_file.cell_settings:
                 if not cell_setting.locs:
@@ -174,9 +223,9 @@ class AegisWorld:
                 cell.move_cost = cell_info_setting.move_cost
 
                 # reverse so the top of the stack is actually
-                # the top declared in the world file
-                cell_info_setting.contents.reverse()
-                for content in cell_info_setting.contents:
+                # the top declared in the world file (not in place, the
+                # contents are shared with the JSON sent to the viewer)
+                for content in reversed(cell_info_setting.contents):
                     object_handler = self._object_handlers.get(content["type"].upper())
                     if not object_handler:
                         continue
@@ -211,63 +260,320 @@ class AegisWorld:
             )
             self._survivors_list = survivor_handler.sv_map
             self._survivor_groups_list = survivor_group_handler.svg_map
+            self._template = WorldTemplate(
+                self._world,
+                self._spawn_manager.spawn_locations,
+                self._random_seed,
+                dict(self._survivors_list),
+                dict(self._survivor_groups_list),
+                self._number_of_survivors_alive,
+                self._number_of_survivors_dead,
+            )
+            self._world = InternalWorld(
+                world=self._template.copy_grid(), max_size=self.world_max
+            )
+            self._copied_cells.clear()
+            self._build_move_cost_grid()
             self._write_agent_world_file()
             return True
         except Exception as e:
             print(f"Error in building world: {e}")
             return False
 
+    def reset(self, seed: int | None = None) -> bool:
+        """
+        Puts the world back the way it was built, with no agents, without
+        parsing or building it again.
+
+        Only the cells changed since the world was built or last reset are
+        put back, so a reset costs about as much as the changes being undone.
+
+        Args:
+            seed: The random seed to play with, by default the one the world
+                was built with.
+
+        Returns:
+            True if the world was reset, False if it hasn't been built.
+        """
+        template = self._template
+        if template is None or self._world is None:
+            return False
+
+        grid = self._world.get_world_grid()
+        template_grid = template.world.get_world_grid()
+        for location in self._copied_cells:
+            grid[location.x][location.y] = template_grid[location.x][location.y]
+        self._copied_cells.clear()
+        template.restore_energy_levels()
+
+        self._seed_random(template.random_seed if seed is None else seed)
+        self.round = 1
+        self._spawn_manager = SpawnManger()
+        for spawn in template.new_spawn_zones():
+            self._spawn_manager.add_spawn_zone(spawn)
+        self._agents.clear()
+        self._agent_index.clear()
+        self._top_layer_removed_cell_list.clear()
+        self._survivors_list = dict(template.survivors)
+        self._survivor_groups_list = dict(template.survivor_groups)
+        self._number_of_alive_agents = 0
+        self._number_of_dead_agents = 0
+        self._number_of_survivors_alive = template.number_of_survivors_alive
+        self._number_of_survivors_dead = template.number_of_survivors_dead
+        self._number_of_survivors_saved_alive = 0
+        self._number_of_survivors_saved_dead = 0
+        self._write_agent_world_file()
+        return True
+
+    def checkpoint(self) -> WorldCheckpoint:
+        """
+        Returns the state of the world, to be put back by `restore`.
+
+        Layers are only ever taken off the top of a cell, so a changed cell
+        is saved as the number of its built layers left, and the checkpoint
+        costs about as much as the changes since the world was built.
+
+        Raises:
+            ValueError: If the world hasn't been built.
+        """
+        template = self._template
+        if template is None or self._world is None:
+            raise ValueError("The world hasn't been built.")
+
+        cells: list[list[int]] = []
+        for location in self._copied_cells:
+            cell = self._world.get_cell_at(location)
+            if cell is not None:
+                cells.append([location.x, location.y, cell.number_of_layers()])
+        return {
+            "round": self.round,
+            "random_seed": self._random_seed,
+            "random_state": self._random.get_state(),
+            "cells": cells,
+            "survivors": [
+                [id, survivor.get_energy_level()]
+                for id, survivor in template.survivors.items()
+            ],
+            "survivor_groups": [
+                [id, survivor_group.get_energy_level()]
+                for id, survivor_group in template.survivor_groups.items()
+            ],
+            "agents": [
+                [
+                    agent.agent_id.id,
+                    agent.agent_id.gid,
+                    agent.location.x,
+                    agent.location.y,
+                    agent.get_energy_level(),
+                    agent.steps_taken,
+                ]
+                for agent in self._agents
+            ],
+            "spawned": [zone.spawned for zone in self._spawn_manager.spawn_locations],
+            "number_of_alive_agents": self._number_of_alive_agents,
+            "number_of_dead_agents": self._number_of_dead_agents,
+            "number_of_survivors_alive": self._number_of_survivors_alive,
+            "number_of_survivors_dead": self._number_of_survivors_dead,
+            "number_of_survivors_saved_alive": self._number_of_survivors_saved_alive,
+            "number_of_survivors_saved_dead": self._number_of_survivors_saved_dead,
+        }
+
+    def restore(self, checkpoint: WorldCheckpoint, seed: int | None = None) -> bool:
+        """
+        Puts the world in the state of a checkpoint taken on the same world,
+        resetting it first, see `reset`.
+
+        Args:
+            checkpoint: The checkpoint, from `checkpoint`.
+            seed: A random seed to play on with instead of the checkpoint's
+                random state, so the world plays out differently from there.
+
+        Returns:
+            True if the world was restored, False if it hasn't been built.
+
+        Raises:
+            ValueError: If the checkpoint wasn't taken on this world, which is
+                then left as it was.
+        """
+        template = self._template
+        if self._world is None or template is None:
+            return False
+        self._check_checkpoint(checkpoint, template)
+        _ = self.reset()
+
+        for x, y, number_of_layers in checkpoint["cells"]:
+            cell = self._get_cell_to_change(InternalLocation(x, y))
+            if cell is not None:
+                del cell.get_cell_layers()[number_of_layers:]
+        for survivors, energy_levels in (
+            (template.survivors, checkpoint["survivors"]),
+            (template.survivor_groups, checkpoint["survivor_groups"]),
+        ):
+            for id, energy_level in energy_levels:
+                survivor = survivors[id]
+                if survivor.get_energy_level() != energy_level:
+                    survivor.set_energy_level(energy_level)
+
+        self._seed_random(checkpoint["random_seed"] if seed is None else seed)
+        if seed is None:
+            self._random.set_state(checkpoint["random_state"])
+        for zone, spawned in zip(
+            self._spawn_manager.spawn_locations, checkpoint["spawned"]
+        ):
+            zone.spawned = spawned
+        for id, gid, x, y, energy_level, steps_taken in checkpoint["agents"]:
+            agent = Agent(AgentID(id, gid), InternalLocation(x, y), energy_level)
+            agent.steps_taken = steps_taken
+            self.add_agent(agent)
+
+        self.round = checkpoint["round"]
+        self._number_of_alive_agents = checkpoint["number_of_alive_agents"]
+        self._number_of_dead_agents = checkpoint["number_of_dead_agents"]
+        self._number_of_survivors_alive = checkpoint["number_of_survivors_alive"]
+        self._number_of_survivors_dead = checkpoint["number_of_survivors_dead"]
+        self._number_of_survivors_saved_alive = checkpoint[
+            "number_of_survivors_saved_alive"
+        ]
+        self._number_of_survivors_saved_dead = checkpoint[
+            "number_of_survivors_saved_dead"
+        ]
+        return True
+
+    @staticmethod
+    def _check_checkpoint(checkpoint: WorldCheckpoint, template: WorldTemplate) -> None:
+        world = template.world
+        for x, y, number_of_layers in checkpoint["cells"]:
+            cell = world.get_cell_at(InternalLocation(x, y))
+            if cell is None:
+                raise ValueError(f"Checkpoint cell ({x},{y}) is off the map.")
+            if number_of_layers > cell.number_of_layers():
+                raise ValueError(f"Checkpoint cell ({x},{y}) has too many layers.")
+        for survivors, energy_levels in (
+            (template.survivors, checkpoint["survivors"]),
+            (template.survivor_groups, checkpoint["survivor_groups"]),
+        ):
+            for id, _ in energy_levels:
+                if id not in survivors:
+                    raise ValueError(f"Checkpoint survivor {id} isn't in the world.")
+        for id, gid, x, y, *_ in checkpoint["agents"]:
+            if not world.on_map(InternalLocation(x, y)):
+                raise ValueError(f"Checkpoint agent ({id},{gid}) is off the map.")
+        if len(checkpoint["spawned"]) != len(template.spawn_zones):
+            raise ValueError("Checkpoint spawn zones don't match the world's.")
+
+    def _get_cell_to_change(self, location: InternalLocation) -> InternalCell | None:
+        """
+        Returns the cell at `location`, copied from the template first if it
+        is still the template's, so the template itself never changes.
+        """
+        if self._world is None:
+            return None
+        cell = self._world.get_cell_at(location)
+        if cell is None or self._template is None:
+            return cell
+        if cell is self._template.world.get_cell_at(location):
+            cell = cell.copy()
+            self._world.set_cell_at(location, cell)
+            self._copied_cells.append(location)
+        return cell
+
+    def _seed_random(self, seed: int) -> None:
+        self._random_seed = seed
+        self._random = RandomStreams(seed)
+        # the simulation only draws from its own streams, but agents run in
+        # this interpreter, e.g. by `a3.in_process`, may draw from `random`
+        Utility.set_random_seed(seed)
+
+    def get_random_seed(self) -> int:
+        """Returns the random seed the world is playing with."""
+        return self._random_seed
+
+    def get_random_streams(self) -> RandomStreams:
+        """Returns the random number generators of the simulation."""
+        return self._random
+
+    def _build_cells_from_compiled(self, compiled: CompiledWorld) -> None:
+        if self._world is None:
+            return
+
+        grid = self._world.get_world_grid()
+        height = compiled.height
+
+        for index in cast(list[int], np.flatnonzero(compiled.cell_types).tolist()):
+            x, y = divmod(index, height)
+            grid[x][y].setup_cell(
+                BinaryWorldFile.CELL_TYPES[int(compiled.cell_types[index])]
+            )
+
+        move_costs = cast(list[int], compiled.move_costs.tolist())
+        for x, column in enumerate(grid):
+            for y, cell in enumerate(column):
+                cell.move_cost = move_costs[x * height + y]
+
+        offsets = cast(list[int], compiled.layer_offsets.tolist())
+        layers = cast(list[list[int]], compiled.layers.tolist())
+        for index in cast(list[int], np.flatnonzero(np.diff(offsets)).tolist()):
+            x, y = divmod(index, height)
+            cell = grid[x][y]
+            # layers are stored top first, so add them bottom up
+            for layer in reversed(layers[offsets[index] : offsets[index + 1]]):
+                key, arguments = BinaryWorldFile.LAYER_KINDS[layer[0]]
+                object_handler = self._object_handlers.get(key)
+                if not object_handler:
+                    continue
+
+                world_object = object_handler.create_world_object(
+                    dict(zip(arguments, layer[1:]))
+                )
+                if world_object is not None:
+                    cell.add_layer(world_object)
+
+    def _build_move_cost_grid(self) -> None:
+        if self._world is None:
+            return
+
+        grid = self._world.get_world_grid()
+        self._move_cost_grid = np.array(
+            [[cell.move_cost for cell in column] for column in grid], np.int32
+        ).reshape(self._world.width, self._world.height)
+
+    def get_move_cost_grid(self) -> NDArray[np.int32]:
+        """Returns the move cost of every cell, indexed `[x, y]`."""
+        return self._move_cost_grid
+
     def install_object_handler(self, object_handler: ObjectHandler) -> None:
         keys = object_handler.get_keys()
         for key in keys:
             self._object_handlers[key.upper()] = object_handler
 
     def _write_agent_world_file(self) -> None:
+        if self._world is None or not self.agent_world_file_enabled:
+            return
+
+        if self._template is not None:
+            self._agent_world_info = self._template.get_agent_world_info(
+                self.move_cost_enabled
+            )
+        else:
+            self._agent_world_info = WorldInfoFile.encode(
+                self._world.get_world_grid(), self.move_cost_enabled
+            )
+        file = "WorldInfoFile.bin"
         try:
-            file = "WorldInfoFile.out"
-            with open(file, "w") as writer:
-                if self._world is None:
-                    return
-
-                width = self._world.width
-                height = self._world.height
-                _ = writer.write(f"Size: ( WIDTH {width} , HEIGHT {height} )\n")
-                for x in range(self._world.width):
-                    for y in range(self._world.height):
-                        cell = self._world.get_cell_at(InternalLocation(x, y))
-                        if cell is None:
-                            _ = writer.write(f"[({x},{y}),No Cell]\n")
-                            continue
-
-                        has_survivors = True
-                        if cell.number_of_survivors() <= 0:
-                            has_survivors = False
-
-                        fire = "+F" if cell.is_fire_cell() else "-F"
-                        killer = "+K" if cell.is_killer_cell() else "-K"
-                        charging = "+C" if cell.is_charging_cell() else "-C"
-
-                        if MOVE_COST_TOGGLE:
-                            _ = writer.write(
-                                f"[({x},{y}),({fire},{killer},{charging}),{has_survivors},{cell.move_cost}]\n"
-                            )
-                        else:
-                            _ = writer.write(
-                                f"[({x},{y}),({fire},{killer},{charging}),{has_survivors}]\n"
-                            )
+            WorldInfoFile.write(file, self._agent_world_info)
             path = os.path.realpath(os.getcwd())
             self._agent_world_filename = os.path.join(path, file)
         except Exception:
-            print(
-                f"Aegis  : Unable to write agent world file to '{self._agent_world_filename}'!"
-            )
+            # agents will be sent the world information inline instead
+            self._agent_world_filename = ""
+            print(f"Aegis  : Unable to write agent world file to '{file}'!")
 
     def run_simulators(self) -> str:
         s = "Sim_Events;\n"
         if Constants.FIRE_SPREAD:
-            s += self._fire_simulator.run()
+            s += self._fire_simulator.run(self._random.fire)
 
-        s += self._survivor_simulator.run()
+        s += self._survivor_simulator.run(self._random.survivors)
         top_layer_remove_message = "Top_Layer_Rem; { "
         if not self._top_layer_removed_cell_list:
             top_layer_remove_message += "NONE"
@@ -293,7 +599,8 @@ class AegisWorld:
         dead_agents = AgentIDList()
         for agent in self._agents:
             if agent.get_energy_level() <= 0:
-                print(f"Aegis  : Agent {agent} ran out of energy and died.\n")
+                if self.verbose:
+                    print(f"Aegis  : Agent {agent} ran out of energy and died.\n")
                 dead_agents.add(agent.agent_id)
                 continue
 
@@ -303,10 +610,14 @@ class AegisWorld:
                     continue
 
                 if cell.is_fire_cell():
-                    print(f"Aegis  : Agent {agent} ran into the fire and died.\n")
+                    if self.verbose:
+                        print(f"Aegis  : Agent {agent} ran into the fire and died.\n")
                     dead_agents.add(agent.agent_id)
                 elif cell.is_killer_cell():
-                    print(f"Aegis  : Agent {agent} ran into killer cell and died.\n")
+                    if self.verbose:
+                        print(
+                            f"Aegis  : Agent {agent} ran into killer cell and died.\n"
+                        )
                     dead_agents.add(agent.agent_id)
 
         self._number_of_dead_agents += dead_agents.size()
@@ -315,11 +626,16 @@ class AegisWorld:
     def get_agent_world_filename(self) -> str:
         return self._agent_world_filename
 
+    def get_agent_world_info(self) -> bytes:
+        return self._agent_world_info
+
     def add_agent_by_id(self, agent_id: AgentID) -> None:
         if self._world is None:
             return
 
-        spawn_loc = self._spawn_manager.get_spawn_location(agent_id.gid)
+        spawn_loc = self._spawn_manager.get_spawn_location(
+            agent_id.gid, self._random.spawn
+        )
 
         cell = self._world.get_cell_at(spawn_loc)
 
@@ -327,7 +643,9 @@ class AegisWorld:
             if len(self._normal_cell_list) == 0:
                 cell = self._world.get_cell_at(InternalLocation(0, 0))
             else:
-                cell = random.choice(self._normal_cell_list)
+                cell = self._normal_cell_list[
+                    int(self._random.spawn.integers(len(self._normal_cell_list)))
+                ]
 
         if cell is None:
             raise Exception("Aegis  : No cell found for agent")
@@ -343,30 +661,26 @@ class AegisWorld:
     def add_agent(self, agent: Agent) -> None:
         if agent not in self._agents:
             self._agents.append(agent)
-            if self._world is None:
-                return
-
-            cell = self._world.get_cell_at(agent.location)
+            _ = self._agent_index.setdefault(agent.agent_id, agent)
+            cell = self._get_cell_to_change(agent.location)
             if cell is None:
                 return
 
             cell.agent_id_list.add(agent.agent_id)
             self._number_of_alive_agents += 1
-            print(f"Aegis  : Added agent {agent}")
+            if self.verbose:
+                print(f"Aegis  : Added agent {agent}")
 
     def get_agent(self, agent_id: AgentID) -> Agent | None:
-        for agent in self._agents:
-            if agent.agent_id == agent_id:
-                return agent
-        return None
+        return self._agent_index.get(agent_id)
 
     def move_agent(self, agent_id: AgentID, location: InternalLocation) -> None:
         agent = self.get_agent(agent_id)
         if agent is None or self._world is None:
             return
 
-        curr_cell = self._world.get_cell_at(agent.location)
-        dest_cell = self._world.get_cell_at(location)
+        curr_cell = self._get_cell_to_change(agent.location)
+        dest_cell = self._get_cell_to_change(location)
 
         if dest_cell is None or curr_cell is None:
             return
@@ -378,7 +692,9 @@ class AegisWorld:
     def remove_agent(self, agent: Agent | None) -> None:
         if agent in self._agents and self._world is not None:
             self._agents.remove(agent)
-            agent_cell = self._world.get_cell_at(agent.location)
+            if self._agent_index.get(agent.agent_id) is agent:
+                del self._agent_index[agent.agent_id]
+            agent_cell = self._get_cell_to_change(agent.location)
             if agent_cell is None:
                 return
 
@@ -386,10 +702,7 @@ class AegisWorld:
             self._number_of_alive_agents -= 1
 
     def remove_layer_from_cell(self, location: InternalLocation) -> None:
-        if self._world is None:
-            return
-
-        cell = self._world.get_cell_at(location)
+        cell = self._get_cell_to_change(location)
         if cell is None:
             return
 
@@ -420,14 +733,19 @@ class AegisWorld:
             return self._world.get_cell_at(location)
         return None
 
-    def get_surround_info(self, location: InternalLocation) -> SurroundInfo | None:
+    def get_surround_info(
+        self, location: InternalLocation, with_life_signals: bool = True
+    ) -> SurroundInfo | None:
         surround_info = SurroundInfo()
         if self._world is None:
             return
         cell = self._world.get_cell_at(location)
         if cell is None:
             return
-        surround_info.life_signals = cell.get_generated_life_signals()
+        if with_life_signals:
+            surround_info.life_signals = cell.get_generated_life_signals(
+                self._random.life_signals
+            )
         surround_info.set_current_info(cell.get_cell_info())
 
         for direction in Direction:
@@ -444,11 +762,6 @@ class AegisWorld:
     def remove_survivor_group(self, survivor_group: SurvivorGroup) -> None:
         del self._survivor_groups_list[survivor_group.id]
 
-    def _get_json_world(self, filename: str) -> WorldFileType:
-        with open(filename, "r") as file:
-            world: WorldFileType = json.load(file)
-        return world
-
     def convert_to_json(self) -> WorldDict:
         if self._world is None:
             raise Exception(
@@ -0,0 +1,114 @@
+from typing import cast
+
+import numpy as np
+from numpy.typing import NDArray
+
+from aegis.common import InternalLocation
+from aegis.common.world.agent import Agent
+
+
+class AgentBatch:
+    """
+    The energy levels and locations of a batch of agents as arrays.
+
+    Commands of one type are resolved for every agent that sent them at once,
+    then written back to the agents with `apply_energy`. Each agent sends at most
+    one command per round, so the agents in a batch are independent of each other.
+
+    Attributes:
+        agents (list[Agent]): The agents in the batch, in command order.
+        energy (NDArray[np.int64]): The energy level of each agent.
+        x (NDArray[np.int64]): The x coordinate of each agent.
+        y (NDArray[np.int64]): The y coordinate of each agent.
+    """
+
+    def __init__(self, agents: list[Agent]) -> None:
+        self.agents: list[Agent] = agents
+        count = len(agents)
+        self.energy: NDArray[np.int64] = np.fromiter(
+            (agent.get_energy_level() for agent in agents), np.int64, count
+        )
+        self.x: NDArray[np.int64] = np.fromiter(
+            (agent.location.x for agent in agents), np.int64, count
+        )
+        self.y: NDArray[np.int64] = np.fromiter(
+            (agent.location.y for agent in agents), np.int64, count
+        )
+
+    def __len__(self) -> int:
+        return len(self.agents)
+
+    def remove_energy(self, energy: int | NDArray[np.int64]) -> None:
+        """
+        Removes energy from every agent, the same way `Agent.remove_energy` does.
+
+        Args:
+            energy: The energy to remove, either one amount or one per agent.
+        """
+        self.energy = np.where(energy < self.energy, self.energy - energy, 0)
+
+    def charge(self, mask: NDArray[np.bool_], energy: int, max_energy: int) -> None:
+        """
+        Adds energy to the masked agents, capped at a maximum energy level.
+
+        Args:
+            mask: Which agents to charge.
+            energy: The energy to add.
+            max_energy: The highest energy level an agent can be charged to.
+        """
+        charged = np.where(
+            self.energy + energy > max_energy, max_energy, self.energy + energy
+        )
+        self.energy = np.where(mask, charged, self.energy)
+
+    def resolve_moves(
+        self,
+        dx: NDArray[np.int64],
+        dy: NDArray[np.int64],
+        move_costs: NDArray[np.int32],
+        stay_cost: int,
+    ) -> NDArray[np.bool_]:
+        """
+        Moves every agent and charges it for the move.
+
+        An agent moving onto a cell pays that cell's move cost. An agent that stays
+        in place, or tries to move off the map, pays `stay_cost` and does not move.
+
+        Args:
+            dx: The change in x of each agent's move.
+            dy: The change in y of each agent's move.
+            move_costs: The move cost of every cell, indexed `[x, y]`.
+            stay_cost: The energy an agent pays when it does not move.
+
+        Returns:
+            Which agents moved.
+        """
+        width, height = move_costs.shape
+        dest_x = self.x + dx
+        dest_y = self.y + dy
+        moved = (
+            ((dx != 0) | (dy != 0))
+            & (dest_x >= 0)
+            & (dest_x < width)
+            & (dest_y >= 0)
+            & (dest_y < height)
+        )
+
+        cost = np.full(len(self), stay_cost, np.int64)
+        cost[moved] = move_costs[dest_x[moved], dest_y[moved]]
+        self.remove_energy(cost)
+
+        self.x = np.where(moved, dest_x, self.x)
+        self.y = np.where(moved, dest_y, self.y)
+        return moved
+
+    def locations(self, mask: NDArray[np.bool_]) -> list[InternalLocation]:
+        """Returns the location of each masked agent."""
+        xs = cast(list[int], self.x[mask].tolist())
+        ys = cast(list[int], self.y[mask].tolist())
+        return [InternalLocation.of(x, y) for x, y in zip(xs, ys)]
+
+    def apply_energy(self) -> None:
+        """Writes the batch's energy levels back to the agents."""
+        for agent, energy in zip(self.agents, cast(list[int], self.energy.tolist())):
+            agent.set_energy_level(energy)
@@ -0,0 +1,75 @@
+from typing import Any, cast
+
+import numpy as np
+
+
+class RandomStreams:
+    """
+    The simulation's random number generators, one per subsystem, spawned
+    from the world's seed with `numpy.random.SeedSequence`.
+
+    A subsystem only draws from its own stream, so how much one subsystem
+    draws, or when, never changes what another one sees: the same seed gives
+    the same spawns, survivor decay and fire spread however many life signals
+    the agents asked for. Within a stream the draws follow the kernel's own
+    order, e.g. the life signals of the agents in agent order.
+
+    Attributes:
+        seed (int): The seed the streams were spawned from.
+        spawn (np.random.Generator): Spawn zone and spawn cell choice.
+        life_signals (np.random.Generator): Life signal distortion.
+        survivors (np.random.Generator): Survivor and survivor group decay.
+        fire (np.random.Generator): Fire spread.
+        ties (np.random.Generator): Which group is given points for a save.
+        predictions (np.random.Generator): The image of a saved survivor.
+    """
+
+    STREAMS: tuple[str, ...] = (
+        "spawn",
+        "life_signals",
+        "survivors",
+        "fire",
+        "ties",
+        "predictions",
+    )
+
+    def __init__(self, seed: int) -> None:
+        """
+        Spawns the streams.
+
+        Args:
+            seed: The world's random seed.
+        """
+        self.seed: int = seed
+        # SeedSequence only takes non-negative entropy, and a negative seed
+        # mustn't share its streams with its absolute value
+        entropy = seed if seed >= 0 else [-seed, 1]
+        # a stream's place in STREAMS picks its child seed, so new streams
+        # must be added at the end
+        spawn, life_signals, survivors, fire, ties, predictions = (
+            np.random.default_rng(child)
+            for child in np.random.SeedSequence(entropy).spawn(len(self.STREAMS))
+        )
+        self.spawn: np.random.Generator = spawn
+        self.life_signals: np.random.Generator = life_signals
+        self.survivors: np.random.Generator = survivors
+        self.fire: np.random.Generator = fire
+        self.ties: np.random.Generator = ties
+        self.predictions: np.random.Generator = predictions
+
+    def get_state(self) -> dict[str, dict[str, Any]]:
+        """Returns the state of every stream, as `set_state` takes it."""
+        return {name: self._stream(name).bit_generator.state for name in self.STREAMS}
+
+    def set_state(self, state: dict[str, dict[str, Any]]) -> None:
+        """
+        Puts the streams back in a state returned by `get_state`.
+
+        Args:
+            state: The state of every stream, by name.
+        """
+        for name in self.STREAMS:
+            self._stream(name).bit_generator.state = state[name]
+
+    def _stream(self, name: str) -> np.random.Generator:
+        return cast(np.random.Generator, getattr(self, name))
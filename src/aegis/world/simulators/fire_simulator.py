@@ -1,4 +1,6 @@
-from aegis.common import Direction, Utility
+import numpy as np
+
+from aegis.common import Direction
 from aegis.common.world.cell import InternalCell
 from aegis.common.world.world import InternalWorld
 
@@ -14,20 +16,21 @@ class FireSimulator:
         self._non_fire_cells_list: list[InternalCell] = non_fire_cells_list
         self._world: InternalWorld | None = world
 
-    def run(self) -> str:
+    def run(self, rng: np.random.Generator) -> str:
         s = ""
         if not self._non_fire_cells_list or self._world is None:
             return s
         count = 0
-        number_to_spread = Utility.random_in_range(0, 2)
+        directions = list(Direction)
+        number_to_spread = int(rng.integers(0, 2, endpoint=True))
         s += "Fire Cells; { "
         for _ in range(number_to_spread):
             fire_cell = self._fire_cells_list[
-                Utility.random_in_range(0, len(self._fire_cells_list) - 1)
+                int(rng.integers(len(self._fire_cells_list)))
             ]
-            number_of_directions = Utility.random_in_range(1, 3)
+            number_of_directions = int(rng.integers(1, 3, endpoint=True))
             for _ in range(number_of_directions):
-                dir = Direction.get_random_direction()
+                dir = directions[int(rng.integers(len(directions)))]
                 spread_cell = self._world.get_cell_at(fire_cell.location.add(dir))
                 if spread_cell is None or spread_cell.is_fire_cell():
                     continue
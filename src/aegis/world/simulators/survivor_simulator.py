@@ -1,4 +1,5 @@
-from aegis.common.utility import Utility
+import numpy as np
+
 from aegis.common.world.objects import SurvivorGroup, Survivor
 
 
@@ -11,25 +12,27 @@ class SurvivorSimulator:
         self.survivors_list = survivors_list
         self.survivor_groups_list = survivor_groups_list
 
-    def run(self) -> str:
+    def run(self, rng: np.random.Generator) -> str:
         s = ""
-        s += f"{self.update_sv_list()}\n"
-        s += f"{self.update_svg_list()}\n"
+        s += f"{self.update_sv_list(rng)}\n"
+        s += f"{self.update_svg_list(rng)}\n"
         return s
 
-    def update_sv_list(self) -> str:
+    def update_sv_list(self, rng: np.random.Generator) -> str:
         s = "SV; { "
         changed_count = 0
         for survivor in self.survivors_list.values():
-            change = Utility.random_in_range(0, 20)
+            change = int(rng.integers(0, 20, endpoint=True))
             if change < 12:
                 continue
             if survivor.is_dead():
                 continue
             changed_count += 1
-            remove_energy = survivor.damage_factor * Utility.random_in_range(1, 5)
+            remove_energy = survivor.damage_factor * int(
+                rng.integers(1, 5, endpoint=True)
+            )
             remove_energy += survivor.body_mass + survivor.mental_state
-            change = Utility.random_in_range(5, 10)
+            change = int(rng.integers(5, 10, endpoint=True))
             if remove_energy > change:
                 remove_energy %= change
                 remove_energy += 1
@@ -40,20 +43,20 @@ class SurvivorSimulator:
         s += " };"
         return s
 
-    def update_svg_list(self) -> str:
+    def update_svg_list(self, rng: np.random.Generator) -> str:
         s = "SVG; { "
         changed_count = 0
         for survivor_group in self.survivor_groups_list.values():
-            change = Utility.random_in_range(0, 20)
+            change = int(rng.integers(0, 20, endpoint=True))
             if change < 12:
                 continue
             if survivor_group.is_dead():
                 continue
             changed_count += 1
-            remove_energy = (
-                survivor_group.number_of_survivors * Utility.random_in_range(1, 10)
+            remove_energy = survivor_group.number_of_survivors * int(
+                rng.integers(1, 10, endpoint=True)
             )
-            change = Utility.random_in_range(5, 10)
+            change = int(rng.integers(5, 10, endpoint=True))
             if remove_energy > change:
                 remove_energy %= change
                 remove_energy += 1
@@ -1,8 +1,15 @@
+from __future__ import annotations
+
 from enum import Enum
-import random
+from typing import TYPE_CHECKING
 
 from aegis.common.location import InternalLocation
 
+# spawn zones are part of the parsed world file, which agents load too, and
+# agents don't load numpy
+if TYPE_CHECKING:
+    import numpy as np
+
 
 class SpawnZoneType(Enum):
     GROUP = "group"
@@ -42,7 +49,9 @@ class SpawnManger:
 
         self.spawn_locations.append(spawn)
 
-    def get_spawn_location(self, group_id: int | None) -> InternalLocation:
+    def get_spawn_location(
+        self, group_id: int | None, rng: np.random.Generator
+    ) -> InternalLocation:
         # Prio group zones first
 
         group_spawns = [
@@ -52,7 +61,7 @@ class SpawnManger:
         ]
 
         if group_spawns:
-            spawn = random.choice(group_spawns)
+            spawn = group_spawns[int(rng.integers(len(group_spawns)))]
             spawn.set_spawned()
             return spawn.location
 
@@ -62,4 +71,4 @@ class SpawnManger:
             if spawn.zone_type == SpawnZoneType.ANY and spawn.can_spawn(group_id)
         ]
 
-        return random.choice(any_spawns).location
+        return any_spawns[int(rng.integers(len(any_spawns)))].location
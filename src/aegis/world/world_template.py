@@ -0,0 +1,74 @@
+from dataclasses import dataclass, field
+
+from aegis.common.world.cell import InternalCell
+from aegis.common.world.objects import Survivor, SurvivorGroup
+from aegis.common.world.world import InternalWorld
+from aegis.common.world.world_info_file import WorldInfoFile
+from aegis.world.spawn_manager import SpawnZone
+
+
+@dataclass
+class WorldTemplate:
+    """
+    A world as it was built, before any agent was added to it.
+
+    `AegisWorld` plays on a copy of the template's grid that shares the
+    template's cells until it changes one, so a world can be reset by putting
+    back the few cells it changed instead of parsing and building it again.
+
+    Attributes:
+        world (InternalWorld): The built world, whose cells are never changed.
+        spawn_zones (list[SpawnZone]): The spawn zones, copied on every reset.
+        random_seed (int): The seed the world was built with.
+        survivors (dict[int, Survivor]): The survivors by id.
+        survivor_groups (dict[int, SurvivorGroup]): The survivor groups by id.
+        number_of_survivors_alive (int): Survivors alive at the start.
+        number_of_survivors_dead (int): Survivors dead at the start.
+    """
+
+    world: InternalWorld
+    spawn_zones: list[SpawnZone]
+    random_seed: int
+    survivors: dict[int, Survivor]
+    survivor_groups: dict[int, SurvivorGroup]
+    number_of_survivors_alive: int
+    number_of_survivors_dead: int
+    # the layers are shared with every copy, so their energy levels are kept
+    # to be put back on reset
+    _energy_levels: list[tuple[Survivor | SurvivorGroup, int]] = field(
+        init=False, repr=False
+    )
+    _agent_world_info: dict[bool, bytes] = field(
+        init=False, default_factory=dict, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        self._energy_levels = [
+            (survivor, survivor.get_energy_level())
+            for survivor in [*self.survivors.values(), *self.survivor_groups.values()]
+        ]
+
+    def copy_grid(self) -> list[list[InternalCell]]:
+        """Returns a grid that shares every cell with the template."""
+        return [list(column) for column in self.world.get_world_grid()]
+
+    def restore_energy_levels(self) -> None:
+        """Puts back the energy levels the survivors were built with."""
+        for survivor, energy_level in self._energy_levels:
+            if survivor.get_energy_level() != energy_level:
+                survivor.set_energy_level(energy_level)
+
+    def new_spawn_zones(self) -> list[SpawnZone]:
+        """Returns copies of the spawn zones, none of them spawned in."""
+        return [
+            SpawnZone(zone.location, zone.zone_type, zone.allowed_group)
+            for zone in self.spawn_zones
+        ]
+
+    def get_agent_world_info(self, move_cost_enabled: bool) -> bytes:
+        """Returns the world info file of the world, encoded once."""
+        info = self._agent_world_info.get(move_cost_enabled)
+        if info is None:
+            info = WorldInfoFile.encode(self.world.get_world_grid(), move_cost_enabled)
+            self._agent_world_info[move_cost_enabled] = info
+        return info
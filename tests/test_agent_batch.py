@@ -0,0 +1,107 @@
+import unittest
+import random
+import sys
+import os
+
+# Add the `src` directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.abspath(os.path.join(current_dir, "../src"))
+if src_dir not in sys.path:
+    sys.path.append(src_dir)
+
+import numpy as np
+
+from aegis.common import AgentID, Direction, InternalLocation
+from aegis.common.world.agent import Agent
+from aegis.world.agent_batch import AgentBatch
+
+
+class TestAgentBatch(unittest.TestCase):
+    WIDTH = 6
+    HEIGHT = 5
+    STAY_COST = 1
+
+    def setUp(self):
+        self.rng = random.Random(7)
+        self.move_costs = np.array(
+            [
+                [self.rng.randint(1, 30) for _ in range(self.HEIGHT)]
+                for _ in range(self.WIDTH)
+            ],
+            np.int32,
+        )
+
+    def make_agents(self, count):
+        return [
+            Agent(
+                AgentID(index + 1, index % 3 + 1),
+                InternalLocation(
+                    self.rng.randrange(self.WIDTH), self.rng.randrange(self.HEIGHT)
+                ),
+                self.rng.randint(1, 60),
+            )
+            for index in range(count)
+        ]
+
+    def test_moves_match_agent_methods(self):
+        agents = self.make_agents(200)
+        directions = [self.rng.choice(list(Direction)) for _ in agents]
+
+        expected = []
+        for agent, direction in zip(agents, directions):
+            clone = agent.clone()
+            dest = clone.location.add(direction)
+            on_map = 0 <= dest.x < self.WIDTH and 0 <= dest.y < self.HEIGHT
+            if direction != Direction.CENTER and on_map:
+                clone.remove_energy(int(self.move_costs[dest.x, dest.y]))
+                clone.location = dest
+            else:
+                clone.remove_energy(self.STAY_COST)
+            expected.append((clone.get_energy_level(), clone.location))
+
+        batch = AgentBatch(agents)
+        moved = batch.resolve_moves(
+            np.array([direction.dx for direction in directions], np.int64),
+            np.array([direction.dy for direction in directions], np.int64),
+            self.move_costs,
+            self.STAY_COST,
+        )
+        batch.apply_energy()
+
+        locations = iter(batch.locations(moved))
+        for index, agent in enumerate(agents):
+            location = next(locations) if moved[index] else agent.location
+            self.assertEqual((agent.get_energy_level(), location), expected[index])
+
+    def test_charge_caps_energy(self):
+        agents = [
+            Agent(AgentID(1, 1), InternalLocation(0, 0), 10),
+            Agent(AgentID(2, 1), InternalLocation(0, 0), 95),
+            Agent(AgentID(3, 1), InternalLocation(0, 0), 10),
+        ]
+        batch = AgentBatch(agents)
+        batch.charge(np.array([True, True, False]), 20, 100)
+        batch.apply_energy()
+        self.assertEqual([agent.get_energy_level() for agent in agents], [30, 100, 10])
+
+    def test_remove_energy_stops_at_zero(self):
+        agents = [
+            Agent(AgentID(1, 1), InternalLocation(0, 0), 5),
+            Agent(AgentID(2, 1), InternalLocation(0, 0), 1),
+        ]
+        batch = AgentBatch(agents)
+        batch.remove_energy(1)
+        batch.apply_energy()
+        self.assertEqual([agent.get_energy_level() for agent in agents], [4, 0])
+
+    def test_empty_batch(self):
+        batch = AgentBatch([])
+        moved = batch.resolve_moves(
+            np.array([], np.int64), np.array([], np.int64), self.move_costs, 1
+        )
+        self.assertEqual(len(batch), 0)
+        self.assertEqual(batch.locations(moved), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
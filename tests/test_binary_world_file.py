@@ -0,0 +1,72 @@
+import unittest
+import sys
+import os
+import tempfile
+
+# Add the `src` directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.abspath(os.path.join(current_dir, "../src"))
+if src_dir not in sys.path:
+    sys.path.append(src_dir)
+
+from aegis.parsers.binary_world_file import BinaryWorldFile
+from aegis.parsers.world_file_parser import WorldFileParser
+from aegis.world.aegis_world import AegisWorld
+
+WORLD_FILE = os.path.join(current_dir, "../worlds/ExampleWorld.world")
+
+
+class TestBinaryWorldFile(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.compiled_file = os.path.join(self.tmp_dir.name, "ExampleWorld.bworld")
+        _ = BinaryWorldFile.compile_world_file(WORLD_FILE, self.compiled_file)
+
+        # AegisWorld writes the agent world file to the working directory
+        self.cwd = os.getcwd()
+        os.chdir(self.tmp_dir.name)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp_dir.cleanup()
+
+    def test_detects_format(self):
+        self.assertTrue(BinaryWorldFile.is_binary_world_file(self.compiled_file))
+        self.assertFalse(BinaryWorldFile.is_binary_world_file(WORLD_FILE))
+
+    def test_builds_same_world_as_json(self):
+        json_world = WorldFileParser.load_world_file(WORLD_FILE)
+        binary_world = WorldFileParser.load_world_file(self.compiled_file)
+        self.assertIsNotNone(json_world)
+        self.assertIsNotNone(binary_world)
+        assert json_world is not None and binary_world is not None
+        self.assertIsNotNone(binary_world.world_file.compiled)
+
+        from_json = AegisWorld()
+        from_binary = AegisWorld()
+        self.assertTrue(from_json.build_world(json_world.world_file))
+        self.assertTrue(from_binary.build_world(binary_world.world_file))
+        self.assertEqual(from_json.convert_to_json(), from_binary.convert_to_json())
+
+    def test_json_round_trip(self):
+        json_world = WorldFileParser.load_world_file(WORLD_FILE)
+        binary_world = WorldFileParser.load_world_file(self.compiled_file)
+        assert json_world is not None and binary_world is not None
+        self.assertEqual(
+            binary_world.json_world["stacks"], json_world.json_world["stacks"]
+        )
+        self.assertEqual(
+            binary_world.json_world["settings"], json_world.json_world["settings"]
+        )
+
+    def test_rejects_truncated_file(self):
+        with open(self.compiled_file, "rb") as file:
+            data = file.read()
+        truncated = os.path.join(self.tmp_dir.name, "truncated.bworld")
+        with open(truncated, "wb") as file:
+            _ = file.write(data[: len(data) // 2])
+        self.assertIsNone(WorldFileParser.load_world_file(truncated))
+
+
+if __name__ == "__main__":
+    unittest.main()
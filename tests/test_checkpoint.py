@@ -0,0 +1,154 @@
+import os
+import sys
+import tempfile
+import unittest
+
+# Add the `src` directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.abspath(os.path.join(current_dir, "../src"))
+if src_dir not in sys.path:
+    sys.path.append(src_dir)
+
+import numpy as np
+
+from a3.aegis_main import Aegis
+from a3.checkpoint import CheckpointFile, CheckpointWriter
+from a3.vector_env import NUM_ACTIONS, SAVE_SURV_ACTION, action_to_command
+from aegis.common import AgentID, AgentIDList, Direction
+from aegis.common.commands.agent_command import AgentCommand
+from aegis.common.commands.agent_commands import SEND_MESSAGE
+from aegis.common.network.loopback_transport import LoopbackListener
+
+REPO_DIR = os.path.abspath(os.path.join(current_dir, ".."))
+WORLDS_DIR = os.path.join(REPO_DIR, "worlds")
+WORLD = os.path.join(WORLDS_DIR, "ExampleWorld.world")
+CONFIG = os.path.join(REPO_DIR, "sys_files", "aegis_config.json")
+# ExampleWorld's agents spawn at (7, 7) and a survivor is at (0, 0)
+SOUTH_WEST = list(Direction).index(Direction.SOUTH_WEST)
+
+
+def start_kernel(world=WORLD, rounds=60) -> Aegis:
+    aegis = Aegis()
+    args = ["-WorldFile", world, "-NumRound", str(rounds)]
+    assert aegis.read_command_line(args + ["-ConfigFile", CONFIG, "-Turbo", "true"])
+    aegis.set_agent_listener(LoopbackListener())
+    aegis.get_aegis_world().agent_world_file_enabled = False
+    assert aegis.start_up() and aegis.build_world()
+    return aegis
+
+
+def commands_of_round(aegis: Aegis, actions: list[int]) -> list[AgentCommand]:
+    commands: list[AgentCommand] = []
+    for agent in aegis.get_agent_handler().agent_list:
+        command = action_to_command(actions[agent.agent_id.id - 1])
+        command.set_agent_id(agent.agent_id)
+        commands.append(command)
+    # the first agent messages its group, so there are messages in the mailboxes
+    message = SEND_MESSAGE(AgentIDList([AgentID(0, 1)]), "a message")
+    message.set_agent_id(AgentID(1, 1))
+    return [message, *commands]
+
+
+class TestCheckpoint(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.directory.name)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.directory.cleanup()
+
+    def test_resumed_run_plays_like_an_uninterrupted_one(self):
+        rng = np.random.default_rng(3)
+        # the first agent saves the survivor in round 8, then all act at random
+        actions = rng.integers(0, NUM_ACTIONS, (40, 3)).tolist()
+        for round in range(7):
+            actions[round][0] = SOUTH_WEST
+        actions[7][0] = SAVE_SURV_ACTION
+
+        uninterrupted = start_kernel()
+        for _ in range(3):
+            self.assertIsNotNone(uninterrupted.add_agent("group"))
+        checkpoint = None
+        for round, round_actions in enumerate(actions):
+            if round == 8:
+                checkpoint = uninterrupted.checkpoint()
+            uninterrupted.run_round(commands_of_round(uninterrupted, round_actions))
+        assert checkpoint is not None
+        # the survivor's image and a message are waiting to be sent
+        self.assertIn("PredInfo", str(checkpoint.agent_handler))
+        self.assertTrue(checkpoint.agent_handler["messages"])
+
+        resumed = start_kernel()
+        # a played kernel is restored as readily as a new one
+        resumed.run_round([])
+        data = CheckpointFile.encode(checkpoint)
+        self.assertTrue(resumed.restore(CheckpointFile.decode(data)))
+        for round_actions in actions[8:]:
+            resumed.run_round(commands_of_round(resumed, round_actions))
+
+        self.assertEqual(resumed.checkpoint(), uninterrupted.checkpoint())
+        self.assertEqual(
+            resumed.get_results()["groups"], uninterrupted.get_results()["groups"]
+        )
+
+    def test_fork_with_a_new_seed(self):
+        aegis = start_kernel()
+        self.assertIsNotNone(aegis.add_agent("group"))
+        aegis.run_round([])
+        checkpoint = aegis.checkpoint()
+
+        fork = start_kernel()
+        self.assertTrue(fork.restore(checkpoint, seed=99))
+        world = fork.get_aegis_world()
+        self.assertEqual(world.get_random_seed(), 99)
+        self.assertEqual(fork.checkpoint().world["agents"], checkpoint.world["agents"])
+        self.assertNotEqual(
+            fork.checkpoint().world["random_state"], checkpoint.world["random_state"]
+        )
+
+    def test_restore_rejects_another_world(self):
+        aegis = start_kernel()
+        for _ in range(2):
+            _ = aegis.add_agent("group")
+        for _ in range(3):
+            aegis.run_round([])
+        checkpoint = aegis.checkpoint()
+
+        other = start_kernel(os.path.join(WORLDS_DIR, "challenge1-1.world"))
+        before = other.checkpoint()
+        with self.assertRaises(ValueError):
+            _ = other.restore(checkpoint)
+        self.assertEqual(other.checkpoint(), before)
+
+    def test_file_rejects_damage(self):
+        aegis = start_kernel()
+        _ = aegis.add_agent("group")
+        data = CheckpointFile.encode(aegis.checkpoint())
+        self.assertEqual(CheckpointFile.decode(data), aegis.checkpoint())
+
+        damaged = bytearray(data)
+        damaged[-1] ^= 0xFF
+        for bad in (b"", b"AEGW" + data[4:], data[:-1], bytes(damaged)):
+            with self.assertRaises(ValueError):
+                _ = CheckpointFile.decode(bad)
+
+    def test_writer_writes_in_the_background(self):
+        aegis = start_kernel()
+        _ = aegis.add_agent("group")
+        writer = CheckpointWriter("checkpoint_{round}.ckpt")
+        for _ in range(2):
+            aegis.run_round([])
+            writer.submit(aegis.checkpoint())
+        writer.close()
+
+        # an earlier checkpoint may be replaced by a later one before it's written
+        self.assertIn("checkpoint_2.ckpt", os.listdir())
+        self.assertNotIn("checkpoint_2.ckpt.tmp", os.listdir())
+        checkpoint = CheckpointFile.read("checkpoint_2.ckpt")
+        self.assertEqual(checkpoint, aegis.checkpoint())
+
+
+if __name__ == "__main__":
+    unittest.main()
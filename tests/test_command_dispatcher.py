@@ -0,0 +1,65 @@
+import unittest
+import sys
+import os
+
+# Add the `src` directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.abspath(os.path.join(current_dir, "../src"))
+if src_dir not in sys.path:
+    sys.path.append(src_dir)
+
+from aegis.common import AgentID, Direction
+from aegis.common.commands.agent_command import AgentCommand
+from aegis.common.commands.agent_commands import END_TURN, MOVE, SLEEP
+from aegis.common.commands.aegis_commands import ROUND_END, ROUND_START
+from aegis.common.commands.command_dispatcher import CommandDispatcher
+
+
+class LONG_SLEEP(SLEEP):
+    __slots__ = ()
+
+
+class TestCommandDispatcher(unittest.TestCase):
+    def setUp(self):
+        self.dispatcher = CommandDispatcher()
+        self.handled = []
+
+    def handler(self, name):
+        return lambda command: self.handled.append((name, command))
+
+    def test_dispatches_by_type(self):
+        self.dispatcher.register(ROUND_START, self.handler("start"))
+        self.dispatcher.register(ROUND_END, self.handler("end"))
+        start, end = ROUND_START(), ROUND_END()
+
+        self.assertTrue(self.dispatcher.dispatch(end))
+        self.assertTrue(self.dispatcher.dispatch(start))
+        self.assertEqual(self.handled, [("end", end), ("start", start)])
+
+    def test_unregistered_type_is_not_handled(self):
+        self.dispatcher.register(MOVE, self.handler("move"))
+        self.assertFalse(self.dispatcher.dispatch(END_TURN()))
+        self.assertEqual(self.handled, [])
+
+    def test_subclass_uses_closest_base_handler(self):
+        self.dispatcher.register(AgentCommand, self.handler("agent"))
+        self.dispatcher.register(SLEEP, self.handler("sleep"))
+        self.assertTrue(self.dispatcher.dispatch(LONG_SLEEP()))
+        self.assertTrue(self.dispatcher.dispatch(END_TURN()))
+        self.assertEqual([name for name, _ in self.handled], ["sleep", "agent"])
+
+        # a handler registered later replaces the one the subclass inherited
+        self.dispatcher.register(LONG_SLEEP, self.handler("long sleep"))
+        self.assertTrue(self.dispatcher.dispatch(LONG_SLEEP()))
+        self.assertEqual(self.handled[-1][0], "long sleep")
+
+    def test_commands_have_no_instance_dict(self):
+        move = MOVE(Direction.NORTH)
+        move.set_agent_id(AgentID(1, 1))
+        self.assertFalse(hasattr(move, "__dict__"))
+        self.assertEqual(move.get_agent_id(), AgentID(1, 1))
+        self.assertEqual(SLEEP().get_agent_id(), AgentID(-1, -1))
+
+
+if __name__ == "__main__":
+    unittest.main()
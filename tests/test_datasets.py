@@ -0,0 +1,45 @@
+import unittest
+import sys
+import os
+
+import numpy as np
+
+# Add the `src` directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.abspath(os.path.join(current_dir, "../src"))
+if src_dir not in sys.path:
+    sys.path.append(src_dir)
+
+from aegis.agent_predictions.datasets import Datasets
+from aegis.agent_predictions.prediction_handler import PredictionHandler
+
+
+class TestDatasets(unittest.TestCase):
+    def test_testing_data_is_memory_mapped(self):
+        images = Datasets.testing_images()
+        self.assertIsInstance(images, np.memmap)
+        self.assertFalse(images.flags.writeable)
+        self.assertEqual(images.shape[0], Datasets.testing_labels().shape[0])
+
+    def test_training_data_is_memory_mapped(self):
+        images = Datasets.training_images()
+        labels = Datasets.training_labels()
+        self.assertIsInstance(images, np.memmap)
+        self.assertFalse(images.flags.writeable)
+        # 28x28 images, like the testing set
+        self.assertEqual(images.shape[1:], (28, 28))
+        self.assertEqual(images.shape[1:], Datasets.testing_images().shape[1:])
+        self.assertEqual(images.dtype, np.uint8)
+        self.assertEqual(labels.shape, (images.shape[0],))
+        self.assertEqual(labels.dtype, np.int32)
+
+    def test_each_file_is_mapped_once(self):
+        self.assertIs(Datasets.testing_images(), Datasets.testing_images())
+
+    def test_prediction_handler_uses_shared_data(self):
+        image = PredictionHandler.get_image_from_index(0)
+        np.testing.assert_array_equal(image, Datasets.testing_images()[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+import sys
+import os
+import json
+import tempfile
+
+# Add the `src` directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.abspath(os.path.join(current_dir, "../src"))
+if src_dir not in sys.path:
+    sys.path.append(src_dir)
+
+from aegis.common.world.world import InternalWorld
+from aegis.parsers.config_parser import ConfigParser
+from aegis.parsers.world_file_parser import WorldFileParser
+from aegis.tools.generate_world import generate_world, write_world
+from aegis.world.aegis_world import AegisWorld
+
+
+class TestGenerateWorld(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+        # AegisWorld writes the agent world file to the working directory
+        self.cwd = os.getcwd()
+        os.chdir(self.tmp_dir.name)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp_dir.cleanup()
+
+    def test_same_seed_same_world(self):
+        self.assertEqual(generate_world(20, 15, seed=3), generate_world(20, 15, seed=3))
+        self.assertNotEqual(
+            generate_world(20, 15, seed=3), generate_world(20, 15, seed=4)
+        )
+
+    def test_spawns_are_safe(self):
+        world = generate_world(20, 20, seed=1, fire=0.5, killer=0.4, spawns=5)
+        spawns = {(spawn["x"], spawn["y"]) for spawn in world["spawn_locs"]}
+        cell_types = world["cell_types"]
+        for cell in cell_types["fire_cells"] + cell_types["killer_cells"]:
+            self.assertNotIn((cell["x"], cell["y"]), spawns)
+
+    def test_group_spawns(self):
+        world = generate_world(10, 10, spawns=1, group_spawns=2)
+        gids = [spawn.get("gid") for spawn in world["spawn_locs"]]
+        self.assertEqual(gids, [None, 1, 2])
+
+    def test_builds_in_both_formats(self):
+        world = generate_world(40, 35, seed=7)
+        for name in ("generated.world", "generated.bworld"):
+            write_world(world, name)
+            loaded = WorldFileParser.load_world_file(name)
+            assert loaded is not None
+            aegis_world = AegisWorld()
+            aegis_world.world_max = 40
+            self.assertTrue(aegis_world.build_world(loaded.world_file))
+            self.assertEqual(loaded.world_file.width, 40)
+            self.assertEqual(loaded.world_file.height, 35)
+
+    def test_world_max(self):
+        with self.assertRaises(ValueError):
+            _ = InternalWorld(width=40, height=40)
+        self.assertEqual(InternalWorld(width=40, height=40, max_size=40).width, 40)
+
+        with open("config.json", "w") as file:
+            json.dump({"World_Max": 512}, file)
+        config_settings = ConfigParser.parse_config_file("config.json")
+        assert config_settings is not None
+        self.assertEqual(config_settings.world_max, 512)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+import sys
+import os
+import subprocess
+
+# Add the `src` directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.abspath(os.path.join(current_dir, "../src"))
+if src_dir not in sys.path:
+    sys.path.append(src_dir)
+
+# the packages agents import, which must stay quick to import
+AGENT_MODULES = ["aegis", "a3.agent"]
+
+
+def import_times(module: str) -> dict[str, int]:
+    """Imports `module` in a fresh interpreter and returns {module: cumulative us}."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = src_dir
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestImportTime(unittest.TestCase):
+    def test_agent_imports_do_not_load_numpy(self):
+        for module in AGENT_MODULES:
+            with self.subTest(module=module):
+                self.assertNotIn("numpy", import_times(module))
+
+    def test_kernel_import_does_not_load_testing_data(self):
+        env = dict(os.environ)
+        env["PYTHONPATH"] = src_dir
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import a3.aegis_main\n"
+                "from aegis.agent_predictions.prediction_handler import PredictionHandler\n"
+                "print(PredictionHandler._x_test is None)",
+            ],
+            capture_output=True,
+            text=True,
+            env=env,
+            check=True,
+        )
+        self.assertEqual(result.stdout.strip(), "True")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import asyncio
+import contextlib
+import io
+import os
+import socket
+import sys
+import tempfile
+import threading
+import unittest
+
+# Add the `src` directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.abspath(os.path.join(current_dir, "../src"))
+if src_dir not in sys.path:
+    sys.path.append(src_dir)
+
+from a3.aegis_main import Aegis
+from a3.load_generator import (
+    LoadGenerator,
+    LoadReport,
+    idle_policy,
+    recorded_policy,
+    walk_policy,
+)
+from a3.resimulator import CommandLog, RecordedRound
+
+REPO_DIR = os.path.abspath(os.path.join(current_dir, ".."))
+WORLD = os.path.join(REPO_DIR, "worlds", "ExampleWorld.world")
+CONFIG = os.path.join(REPO_DIR, "sys_files", "aegis_config.json")
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "needs Unix domain sockets")
+class TestLoadGenerator(unittest.TestCase):
+    def setUp(self):
+        # the kernel writes its world info file to the working directory
+        self.directory = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.directory.name)
+        self.endpoint = f"unix://{os.path.join(self.directory.name, 'aegis.sock')}"
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.directory.cleanup()
+
+    def run_kernel(self, generator: LoadGenerator, agents: int) -> LoadReport:
+        aegis = Aegis()
+        args = ["-NoKViewer", str(agents), "-WorldFile", WORLD, "-ConfigFile", CONFIG]
+        args += ["-NumRound", "10", "-Turbo", "true", "-Endpoint", self.endpoint]
+        self.assertTrue(aegis.read_command_line(args))
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertTrue(aegis.start_up() and aegis.build_world())
+
+            # the clients play until the kernel's shutdown disconnects them
+            def kernel() -> None:
+                try:
+                    aegis.connect_all_agents()
+                    aegis.run_state()
+                finally:
+                    aegis.shutdown()
+
+            thread = threading.Thread(target=kernel)
+            thread.start()
+            try:
+                report = asyncio.run(generator.run(agents, connect_timeout=5))
+            finally:
+                thread.join(timeout=30)
+        return report
+
+    def test_clients_play_every_round(self):
+        report = self.run_kernel(LoadGenerator(self.endpoint, walk_policy(1)), 20)
+        self.assertEqual(report.agents, 20)
+        self.assertEqual(report.rounds, 10)
+        self.assertEqual(len(report.turn_seconds), 200)
+        self.assertEqual(len(report.round_seconds()), 10)
+        summary = report.summary()
+        self.assertGreater(summary["rounds_per_s"], 0)
+        self.assertLessEqual(summary["turn_p99_s"], summary["turn_max_s"])
+
+    def test_idle_clients_only_end_their_turn(self):
+        report = self.run_kernel(LoadGenerator(self.endpoint, idle_policy), 3)
+        self.assertEqual(report.messages_sent, 30)
+
+    def test_recorded_policy_plays_each_agents_commands(self):
+        log = CommandLog(
+            world_filename=WORLD,
+            agents=[[1, 1, 500, 7, 7], [2, 1, 500, 7, 7]],
+            rounds=[
+                RecordedRound(1, ["(2, 1)#Move NORTH", "(1, 1)#Sleep"]),
+                RecordedRound(2, ["(1, 1)#Team Dig"]),
+            ],
+        )
+        policy = recorded_policy(log)
+        self.assertEqual(policy(0, 1), ["SLEEP"])
+        self.assertEqual(policy(1, 1), ["MOVE ( NORTH )"])
+        self.assertEqual(policy(1, 2), [])
+        # more clients than recorded agents, and more rounds than recorded
+        self.assertEqual(policy(2, 4), ["TEAM_DIG"])
+        with self.assertRaises(ValueError):
+            _ = recorded_policy(CommandLog(world_filename=WORLD))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import math
+import unittest
+import sys
+import os
+import urllib.error
+import urllib.request
+
+# Add the `src` directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.abspath(os.path.join(current_dir, "../src"))
+if src_dir not in sys.path:
+    sys.path.append(src_dir)
+
+from aegis.assist.metrics_server import (
+    LatencyWindow,
+    MetricsServer,
+    MetricsText,
+    resident_memory_bytes,
+)
+
+
+class TestLatencyWindow(unittest.TestCase):
+    def test_quantiles_of_recent_samples(self):
+        window = LatencyWindow(size=4)
+        self.assertTrue(math.isnan(window.quantile(0.5)))
+        for sample in (100.0, 1.0, 2.0, 3.0, 4.0):
+            window.add(sample)
+
+        # the first sample has been pushed out of the window
+        self.assertEqual(sorted(window.samples()), [1.0, 2.0, 3.0, 4.0])
+        self.assertEqual(window.quantile(0.5), 2.0)
+        self.assertEqual(window.quantile(0.99), 4.0)
+        self.assertEqual(window.count, 5)
+        self.assertEqual(window.total, 110.0)
+
+
+class TestMetricsText(unittest.TestCase):
+    def test_renders_prometheus_text(self):
+        metrics = MetricsText()
+        metrics.add_value("aegis_rounds_total", "counter", "Rounds.", 3)
+        metrics.add(
+            "aegis_bytes_total",
+            "counter",
+            "Bytes.",
+            [({"agent": "1:1"}, 10), ({"agent": 'a"b'}, 2.5)],
+        )
+        window = LatencyWindow()
+        window.add(0.25)
+        metrics.add_summary("aegis_latency_seconds", "Latency.", [({}, window)], (0.5,))
+
+        self.assertEqual(
+            metrics.render().splitlines(),
+            [
+                "# HELP aegis_rounds_total Rounds.",
+                "# TYPE aegis_rounds_total counter",
+                "aegis_rounds_total 3",
+                "# HELP aegis_bytes_total Bytes.",
+                "# TYPE aegis_bytes_total counter",
+                'aegis_bytes_total{agent="1:1"} 10',
+                'aegis_bytes_total{agent="a\\"b"} 2.5',
+                "# HELP aegis_latency_seconds Latency.",
+                "# TYPE aegis_latency_seconds summary",
+                'aegis_latency_seconds{quantile="0.5"} 0.25',
+                "aegis_latency_seconds_sum 0.25",
+                "aegis_latency_seconds_count 1",
+            ],
+        )
+
+
+class TestMetricsServer(unittest.TestCase):
+    def setUp(self):
+        self.server = MetricsServer(0, lambda: "aegis_up 1\n")
+        self.server.start()
+        self.url = f"http://127.0.0.1:{self.server.port}"
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_serves_metrics(self):
+        with urllib.request.urlopen(f"{self.url}/metrics") as response:
+            self.assertEqual(response.read(), b"aegis_up 1\n")
+            self.assertIn("version=0.0.4", response.headers["Content-Type"])
+
+    def test_other_paths_are_not_found(self):
+        with self.assertRaises(urllib.error.HTTPError) as context:
+            _ = urllib.request.urlopen(f"{self.url}/")
+        self.assertEqual(context.exception.code, 404)
+
+    def test_reads_resident_memory(self):
+        self.assertGreater(resident_memory_bytes(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import os
+import pstats
+import signal
+import sys
+import tempfile
+import unittest
+
+# Add the `src` directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.abspath(os.path.join(current_dir, "../src"))
+if src_dir not in sys.path:
+    sys.path.append(src_dir)
+
+from a3.aegis_main import Aegis
+from aegis.assist.on_demand_profiler import OnDemandProfiler
+
+REPO_DIR = os.path.abspath(os.path.join(current_dir, ".."))
+
+
+def busy_round():
+    return sorted(str(i) for i in range(200))
+
+
+class TestOnDemandProfiler(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.prefix = os.path.join(self.directory.name, "replay")
+        self.messages = []
+        self.profiler = OnDemandProfiler(self.prefix, 3, self.messages.append)
+
+    def tearDown(self):
+        self.profiler.stop()
+        self.directory.cleanup()
+
+    def run_rounds(self, first, last):
+        for round in range(first, last + 1):
+            self.profiler.round_started(round)
+            _ = busy_round()
+
+    def test_cprofile_covers_the_requested_rounds(self):
+        self.run_rounds(1, 2)
+        self.profiler.request_cprofile()
+        self.run_rounds(3, 8)
+
+        self.assertEqual(
+            os.listdir(self.directory.name), ["replay.cprofile.r3-5.pstats"]
+        )
+        stats = pstats.Stats(f"{self.prefix}.cprofile.r3-5.pstats")
+        functions = {name for _, _, name in stats.stats}  # pyright: ignore[reportAttributeAccessIssue]
+        self.assertIn("busy_round", functions)
+
+    def test_tracemalloc_written_on_stop(self):
+        self.profiler.request_tracemalloc()
+        self.run_rounds(1, 2)
+        self.profiler.stop()
+
+        filename = f"{self.prefix}.tracemalloc.r1-2.txt"
+        with open(filename) as file:
+            report = file.read()
+        self.assertIn("Top 25 allocations by size:", report)
+        self.assertIn("by growth since round 1", report)
+
+    @unittest.skipUnless(hasattr(signal, "SIGUSR1"), "needs SIGUSR1")
+    def test_signal_requests_a_capture(self):
+        previous = signal.getsignal(signal.SIGUSR1), signal.getsignal(signal.SIGUSR2)
+        try:
+            self.assertTrue(self.profiler.install_signal_handlers())
+            os.kill(os.getpid(), signal.SIGUSR1)
+            self.run_rounds(1, 4)
+        finally:
+            _ = signal.signal(signal.SIGUSR1, previous[0])
+            _ = signal.signal(signal.SIGUSR2, previous[1])
+
+        self.assertEqual(
+            os.listdir(self.directory.name), ["replay.cprofile.r1-3.pstats"]
+        )
+
+    @unittest.skipUnless(hasattr(signal, "SIGUSR1"), "needs SIGUSR1")
+    def test_stop_restores_the_previous_handlers(self):
+        def handler(signum, frame):
+            pass
+
+        previous = signal.signal(signal.SIGUSR1, handler)
+        try:
+            self.assertTrue(self.profiler.install_signal_handlers())
+            self.assertIsNot(signal.getsignal(signal.SIGUSR1), handler)
+            self.profiler.stop()
+            self.assertIs(signal.getsignal(signal.SIGUSR1), handler)
+        finally:
+            _ = signal.signal(signal.SIGUSR1, previous)
+
+    @unittest.skipUnless(hasattr(signal, "SIGUSR1"), "needs SIGUSR1")
+    def test_kernel_leaves_signals_alone_unless_asked(self):
+        handlers = signal.getsignal(signal.SIGUSR1), signal.getsignal(signal.SIGUSR2)
+        aegis = Aegis()
+        world = os.path.join(REPO_DIR, "worlds", "ExampleWorld.world")
+        config = os.path.join(REPO_DIR, "sys_files", "aegis_config.json")
+        args = ["-WorldFile", world, "-NumRound", "1", "-ConfigFile", config]
+        self.assertTrue(aegis.read_command_line([*args, "-Turbo", "true"]))
+        self.assertTrue(aegis.start_up())
+        self.assertEqual(
+            (signal.getsignal(signal.SIGUSR1), signal.getsignal(signal.SIGUSR2)),
+            handlers,
+        )
+
+        self.assertTrue(aegis.install_profiler_signal_handlers())
+        self.assertNotEqual(signal.getsignal(signal.SIGUSR1), handlers[0])
+        aegis.shutdown()
+        self.assertEqual(
+            (signal.getsignal(signal.SIGUSR1), signal.getsignal(signal.SIGUSR2)),
+            handlers,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
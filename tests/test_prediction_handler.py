@@ -0,0 +1,111 @@
+import unittest
+import sys
+import os
+import random
+
+# Add the `src` directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.abspath(os.path.join(current_dir, "../src"))
+if src_dir not in sys.path:
+    sys.path.append(src_dir)
+
+from aegis.agent_predictions.prediction_handler import PredictionHandler
+from aegis.common import AgentID
+
+
+class ScanningPredictions:
+    """The original scanning implementation, used as the reference."""
+
+    def __init__(self):
+        self.no_pred_yet = {}
+        self.pred_results = {}
+
+    def add(self, agent_id, survivor_id, index):
+        key = (agent_id.gid, survivor_id)
+        if key in self.no_pred_yet:
+            self.no_pred_yet[key][0].append(agent_id)
+        else:
+            self.no_pred_yet[key] = ([agent_id], index)
+
+    def pred_info(self, agent_id):
+        for (gid, surv_id), (agents, idx) in self.no_pred_yet.items():
+            if agent_id.gid == gid and agent_id in agents:
+                return surv_id, idx
+        return None
+
+    def set_result(self, agent_id, survivor_id, correct):
+        self.pred_results.setdefault(agent_id.gid, {})[survivor_id] = (
+            agent_id.id,
+            correct,
+        )
+        self.no_pred_yet.pop((agent_id.gid, survivor_id), None)
+
+    def result(self, agent_id):
+        for surv_id, (responsible, correct) in self.pred_results.get(
+            agent_id.gid, {}
+        ).items():
+            if responsible == agent_id.id:
+                return surv_id, correct
+        return None
+
+
+class TestPredictionHandler(unittest.TestCase):
+    def test_matches_scanning_implementation(self):
+        rng = random.Random(7)
+        handler = PredictionHandler()
+        reference = ScanningPredictions()
+        agents = [AgentID(id, gid) for gid in (1, 2) for id in range(1, 4)]
+
+        for _ in range(2000):
+            agent_id = rng.choice(agents)
+            survivor_id = rng.randrange(10)
+            action = rng.random()
+            if action < 0.4:
+                handler.add_agent_to_no_pred_yet(agent_id, survivor_id)
+                index = handler._no_pred_yet[(agent_id.gid, survivor_id)][1]
+                reference.add(agent_id, survivor_id, index)
+            elif action < 0.6:
+                if handler.is_agent_in_saving_group(agent_id, survivor_id):
+                    correct = rng.random() < 0.5
+                    handler.set_prediction_result(agent_id, survivor_id, correct)
+                    reference.set_result(agent_id, survivor_id, correct)
+
+            for other in agents:
+                info = handler.get_pred_info_for_agent(other)
+                expected = reference.pred_info(other)
+                if expected is None:
+                    self.assertIsNone(info)
+                else:
+                    assert info is not None
+                    self.assertEqual(info[0], expected[0])
+                    self.assertTrue(
+                        (
+                            info[1]
+                            == PredictionHandler.get_image_from_index(expected[1])
+                        ).all()
+                    )
+                self.assertEqual(
+                    handler.get_prediction_result(other), reference.result(other)
+                )
+
+    def test_handlers_do_not_share_state(self):
+        first = PredictionHandler()
+        second = PredictionHandler()
+        first.add_agent_to_no_pred_yet(AgentID(1, 1), 5)
+        self.assertTrue(first.is_group_in_no_pred_yet(1, 5))
+        self.assertFalse(second.is_group_in_no_pred_yet(1, 5))
+
+    def test_reset(self):
+        handler = PredictionHandler()
+        agent_id = AgentID(1, 1)
+        handler.add_agent_to_no_pred_yet(agent_id, 5)
+        handler.set_prediction_result(agent_id, 5, True)
+        handler.add_agent_to_no_pred_yet(agent_id, 6)
+        handler.reset()
+        self.assertIsNone(handler.get_pred_info_for_agent(agent_id))
+        self.assertIsNone(handler.get_prediction_result(agent_id))
+        self.assertFalse(handler.is_group_in_no_pred_yet(1, 6))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import os
+import sys
+import unittest
+
+# Add the `src` directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.abspath(os.path.join(current_dir, "../src"))
+if src_dir not in sys.path:
+    sys.path.append(src_dir)
+
+from aegis.common import Constants
+from aegis.common.world.cell import InternalCell
+from aegis.common.world.objects import SurvivorGroup
+from aegis.world.random_streams import RandomStreams
+
+
+def draws(streams: RandomStreams) -> dict[str, list[int]]:
+    return {
+        name: getattr(streams, name).integers(0, 1 << 30, 4).tolist()
+        for name in RandomStreams.STREAMS
+    }
+
+
+class TestRandomStreams(unittest.TestCase):
+    def test_same_seed_same_streams(self):
+        self.assertEqual(draws(RandomStreams(42)), draws(RandomStreams(42)))
+        self.assertNotEqual(draws(RandomStreams(42)), draws(RandomStreams(43)))
+        self.assertNotEqual(draws(RandomStreams(-42)), draws(RandomStreams(42)))
+
+    def test_streams_are_independent(self):
+        first = RandomStreams(7)
+        second = RandomStreams(7)
+        # drawing from one stream leaves the others as they were
+        _ = second.life_signals.integers(0, 10, 1000)
+        first_draws, second_draws = draws(first), draws(second)
+        for name in RandomStreams.STREAMS:
+            with self.subTest(stream=name):
+                if name == "life_signals":
+                    self.assertNotEqual(first_draws[name], second_draws[name])
+                else:
+                    self.assertEqual(first_draws[name], second_draws[name])
+        self.assertEqual(len(set(map(tuple, first_draws.values()))), 6)
+
+    def test_life_signals_are_distorted_by_depth(self):
+        cell = InternalCell(0, 0)
+        for id in range(4):
+            cell.add_layer(SurvivorGroup(id, 100, 1))
+
+        signals = cell.get_generated_life_signals(RandomStreams(3).life_signals)
+        again = cell.get_generated_life_signals(RandomStreams(3).life_signals)
+        self.assertEqual(signals.life_signals, again.life_signals)
+        self.assertEqual(signals.get(0), 100)
+        for depth in range(3):
+            low = Constants.DEPTH_LOW_START + Constants.DEPTH_LOW_INC * depth
+            high = Constants.DEPTH_HIGH_START + Constants.DEPTH_HIGH_INC * depth
+            self.assertGreaterEqual(signals.get(depth + 1), 100 - high)
+            self.assertLessEqual(signals.get(depth + 1), 100 - low)
+
+
+if __name__ == "__main__":
+    unittest.main()
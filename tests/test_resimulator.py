@@ -0,0 +1,125 @@
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+# Add the `src` directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.abspath(os.path.join(current_dir, "../src"))
+if src_dir not in sys.path:
+    sys.path.append(src_dir)
+
+from a3.in_process import run_in_process
+from a3.resimulator import CommandLog, parse_command_record, resimulate
+from agents.example_agent_a3.example_agent import ExampleAgent
+from aegis.common import AgentID, AgentIDList, Direction, InternalLocation
+from aegis.common.commands.agent_commands import (
+    AGENT_UNKNOWN,
+    END_TURN,
+    MOVE,
+    OBSERVE,
+    PREDICT,
+    SAVE_SURV,
+    SEND_MESSAGE,
+    SLEEP,
+    TEAM_DIG,
+)
+
+REPO_DIR = os.path.abspath(os.path.join(current_dir, ".."))
+WORLD = os.path.join(REPO_DIR, "worlds", "ExampleWorld.world")
+CONFIG = os.path.join(REPO_DIR, "sys_files", "aegis_config.json")
+
+
+class TestResimulator(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.replay = os.path.join(cls.directory.name, "replay.txt")
+        cwd = os.getcwd()
+        # the kernel writes its world info file to the working directory
+        os.chdir(cls.directory.name)
+        try:
+            args = ["-WorldFile", WORLD, "-ConfigFile", CONFIG, "-NumRound", "20"]
+            with contextlib.redirect_stdout(io.StringIO()):
+                assert run_in_process(
+                    [*args, "-ProcFile", cls.replay], [("test", ExampleAgent)] * 2
+                )
+        finally:
+            os.chdir(cwd)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def resimulate(self, log: CommandLog):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return resimulate(log, config_filename=CONFIG)
+
+    def test_resimulation_matches_the_replay(self):
+        log = CommandLog.read(self.replay)
+        self.assertEqual(log.world_filename, WORLD)
+        self.assertEqual(len(log.agents), 2)
+        self.assertEqual(len(log.rounds), 20)
+        self.assertTrue(any(recorded.commands for recorded in log.rounds))
+
+        result = self.resimulate(log)
+        self.assertIsNone(result.mismatch)
+        self.assertEqual(result.rounds, 20)
+
+    def test_resimulation_finds_a_changed_round(self):
+        log = CommandLog.read(self.replay)
+        events = log.rounds[4].events
+        assert events is not None
+        log.rounds[4].events = events.replace(
+            "Agents_Information; {", "Agents_Information; { (9,9,9,9,9),"
+        )
+
+        result = self.resimulate(log)
+        assert result.mismatch is not None
+        self.assertEqual(result.mismatch.round, log.rounds[4].round)
+        self.assertEqual(result.rounds, 5)
+
+    def test_command_log_round_trip(self):
+        log = CommandLog.read(self.replay)
+        command_log = os.path.join(self.directory.name, "replay.cmdlog")
+        log.write(command_log)
+        self.assertLess(os.path.getsize(command_log), os.path.getsize(self.replay))
+
+        read = CommandLog.read(command_log)
+        self.assertIsNone(read.world_content)
+        read.world_content = log.world_content
+        self.assertEqual(read, log)
+        self.assertIsNone(self.resimulate(read).mismatch)
+
+    def test_parse_every_command(self):
+        commands = [
+            MOVE(Direction.NORTH_WEST),
+            OBSERVE(InternalLocation(3, 4)),
+            SAVE_SURV(),
+            TEAM_DIG(),
+            SLEEP(),
+            END_TURN(),
+            AGENT_UNKNOWN(),
+            SEND_MESSAGE(AgentIDList(), "to everyone $ to all"),
+            SEND_MESSAGE(
+                AgentIDList([AgentID(1, 1), AgentID(2, 1)]), "M1 2 ) to (3, 4"
+            ),
+        ]
+        for command in commands:
+            command.set_agent_id(AgentID(2, 1))
+            record = command.proc_string()
+            self.assertEqual(parse_command_record(record).proc_string(), record)
+
+        predict = parse_command_record("(1, 1)#Prediction 3 for survivor 7")
+        assert isinstance(predict, PREDICT)
+        self.assertEqual(predict.surv_id, 7)
+        self.assertEqual(int(predict.label), 3)
+
+        with self.assertRaises(ValueError):
+            _ = parse_command_record("(1, 1)#Fly NORTH")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import json
+import unittest
+import sys
+import os
+import tempfile
+
+# Add the `src` directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.abspath(os.path.join(current_dir, "../src"))
+if src_dir not in sys.path:
+    sys.path.append(src_dir)
+
+from aegis.assist.round_profiler import RoundProfiler
+from aegis.common import AgentID
+
+
+class TestRoundProfiler(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.metrics = os.path.join(self.directory.name, "metrics.jsonl")
+        self.trace = os.path.join(self.directory.name, "trace.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def run_rounds(self, profiler, rounds):
+        for round in range(1, rounds + 1):
+            profiler.begin_round(round)
+            with profiler.agent_wait(AgentID(1, 1)):
+                pass
+            with profiler.agent_wait(AgentID(2, 1)):
+                pass
+            with profiler.phase("process_commands"):
+                pass
+            with profiler.phase("create_results"):
+                pass
+            profiler.end_round()
+        profiler.close()
+
+    def test_writes_one_metrics_line_per_round(self):
+        self.run_rounds(RoundProfiler(self.metrics), 3)
+        with open(self.metrics) as file:
+            lines = [json.loads(line) for line in file]
+
+        self.assertEqual([line["round"] for line in lines], [1, 2, 3])
+        for line in lines:
+            self.assertEqual(
+                set(line["phases_ms"]),
+                {"agent_wait", "process_commands", "create_results"},
+            )
+            self.assertEqual(set(line["agent_wait_ms"]), {"1:1", "2:1"})
+            self.assertGreaterEqual(line["total_ms"], 0)
+
+    def test_trace_is_a_valid_chrome_trace(self):
+        self.run_rounds(RoundProfiler(None, self.trace), 2)
+        with open(self.trace) as file:
+            events = json.load(file)
+
+        spans = [event for event in events if event["ph"] == "X"]
+        self.assertEqual(len(spans), 2 * 5)
+        threads = {
+            event["args"]["name"]
+            for event in events
+            if event["ph"] == "M" and event["name"] == "thread_name"
+        }
+        self.assertEqual(threads, {"kernel", "agent 1:1", "agent 2:1"})
+        self.assertTrue(all(span["dur"] >= 0 for span in spans))
+
+    def test_disabled_profiler_does_nothing(self):
+        profiler = RoundProfiler()
+        self.assertFalse(profiler.enabled)
+        self.assertIs(profiler.phase("a"), profiler.phase("b"))
+        self.run_rounds(profiler, 1)
+        self.assertEqual(os.listdir(self.directory.name), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import multiprocessing
+import os
+import sys
+import time
+import unittest
+from unittest import mock
+
+# Add the repository root, where run_batch.py is, to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+repo_dir = os.path.abspath(os.path.join(current_dir, ".."))
+if repo_dir not in sys.path:
+    sys.path.append(repo_dir)
+
+import run_batch
+from run_batch import Simulation, run_simulation
+
+WORLD = os.path.join(run_batch.WORLDS_DIR, "ExampleWorld.world")
+
+
+def hang(*_):
+    time.sleep(60)
+
+
+def in_process_simulation(rounds: int, timeout: float) -> Simulation:
+    return Simulation(
+        WORLD,
+        None,
+        1,
+        run_batch.DEFAULT_CONFIG,
+        "example_agent_a3",
+        rounds,
+        in_process=True,
+        turbo=True,
+        timeout=timeout,
+    )
+
+
+class TestRunBatch(unittest.TestCase):
+    def test_in_process_simulation(self):
+        result = run_simulation(in_process_simulation(3, 60))
+        self.assertEqual(result["status"], "ok")
+        self.assertEqual(result["rounds"], 3)
+
+    @unittest.skipUnless(
+        "fork" in multiprocessing.get_all_start_methods(),
+        "the hanging worker is patched in, which only a forked child sees",
+    )
+    def test_in_process_simulation_times_out(self):
+        context = multiprocessing.get_context("fork")
+        with (
+            mock.patch.object(run_batch, "_in_process_worker", hang),
+            mock.patch.object(run_batch.multiprocessing, "Process", context.Process),
+        ):
+            result = run_simulation(in_process_simulation(3, 0.5))
+        self.assertEqual(result["status"], "timeout")
+        self.assertLess(result["wall_s"], 30)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,216 @@
+import contextlib
+import io
+import json
+import os
+import shutil
+import socket
+import sys
+import tempfile
+import threading
+import unittest
+
+# Add the `src` directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.abspath(os.path.join(current_dir, "../src"))
+if src_dir not in sys.path:
+    sys.path.append(src_dir)
+
+from a3.in_process import run_in_process
+from aegis.agent_control.network.agent_socket import AgentSocket
+from aegis.common.network.loopback_transport import LoopbackListener, LoopbackTransport
+from aegis.common.network.socket_transport import (
+    SocketListener,
+    SocketTransport,
+    parse_endpoint,
+)
+from agents.example_agent_a3.example_agent import ExampleAgent
+
+REPO_DIR = os.path.abspath(os.path.join(current_dir, ".."))
+
+
+class TestLoopbackTransport(unittest.TestCase):
+    def test_messages_arrive_in_order(self):
+        agent_end, kernel_end = LoopbackTransport.pair()
+        agent_end.send_message("MOVE ( NORTH )")
+        agent_end.send_message("END_TURN")
+        self.assertEqual(kernel_end.read_message(), "MOVE ( NORTH )")
+        self.assertEqual(kernel_end.read_message(), "END_TURN")
+        self.assertIsNone(kernel_end.read_message(timeout=0.01))
+
+    def test_close_is_seen_after_pending_messages(self):
+        agent_end, kernel_end = LoopbackTransport.pair()
+        kernel_end.send_message("DISCONNECT")
+        kernel_end.close()
+        self.assertEqual(agent_end.read_message(), "DISCONNECT")
+        with self.assertRaises(ConnectionError):
+            _ = agent_end.read_message()
+        with self.assertRaises(ConnectionError):
+            agent_end.send_message("END_TURN")
+
+    def test_listener_accepts_in_connect_order(self):
+        listener = LoopbackListener()
+        first = listener.connect()
+        second = listener.connect()
+        first.send_message("first")
+        second.send_message("second")
+        self.assertEqual(listener.accept().read_message(), "first")
+        self.assertEqual(listener.accept().read_message(), "second")
+        with self.assertRaises(TimeoutError):
+            _ = listener.accept(timeout=0.01)
+        listener.close()
+        with self.assertRaises(ConnectionRefusedError):
+            _ = listener.connect()
+
+
+class TestSocketTransport(unittest.TestCase):
+    def round_trip(self, endpoint):
+        listener = SocketListener(endpoint)
+        accepted: list[SocketTransport] = []
+        thread = threading.Thread(target=lambda: accepted.append(listener.accept(5)))
+        thread.start()
+        agent_end = SocketTransport.connect_endpoint(listener.endpoint)
+        thread.join()
+        kernel_end = accepted[0]
+        try:
+            agent_end.send_message("CONNECT ( test )")
+            self.assertEqual(kernel_end.read_message(5), "CONNECT ( test )")
+            kernel_end.send_message("CONNECT_OK")
+            self.assertEqual(agent_end.read_message(5), "CONNECT_OK")
+            self.assertTrue(kernel_end.is_local())
+            agent_end.close()
+            with self.assertRaises(ConnectionError):
+                _ = kernel_end.read_message(5)
+        finally:
+            kernel_end.close()
+            listener.close()
+
+    def test_tcp_round_trip(self):
+        self.round_trip("tcp://127.0.0.1:0")
+
+    @unittest.skipUnless(hasattr(socket, "AF_UNIX"), "needs Unix domain sockets")
+    def test_unix_round_trip(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "aegis.sock")
+            self.round_trip(f"unix://{path}")
+            self.assertFalse(os.path.exists(path))
+
+    def test_parse_endpoint(self):
+        self.assertEqual(
+            parse_endpoint("tcp://localhost:6001"),
+            (socket.AF_INET, ("localhost", 6001)),
+        )
+        self.assertEqual(parse_endpoint("tcp://:6001"), (socket.AF_INET, ("", 6001)))
+        for endpoint in ("localhost:6001", "tcp://localhost", "udp://:6001"):
+            with self.assertRaises(ValueError):
+                _ = parse_endpoint(endpoint)
+
+
+class TestAgentSocketBytes(unittest.TestCase):
+    def count_bytes(self, listener, agent_end) -> AgentSocket:
+        agent_socket = AgentSocket()
+        agent_socket.connect(listener, 5)
+        try:
+            agent_end.send_message("END_TURN")
+            self.assertEqual(agent_socket.read_message(5), "END_TURN")
+            agent_socket.send_message("ROUND_END")
+            self.assertEqual(agent_end.read_message(5), "ROUND_END")
+        finally:
+            agent_end.close()
+            agent_socket.disconnect()
+            listener.close()
+        return agent_socket
+
+    def test_loopback_has_no_framing(self):
+        listener = LoopbackListener()
+        agent_socket = self.count_bytes(listener, listener.connect())
+        self.assertEqual(agent_socket.bytes_received, len("END_TURN"))
+        self.assertEqual(agent_socket.bytes_sent, len("ROUND_END"))
+
+    def test_socket_counts_its_framing(self):
+        listener = SocketListener("tcp://127.0.0.1:0")
+        agent_end = SocketTransport.connect_endpoint(listener.endpoint)
+        agent_socket = self.count_bytes(listener, agent_end)
+        # the 4 byte length prefix and the null terminator
+        self.assertEqual(agent_socket.bytes_received, len("END_TURN") + 5)
+        self.assertEqual(agent_socket.bytes_sent, len("ROUND_END") + 5)
+
+
+class TestInProcess(unittest.TestCase):
+    def setUp(self):
+        # the kernel reads its config from, and writes its files to, the
+        # working directory
+        self.directory = tempfile.TemporaryDirectory()
+        shutil.copytree(
+            os.path.join(REPO_DIR, "sys_files"),
+            os.path.join(self.directory.name, "sys_files"),
+        )
+        self.cwd = os.getcwd()
+        os.chdir(self.directory.name)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.directory.cleanup()
+
+    def test_runs_simulation_without_sockets(self):
+        world = os.path.join(REPO_DIR, "worlds", "ExampleWorld.world")
+        with contextlib.redirect_stdout(io.StringIO()):
+            ran = run_in_process(
+                ["-WorldFile", world, "-NumRound", "5", "-ProcFile", "replay.txt"],
+                [("test", ExampleAgent), ("test", ExampleAgent)],
+            )
+        self.assertTrue(ran)
+        with open("replay.txt") as file:
+            replay = file.read()
+        self.assertIn("ADD_AGT; Info(ID 1, GID 1", replay)
+        self.assertIn("ADD_AGT; Info(ID 2, GID 1", replay)
+        self.assertEqual(replay.count("RS;"), 5)
+
+    def test_writes_results_file(self):
+        world = os.path.join(REPO_DIR, "worlds", "ExampleWorld.world")
+        with contextlib.redirect_stdout(io.StringIO()):
+            ran = run_in_process(
+                [
+                    "-WorldFile",
+                    world,
+                    "-NumRound",
+                    "3",
+                    "-Seed",
+                    "0",
+                    "-ResultsFile",
+                    "results.json",
+                ],
+                [("test", ExampleAgent)],
+            )
+        self.assertTrue(ran)
+        with open("results.json") as file:
+            results = json.load(file)
+        self.assertEqual(results["seed"], 0)
+        self.assertEqual(results["rounds"], 3)
+        self.assertEqual([group["name"] for group in results["groups"]], ["test"])
+
+    def test_turbo_writes_only_results(self):
+        world = os.path.join(REPO_DIR, "worlds", "ExampleWorld.world")
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            ran = run_in_process(
+                [
+                    "-WorldFile",
+                    world,
+                    "-NumRound",
+                    "3",
+                    "-Turbo",
+                    "true",
+                    "-ResultsFile",
+                    "results.json",
+                ],
+                [("test", ExampleAgent)],
+            )
+        self.assertTrue(ran)
+        self.assertFalse(os.path.exists("replay.txt"))
+        self.assertNotIn("Added agent", output.getvalue())
+        with open("results.json") as file:
+            self.assertEqual(json.load(file)["rounds"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
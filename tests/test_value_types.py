@@ -0,0 +1,52 @@
+import unittest
+import sys
+import os
+
+# Add the `src` directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.abspath(os.path.join(current_dir, "../src"))
+if src_dir not in sys.path:
+    sys.path.append(src_dir)
+
+from aegis.common import AgentID, Direction, InternalLocation
+from aegis.common.world.objects import Rubble, Survivor, SurvivorGroup
+
+
+class TestValueTypes(unittest.TestCase):
+    def test_locations_are_interned(self):
+        location = InternalLocation.of(2, 3)
+        self.assertIs(location, InternalLocation.of(2, 3))
+        self.assertIs(location.clone(), location)
+        self.assertIs(location.add(Direction.NORTH), InternalLocation.of(2, 4))
+        self.assertEqual(InternalLocation(2, 3), location)
+
+    def test_agent_ids_are_interned(self):
+        agent_id = AgentID.of(4, 2)
+        self.assertIs(agent_id, AgentID.of(4, 2))
+        self.assertIs(agent_id.clone(), agent_id)
+        self.assertEqual(AgentID(4, 2), agent_id)
+        self.assertEqual(hash(AgentID(4, 2)), hash(agent_id))
+
+    def test_hot_types_have_no_instance_dict(self):
+        for value in (
+            InternalLocation(0, 0),
+            AgentID(1, 1),
+            Survivor(1, 10),
+            SurvivorGroup(2, 10, 3),
+            Rubble(3, 5, 2),
+        ):
+            with self.subTest(type=type(value).__name__):
+                self.assertFalse(hasattr(value, "__dict__"))
+
+    def test_world_objects_still_clone(self):
+        survivor = Survivor(7, 12, 1, 2, 3)
+        clone = survivor.clone()
+        self.assertIsNot(clone, survivor)
+        self.assertEqual(str(clone), str(survivor))
+        clone.remove_energy(20)
+        self.assertTrue(clone.is_dead())
+        self.assertTrue(survivor.is_alive())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,166 @@
+import os
+import signal
+import sys
+import tempfile
+import unittest
+
+# Add the `src` directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.abspath(os.path.join(current_dir, "../src"))
+if src_dir not in sys.path:
+    sys.path.append(src_dir)
+
+import numpy as np
+
+from a3.vector_env import (
+    NUM_ACTIONS,
+    SAVE_SURV_ACTION,
+    SLEEP_ACTION,
+    VectorEnv,
+    action_to_command,
+)
+from aegis.common import CellType, Direction
+from aegis.common.commands.agent_commands import MOVE, SAVE_SURV, SLEEP, TEAM_DIG
+
+REPO_DIR = os.path.abspath(os.path.join(current_dir, ".."))
+WORLD = os.path.join(REPO_DIR, "worlds", "ExampleWorld.world")
+CONFIG = os.path.join(REPO_DIR, "sys_files", "aegis_config.json")
+# ExampleWorld's agents spawn at (7, 7) and a survivor is at (0, 0)
+SOUTH_WEST = list(Direction).index(Direction.SOUTH_WEST)
+
+
+class TestVectorEnv(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.directory.name)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.directory.cleanup()
+
+    def make_env(self, num_envs=2, agents=1, rounds=50):
+        return VectorEnv(
+            WORLD, num_envs, agents=agents, rounds=rounds, config_filename=CONFIG
+        )
+
+    def test_reset_observes_spawn(self):
+        env = self.make_env(num_envs=3, agents=2)
+        observation, info = env.reset(seeds=[1, 2, 3])
+        self.assertEqual(observation["cell_type"].shape, (3, 2, 9))
+        self.assertEqual(observation["life_signals"].shape, (3, 2, 8))
+        self.assertTrue(observation["alive"].all())
+        self.assertTrue((observation["location"] == 7).all())
+        self.assertTrue((observation["energy"] == 500).all())
+        self.assertTrue((observation["cell_type"] == CellType.NORMAL_CELL.value).all())
+        self.assertTrue((observation["life_signals"] == -1).all())
+        self.assertEqual(info["round"].tolist(), [0, 0, 0])
+        # nothing reads the world info file, so it isn't written
+        self.assertEqual(os.listdir(), [])
+
+    @unittest.skipUnless(hasattr(signal, "SIGUSR1"), "needs SIGUSR1")
+    def test_leaves_signal_handlers_alone(self):
+        handlers = signal.getsignal(signal.SIGUSR1), signal.getsignal(signal.SIGUSR2)
+        env = self.make_env()
+        _ = env.reset(seeds=[1, 2])
+        _ = env.step(np.zeros((2, 1), np.int64))
+        env.close()
+        self.assertEqual(
+            (signal.getsignal(signal.SIGUSR1), signal.getsignal(signal.SIGUSR2)),
+            handlers,
+        )
+
+    def test_saving_a_survivor_is_rewarded(self):
+        env = self.make_env()
+        _ = env.reset()
+        for _ in range(7):
+            observation, rewards, _, _, _ = env.step(np.full((2, 1), SOUTH_WEST))
+            self.assertEqual(rewards.tolist(), [0, 0])
+        self.assertTrue((observation["location"] == 0).all())
+        center = list(Direction).index(Direction.CENTER)
+        self.assertTrue((observation["top_layer"][:, 0, center] == 2).all())
+
+        observation, rewards, _, _, info = env.step(np.full((2, 1), SAVE_SURV_ACTION))
+        self.assertEqual(rewards.tolist(), [100, 100])
+        self.assertEqual(info["score"].tolist(), [100, 100])
+        self.assertTrue((observation["top_layer"][:, 0, center] == 0).all())
+
+    def test_reset_puts_back_saved_survivors(self):
+        env = self.make_env()
+        for _ in range(2):
+            _ = env.reset()
+            for _ in range(7):
+                _ = env.step(np.full((2, 1), SOUTH_WEST))
+            _, rewards, _, _, info = env.step(np.full((2, 1), SAVE_SURV_ACTION))
+            self.assertEqual(rewards.tolist(), [100, 100])
+            self.assertEqual(info["score"].tolist(), [100, 100])
+
+    def test_reset_plays_like_a_new_env(self):
+        def run(env):
+            _ = env.reset(seeds=[7, 8])
+            rng = np.random.default_rng(1)
+            steps = []
+            for _ in range(30):
+                steps.append(env.step(rng.integers(0, NUM_ACTIONS, (2, 2))))
+            return steps
+
+        reused = self.make_env(agents=2)
+        _ = run(reused)
+        for first, second in zip(run(reused), run(self.make_env(agents=2))):
+            for name in first[0]:
+                np.testing.assert_array_equal(first[0][name], second[0][name])
+            for index in range(1, 4):
+                np.testing.assert_array_equal(first[index], second[index])
+
+    def test_finished_envs_wait_for_reset(self):
+        env = self.make_env(rounds=3)
+        _ = env.reset()
+        sleep = np.full((2, 1), SLEEP_ACTION)
+        for _ in range(3):
+            _, _, terminated, truncated, _ = env.step(sleep)
+        self.assertEqual(truncated.tolist(), [True, True])
+        self.assertEqual(terminated.tolist(), [False, False])
+
+        _, _, _, truncated, info = env.step(sleep)
+        self.assertEqual(info["round"].tolist(), [3, 3])
+
+        _ = env.reset(indices=[1])
+        _, _, _, truncated, info = env.step(sleep)
+        self.assertEqual(info["round"].tolist(), [3, 1])
+        self.assertEqual(truncated.tolist(), [True, False])
+
+    def test_same_seeds_same_episode(self):
+        def run():
+            env = self.make_env(num_envs=2, agents=2)
+            observation, _ = env.reset(seeds=[5, 6])
+            rng = np.random.default_rng(0)
+            for _ in range(20):
+                observation, _, _, _, _ = env.step(rng.integers(0, NUM_ACTIONS, (2, 2)))
+            return observation
+
+        first, second = run(), run()
+        for name in first:
+            np.testing.assert_array_equal(first[name], second[name])
+
+    def test_rejects_bad_actions(self):
+        env = self.make_env()
+        with self.assertRaises(RuntimeError):
+            _ = env.step(np.zeros((2, 1), np.int64))
+        _ = env.reset()
+        with self.assertRaises(ValueError):
+            _ = env.step(np.zeros((3, 1), np.int64))
+        with self.assertRaises(ValueError):
+            _ = env.step(np.full((2, 1), NUM_ACTIONS))
+
+    def test_action_to_command(self):
+        commands = [action_to_command(action) for action in range(NUM_ACTIONS)]
+        for command, direction in zip(commands, Direction):
+            assert isinstance(command, MOVE)
+            self.assertEqual(command.direction, direction)
+        self.assertIsInstance(commands[SLEEP_ACTION], SLEEP)
+        self.assertIsInstance(commands[SLEEP_ACTION + 1], TEAM_DIG)
+        self.assertIsInstance(commands[SAVE_SURV_ACTION], SAVE_SURV)
+
+
+if __name__ == "__main__":
+    unittest.main()
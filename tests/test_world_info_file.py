@@ -0,0 +1,74 @@
+import unittest
+import sys
+import os
+
+# Add the `src` directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.abspath(os.path.join(current_dir, "../src"))
+if src_dir not in sys.path:
+    sys.path.append(src_dir)
+
+from a3.aegis_parser import AegisParser
+from aegis import CONNECT_OK, AgentID
+from aegis.common import InternalLocation
+from aegis.common.world.cell import InternalCell
+from aegis.common.world.objects import Survivor
+from aegis.common.world.world_info_file import WorldInfoFile
+
+
+class TestWorldInfoFile(unittest.TestCase):
+    def setUp(self):
+        self.world = [[InternalCell(x, y) for y in range(4)] for x in range(3)]
+        for column in self.world:
+            for cell in column:
+                cell.set_normal_cell()
+        self.world[0][1].set_fire_cell()
+        self.world[1][2].set_killer_cell()
+        self.world[2][3].set_charging_cell()
+        self.world[2][0].move_cost = 7
+        self.world[1][1].add_layer(Survivor(0, 10, 0, 0, 0))
+
+    def assert_same_cells(self, decoded, move_costs=True):
+        self.assertEqual(len(decoded), 3)
+        self.assertEqual(len(decoded[0]), 4)
+        for x in range(3):
+            for y in range(4):
+                expected = self.world[x][y]
+                cell = decoded[x][y]
+                self.assertEqual(cell.location, expected.location)
+                self.assertEqual(cell.is_fire_cell(), expected.is_fire_cell())
+                self.assertEqual(cell.is_killer_cell(), expected.is_killer_cell())
+                self.assertEqual(cell.is_charging_cell(), expected.is_charging_cell())
+                self.assertEqual(cell.is_normal_cell(), expected.is_normal_cell())
+                self.assertEqual(
+                    cell.has_survivors, expected.number_of_survivors() > 0
+                )
+                self.assertEqual(cell.move_cost, expected.move_cost if move_costs else 1)
+
+    def test_round_trip(self):
+        data = WorldInfoFile.encode(self.world, include_move_costs=True)
+        self.assert_same_cells(WorldInfoFile.decode(data))
+
+    def test_round_trip_without_move_costs(self):
+        data = WorldInfoFile.encode(self.world, include_move_costs=False)
+        self.assert_same_cells(WorldInfoFile.decode(data), move_costs=False)
+
+    def test_connect_ok_inline_world(self):
+        data = WorldInfoFile.encode(self.world, include_move_costs=True)
+        command = CONNECT_OK(AgentID(1, 1), 500, InternalLocation(2, 3), "", data)
+        parsed = AegisParser.parse_aegis_command(str(command))
+        self.assertIsInstance(parsed, CONNECT_OK)
+        assert isinstance(parsed, CONNECT_OK)
+        self.assertEqual(parsed.world_data, data)
+        self.assertEqual(parsed.location, InternalLocation(2, 3))
+
+    def test_connect_ok_file(self):
+        command = CONNECT_OK(AgentID(1, 1), 500, InternalLocation(2, 3), "/tmp/a b.bin")
+        parsed = AegisParser.parse_aegis_command(str(command))
+        assert isinstance(parsed, CONNECT_OK)
+        self.assertIsNone(parsed.world_data)
+        self.assertEqual(parsed.world_filename, "/tmp/a b.bin")
+
+
+if __name__ == "__main__":
+    unittest.main()